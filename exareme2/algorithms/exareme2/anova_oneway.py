@@ -1,10 +1,9 @@
-from typing import TypeVar
-
 import pandas as pd
 from pydantic import BaseModel
 
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
+from exareme2.algorithms.exareme2.group_aggregates import compute_group_statistics
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
 from exareme2.algorithms.exareme2.udfgen import literal
 from exareme2.algorithms.exareme2.udfgen import merge_transfer
@@ -42,9 +41,19 @@ class AnovaOneWayAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
         covar_enums = list(metadata[x_var_name]["enumerations"])
 
+        # The statistics per group are computed by a SQL GROUP BY, local1 only
+        # lays them out on the covariable's enumerations
+        group_stats = compute_group_statistics(
+            self.engine, groups=X_relation, values=Y_relation
+        )
         sec_local_transfer, local_transfers = local_run(
             func=local1,
-            keyword_args=dict(y=Y_relation, x=X_relation, covar_enums=covar_enums),
+            keyword_args=dict(
+                group_stats=group_stats,
+                covar_enums=covar_enums,
+                var_label=y_var_name,
+                covar_label=x_var_name,
+            ),
             share_to_global=[True, True],
         )
         try:
@@ -118,120 +127,77 @@ class AnovaOneWayAlgorithm(Algorithm, algname=ALGORITHM_NAME):
         return anova_table
 
 
-S = TypeVar("S")
-T = TypeVar("T")
-
-
 @udf(
-    y=relation(schema=S),
-    x=relation(schema=T),
+    group_stats=relation(),
     covar_enums=literal(),
+    var_label=literal(),
+    covar_label=literal(),
     return_type=[secure_transfer(sum_op=True, min_op=True, max_op=True), transfer()],
 )
-def local1(y, x, covar_enums):
+def local1(group_stats, covar_enums, var_label, covar_label):
     import sys
 
-    import numpy as np
-    import pandas as pd
-
-    y.reset_index(drop=True)
-    x.reset_index(drop=True)
-    variable = y.to_numpy().squeeze()
-    covariable = x.to_numpy().squeeze()
-    var_label = y.columns.values.tolist()[0]
-    covar_label = x.columns.values.tolist()[0]
-    covar_enums = np.array(covar_enums)
-    dataset = pd.DataFrame({var_label: variable, covar_label: covariable}, copy=False)
-
-    n_obs = y.shape[0]
-    min_per_group = dataset.groupby([covar_label]).min()
-    max_per_group = dataset.groupby([covar_label]).max()
-    var_sq = var_label + "_sq"
-    dataset[var_sq] = variable**2
+    # Groups missing from the worker's data get neutral statistics
+    group_stats.index = group_stats["group_value"].astype(str)
+    group_stats = group_stats.reindex([str(enum) for enum in covar_enums])
+    group_counts = group_stats[f"count__{var_label}"].fillna(0).astype(int)
+    group_sums = group_stats[f"sum__{var_label}"].fillna(0)
+    group_ssq = group_stats[f"sum_sq__{var_label}"].fillna(0)
+    min_per_group = group_stats[f"min__{var_label}"].fillna(sys.float_info.max)
+    max_per_group = group_stats[f"max__{var_label}"].fillna(sys.float_info.min)
 
     # get overall stats
-    overall_stats = dataset[var_label].agg(["count", "sum"])
-    overall_ssq = dataset[var_sq].sum()
-    overall_stats = pd.concat(
-        [overall_stats, pd.Series(data=overall_ssq, index=["sum_sq"])]
-    )
-
-    # get group stats
-    group_stats = (
-        dataset[[var_label, covar_label]].groupby(covar_label).agg(["count", "sum"])
-    )
-    group_stats.columns = ["count", "sum"]
-    group_ssq = dataset[[var_sq, covar_label]].groupby(covar_label).sum()
-    group_ssq.columns = ["sum_sq"]
-    min_per_group.columns = ["min_per_group"]
-    max_per_group.columns = ["max_per_group"]
-    group_stats_df = pd.DataFrame(group_stats)
-    group_stats_df["group_ssq"] = group_ssq
-    group_stats_df["min_per_group"] = min_per_group
-    group_stats_df["max_per_group"] = max_per_group
-    diff = list(set(covar_enums) - set(group_stats.index))
-    if diff:
-        diff_df = pd.DataFrame(
-            0,
-            index=diff,
-            columns=["count", "sum", "group_ssq", "min_per_group", "max_per_group"],
-        )
-        diff_df["min_per_group"] = sys.float_info.max
-        diff_df["max_per_group"] = sys.float_info.min
-        group_stats_df = pd.concat([group_stats, diff_df])
-
-    group_stats_df["groups"] = pd.Categorical(
-        group_stats_df.index, categories=covar_enums.tolist(), ordered=True
-    )
-    group_stats_df.sort_values("groups", inplace=True)
+    n_obs = int(group_counts.sum())
+    overall_sum = float(group_sums.sum())
+    overall_ssq = float(group_ssq.sum())
 
     sec_transfer_ = {}
     sec_transfer_["n_obs"] = {"data": n_obs, "operation": "sum", "type": "int"}
     sec_transfer_["overall_stats_sum"] = {
-        "data": overall_stats["sum"].tolist(),
+        "data": overall_sum,
         "operation": "sum",
         "type": "float",
     }
     sec_transfer_["overall_stats_count"] = {
-        "data": overall_stats["count"].tolist(),
+        "data": n_obs,
         "operation": "sum",
         "type": "float",
     }
     sec_transfer_["overall_ssq"] = {
-        "data": overall_ssq.item(),
+        "data": overall_ssq,
         "operation": "sum",
         "type": "float",
     }
     sec_transfer_["group_stats_sum"] = {
-        "data": group_stats_df["sum"].tolist(),
+        "data": group_sums.tolist(),
         "operation": "sum",
         "type": "float",
     }
     sec_transfer_["group_stats_count"] = {
-        "data": group_stats_df["count"].tolist(),
+        "data": group_counts.tolist(),
         "operation": "sum",
         "type": "float",
     }
     sec_transfer_["group_stats_ssq"] = {
-        "data": group_stats_df["group_ssq"].tolist(),
+        "data": group_ssq.tolist(),
         "operation": "sum",
         "type": "float",
     }
     sec_transfer_["min_per_group"] = {
-        "data": group_stats_df["min_per_group"].tolist(),
+        "data": min_per_group.tolist(),
         "operation": "min",
         "type": "float",
     }
     sec_transfer_["max_per_group"] = {
-        "data": group_stats_df["max_per_group"].tolist(),
+        "data": max_per_group.tolist(),
         "operation": "max",
         "type": "float",
     }
     transfer_ = {
         "var_label": var_label,
         "covar_label": covar_label,
-        "covar_enums": covar_enums.tolist(),
-        "group_stats_df_index": group_stats_df.index.tolist(),
+        "covar_enums": covar_enums,
+        "group_stats_df_index": covar_enums,
     }
 
     return sec_transfer_, transfer_
@@ -0,0 +1,360 @@
+"""
+Group-wise aggregates computed by MonetDB.
+
+The local steps needing counts, sums, sums of squares, minima or maxima per group
+compute them with a single SQL GROUP BY over their relations, executed natively
+by MonetDB, instead of loading the whole relations in a Python UDF. The result is
+a small table, with one row per group, which the algorithms then turn into secure
+transfers laid out on the known categories, so that they can be summed across the
+workers. Histograms are computed the same way, grouping by the bin of each value,
+so their cost grows with the number of bins instead of the number of values.
+"""
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from exareme2 import DType
+from exareme2.algorithms.exareme2.udfgen import AdhocUdfGenerator
+from exareme2.algorithms.exareme2.udfgen.udfgen_DTOs import UDFGenTableResult
+
+ROW_ID = "row_id"
+GROUP_COLUMN = "group_value"
+VARIABLE_COLUMN = "variable"
+VALUE_COLUMN = "value"
+COUNT_COLUMN = "count"
+BIN_COLUMN = "bin"
+
+
+def compute_group_statistics(engine, groups, values):
+    """
+    Computes on the local workers, per value of the single column of 'groups',
+    the count, the sum, the sum of squares, the min and the max of every column of
+    'values'. The two relations are joined on their row_id.
+
+    The resulting table has a 'group_value' column and, for every column 'c' of
+    'values', the columns returned by 'get_group_statistics_columns(c)'.
+    """
+    return engine.run_udf_on_local_workers(
+        func=GroupStatisticsUdf,
+        keyword_args={"groups": groups, "values": values},
+        share_to_global=[False],
+    )
+
+
+def compute_category_counts(engine, groups, values):
+    """
+    Computes on the local workers, per value of the single column of 'groups' and
+    per value of every column of 'values', the number of rows. The two relations
+    are joined on their row_id.
+
+    The resulting table has the columns 'variable', the name of the column of
+    'values', 'group_value', 'value', converted to text, and 'count'.
+    """
+    return engine.run_udf_on_local_workers(
+        func=CategoryCountsUdf,
+        keyword_args={"groups": groups, "values": values},
+        share_to_global=[False],
+    )
+
+
+def compute_bin_counts(
+    engine,
+    data,
+    variable: str,
+    groupings: List[str],
+    bins: Optional[int] = None,
+    bin_range: Optional[Sequence[float]] = None,
+):
+    """
+    Computes on the local workers the histogram counts of the column 'variable'
+    of 'data', overall and per value of every column in 'groupings'. A numerical
+    variable is binned in 'bins' equal bins over 'bin_range', like
+    'numpy.histogram', a nominal one is counted per value when 'bins' is None.
+
+    The resulting table has the columns 'variable', the grouping column, empty
+    for the overall counts, 'group_value', converted to text, 'bin', the index of
+    the bin or the value converted to text, and 'count'.
+    """
+    return engine.run_udf_on_local_workers(
+        func=BinCountsUdf,
+        keyword_args={
+            "data": data,
+            "variable": variable,
+            "groupings": groupings,
+            "bins": bins,
+            "bin_range": bin_range,
+        },
+        share_to_global=[False],
+    )
+
+
+def get_group_statistics_columns(column: str) -> dict:
+    """Returns the names of the statistics columns of a 'values' column."""
+    return {
+        statistic: f"{statistic}__{column}"
+        for statistic in GroupStatisticsUdf.STATISTICS
+    }
+
+
+class _AggregatesUdf(AdhocUdfGenerator):
+    def _insert_from_subquery(self, table_name: str, query: str) -> str:
+        # The worker appends a WHERE clause to the execution statement, to make it
+        # idempotent, so the aggregate query is wrapped in a subquery
+        star = self.ast.Column("*")
+        subquery = self.ast.Table(name=f"(\n{query}\n) AS aggregates", columns=[star])
+        sel = self.ast.Select(columns=[star], from_=[subquery])
+        return self.ast.Insert(table=table_name, values=sel).compile()
+
+    def get_results(self, output_table_names: List[str]) -> List[UDFGenTableResult]:
+        main_output_name, *_ = output_table_names
+        create = self.ast.CreateTable(main_output_name, self.output_schema).compile()
+        return [
+            UDFGenTableResult(
+                table_name=main_output_name,
+                table_schema=self.output_schema,
+                create_query=create,
+            )
+        ]
+
+
+class _GroupByUdf(_AggregatesUdf):
+    @property
+    def group_column(self) -> str:
+        [group_column] = [name for name in self.groups.column_names if name != ROW_ID]
+        return group_column
+
+    @property
+    def group_dtype(self) -> DType:
+        [dtype] = [
+            column.dtype
+            for column in self.groups.schema_.columns
+            if column.name == self.group_column
+        ]
+        return dtype
+
+    @property
+    def value_columns(self) -> List[str]:
+        return [name for name in self.values.column_names if name != ROW_ID]
+
+    def _get_tables(self):
+        groups_table = self.ast.Table(
+            name=self.groups.name, columns=[ROW_ID, self.group_column]
+        )
+        values_table = self.ast.Table(
+            name=self.values.name, columns=[ROW_ID] + self.value_columns
+        )
+        return groups_table, values_table
+
+    @staticmethod
+    def _get_join_clause(groups_table, values_table):
+        return [groups_table.c[ROW_ID] == values_table.c[ROW_ID]]
+
+
+class GroupStatisticsUdf(_GroupByUdf):
+    # SQL templates and types of the statistics computed per group and column
+    STATISTICS = {
+        "count": ("COUNT({0})", DType.INT),
+        "sum": ("SUM(CAST({0} AS DOUBLE))", DType.FLOAT),
+        "sum_sq": ("SUM(CAST({0} AS DOUBLE) * CAST({0} AS DOUBLE))", DType.FLOAT),
+        "min": ("MIN(CAST({0} AS DOUBLE))", DType.FLOAT),
+        "max": ("MAX(CAST({0} AS DOUBLE))", DType.FLOAT),
+    }
+
+    @property
+    def output_schema(self):
+        schema = [(GROUP_COLUMN, self.group_dtype)]
+        for column in self.value_columns:
+            statistics_columns = get_group_statistics_columns(column)
+            schema.extend(
+                (statistics_columns[statistic], dtype)
+                for statistic, (_, dtype) in self.STATISTICS.items()
+            )
+        return schema
+
+    def get_exec_stmt(self, udf_name: None, output_table_names: List[str]) -> str:
+        main_output_name, *_ = output_table_names
+        groups_table, values_table = self._get_tables()
+
+        group_column = self.ast.Column(
+            name=self.group_column, table=groups_table, alias=GROUP_COLUMN
+        )
+        columns = [group_column]
+        for column in self.value_columns:
+            value = values_table.c[column].compile(use_alias=False)
+            statistics_columns = get_group_statistics_columns(column)
+            columns.extend(
+                self.ast.ConstColumn(
+                    value=template.format(value), alias=statistics_columns[statistic]
+                )
+                for statistic, (template, _) in self.STATISTICS.items()
+            )
+
+        sel = self.ast.Select(
+            columns=columns,
+            from_=[groups_table, values_table],
+            where=self._get_join_clause(groups_table, values_table),
+            groupby=[self.ast.Column(name=self.group_column, table=groups_table)],
+        )
+        return self._insert_from_subquery(main_output_name, sel.compile())
+
+
+class CategoryCountsUdf(_GroupByUdf):
+    @property
+    def output_schema(self):
+        return [
+            (VARIABLE_COLUMN, DType.STR),
+            (GROUP_COLUMN, self.group_dtype),
+            (VALUE_COLUMN, DType.STR),
+            (COUNT_COLUMN, DType.INT),
+        ]
+
+    def get_exec_stmt(self, udf_name: None, output_table_names: List[str]) -> str:
+        main_output_name, *_ = output_table_names
+        groups_table, values_table = self._get_tables()
+
+        # One GROUP BY per column of 'values', all stored in the same table
+        selects = []
+        for column in self.value_columns:
+            value = values_table.c[column].compile(use_alias=False)
+            sel = self.ast.Select(
+                columns=[
+                    self.ast.ConstColumn(value=f"'{column}'", alias=VARIABLE_COLUMN),
+                    self.ast.Column(
+                        name=self.group_column, table=groups_table, alias=GROUP_COLUMN
+                    ),
+                    self.ast.ConstColumn(
+                        value=f"CAST({value} AS {DType.STR.to_sql()})",
+                        alias=VALUE_COLUMN,
+                    ),
+                    self.ast.ConstColumn(value="COUNT(*)", alias=COUNT_COLUMN),
+                ],
+                from_=[groups_table, values_table],
+                where=self._get_join_clause(groups_table, values_table),
+                groupby=[
+                    self.ast.Column(name=self.group_column, table=groups_table),
+                    self.ast.Column(name=column, table=values_table),
+                ],
+            )
+            selects.append(sel.compile())
+        union = "\nUNION ALL\n".join(selects)
+        return self._insert_from_subquery(main_output_name, union)
+
+
+class BinCountsUdf(_AggregatesUdf):
+    @property
+    def output_schema(self):
+        bin_dtype = DType.STR if self.bins is None else DType.INT
+        return [
+            (VARIABLE_COLUMN, DType.STR),
+            (GROUP_COLUMN, DType.STR),
+            (BIN_COLUMN, bin_dtype),
+            (COUNT_COLUMN, DType.INT),
+        ]
+
+    def _get_binned_query(self) -> str:
+        # The grouping columns and the bin of the value of every row
+        table = self.ast.Table(
+            name=self.data.name, columns=[self.variable] + list(self.groupings)
+        )
+        groupings = [table.c[grouping] for grouping in self.groupings]
+        value = table.c[self.variable].compile(use_alias=False)
+        if self.bins is None:
+            bin_column = self.ast.ConstColumn(
+                value=f"CAST({value} AS {DType.STR.to_sql()})", alias=BIN_COLUMN
+            )
+            return self.ast.Select(columns=groupings + [bin_column], from_=[table])
+
+        # The same bins as numpy.histogram, which computes the index of the bin of
+        # each value and then corrects it with the edges of the bin, the last one
+        # including its right edge. The values out of the range have no bin.
+        first_edge, last_edge = (float(edge) for edge in self.bin_range)
+        norm = self.bins / (last_edge - first_edge)
+        step = (last_edge - first_edge) / self.bins
+        last_bin = self.bins - 1
+        index = (
+            f"CASE WHEN {value} >= {first_edge!r} AND {value} <= {last_edge!r} "
+            f"THEN CAST(FLOOR((CAST({value} AS DOUBLE) - {first_edge!r}) * {norm!r}) "
+            f"AS INT) END"
+        )
+        indexed = self.ast.Select(
+            columns=groupings
+            + [
+                self.ast.ConstColumn(value=f"CAST({value} AS DOUBLE)", alias="value"),
+                self.ast.ConstColumn(value=index, alias="bin_index"),
+            ],
+            from_=[table],
+        )
+        indexed_table = self.ast.Table(
+            name=f"(\n{indexed.compile()}\n)",
+            columns=self.groupings + ["value", "bin_index"],
+            alias="indexed",
+        )
+        value = indexed_table.c["value"].compile(use_alias=False)
+        index = indexed_table.c["bin_index"].compile(use_alias=False)
+        last_bin_edge = last_bin * step + first_edge
+        bin_ = "\n".join(
+            [
+                "CASE",
+                f"    WHEN {index} >= {last_bin} AND {value} < {last_bin_edge!r} "
+                f"THEN {last_bin - 1}",
+                f"    WHEN {index} >= {last_bin} THEN {last_bin}",
+                f"    WHEN {value} < {index} * {step!r} + {first_edge!r} "
+                f"THEN {index} - 1",
+                f"    WHEN {value} >= ({index} + 1) * {step!r} + {first_edge!r} "
+                f"THEN {index} + 1",
+                f"    ELSE {index}",
+                "END",
+            ]
+        )
+        return self.ast.Select(
+            columns=[indexed_table.c[grouping] for grouping in self.groupings]
+            + [self.ast.ConstColumn(value=bin_, alias=BIN_COLUMN)],
+            from_=[indexed_table],
+        )
+
+    def get_exec_stmt(self, udf_name: None, output_table_names: List[str]) -> str:
+        main_output_name, *_ = output_table_names
+        binned = self.ast.Table(
+            name=f"(\n{self._get_binned_query().compile()}\n)",
+            columns=list(self.groupings) + [BIN_COLUMN],
+            alias="binned",
+        )
+        bin_column = binned.c[BIN_COLUMN]
+        str_type = DType.STR.to_sql()
+
+        # The overall counts and the counts per grouping are computed by a single
+        # GROUP BY, with a grouping set for each of them. The grouping of a row is
+        # given by the GROUPING function, which is 0 for the grouped columns.
+        variable_cases, group_cases = [], []
+        for grouping in self.groupings:
+            group = binned.c[grouping].compile(use_alias=False)
+            condition = f"GROUPING({group}) = 0"
+            variable_cases.append(f"WHEN {condition} THEN '{grouping}'")
+            group_cases.append(f"WHEN {condition} THEN CAST({group} AS {str_type})")
+        variable = " ".join(["CASE", *variable_cases, "ELSE '' END"])
+        group_value = " ".join(["CASE", *group_cases, "END"])
+        if not self.groupings:
+            variable, group_value = "''", f"CAST(NULL AS {str_type})"
+
+        grouping_sets = [[bin_column]] + [
+            [binned.c[grouping], bin_column] for grouping in self.groupings
+        ]
+        grouping_sets = ",\n".join(
+            "    (" + ", ".join(column.compile() for column in grouping_set) + ")"
+            for grouping_set in grouping_sets
+        )
+        sel = self.ast.Select(
+            columns=[
+                self.ast.ConstColumn(value=variable, alias=VARIABLE_COLUMN),
+                self.ast.ConstColumn(value=group_value, alias=GROUP_COLUMN),
+                bin_column,
+                self.ast.ConstColumn(value="COUNT(*)", alias=COUNT_COLUMN),
+            ],
+            from_=[binned],
+            groupby=[
+                self.ast.ConstColumn(
+                    value=f"GROUPING SETS (\n{grouping_sets}\n)", alias=""
+                )
+            ],
+        )
+        return self._insert_from_subquery(main_output_name, sel.compile())
@@ -19,6 +19,7 @@ from exareme2.algorithms.exareme2.udfgen import state
 from exareme2.algorithms.exareme2.udfgen import tensor
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
+from exareme2.algorithms.exareme2.udfgen import udfio
 
 T = TypeVar("T")
 S = TypeVar("S")
@@ -256,23 +257,21 @@ def compute_metrics2(X, global_transfer, n_clusters):
     from sklearn.metrics.pairwise import euclidean_distances
 
     centers = numpy.array(global_transfer["centers"])
-    distances = euclidean_distances(X, centers)
-
-    labels = numpy.argmin(distances, axis=1)
 
-    labels = numpy.array(labels)
-    sum_list = []
-    count_list = []
-    for i in range(n_clusters):
-        relevant_features = numpy.where(labels == i)
-        X_clust = X[relevant_features, :]
-        X_clust = X_clust[0, :, :]
-        X_sum = numpy.sum(X_clust, axis=0)
-        X_count = X_clust.shape[0]
-        # raise ValueError(str(relevant_features)+''+str(labels.shape)+' '+str(X.shape)+' '+str(X_sum.shape)+' '+str(X_clust.shape))
-        # metrics[i] = {'X_sum': X_sum.tolist(),'X_count':X_count}
-        sum_list.append(X_sum.tolist())
-        count_list.append(X_count)
+    # The points are assigned to their clusters in chunks of rows, accumulating
+    # the sums and the counts per cluster, so that the distance matrix never
+    # grows with the number of points.
+    sums = numpy.zeros((n_clusters, X.shape[1]))
+    counts = numpy.zeros(n_clusters, dtype=int)
+    for rows in udfio.iter_chunks(len(X)):
+        X_chunk = X[rows]
+        labels = numpy.argmin(euclidean_distances(X_chunk, centers), axis=1)
+        for i in range(n_clusters):
+            X_clust = X_chunk[labels == i]
+            sums[i] += numpy.sum(X_clust, axis=0)
+            counts[i] += X_clust.shape[0]
+    sum_list = sums.tolist()
+    count_list = counts.tolist()
 
     secure_transfer_ = {}
     secure_transfer_["sum_list"] = {
@@ -1,4 +1,6 @@
+from typing import Hashable
 from typing import List
+from typing import Optional
 
 import numpy
 import scipy.stats as stats
@@ -15,6 +17,7 @@ from exareme2.algorithms.exareme2.udfgen import relation
 from exareme2.algorithms.exareme2.udfgen import secure_transfer
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
+from exareme2.algorithms.exareme2.udfgen import udfio
 from exareme2.algorithms.specifications import AlgorithmName
 from exareme2.worker_communication import BadUserInput
 
@@ -40,7 +43,9 @@ class LogisticRegressionAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
         ybin = LabelBinarizer(self.engine, positive_class).transform(y)
 
-        lr = LogisticRegression(self.engine)
+        lr = LogisticRegression(
+            self.engine, warm_start_key=(y.columns[0], positive_class)
+        )
         lr.fit(X=X, y=ybin)
 
         summary = compute_summary(model=lr)
@@ -55,15 +60,23 @@ class LogisticRegressionAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
 
 class LogisticRegression:
-    def __init__(self, engine):
+    def __init__(self, engine, warm_start_key: Optional[Hashable] = None):
+        """
+        When a 'warm_start_key', identifying the target of the model, is given,
+        the training starts from the coefficients of a previous model with the
+        same key and covariates, if the engine provides them, and the final
+        coefficients are stored for the later models.
+        """
+        self.engine = engine
         self.local_run = engine.run_udf_on_local_workers
         self.global_run = engine.run_udf_on_global_worker
+        self.warm_start_key = warm_start_key
 
     def fit(self, X, y):
         self.p = len(X.columns)
 
         # init model
-        coeff = [0] * self.p
+        coeff = self._get_initial_coeff(X.columns)
         local_transfers = self.local_run(
             self._fit_init_local,
             keyword_args={"y": y},
@@ -102,6 +115,20 @@ class LogisticRegression:
         self.coeff = coeff
         self.ll = transfer_data["ll"]
         self.H_inv = transfer_data["H_inv"]
+        if self.warm_start_key is not None:
+            self.engine.set_warm_start_params(
+                self._get_warm_start_key(X.columns), coeff
+            )
+
+    def _get_initial_coeff(self, columns) -> List[float]:
+        if self.warm_start_key is not None:
+            coeff = self.engine.get_warm_start_params(self._get_warm_start_key(columns))
+            if coeff is not None and len(coeff) == self.p:
+                return list(coeff)
+        return [0] * self.p
+
+    def _get_warm_start_key(self, columns):
+        return ALGORITHM_NAME, self.warm_start_key, tuple(columns)
 
     @staticmethod
     @udf(y=relation(), return_type=secure_transfer(sum_op=True))
@@ -139,30 +166,38 @@ class LogisticRegression:
     def _fit_local_step(X, y, coeff):
         from scipy import special
 
-        # Add a second axis to coeff to make it a proper column vector.
-        # Simplifies algebraic manipulations later.
-        coeff = numpy.array(coeff)[:, numpy.newaxis]
-
-        X = X.to_numpy()
-        y = y.to_numpy()
-
-        # auxiliary quantities
-        eta = X @ coeff
-        mu = special.expit(eta)
-        w = mu * (1 - mu)
-
-        # The computation of the Hessian could have been writen as
-        #     X.T @ numpy.diag(d) @ X
-        # However, this generates a large (n_obs, n_obs) diagonal matrix.
-        # Instead, the version using Einstein summation is memory efficient
-        # thanks to the optimized tensor constraction algorithms behind einsum.
-        H = numpy.einsum("ji, j, jk -> ik", X, w.squeeze(), X)
-
-        # gradient
-        grad = numpy.einsum("ji, j -> i", X, (y - mu).squeeze())
-
-        # log-likelihood
-        ll = numpy.sum(special.xlogy(y, mu) + special.xlogy(1 - y, 1 - mu))
+        coeff = numpy.array(coeff)
+        p = len(coeff)
+
+        # The local data are processed in chunks of rows, accumulating the
+        # Hessian, the gradient and the log-likelihood, so that the auxiliary
+        # arrays below never grow with the number of observations.
+        H = numpy.zeros((p, p))
+        grad = numpy.zeros(p)
+        ll = 0.0
+        for rows in udfio.iter_chunks(len(X)):
+            X_chunk = X.iloc[rows].to_numpy()
+            y_chunk = y.iloc[rows].to_numpy().ravel()
+
+            # auxiliary quantities
+            eta = X_chunk @ coeff
+            mu = special.expit(eta)
+            w = mu * (1 - mu)
+
+            # The computation of the Hessian could have been writen as
+            #     X.T @ numpy.diag(d) @ X
+            # However, this generates a large (n_obs, n_obs) diagonal matrix.
+            # Instead, the version using Einstein summation is memory efficient
+            # thanks to the optimized tensor constraction algorithms behind einsum.
+            H += numpy.einsum("ji, j, jk -> ik", X_chunk, w, X_chunk)
+
+            # gradient
+            grad += numpy.einsum("ji, j -> i", X_chunk, y_chunk - mu)
+
+            # log-likelihood
+            ll += numpy.sum(
+                special.xlogy(y_chunk, mu) + special.xlogy(1 - y_chunk, 1 - mu)
+            )
 
         stransfer = {}
         stransfer["H"] = {"data": H.tolist(), "operation": "sum", "type": "float"}
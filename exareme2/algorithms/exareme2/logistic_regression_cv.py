@@ -41,7 +41,15 @@ class LogisticRegressionCVAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
         # Perform cross-validation
         kf = KFold(self.engine, n_splits=n_splits)
-        models = [LogisticRegression(self.engine) for _ in range(n_splits)]
+        # Each fold warm starts from its own model of a previous execution, the
+        # fold index keeping it apart from the other folds and from the model
+        # trained on all the data by the logistic regression
+        models = [
+            LogisticRegression(
+                self.engine, warm_start_key=(y.columns[0], positive_class, fold)
+            )
+            for fold in range(n_splits)
+        ]
         probas, y_true = cross_validate(X, ybin, models, kf, pred_type="probabilities")
 
         # Patrial and total confusion matrices
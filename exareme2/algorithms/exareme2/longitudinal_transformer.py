@@ -1,10 +1,12 @@
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from exareme2 import DType
 from exareme2.algorithms.exareme2.udfgen import AdhocUdfGenerator
@@ -85,25 +87,9 @@ class LongitudinalTransformerRunner:
         if set(strategies.keys()) != var_names:
             raise BadUserInput(f"A strategy must be selected for all variables.")
 
-        # Split strategies to X and Y part
-        x_strats = {
-            name: strat
-            for name, strat in strategies.items()
-            if name in self.variables.x
-        }
-        y_strats = {
-            name: strat
-            for name, strat in strategies.items()
-            if name in self.variables.y
-        }
-
-        lt_x = LongitudinalTransformer(self.engine, metadata, x_strats, visit1, visit2)
-        X = lt_x.transform(X)
-        metadata = lt_x.transform_metadata(metadata)
-
-        lt_y = LongitudinalTransformer(self.engine, metadata, y_strats, visit1, visit2)
-        y = lt_y.transform(y)
-        metadata = lt_y.transform_metadata(metadata)
+        lt = LongitudinalTransformer(self.engine, metadata, strategies, visit1, visit2)
+        X, y = lt.transform(X, y)
+        metadata = lt.transform_metadata(metadata)
 
         data = (X, y)
 
@@ -118,23 +104,23 @@ class LongitudinalTransformer:
                 raise BadUserInput(msg)
 
         self._local_run = engine.run_udf_on_local_workers
-        self._global_run = engine.run_udf_on_global_worker
         self.metadata = metadata
         self.strategies = strategies
         self.visit1 = visit1
         self.visit2 = visit2
 
-    def transform(self, X):
-        schema = self._make_output_schmema()
+    def transform(self, X, y):
+        """Transforms both relations with a single local command."""
         return self._local_run(
             func=LongitudinalTransformerUdf,
             keyword_args={
-                "dataframe": X,
+                "x": X,
+                "y": y,
                 "visit1": self.visit1,
                 "visit2": self.visit2,
                 "strategies": self.strategies,
             },
-            output_schema=schema,
+            share_to_global=[False, False],
         )
 
     def transform_metadata(self, metadata: dict) -> dict:
@@ -144,84 +130,122 @@ class LongitudinalTransformer:
                 metadata[f"{varname}_diff"] = metadata.pop(varname)
         return metadata
 
-    def _make_output_schmema(self):
-        def format_name(name: str, strategy: str) -> str:
-            return f"{name}_diff" if strategy == "diff" else name
 
-        def make_dtype(name: str) -> DType:
-            return DType.from_cde(self.metadata[name]["sql_type"])
-
-        schema = [("row_id", DType.INT)]
-        schema += [
-            (format_name(name, strategy), make_dtype(name))
-            for name, strategy in self.strategies.items()
-        ]
-        return schema
+def _format_name(name: str, strategy: str) -> str:
+    return f"{name}_diff" if strategy == "diff" else name
 
 
 class LongitudinalTransformerUdf(AdhocUdfGenerator):
+    """
+    Pairs the visits 'visit1' and 'visit2' of each subject, in relations 'x'
+    and 'y' having the 'subjectid' and 'visitid' columns, keeping the row_id of
+    the first visit and a column per variable of 'strategies'. The transformed
+    relations are the two outputs, each one a view over a single self-join of
+    its relation, so nothing is materialized.
+    """
+
+    num_outputs = 2
+    creates_views = True
+
     @property
     def output_schema(self):
-        return self._output_schema
+        return self._get_output_schema(self.x)
 
-    def get_definition(self, udf_name: str, output_table_names: List[str]) -> str:
+    def get_exec_stmt(self, udf_name: None, output_table_names: List[str]) -> str:
         return ""
 
-    def get_exec_stmt(self, udf_name: None, output_table_names: List[str]) -> str:
-        table_name, *_ = output_table_names
-
-        # Left subquery for join
-        left_terms = [self.ast.Column("*")]
-        left_select = self.ast.Select(
-            columns=left_terms,
-            from_=[self.ast.Table(name=self.dataframe.name, columns=left_terms)],
-            where=[self.ast.Column("visitid") == self.visit1],
-        )
+    def get_exec_stmts(
+        self, udf_name: None, output_table_names: List[str]
+    ) -> List[str]:
+        # The views are created by the creation statements of the results
+        return []
 
-        # Right subquery for join
-        right_terms = [self.ast.Column("*")]
-        right_select = self.ast.Select(
-            columns=right_terms,
-            from_=[self.ast.Table(name=self.dataframe.name, columns=right_terms)],
-            where=[self.ast.Column("visitid") == self.visit2],
-        )
+    def get_results(self, output_table_names: List[str]) -> List[UDFGenTableResult]:
+        results = []
+        for table, view_name in zip((self.x, self.y), output_table_names):
+            schema = self._get_output_schema(table)
+            results.append(
+                UDFGenTableResult(
+                    table_name=view_name,
+                    table_schema=schema,
+                    create_query=self._get_create_view(table, view_name, schema),
+                )
+            )
+        return results
 
-        # Main select query
-        join = self.ast.Join(
-            left_select,
-            right_select,
-            l_alias="t1",
-            r_alias="t2",
-            on="subjectid",
-            type="inner",
+    def _get_strategies(self, table) -> Tuple[Tuple[str, str], ...]:
+        return tuple(
+            (name, self.strategies[name])
+            for name in table.column_names
+            if name in self.strategies
         )
-        main_terms = [self.ast.Column("row_id", table="t1")]
-        for colname, strategy in self.strategies.items():
-            main_terms.append(self._term_from_strategy(strategy, colname))
-        # Currently Select cannot accept a Join in the from_ arg, and it's
-        # probably not worth the effort to make this change. Instead, I create
-        # a table having the JOIN expression for its name.
-        table = self.ast.Table(name=join.compile(), columns=main_terms)
-        select_main = self.ast.Select(main_terms, from_=[table])
-
-        return self.ast.Insert(table=table_name, values=select_main).compile()
 
-    def get_results(self, output_table_names: List[str]) -> List[UDFGenTableResult]:
-        table_name, *_ = output_table_names
-        create_stmt = self.ast.CreateTable(table_name, self.output_schema).compile()
-        return [
-            UDFGenTableResult(
-                table_name=table_name,
-                table_schema=self.output_schema,
-                create_query=create_stmt,
-            )
+    def _get_output_schema(self, table) -> List[Tuple[str, DType]]:
+        dtypes = {column.name: column.dtype for column in table.schema_.columns}
+        schema = [("row_id", DType.INT)]
+        schema += [
+            (_format_name(name, strategy), dtypes[name])
+            for name, strategy in self._get_strategies(table)
         ]
+        return schema
+
+    def _get_create_view(
+        self, table, view_name: str, schema: List[Tuple[str, DType]]
+    ) -> str:
+        select = _get_longitudinal_select(
+            self.visit1, self.visit2, self._get_strategies(table)
+        )
+        select = select.replace(_DATA_PLACEHOLDER, table.name)
+        # The columns are named explicitly, the differences having no name
+        columns = ",".join(f'"{name}"' for name, _ in schema)
+        return f"CREATE VIEW {view_name}({columns}) AS\n{select};"
+
+
+# The name of the relation in the cached query, replaced by the actual one
+_DATA_PLACEHOLDER = "$data"
+
+
+@lru_cache(maxsize=128)
+def _get_longitudinal_select(
+    visit1: str, visit2: str, strategies: Tuple[Tuple[str, str], ...]
+) -> str:
+    """
+    Returns the self-join pairing the visits of each subject, compiled once per
+    visit pair and variables.
+    """
+    ast = AdhocUdfGenerator.ast
+
+    def select_visit(visit):
+        terms = [ast.Column("*")]
+        return ast.Select(
+            columns=terms,
+            from_=[ast.Table(name=_DATA_PLACEHOLDER, columns=terms)],
+            where=[ast.Column("visitid") == visit],
+        )
 
-    def _term_from_strategy(self, strategy, colname):
-        if strategy == "first":
-            return self.ast.Column(colname, "t1")
-        elif strategy == "second":
-            return self.ast.Column(colname, "t2")
-        elif strategy == "diff":
-            return self.ast.Column(colname, "t2") - self.ast.Column(colname, "t1")
-        raise NotImplementedError
+    join = ast.Join(
+        select_visit(visit1),
+        select_visit(visit2),
+        l_alias="t1",
+        r_alias="t2",
+        on="subjectid",
+        type="inner",
+    )
+    terms = [ast.Column("row_id", table="t1")]
+    terms += [_term_from_strategy(strategy, name) for name, strategy in strategies]
+    # Currently Select cannot accept a Join in the from_ arg, and it's
+    # probably not worth the effort to make this change. Instead, I create
+    # a table having the JOIN expression for its name.
+    table = ast.Table(name=join.compile(), columns=terms)
+    return ast.Select(terms, from_=[table]).compile()
+
+
+def _term_from_strategy(strategy, colname):
+    ast = AdhocUdfGenerator.ast
+    if strategy == "first":
+        return ast.Column(colname, "t1")
+    elif strategy == "second":
+        return ast.Column(colname, "t2")
+    elif strategy == "diff":
+        return ast.Column(colname, "t2") - ast.Column(colname, "t1")
+    raise NotImplementedError
@@ -1,5 +1,7 @@
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 from typing import Union
 
@@ -8,15 +10,18 @@ from pydantic import BaseModel
 
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
+from exareme2.algorithms.exareme2.group_aggregates import compute_bin_counts
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
 from exareme2.algorithms.exareme2.udfgen import MIN_ROW_COUNT
+from exareme2.algorithms.exareme2.udfgen import Aggregate
+from exareme2.algorithms.exareme2.udfgen import AggregateUdfGenerator
 from exareme2.algorithms.exareme2.udfgen import literal
-from exareme2.algorithms.exareme2.udfgen import merge_transfer
 from exareme2.algorithms.exareme2.udfgen import relation
 from exareme2.algorithms.exareme2.udfgen import secure_transfer
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
 from exareme2.algorithms.specifications import AlgorithmName
+from exareme2.worker_communication import DatasetStatistics
 
 S = TypeVar("S")
 
@@ -67,123 +72,109 @@ class MultipleHistogramsAlgorithm(Algorithm, algname=ALGORITHM_NAME):
         if yvar in xvars:
             xvars.remove(yvar)
 
+        # The counts per bin are computed by MonetDB, grouping the rows by the bin
+        # of their value, so only the counts are loaded by the local step.
         if yvar in nominal_vars:
-            locals_result = local_run(
-                func=compute_local_histogram_categorical_secure,
-                positional_args=[data, enumerations_dict, yvar, xvars],
-                share_to_global=[True],
+            histogram_bins = list(enumerations_dict[yvar].keys())
+            bin_labels = histogram_bins
+            bin_counts = compute_bin_counts(
+                self.engine, data, variable=yvar, groupings=xvars
             )
-
-            categorical_histogram = get_transfer_data(
-                global_run(
-                    func=merge_grouped_histogram_categorical_secure2,
-                    positional_args=[locals_result, xvars],
-                    share_to_locals=[False],
-                )
-            )
-            numerical_histogram = {}
-
         else:
-            local_result4 = local_run(
-                func=find_min_max_local,
-                positional_args=[data, yvar],
-                share_to_global=[True],
+            min_max = get_min_max_from_statistics(
+                self.engine.get_dataset_statistics(), yvar, xvars
             )
-            min_max_result = get_transfer_data(
-                global_run(
-                    func=find_min_max_global,
-                    positional_args=[local_result4],
-                    share_to_locals=[False],
+            if min_max is None:
+                local_min_max = local_run(
+                    func=MinMaxUdf,
+                    keyword_args=dict(data=data, variable=yvar),
+                    share_to_global=[True],
                 )
-            )
-            min_value = min_max_result["min_value"]
-            max_value = min_max_result["max_value"]
-            local_result5, bins_transfer = local_run(
-                func=compute_local_histogram_numerical_secure2,
-                positional_args=[
-                    data,
-                    enumerations_dict,
-                    bins,
-                    yvar,
-                    xvars,
-                    min_value,
-                    max_value,
-                ],
-                share_to_global=[True, True],
-            )
-
-            numerical_histogram = get_transfer_data(
-                global_run(
-                    func=merge_grouped_histogram_numerical_secure2,
-                    positional_args=[local_result5, bins_transfer, xvars],
-                    share_to_locals=[False],
+                min_max_result = get_transfer_data(
+                    global_run(
+                        func=find_min_max_global,
+                        positional_args=[local_min_max],
+                        share_to_locals=[False],
+                    )
                 )
+                min_max = (min_max_result["min_value"], min_max_result["max_value"])
+            bin_edges = numpy.histogram_bin_edges([], bins=bins, range=min_max)
+            histogram_bins = bin_edges.tolist()
+            bin_labels = list(range(bins))
+            bin_counts = compute_bin_counts(
+                self.engine,
+                data,
+                variable=yvar,
+                groupings=xvars,
+                bins=bins,
+                bin_range=[histogram_bins[0], histogram_bins[-1]],
             )
-            categorical_histogram = {}
-
-        return_list = []
-        if yvar in nominal_vars:
-            categorical_histogram1 = Histogram(
-                var=yvar,
-                bins=list(enumerations_dict[yvar].keys()),
-                counts=categorical_histogram["categorical_histogram"],
-            )
-            return_list.append(categorical_histogram1)
-            if xvars:
-                for i, x_variable in enumerate(xvars):
-                    possible_groups = enumerations_dict[x_variable].keys()
-                    possible_values = list(enumerations_dict[yvar].keys())
-                    for j, curr_group in enumerate(possible_groups):
-                        curr_group_histogram = Histogram(
-                            var=yvar,
-                            grouping_var=x_variable,
-                            grouping_enum=curr_group,
-                            bins=possible_values,
-                            counts=categorical_histogram[
-                                "grouped_histogram_categorical"
-                            ][i][j],
-                        )
-                        return_list.append(curr_group_histogram)
 
-        else:
-            numerical_histogram1 = Histogram(
-                var=yvar,
-                bins=numerical_histogram["numerical_bins"],
-                counts=numerical_histogram["histogram"],
+        locals_result = local_run(
+            func=compute_local_histograms,
+            positional_args=[bin_counts, bin_labels, enumerations_dict, xvars],
+            share_to_global=[True],
+        )
+        histograms = get_transfer_data(
+            global_run(
+                func=merge_histograms,
+                positional_args=[locals_result, xvars],
+                share_to_locals=[False],
             )
-            return_list.append(numerical_histogram1)
-            if xvars:
-                for i, x_variable in enumerate(xvars):
-                    possible_groups = enumerations_dict[x_variable].keys()
-                    for j, curr_group in enumerate(possible_groups):
-                        curr_group_histogram = Histogram(
-                            var=yvar,
-                            grouping_var=x_variable,
-                            grouping_enum=curr_group,
-                            bins=numerical_histogram["numerical_bins"],
-                            counts=numerical_histogram["grouped_histogram"][i][j],
-                        )
-                        return_list.append(curr_group_histogram)
+        )
+
+        return_list = [
+            Histogram(var=yvar, bins=histogram_bins, counts=histograms["histogram"])
+        ]
+        for i, x_variable in enumerate(xvars):
+            possible_groups = enumerations_dict[x_variable].keys()
+            for j, curr_group in enumerate(possible_groups):
+                curr_group_histogram = Histogram(
+                    var=yvar,
+                    grouping_var=x_variable,
+                    grouping_enum=curr_group,
+                    bins=histogram_bins,
+                    counts=histograms["grouped_histogram"][i][j],
+                )
+                return_list.append(curr_group_histogram)
 
         ret_val = HistogramResult1(histogram=return_list)
         return ret_val
 
 
-@udf(
-    data=relation(S),
-    column=literal(),
-    return_type=[secure_transfer(sum_op=True, min_op=True, max_op=True)],
-)
-def find_min_max_local(data, column):
-    min_value = data[column].min()
-    max_value = data[column].max()
+def get_min_max_from_statistics(
+    dataset_statistics: Optional[Dict[str, DatasetStatistics]],
+    yvar: str,
+    xvars: List[str],
+) -> Optional[Tuple[float, float]]:
+    """
+    Returns the min and the max of 'yvar' stored in the statistics of the
+    datasets. They are the ones of the data of the algorithm only when no row is
+    dropped because of a missing value of 'yvar' or of the 'xvars'.
+    """
+    if not dataset_statistics:
+        return None
+    statistics = [
+        dataset.columns.get(var)
+        for dataset in dataset_statistics.values()
+        for var in [yvar] + xvars
+    ]
+    if any(column is None or column.null_count for column in statistics):
+        return None
+    yvar_statistics = [dataset.columns[yvar] for dataset in dataset_statistics.values()]
+    return (
+        min(column.min for column in yvar_statistics),
+        max(column.max for column in yvar_statistics),
+    )
 
-    secure_transfer_ = {
-        "min": {"data": float(min_value), "operation": "min", "type": "float"},
-        "max": {"data": float(max_value), "operation": "max", "type": "float"},
-    }
 
-    return secure_transfer_
+class MinMaxUdf(AggregateUdfGenerator):
+    def get_aggregates(self):
+        value = self.column("data", self.variable)
+        return {
+            "min": Aggregate(self.sql.min(value), operation="min"),
+            "max": Aggregate(self.sql.max(value), operation="max"),
+        }
 
 
 @udf(
@@ -200,172 +191,64 @@ def find_min_max_global(locals_result):
 
 
 @udf(
-    data=relation(S),
+    bin_counts=relation(S),
+    bin_labels=literal(),
     metadata=literal(),
-    yvar=literal(),
     xvars=literal(),
-    return_type=[secure_transfer(sum_op=True, min_op=True, max_op=True)],
+    return_type=[secure_transfer(sum_op=True)],
 )
-def compute_local_histogram_categorical_secure(data, metadata, yvar, xvars):
-    possible_enumerations = metadata[yvar].keys()
-    local_counts = data[yvar].value_counts().to_dict()
-    categorical_histogram_list = []
-    for curr_key in possible_enumerations:
-        curr_value = local_counts.get(curr_key, 0)
-        categorical_histogram_list.append(curr_value)
-
-    secure_transfer_ = {}
-    secure_transfer_["categorical_histogram"] = {
-        "data": categorical_histogram_list,
-        "operation": "sum",
-        "type": "int",
+def compute_local_histograms(bin_counts, bin_labels, metadata, xvars):
+    # Lays the counts computed by MonetDB out on the bins and on the enumerations
+    # of the grouping variables, the counts of the absent ones being zero
+    bin_positions = {label: i for i, label in enumerate(bin_labels)}
+    group_positions = {
+        x_variable: {group: j for j, group in enumerate(metadata[x_variable].keys())}
+        for x_variable in xvars
     }
-    if xvars:
-        final_dict = {}
-        for x_variable in xvars:
-            local_grouped_histogram = {}
-            grouped = data[[yvar, x_variable]].groupby(x_variable)
-            for group_name, curr_grouped in grouped:
-                local_grouped_histogram[group_name] = (
-                    curr_grouped[yvar].value_counts().to_dict()
-                )
-            final_dict[x_variable] = local_grouped_histogram
-
-            possible_groups = metadata[x_variable].keys()
-
-            for curr_group in possible_groups:
-                curr_result = final_dict[x_variable].get(curr_group, {})
-                final_dict[x_variable][curr_group] = curr_result
-
-        grouped_list = []
-        for x_variable in xvars:
-            possible_groups = metadata[x_variable].keys()
-            possible_values = metadata[yvar].keys()
-            groups_list = []
-            for curr_group in possible_groups:
-                elements_list = []
-                for curr_element in possible_values:
-                    curr_result = final_dict[x_variable][curr_group].get(
-                        curr_element, 0
-                    )
-                    elements_list.append(curr_result)
-                groups_list.append(elements_list)
-            grouped_list.append(groups_list)
-        secure_transfer_["grouped_histogram_categorical"] = {
-            "data": grouped_list,
-            "operation": "sum",
-            "type": "int",
-        }
-    return secure_transfer_
-
-
-@udf(
-    locals_result=secure_transfer(sum_op=True, min_op=True, max_op=True),
-    xvars=literal(),
-    min_row_count=MIN_ROW_COUNT,
-    return_type=[transfer()],
-)
-def merge_grouped_histogram_categorical_secure2(locals_result, xvars, min_row_count):
-    return_dict = {}
-    histogram_merge = locals_result["categorical_histogram"]
-    return_dict["categorical_histogram"] = [
-        curr_value if curr_value >= min_row_count else None
-        for curr_value in histogram_merge
+    histogram = [0] * len(bin_labels)
+    grouped_histogram = [
+        [[0] * len(bin_labels) for _ in metadata[x_variable].keys()]
+        for x_variable in xvars
     ]
-    if xvars:
-        grouped_merge = locals_result["grouped_histogram_categorical"]
-        x_variable_return = []
-        for x_variable in grouped_merge:
-            group_list = []
-            for curr_group in x_variable:
-                elements_list = []
-                for curr_element in curr_group:
-                    curr_value = curr_element if curr_element >= min_row_count else None
-                    elements_list.append(curr_value)
-                group_list.append(elements_list)
-            x_variable_return.append(group_list)
-        return_dict["grouped_histogram_categorical"] = x_variable_return
-    return return_dict
-
 
-@udf(
-    data=relation(S),
-    metadata=literal(),
-    bins=literal(),
-    yvar=literal(),
-    xvars=literal(),
-    min_value=literal(),
-    max_value=literal(),
-    return_type=[secure_transfer(sum_op=True, min_op=True, max_op=True), transfer()],
-)
-def compute_local_histogram_numerical_secure2(
-    data, metadata, bins, yvar, xvars, min_value, max_value
-):
-    def hist_func(x, min_value, max_value, bins=20):
-        hist, bins = numpy.histogram(x, range=(min_value, max_value), bins=bins)
-        return hist
-
-    final_dict = {}
-    local_histogram, local_bins = numpy.histogram(
-        data[yvar], range=(min_value, max_value), bins=bins
+    rows = bin_counts[["variable", "group_value", "bin", "count"]].itertuples(
+        index=False
     )
+    for variable, group_value, bin_label, count in rows:
+        # The values out of the bins, possible when the global range excludes
+        # a worker's values, are not counted, like numpy.histogram does
+        if bin_label not in bin_positions:
+            continue
+        position = bin_positions[bin_label]
+        if not variable:
+            histogram[position] += int(count)
+        elif group_value in group_positions[variable]:
+            group_position = group_positions[variable][group_value]
+            counts = grouped_histogram[xvars.index(variable)][group_position]
+            counts[position] += int(count)
 
     secure_transfer_ = {}
     secure_transfer_["histogram"] = {
-        "data": local_histogram.tolist(),
+        "data": histogram,
         "operation": "sum",
         "type": "int",
     }
-    transfer_ = {}
-    transfer_["bins"] = local_bins.tolist()
     if xvars:
-        final_dict = {}
-        for x_variable in xvars:
-            local_grouped_histogram = (
-                data[[yvar, x_variable]]
-                .groupby(x_variable)
-                .apply(
-                    lambda x: hist_func(
-                        x, min_value=min_value, max_value=max_value, bins=bins
-                    ).tolist()
-                )
-                .to_dict()
-            )
-            final_dict[x_variable] = local_grouped_histogram
-
-        for x_variable in xvars:
-            for curr_group in metadata[x_variable].keys():
-                result = final_dict[x_variable].get(
-                    curr_group, numpy.zeros(bins, dtype="int64").tolist()
-                )
-                final_dict[x_variable][curr_group] = result
-        x_variables_list = []
-        for x_variable in xvars:
-            groups_list = []
-            for curr_group in metadata[x_variable].keys():
-                curr_element = final_dict[x_variable][curr_group]
-                groups_list.append(curr_element)
-            x_variables_list.append(groups_list)
-
         secure_transfer_["grouped_histogram"] = {
-            "data": x_variables_list,
+            "data": grouped_histogram,
             "operation": "sum",
             "type": "int",
         }
-
-    return secure_transfer_, transfer_
+    return secure_transfer_
 
 
 @udf(
-    locals_result=secure_transfer(sum_op=True, min_op=True, max_op=True),
-    bins_transfer=merge_transfer(),
+    locals_result=secure_transfer(sum_op=True),
     xvars=literal(),
     min_row_count=MIN_ROW_COUNT,
     return_type=[transfer()],
 )
-def merge_grouped_histogram_numerical_secure2(
-    locals_result, bins_transfer, xvars, min_row_count
-):
+def merge_histograms(locals_result, xvars, min_row_count):
     return_dict = {}
     histogram_merge = locals_result["histogram"]
     return_dict["histogram"] = [
@@ -385,5 +268,4 @@ def merge_grouped_histogram_numerical_secure2(
                 group_list.append(elements_list)
             x_variable_return.append(group_list)
         return_dict["grouped_histogram"] = x_variable_return
-    return_dict["numerical_bins"] = bins_transfer[0]["bins"]
     return return_dict
@@ -5,6 +5,7 @@ from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
 from exareme2.algorithms.exareme2.crossvalidation import KFold
 from exareme2.algorithms.exareme2.crossvalidation import cross_validate
+from exareme2.algorithms.exareme2.group_aggregates import compute_category_counts
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
 from exareme2.algorithms.exareme2.metrics import confusion_matrix_multiclass
 from exareme2.algorithms.exareme2.metrics import multiclass_classification_metrics
@@ -53,6 +54,7 @@ class CategoricalNBAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
 class CategoricalNB:
     def __init__(self, engine, metadata):
+        self.engine = engine
         self.local_run = engine.run_udf_on_local_workers
         self.global_run = engine.run_udf_on_global_worker
         self.metadata = metadata
@@ -64,9 +66,17 @@ class CategoricalNB:
         sorted_cats = {var: list(sorted(cats)) for var, cats in categories.items()}
         self.categories = categories
 
+        # The counts per class and category are computed by a SQL GROUP BY, the
+        # local UDF only lays them out on the known classes and categories
+        counts = compute_category_counts(self.engine, groups=y, values=X)
         values, names = self.local_run(
             func=self._fit_local,
-            keyword_args={"X": X, "y": y, "categories": sorted_cats},
+            keyword_args={
+                "counts": counts,
+                "xvars": list(X.columns),
+                "yvar": y.columns[0],
+                "categories": sorted_cats,
+            },
             share_to_global=[True, True],
         )
         global_transf = self.global_run(
@@ -100,31 +110,40 @@ class CategoricalNB:
 
     @staticmethod
     @udf(
-        X=relation(),
-        y=relation(),
+        counts=relation(),
+        xvars=literal(),
+        yvar=literal(),
         categories=literal(),
         return_type=[secure_transfer(sum_op=True), transfer()],
     )
-    def _fit_local(X, y, categories):
-        import pandas as pd
-
-        xvars = X.columns
-        yvar = y.columns[0]
-
-        # Create single dataframe with all categorical variables
-        df = pd.DataFrame()
-        df[yvar] = pd.Categorical(y[yvar], categories=categories[yvar])
-        for xvar in xvars:
-            df[xvar] = pd.Categorical(X[xvar], categories=categories[xvar])
+    def _fit_local(counts, xvars, yvar, categories):
+        import numpy as np
 
-        count_dfs = {var: df.groupby([yvar, var]).size() for var in xvars}
-        counts = [d.values.tolist() for d in count_dfs.values()]
-        indices = {var: d.index.tolist() for var, d in count_dfs.items()}
+        keys = ["variable", "group_value", "value"]
+        counts[keys] = counts[keys].astype(str)
+        counts = counts.set_index(keys)["count"]
+
+        # Lay the counts out on every pair of class and category, in the order
+        # of the sorted categories, with zeros for the missing pairs
+        indices = {
+            xvar: [
+                (ycat, xcat) for ycat in categories[yvar] for xcat in categories[xvar]
+            ]
+            for xvar in xvars
+        }
+        count_dfs = {
+            xvar: counts.reindex(
+                [(xvar, str(ycat), str(xcat)) for ycat, xcat in index], fill_value=0
+            )
+            for xvar, index in indices.items()
+        }
+        counts = [d.values.astype(int).tolist() for d in count_dfs.values()]
 
-        # compute class counts
-        agg = df.groupby(by=yvar).agg(["count"])
-        agg = agg.swaplevel(axis=1)
-        class_count = agg.xs("count", axis=1)
+        # compute class counts, per class and variable
+        n_classes = len(categories[yvar])
+        class_count = np.array(
+            [np.reshape(count, (n_classes, -1)).sum(axis=1) for count in counts]
+        ).T
 
         stransf = {}
         stransf["counts"] = {
@@ -133,14 +152,14 @@ class CategoricalNB:
             "operation": "sum",
         }
         stransf["class_count"] = {
-            "data": class_count.values.tolist(),
+            "data": class_count.tolist(),
             "type": "int",
             "operation": "sum",
         }
 
         transf = {}
         transf["indices"] = indices
-        transf["class_index"] = class_count.index.tolist()
+        transf["class_index"] = list(categories[yvar])
 
         return stransf, transf
 
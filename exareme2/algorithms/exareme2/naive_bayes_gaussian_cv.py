@@ -8,6 +8,7 @@ from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
 from exareme2.algorithms.exareme2.crossvalidation import KFold
 from exareme2.algorithms.exareme2.crossvalidation import cross_validate
+from exareme2.algorithms.exareme2.group_aggregates import compute_group_statistics
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
 from exareme2.algorithms.exareme2.metrics import confusion_matrix_multiclass
 from exareme2.algorithms.exareme2.metrics import multiclass_classification_metrics
@@ -114,6 +115,7 @@ class GaussianNBAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
 class GaussianNB:
     def __init__(self, engine, metadata):
+        self.engine = engine
         self.local_run = engine.run_udf_on_local_workers
         self.global_run = engine.run_udf_on_global_worker
         self.metadata = metadata
@@ -125,9 +127,16 @@ class GaussianNB:
         categories = {key: categories[key] for key in sorted(categories)}
         self.categories = categories
 
+        # The counts, sums and sums of squares per class are computed by a SQL
+        # GROUP BY, the local UDF only lays them out on the known classes
+        stats = compute_group_statistics(self.engine, groups=y, values=X)
         values, names = self.local_run(
             func=self._fit_local,
-            keyword_args={"X": X, "y": y, "categories": categories},
+            keyword_args={
+                "stats": stats,
+                "xvars": list(X.columns),
+                "categories": list(categories),
+            },
             share_to_global=[True, True],
         )
         global_result = self.global_run(
@@ -149,27 +158,25 @@ class GaussianNB:
 
     @staticmethod
     @udf(
-        X=relation(),
-        y=relation(),
+        stats=relation(),
+        xvars=literal(),
         categories=literal(),
         return_type=[secure_transfer(sum_op=True), transfer()],
     )
-    def _fit_local(X, y, categories):
+    def _fit_local(stats, xvars, categories):
         import pandas as pd
 
-        data = X
-        yvar = y.columns[0]
-        data[yvar] = pd.Categorical(y[yvar], categories=categories)
-
-        def sum_sq(x):
-            return sum(x**2)
+        # Classes missing from the worker's data get zero counts and sums
+        stats.index = stats["group_value"].astype(str)
+        stats = stats.reindex([str(cat) for cat in categories]).fillna(0)
 
-        agg = data.groupby(by=yvar).agg(["count", "sum", sum_sq])
-        agg = agg.swaplevel(axis=1)
+        def get_statistic(statistic):
+            data = {xvar: stats[f"{statistic}__{xvar}"].values for xvar in xvars}
+            return pd.DataFrame(data, index=categories, columns=xvars)
 
-        counts = agg.xs("count", axis=1)
-        sums = agg.xs("sum", axis=1)
-        sums_sq = agg.xs("sum_sq", axis=1)
+        counts = get_statistic("count").astype(int)
+        sums = get_statistic("sum")
+        sums_sq = get_statistic("sum_sq")
 
         values = {}
         values["counts"] = {
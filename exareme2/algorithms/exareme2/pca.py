@@ -1,5 +1,4 @@
 from typing import List
-from typing import TypeVar
 
 import numpy
 from pydantic import BaseModel
@@ -7,9 +6,8 @@ from pydantic import BaseModel
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
-from exareme2.algorithms.exareme2.udfgen import relation
+from exareme2.algorithms.exareme2.sufficient_statistics import compute_moments
 from exareme2.algorithms.exareme2.udfgen import secure_transfer
-from exareme2.algorithms.exareme2.udfgen import state
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
 
@@ -30,109 +28,43 @@ class PCAResult(BaseModel):
 
 class PCAAlgorithm(Algorithm, algname=ALGORITHM_NAME):
     def run(self, data, metadata):
-        local_run = self.engine.run_udf_on_local_workers
-        global_run = self.engine.run_udf_on_global_worker
-
         [X_relation] = data
+        return run_pca(self.engine, X_relation)
+
+
+def run_pca(engine, X_relation) -> PCAResult:
+    """
+    Computes the PCA in a single pass over the data. Each local worker sends the
+    number of observations, the column sums and the cross-product matrix XᵀX of
+    its data, from which the global worker derives the correlation matrix.
+    """
+    local_transfers = compute_moments(engine, X_relation)
+    result = engine.run_udf_on_global_worker(
+        func=global1,
+        keyword_args=dict(local_transfers=local_transfers),
+    )
+    result = get_transfer_data(result)
 
-        local_transfers = local_run(
-            func=local1,
-            keyword_args={"x": X_relation},
-            share_to_global=[True],
-        )
-        global_state, global_transfer = global_run(
-            func=global1,
-            keyword_args=dict(local_transfers=local_transfers),
-            share_to_locals=[False, True],
-        )
-        local_transfers = local_run(
-            func=local2,
-            keyword_args=dict(x=X_relation, global_transfer=global_transfer),
-            share_to_global=[True],
-        )
-        result = global_run(
-            func=global2,
-            keyword_args=dict(local_transfers=local_transfers, prev_state=global_state),
-        )
-        result = get_transfer_data(result)
-        n_obs = result["n_obs"]
-        eigenvalues = result["eigenvalues"]
-        eigenvectors = result["eigenvectors"]
-
-        result = PCAResult(
-            title="Eigenvalues and Eigenvectors",
-            n_obs=n_obs,
-            eigenvalues=eigenvalues,
-            eigenvectors=eigenvectors,
-        )
-        return result
-
-
-S = TypeVar("S")
-
-
-@udf(x=relation(schema=S), return_type=[secure_transfer(sum_op=True)])
-def local1(x):
-    n_obs = len(x)
-    sx = numpy.einsum("ij->j", x)
-    sxx = numpy.einsum("ij,ij->j", x, x)
-
-    transfer_ = {}
-    transfer_["n_obs"] = {"data": n_obs, "operation": "sum", "type": "int"}
-    transfer_["sx"] = {"data": sx.tolist(), "operation": "sum", "type": "float"}
-    transfer_["sxx"] = {"data": sxx.tolist(), "operation": "sum", "type": "float"}
-    return transfer_
+    return PCAResult(
+        title="Eigenvalues and Eigenvectors",
+        n_obs=result["n_obs"],
+        eigenvalues=result["eigenvalues"],
+        eigenvectors=result["eigenvectors"],
+    )
 
 
-@udf(local_transfers=secure_transfer(sum_op=True), return_type=[state(), transfer()])
+@udf(local_transfers=secure_transfer(sum_op=True), return_type=[transfer()])
 def global1(local_transfers):
     n_obs = local_transfers["n_obs"]
     sx = numpy.array(local_transfers["sx"])
-    sxx = numpy.array(local_transfers["sxx"])
+    cross_products = numpy.array(local_transfers["cross_products"])
 
+    # The gramian of the centered data is XᵀX - n * means * meansᵀ and the
+    # gramian of the standardized data is the centered one scaled by the sigmas.
     means = sx / n_obs
-    sigmas = ((sxx - n_obs * means**2) / (n_obs - 1)) ** 0.5
-
-    state_ = dict(n_obs=n_obs)
-    transfer_ = dict(means=means.tolist(), sigmas=sigmas.tolist())
-    return state_, transfer_
-
-
-@udf(
-    x=relation(schema=S),
-    global_transfer=transfer(),
-    return_type=[secure_transfer(sum_op=True)],
-)
-def local2(x, global_transfer):
-    means = numpy.array(global_transfer["means"])
-    sigmas = numpy.array(global_transfer["sigmas"])
-
-    x = x.values
-    out = numpy.empty(x.shape)
-
-    numpy.subtract(x, means, out=out)
-    numpy.divide(out, sigmas, out=out)
-    gramian = numpy.einsum("ji,jk->ik", out, out)
-
-    transfer_ = {
-        "gramian": {
-            "data": gramian.tolist(),
-            "operation": "sum",
-            "type": "float",
-        }
-    }
-    return transfer_
-
-
-@udf(
-    local_transfers=secure_transfer(sum_op=True),
-    prev_state=state(),
-    return_type=[transfer()],
-)
-def global2(local_transfers, prev_state):
-    gramian = numpy.array(local_transfers["gramian"])
-    n_obs = prev_state["n_obs"]
-    covariance = gramian / (n_obs - 1)
+    centered_gramian = cross_products - n_obs * numpy.outer(means, means)
+    sigmas = (numpy.diag(centered_gramian) / (n_obs - 1)) ** 0.5
+    covariance = centered_gramian / (n_obs - 1) / numpy.outer(sigmas, sigmas)
 
     eigenvalues, eigenvectors = numpy.linalg.eig(covariance)
     idx = eigenvalues.argsort()[::-1]
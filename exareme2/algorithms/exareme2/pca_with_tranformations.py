@@ -6,12 +6,7 @@ from pydantic import BaseModel
 from exareme2 import DType
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
-from exareme2.algorithms.exareme2.helpers import get_transfer_data
-from exareme2.algorithms.exareme2.pca import PCAResult
-from exareme2.algorithms.exareme2.pca import global1
-from exareme2.algorithms.exareme2.pca import global2
-from exareme2.algorithms.exareme2.pca import local1
-from exareme2.algorithms.exareme2.pca import local2
+from exareme2.algorithms.exareme2.pca import run_pca
 from exareme2.algorithms.exareme2.udfgen import DEFERRED
 from exareme2.algorithms.exareme2.udfgen import literal
 from exareme2.algorithms.exareme2.udfgen import merge_transfer
@@ -47,7 +42,7 @@ class PCAAlgorithm(Algorithm, algname=ALGORITHM_NAME):
             ):
                 X_relation = self.handle_standardize_and_center(X_relation)
 
-        return self.perform_pca(X_relation)
+        return run_pca(self.engine, X_relation)
 
     def handle_data_transformation(self, X_relation):
         local_run = self.engine.run_udf_on_local_workers
@@ -130,41 +125,6 @@ class PCAAlgorithm(Algorithm, algname=ALGORITHM_NAME):
             raise BadUserInput(str(ex))
         raise ex
 
-    def perform_pca(self, X_relation):
-        local_run = self.engine.run_udf_on_local_workers
-        global_run = self.engine.run_udf_on_global_worker
-
-        local_transfers = local_run(
-            func=local1,
-            keyword_args={"x": X_relation},
-            share_to_global=[True],
-        )
-        global_state, global_transfer = global_run(
-            func=global1,
-            keyword_args=dict(local_transfers=local_transfers),
-            share_to_locals=[False, True],
-        )
-        local_transfers = local_run(
-            func=local2,
-            keyword_args=dict(x=X_relation, global_transfer=global_transfer),
-            share_to_global=[True],
-        )
-        result = global_run(
-            func=global2,
-            keyword_args=dict(local_transfers=local_transfers, prev_state=global_state),
-        )
-        result = get_transfer_data(result)
-        n_obs = result["n_obs"]
-        eigenvalues = result["eigenvalues"]
-        eigenvectors = result["eigenvectors"]
-
-        return PCAResult(
-            title="Eigenvalues and Eigenvectors",
-            n_obs=n_obs,
-            eigenvalues=eigenvalues,
-            eigenvectors=eigenvectors,
-        )
-
 
 S = TypeVar("S")
 
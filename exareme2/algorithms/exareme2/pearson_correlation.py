@@ -1,13 +1,11 @@
-from typing import TypeVar
-
 import numpy
 from pydantic import BaseModel
 
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
+from exareme2.algorithms.exareme2.sufficient_statistics import compute_moments
 from exareme2.algorithms.exareme2.udfgen import literal
-from exareme2.algorithms.exareme2.udfgen import relation
 from exareme2.algorithms.exareme2.udfgen import secure_transfer
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
@@ -35,17 +33,12 @@ class PearsonResult(BaseModel):
 
 class PearsonCorrelationAlgorithm(Algorithm, algname=ALGORITHM_NAME):
     def run(self, data, metadata):
-        local_run = self.engine.run_udf_on_local_workers
         global_run = self.engine.run_udf_on_global_worker
         alpha = self.algorithm_parameters["alpha"]
 
         X_relation, Y_relation = data
 
-        local_transfers = local_run(
-            func=local1,
-            keyword_args=dict(y=Y_relation, x=X_relation),
-            share_to_global=[True],
-        )
+        local_transfers = compute_moments(self.engine, X_relation, Y_relation)
 
         result = global_run(
             func=global1,
@@ -95,36 +88,6 @@ def create_dicts(global_result, row_names, column_names):
     return corr_dict, p_values_dict, ci_hi_dict, ci_lo_dict
 
 
-S = TypeVar("S")
-
-
-@udf(
-    y=relation(schema=S),
-    x=relation(schema=S),
-    return_type=[secure_transfer(sum_op=True)],
-)
-def local1(y, x):
-    n_obs = y.shape[0]
-    Y = y.to_numpy()
-    X = Y if x is None else x.to_numpy()
-
-    sx = numpy.einsum("ij->j", X)
-    sy = numpy.einsum("ij->j", Y)
-    sxx = numpy.einsum("ij,ij->j", X, X)
-    sxy = numpy.einsum("ji,jk->ki", X, Y)
-    syy = numpy.einsum("ij,ij->j", Y, Y)
-
-    transfer_ = {}
-    transfer_["n_obs"] = {"data": n_obs, "operation": "sum", "type": "int"}
-    transfer_["sx"] = {"data": sx.tolist(), "operation": "sum", "type": "float"}
-    transfer_["sxx"] = {"data": sxx.tolist(), "operation": "sum", "type": "float"}
-    transfer_["sxy"] = {"data": sxy.tolist(), "operation": "sum", "type": "float"}
-    transfer_["sy"] = {"data": sy.tolist(), "operation": "sum", "type": "float"}
-    transfer_["syy"] = {"data": syy.tolist(), "operation": "sum", "type": "float"}
-
-    return transfer_
-
-
 @udf(
     local_transfers=secure_transfer(sum_op=True),
     alpha=literal(),
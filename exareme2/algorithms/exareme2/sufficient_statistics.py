@@ -0,0 +1,137 @@
+"""
+Sufficient statistics shared by the moment-based algorithms.
+
+The local workers compute, in a single pass over their data, the number of
+observations, the column sums, the column sums of squares and the cross-product
+matrices of the given relations. The runs are memoized in the execution context,
+so algorithms needing the moments of the same view read the data only once. The
+algorithms needing only the column moments get them from SQL aggregates.
+"""
+from typing import TypeVar
+
+import numpy
+
+from exareme2.algorithms.exareme2.udfgen import Aggregate
+from exareme2.algorithms.exareme2.udfgen import AggregateUdfGenerator
+from exareme2.algorithms.exareme2.udfgen import relation
+from exareme2.algorithms.exareme2.udfgen import secure_transfer
+from exareme2.algorithms.exareme2.udfgen import udf
+
+
+def compute_moments(engine, x, y=None):
+    """
+    Computes the moments of the relation 'x' and, optionally, the cross moments of
+    'x' and 'y' on the local workers and shares them to the global worker.
+
+    The secure transfer returned contains:
+        n_obs: the number of observations
+        sx, sxx: the column sums and sums of squares of 'x'
+        cross_products: the matrix XᵀX (only when 'y' is not given)
+        sy, syy: the column sums and sums of squares of 'y' (only when 'y' is given)
+        sxy: the matrix YᵀX (only when 'y' is given)
+    """
+    if y is None:
+        return engine.run_udf_on_local_workers(
+            func=local_moments,
+            keyword_args={"x": x},
+            share_to_global=[True],
+            memoize=True,
+        )
+    return engine.run_udf_on_local_workers(
+        func=local_cross_moments,
+        keyword_args={"x": x, "y": y},
+        share_to_global=[True],
+        memoize=True,
+    )
+
+
+def compute_column_moments(engine, x, y=None):
+    """
+    Computes the same moments as 'compute_moments', except the cross products of
+    'x', with SQL aggregates only. The number of aggregates grows with the product
+    of the numbers of columns of 'x' and 'y', so it suits the algorithms working
+    on a few columns, like the t-tests.
+    """
+    keyword_args = {"x": x} if y is None else {"x": x, "y": y}
+    return engine.run_udf_on_local_workers(
+        func=ColumnMomentsUdf,
+        keyword_args=keyword_args,
+        share_to_global=[True],
+        memoize=True,
+    )
+
+
+class ColumnMomentsUdf(AggregateUdfGenerator):
+    def get_aggregates(self):
+        sql = self.sql
+        xcols = [self.column("x", col) for col in self.value_columns("x")]
+        aggregates = {
+            "n_obs": Aggregate(sql.count(), type="int"),
+            "sx": Aggregate([sql.sum(x) for x in xcols]),
+            "sxx": Aggregate([sql.sum(f"{x} * {x}") for x in xcols]),
+        }
+        if "y" not in self.__dict__:
+            return aggregates
+
+        ycols = [self.column("y", col) for col in self.value_columns("y")]
+        aggregates["sy"] = Aggregate([sql.sum(y) for y in ycols])
+        aggregates["syy"] = Aggregate([sql.sum(f"{y} * {y}") for y in ycols])
+        aggregates["sxy"] = Aggregate(
+            [[sql.sum(f"{y} * {x}") for x in xcols] for y in ycols]
+        )
+        return aggregates
+
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+@udf(x=relation(schema=S), return_type=[secure_transfer(sum_op=True)])
+def local_moments(x):
+    x = x.to_numpy(dtype=float)
+    n_obs = len(x)
+    sx = x.sum(axis=0)
+    cross_products = x.T @ x
+    sxx = numpy.diag(cross_products)
+
+    transfer_ = {}
+    transfer_["n_obs"] = {"data": n_obs, "operation": "sum", "type": "int"}
+    transfer_["sx"] = {"data": sx.tolist(), "operation": "sum", "type": "float"}
+    transfer_["sxx"] = {"data": sxx.tolist(), "operation": "sum", "type": "float"}
+    transfer_["cross_products"] = {
+        "data": cross_products.tolist(),
+        "operation": "sum",
+        "type": "float",
+    }
+    return transfer_
+
+
+@udf(
+    x=relation(schema=S),
+    y=relation(schema=T),
+    return_type=[secure_transfer(sum_op=True)],
+)
+def local_cross_moments(x, y):
+    # The rows of the two relations are aligned, so all the moments are blocks of
+    # the gramian of the concatenated data, computed with a single product.
+    x = x.to_numpy(dtype=float)
+    y = y.to_numpy(dtype=float)
+    n_x_columns = x.shape[1]
+    z = numpy.hstack([x, y])
+    n_obs = len(z)
+    sz = z.sum(axis=0)
+    gramian = z.T @ z
+    szz = numpy.diag(gramian)
+
+    sx, sy = sz[:n_x_columns], sz[n_x_columns:]
+    sxx, syy = szz[:n_x_columns], szz[n_x_columns:]
+    sxy = gramian[n_x_columns:, :n_x_columns]
+
+    transfer_ = {}
+    transfer_["n_obs"] = {"data": n_obs, "operation": "sum", "type": "int"}
+    transfer_["sx"] = {"data": sx.tolist(), "operation": "sum", "type": "float"}
+    transfer_["sxx"] = {"data": sxx.tolist(), "operation": "sum", "type": "float"}
+    transfer_["sy"] = {"data": sy.tolist(), "operation": "sum", "type": "float"}
+    transfer_["syy"] = {"data": syy.tolist(), "operation": "sum", "type": "float"}
+    transfer_["sxy"] = {"data": sxy.tolist(), "operation": "sum", "type": "float"}
+    return transfer_
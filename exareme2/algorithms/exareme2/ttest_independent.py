@@ -4,10 +4,10 @@ from pydantic import BaseModel
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
+from exareme2.algorithms.exareme2.udfgen import Aggregate
+from exareme2.algorithms.exareme2.udfgen import AggregateUdfGenerator
 from exareme2.algorithms.exareme2.udfgen import literal
-from exareme2.algorithms.exareme2.udfgen import relation
 from exareme2.algorithms.exareme2.udfgen import secure_transfer
-from exareme2.algorithms.exareme2.udfgen import state
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
 from exareme2.worker_communication import BadUserInput
@@ -43,20 +43,21 @@ class IndependentTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
         X_relation, Y_relation = data
 
-        self.split_state_local, split_result_local = local_run(
-            func=split_data_into_groups_local,
+        # The moments of the two groups are computed by SQL aggregates
+        sec_local_transfer = local_run(
+            func=GroupMomentsUdf,
             keyword_args=dict(y=Y_relation, x=X_relation, groupA=groupA, groupB=groupB),
-            share_to_global=[False, True],
+            share_to_global=[True],
         )
 
-        split_res = global_run(
-            func=split_data_into_groups_global,
+        group_counts = global_run(
+            func=count_groups_global,
             keyword_args=dict(
-                sec_local_transfer=split_result_local,
+                sec_local_transfer=sec_local_transfer,
             ),
         )
 
-        res = get_transfer_data(split_res)
+        res = get_transfer_data(group_counts)
         n_x1 = res["n_x1"]
         n_x2 = res["n_x2"]
 
@@ -69,12 +70,6 @@ class IndependentTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
                 f"Not enough data in {groupB}. Please select a group with more data."
             )
 
-        sec_local_transfer = local_run(
-            func=local_independent,
-            keyword_args=dict(split_state=self.split_state_local),
-            share_to_global=[True],
-        )
-
         result = global_run(
             func=global_independent,
             keyword_args=dict(
@@ -98,84 +93,38 @@ class IndependentTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
         return res
 
 
-@udf(
-    y=relation(),
-    x=relation(),
-    groupA=literal(),
-    groupB=literal(),
-    return_type=[state(), secure_transfer(sum_op=True)],
-)
-def split_data_into_groups_local(x, y, groupA, groupB):
-    import numpy as np
-
-    x = np.array(x)
-    y = np.array(y)
-
-    state = {}
-    x1 = y[x == groupA]
-    x2 = y[x == groupB]
-    state["x1"] = x1
-    state["x2"] = x2
-    n_x1 = len(x1)
-    n_x2 = len(x2)
-
-    transfer = {
-        "n_x1": {"data": n_x1, "operation": "sum", "type": "int"},
-        "n_x2": {"data": n_x2, "operation": "sum", "type": "int"},
-    }
+class GroupMomentsUdf(AggregateUdfGenerator):
+    def get_aggregates(self):
+        sql = self.sql
+        [xcol] = self.value_columns("x")
+        [ycol] = self.value_columns("y")
+        x, y = self.column("x", xcol), self.column("y", ycol)
+        in_x1 = f"{x} = {sql.literal(self.groupA)}"
+        in_x2 = f"{x} = {sql.literal(self.groupB)}"
 
-    return state, transfer
+        return {
+            "n_obs_x1": Aggregate(sql.count(in_x1), type="int"),
+            "n_obs_x2": Aggregate(sql.count(in_x2), type="int"),
+            "sum_x1": Aggregate(sql.sum(y, in_x1)),
+            "sum_x2": Aggregate(sql.sum(y, in_x2)),
+            "x1_sqrd_sum": Aggregate(sql.sum(f"{y} * {y}", in_x1)),
+            "x2_sqrd_sum": Aggregate(sql.sum(f"{y} * {y}", in_x2)),
+        }
 
 
 @udf(
     sec_local_transfer=secure_transfer(sum_op=True),
     return_type=[transfer()],
 )
-def split_data_into_groups_global(sec_local_transfer):
-    n_x1 = sec_local_transfer["n_x1"]
-    n_x2 = sec_local_transfer["n_x2"]
+def count_groups_global(sec_local_transfer):
+    n_x1 = sec_local_transfer["n_obs_x1"]
+    n_x2 = sec_local_transfer["n_obs_x2"]
 
     transfer = {"n_x1": n_x1, "n_x2": n_x2}
 
     return transfer
 
 
-@udf(
-    split_state=state(),
-    return_type=[secure_transfer(sum_op=True)],
-)
-def local_independent(split_state):
-    import numpy as np
-
-    x1 = np.array(split_state["x1"])
-    x2 = np.array(split_state["x2"])
-    x1_sum = sum(x1)
-    x2_sum = sum(x2)
-    n_obs_x1 = len(x1)
-    n_obs_x2 = len(x2)
-    x1_sqrd_sum = numpy.einsum("i,i->", x1, x1)
-    x2_sqrd_sum = numpy.einsum("i,i->", x2, x2)
-
-    sec_transfer_ = {
-        "n_obs_x1": {"data": n_obs_x1, "operation": "sum", "type": "int"},
-        "n_obs_x2": {"data": n_obs_x2, "operation": "sum", "type": "int"},
-        "sum_x1": {"data": x1_sum, "operation": "sum", "type": "float"},
-        "sum_x2": {"data": x2_sum, "operation": "sum", "type": "float"},
-        "x1_sqrd_sum": {
-            "data": x1_sqrd_sum.tolist(),
-            "operation": "sum",
-            "type": "float",
-        },
-        "x2_sqrd_sum": {
-            "data": x2_sqrd_sum.tolist(),
-            "operation": "sum",
-            "type": "float",
-        },
-    }
-
-    return sec_transfer_
-
-
 @udf(
     sec_local_transfer=secure_transfer(sum_op=True),
     alpha=literal(),
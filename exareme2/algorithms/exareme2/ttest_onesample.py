@@ -4,8 +4,8 @@ from pydantic import BaseModel
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
+from exareme2.algorithms.exareme2.sufficient_statistics import compute_column_moments
 from exareme2.algorithms.exareme2.udfgen import literal
-from exareme2.algorithms.exareme2.udfgen import relation
 from exareme2.algorithms.exareme2.udfgen import secure_transfer
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
@@ -33,7 +33,6 @@ class TtestResult(BaseModel):
 
 class OnesampleTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
     def run(self, data, metadata):
-        local_run = self.engine.run_udf_on_local_workers
         global_run = self.engine.run_udf_on_global_worker
         alpha = self.algorithm_parameters["alpha"]
         alternative = self.algorithm_parameters["alt_hypothesis"]
@@ -41,11 +40,7 @@ class OnesampleTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
 
         [X_relation] = data
 
-        sec_local_transfer = local_run(
-            func=local_one_sample,
-            keyword_args=dict(x=X_relation, mu=mu),
-            share_to_global=[True],
-        )
+        sec_local_transfer = compute_column_moments(self.engine, X_relation)
 
         result = global_run(
             func=global_one_sample,
@@ -74,35 +69,6 @@ class OnesampleTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
         return one_sample_ttest_res
 
 
-@udf(
-    x=relation(),
-    mu=literal(),
-    return_type=[secure_transfer(sum_op=True)],
-)
-def local_one_sample(x, mu):
-    x.reset_index(drop=True, inplace=True)
-    x = x.to_numpy().squeeze()
-    n_obs = len(x)
-    sum_x = numpy.einsum("i->", x)
-    sqrd_x = numpy.einsum("i,i->", x, x)
-    diff_x = sum_x - n_obs * mu
-    diff_sqrd_x = sqrd_x - 2 * mu * sum_x + n_obs * mu**2
-
-    sec_transfer_ = {
-        "n_obs": {"data": n_obs, "operation": "sum", "type": "int"},
-        "sum_x": {"data": sum_x.item(), "operation": "sum", "type": "float"},
-        "sqrd_x": {"data": sqrd_x.tolist(), "operation": "sum", "type": "float"},
-        "diff_x": {"data": diff_x.tolist(), "operation": "sum", "type": "float"},
-        "diff_sqrd_x": {
-            "data": diff_sqrd_x.tolist(),
-            "operation": "sum",
-            "type": "float",
-        },
-    }
-
-    return sec_transfer_
-
-
 @udf(
     sec_local_transfer=secure_transfer(sum_op=True),
     alpha=literal(),
@@ -114,10 +80,10 @@ def global_one_sample(sec_local_transfer, alpha, alternative, mu):
     from scipy.stats import t
 
     n_obs = sec_local_transfer["n_obs"]
-    sum_x = sec_local_transfer["sum_x"]
-    sqrd_x = sec_local_transfer["sqrd_x"]
-    diff_sum = sec_local_transfer["diff_x"]
-    diff_sqrd_x = sec_local_transfer["diff_sqrd_x"]
+    [sum_x] = sec_local_transfer["sx"]
+    [sqrd_x] = sec_local_transfer["sxx"]
+    diff_sum = sum_x - n_obs * mu
+    diff_sqrd_x = sqrd_x - 2 * mu * sum_x + n_obs * mu**2
 
     smpl_mean = sum_x / n_obs
     # standard deviation of the difference between means
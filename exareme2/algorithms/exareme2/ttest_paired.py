@@ -4,8 +4,8 @@ from pydantic import BaseModel
 from exareme2.algorithms.exareme2.algorithm import Algorithm
 from exareme2.algorithms.exareme2.algorithm import AlgorithmDataLoader
 from exareme2.algorithms.exareme2.helpers import get_transfer_data
+from exareme2.algorithms.exareme2.sufficient_statistics import compute_column_moments
 from exareme2.algorithms.exareme2.udfgen import literal
-from exareme2.algorithms.exareme2.udfgen import relation
 from exareme2.algorithms.exareme2.udfgen import secure_transfer
 from exareme2.algorithms.exareme2.udfgen import transfer
 from exareme2.algorithms.exareme2.udfgen import udf
@@ -31,18 +31,13 @@ class TtestResult(BaseModel):
 
 class PairedTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
     def run(self, data, metadata):
-        local_run = self.engine.run_udf_on_local_workers
         global_run = self.engine.run_udf_on_global_worker
         alpha = self.algorithm_parameters["alpha"]
         alternative = self.algorithm_parameters["alt_hypothesis"]
 
         X_relation, Y_relation = data
 
-        sec_local_transfer = local_run(
-            func=local_paired,
-            keyword_args=dict(y=Y_relation, x=X_relation),
-            share_to_global=[True],
-        )
+        sec_local_transfer = compute_column_moments(self.engine, X_relation, Y_relation)
 
         result = global_run(
             func=global_paired,
@@ -68,45 +63,6 @@ class PairedTTestAlgorithm(Algorithm, algname=ALGORITHM_NAME):
         return res
 
 
-@udf(
-    y=relation(),
-    x=relation(),
-    return_type=[secure_transfer(sum_op=True)],
-)
-def local_paired(x, y):
-    x.reset_index(drop=True, inplace=True)
-    y.reset_index(drop=True, inplace=True)
-    x1, x2 = x.values.squeeze(), y.values.squeeze()
-    x1_sum = numpy.einsum("i->", x1)
-    x2_sum = numpy.einsum("i->", x2)
-    n_obs = x.shape[0]
-    diff = x1 - x2
-    sd = numpy.einsum("i->", diff)
-    ssd = numpy.einsum("i,i", diff, diff)
-    x1_sqrd_sum = numpy.einsum("i,i", x1, x1)
-    x2_sqrd_sum = numpy.einsum("i,i", x2, x2)
-
-    sec_transfer_ = {
-        "n_obs": {"data": n_obs, "operation": "sum", "type": "int"},
-        "sum_x1": {"data": x1_sum.item(), "operation": "sum", "type": "float"},
-        "sum_x2": {"data": x2_sum.item(), "operation": "sum", "type": "float"},
-        "diff": {"data": sd.tolist(), "operation": "sum", "type": "float"},
-        "diff_sqrd": {"data": ssd.tolist(), "operation": "sum", "type": "float"},
-        "x1_sqrd_sum": {
-            "data": x1_sqrd_sum.tolist(),
-            "operation": "sum",
-            "type": "float",
-        },
-        "x2_sqrd_sum": {
-            "data": x2_sqrd_sum.tolist(),
-            "operation": "sum",
-            "type": "float",
-        },
-    }
-
-    return sec_transfer_
-
-
 @udf(
     sec_local_transfer=secure_transfer(sum_op=True),
     alpha=literal(),
@@ -117,12 +73,13 @@ def global_paired(sec_local_transfer, alpha, alternative):
     from scipy.stats import t
 
     n_obs = sec_local_transfer["n_obs"]
-    sum_x1 = sec_local_transfer["sum_x1"]
-    sum_x2 = sec_local_transfer["sum_x2"]
-    diff_sum = sec_local_transfer["diff"]
-    diff_sqrd_sum = sec_local_transfer["diff_sqrd"]
-    x1_sqrd_sum = sec_local_transfer["x1_sqrd_sum"]
-    x2_sqrd_sum = sec_local_transfer["x2_sqrd_sum"]
+    [sum_x1] = sec_local_transfer["sx"]
+    [sum_x2] = sec_local_transfer["sy"]
+    [x1_sqrd_sum] = sec_local_transfer["sxx"]
+    [x2_sqrd_sum] = sec_local_transfer["syy"]
+    [[x1_x2_sum]] = sec_local_transfer["sxy"]
+    diff_sum = sum_x1 - sum_x2
+    diff_sqrd_sum = x1_sqrd_sum - 2 * x1_x2_sum + x2_sqrd_sum
 
     mean_x1 = sum_x1 / n_obs
     mean_x2 = sum_x2 / n_obs
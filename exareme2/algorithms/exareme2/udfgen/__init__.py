@@ -1,4 +1,8 @@
 from exareme2.algorithms.exareme2.udfgen.adhoc_udfgenerator import AdhocUdfGenerator
+from exareme2.algorithms.exareme2.udfgen.aggregate_udfgenerator import Aggregate
+from exareme2.algorithms.exareme2.udfgen.aggregate_udfgenerator import (
+    AggregateUdfGenerator,
+)
 from exareme2.algorithms.exareme2.udfgen.decorator import udf
 from exareme2.algorithms.exareme2.udfgen.factory import get_udfgenerator
 from exareme2.algorithms.exareme2.udfgen.helpers import make_unique_func_name
@@ -28,6 +32,8 @@ __all__ = [
     "udf",
     "udf_logger",
     "AdhocUdfGenerator",
+    "Aggregate",
+    "AggregateUdfGenerator",
     "FlowUdfArg",
     "get_udfgenerator",
     "DEFERRED",
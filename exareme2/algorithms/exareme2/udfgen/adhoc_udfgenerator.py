@@ -26,8 +26,9 @@ class AdhocUdfGenerator(UdfGenerator, ABC):
     `get_exec_stmt` should return a string with the statement needed for
     executing the UDF and storing its results into the return table.
 
-    `get_results` should return a list of `UDFGenTableResult`. Currently, only
-    a single result is supported. Each `UDFGenTableResult` is an object
+    `get_results` should return a list of `UDFGenTableResult`, usually a single
+    one. UDFs with more results set `num_outputs` and override `get_exec_stmts`
+    to return one statement per output table. Each `UDFGenTableResult` is an object
     representing the output table. The user needs to provide three args to each
     `UDFGenTableResult`. The table name, its schema and its creation SQL
     statement.
@@ -35,6 +36,10 @@ class AdhocUdfGenerator(UdfGenerator, ABC):
     `output_schema` is a property representing the schema of the main output
     table.
 
+    UDFs computing their outputs with a single query can set `creates_views`,
+    in which case the creation statements of the results create the output
+    views and `get_exec_stmts` returns no statements.
+
     Additionally, the user can override `get_definition` to create ad hoc
     python UDFs. `get_definition` should return a string with the UDF
     definition. The default implementation returns an empty string for pure SQL
@@ -66,7 +71,7 @@ class AdhocUdfGenerator(UdfGenerator, ABC):
     """
 
     _registry = {}
-    # AdhocUdfGenerator should always produce a single output
+    # AdhocUdfGenerator produces a single output, unless overridden
     num_outputs = 1
 
     # Make AST classes locally available to users
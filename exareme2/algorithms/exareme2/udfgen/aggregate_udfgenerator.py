@@ -0,0 +1,311 @@
+import json
+from abc import ABC
+from abc import abstractmethod
+from types import SimpleNamespace
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+
+from exareme2 import DType
+from exareme2.algorithms.exareme2.udfgen.adhoc_udfgenerator import AdhocUdfGenerator
+from exareme2.algorithms.exareme2.udfgen.smpc import get_smpc_tablename_placeholders
+from exareme2.algorithms.exareme2.udfgen.udfgen_DTOs import UDFGenResult
+from exareme2.algorithms.exareme2.udfgen.udfgen_DTOs import UDFGenSMPCResult
+from exareme2.algorithms.exareme2.udfgen.udfgen_DTOs import UDFGenTableResult
+from exareme2.worker_communication import TableInfo
+
+ROW_ID = "row_id"
+SECURE_TRANSFER_COLUMN = "secure_transfer"
+SMPC_OPERATIONS = ("sum", "min", "max")
+
+
+class Aggregate(NamedTuple):
+    """An entry of a secure transfer computed with SQL aggregates
+
+    Attributes
+    ----------
+    data
+        A SQL aggregate expression, or a (nested) list of them, giving the
+        shape of the entry's data
+    operation
+        The secure transfer operation, one of 'sum', 'min' or 'max'
+    type
+        The secure transfer type of the values, 'int' or 'float'
+    """
+
+    data: Union[str, list]
+    operation: str = "sum"
+    type: str = "float"
+
+
+def _count(condition: Optional[str] = None) -> str:
+    if condition is None:
+        return "COUNT(*)"
+    return f"COALESCE(SUM(CASE WHEN {condition} THEN 1 ELSE 0 END), 0)"
+
+
+def _sum(expression: str, condition: Optional[str] = None) -> str:
+    if condition is not None:
+        expression = f"CASE WHEN {condition} THEN {expression} END"
+    return f"COALESCE(SUM(CAST({expression} AS DOUBLE)), 0)"
+
+
+def _min(expression: str) -> str:
+    return f"MIN(CAST({expression} AS DOUBLE))"
+
+
+def _max(expression: str) -> str:
+    return f"MAX(CAST({expression} AS DOUBLE))"
+
+
+def _literal(value) -> str:
+    if isinstance(value, str):
+        escaped = value.replace("'", "''")
+        return f"'{escaped}'"
+    return str(value)
+
+
+class AggregateUdfGenerator(AdhocUdfGenerator, ABC):
+    """This abstract class can be subclassed to define UDFs computing a secure
+    transfer with SQL aggregates only
+
+    The user needs to define a single abstract method, `get_aggregates`,
+    declaring the secure transfer as a dict of `Aggregate` objects, whose data
+    are SQL aggregate expressions. The relations received by the algorithm
+    flow are joined on their row_id and the aggregates are computed by a
+    single SELECT, without any python UDF, so the database computes them
+    natively, without building dataframes.
+
+    The result has the same format as a secure transfer returned by a python
+    UDF, with or without SMPC. As for the python UDFs, the minimum number of
+    rows is checked when the data model views are created, so the aggregates
+    always produce a single secure transfer.
+
+    In order to facilitate the creation of the aggregates, a `sql` attribute is
+    available with the functions `count`, `sum`, `min`, `max` and `literal`,
+    all returning SQL strings. The methods `column` and `value_columns` give
+    the columns of the relations.
+
+    Examples
+    --------
+    >>> class MyAggregateUdf(AggregateUdfGenerator):
+    ...     def get_aggregates(self):
+    ...         columns = [self.column("x", c) for c in self.value_columns("x")]
+    ...         return {
+    ...             "n_obs": Aggregate(self.sql.count(), type="int"),
+    ...             "sums": Aggregate([self.sql.sum(c) for c in columns]),
+    ...         }
+    """
+
+    sql = SimpleNamespace(
+        count=_count,
+        sum=_sum,
+        min=_min,
+        max=_max,
+        literal=_literal,
+    )
+
+    @abstractmethod
+    def get_aggregates(self) -> Dict[str, Aggregate]:
+        pass
+
+    @property
+    def output_schema(self):
+        return [(SECURE_TRANSFER_COLUMN, DType.JSON)]
+
+    @property
+    def tables(self) -> List[TableInfo]:
+        return [arg for arg in self.__dict__.values() if isinstance(arg, TableInfo)]
+
+    def column(self, arg_name: str, column_name: str) -> str:
+        """Returns the SQL reference of a column of a relation argument."""
+        table = getattr(self, arg_name)
+        return f'{table.name}."{column_name}"'
+
+    def value_columns(self, arg_name: str) -> List[str]:
+        """Returns the columns of a relation argument, except its row_id."""
+        table = getattr(self, arg_name)
+        return [name for name in table.column_names if name != ROW_ID]
+
+    def get_exec_stmt(self, udf_name: None, output_table_names: List[str]) -> str:
+        main_output_name, *_ = output_table_names
+        if self._smpc_used:
+            template = json.dumps(self._get_smpc_template())
+            secure_transfer = _literal(template)
+        else:
+            secure_transfer = self._to_sql_json(self._get_secure_transfer())
+        return self._insert_from_aggregates(main_output_name, secure_transfer) + ";"
+
+    def get_exec_stmts(
+        self, udf_name: None, output_table_names: List[str]
+    ) -> List[str]:
+        # With SMPC the values of each operation are inserted in their own table,
+        # after the template of the secure transfer
+        exec_stmt = self.get_exec_stmt(udf_name, output_table_names)
+        if not self._smpc_used:
+            return [exec_stmt]
+        main_output_name, *_ = output_table_names
+        _, *op_table_names = get_smpc_tablename_placeholders(main_output_name)
+        values = self._get_values_per_operation()
+        return [exec_stmt] + [
+            self._insert_from_aggregates(table_name, self._to_sql_json(values[op]))
+            + ";"
+            for op, table_name in zip(SMPC_OPERATIONS, op_table_names)
+            if values[op]
+        ]
+
+    def get_results(self, output_table_names: List[str]) -> List[UDFGenResult]:
+        main_output_name, *_ = output_table_names
+        if not self._smpc_used:
+            return [self._make_table_result(main_output_name, share=True)]
+
+        template_name, *op_table_names = get_smpc_tablename_placeholders(
+            main_output_name
+        )
+        values = self._get_values_per_operation()
+        op_results = {
+            f"{op}_op_values": self._make_table_result(table_name, share=False)
+            for op, table_name in zip(SMPC_OPERATIONS, op_table_names)
+            if values[op]
+        }
+        template = self._make_table_result(template_name, share=True)
+        return [UDFGenSMPCResult(template=template, **op_results)]
+
+    def _make_table_result(self, table_name: str, share: bool) -> UDFGenTableResult:
+        create = self.ast.CreateTable(table_name, self.output_schema).compile()
+        return UDFGenTableResult(
+            table_name=table_name,
+            table_schema=self.output_schema,
+            create_query=create,
+            share=share,
+        )
+
+    def _get_expressions(self) -> List[str]:
+        return [
+            expression
+            for aggregate in self.get_aggregates().values()
+            for expression in _flatten(aggregate.data)
+        ]
+
+    def _get_secure_transfer(self) -> dict:
+        # The data of the secure transfer, with the aliases of the aggregates
+        # computed by the inner query in place of their expressions
+        aliases = iter(_get_alias(i) for i, _ in enumerate(self._get_expressions()))
+        return {
+            key: {
+                "data": _map_nested(aggregate.data, lambda _: next(aliases)),
+                "operation": aggregate.operation,
+                "type": aggregate.type,
+            }
+            for key, aggregate in self.get_aggregates().items()
+        }
+
+    def _get_values_per_operation(self) -> Dict[str, List[str]]:
+        values = {op: [] for op in SMPC_OPERATIONS}
+        for item in self._get_secure_transfer().values():
+            values[item["operation"]].extend(_flatten(item["data"]))
+        return values
+
+    def _get_smpc_template(self) -> dict:
+        # The template has the positions of the values in the list of values of
+        # their operation, as the ones of udfio.split_secure_transfer_dict
+        positions = {
+            op: iter(range(len(values)))
+            for op, values in self._get_values_per_operation().items()
+        }
+        template = {}
+        for key, item in self._get_secure_transfer().items():
+            op_positions = positions[item["operation"]]
+            data = _map_nested(item["data"], lambda _: next(op_positions))
+            template[key] = {**item, "data": data}
+        return template
+
+    def _insert_from_aggregates(self, table_name: str, value: str) -> str:
+        aggregates = self._get_aggregates_query()
+        subquery = self.ast.Table(name=f"(\n{aggregates}\n) AS aggregates", columns=[])
+        column = self.ast.ConstColumn(value=value, alias=SECURE_TRANSFER_COLUMN)
+        sel = self.ast.Select(columns=[column], from_=[subquery])
+        return self.ast.Insert(table=table_name, values=sel).compile().rstrip(";")
+
+    def _get_aggregates_query(self) -> str:
+        columns = [
+            self.ast.ConstColumn(value=expression, alias=_get_alias(i))
+            for i, expression in enumerate(self._get_expressions())
+        ]
+        tables = [
+            self.ast.Table(name=table.name, columns=[ROW_ID]) for table in self.tables
+        ]
+        head, *tail = tables
+        where = [head.c[ROW_ID] == table.c[ROW_ID] for table in tail]
+        return self.ast.Select(columns=columns, from_=tables, where=where).compile()
+
+    @staticmethod
+    def _to_sql_json(data) -> str:
+        """Returns the SQL expression building the JSON of a secure transfer, or
+        of a list, whose leaves are aliases of the aggregates query."""
+        if isinstance(data, dict):
+            parts = _get_secure_transfer_json_parts(data)
+        else:
+            parts = _get_json_parts(data)
+        # Merge the consecutive literal parts
+        merged = []
+        for part in parts:
+            if (
+                isinstance(part, _JsonLiteral)
+                and merged
+                and isinstance(merged[-1], _JsonLiteral)
+            ):
+                merged[-1] = _JsonLiteral(merged[-1] + part)
+            else:
+                merged.append(part)
+        return " || ".join(
+            _literal(str(part)) if isinstance(part, _JsonLiteral) else part
+            for part in merged
+        )
+
+
+class _JsonLiteral(str):
+    pass
+
+
+def _get_alias(position: int) -> str:
+    return f"v{position}"
+
+
+def _get_secure_transfer_json_parts(secure_transfer: dict) -> list:
+    parts = [_JsonLiteral("{")]
+    for i, (key, item) in enumerate(secure_transfer.items()):
+        separator = ", " if i else ""
+        parts.append(_JsonLiteral(f'{separator}{json.dumps(key)}: {{"data": '))
+        parts.extend(_get_json_parts(item["data"]))
+        operation, type_ = json.dumps(item["operation"]), json.dumps(item["type"])
+        parts.append(_JsonLiteral(f', "operation": {operation}, "type": {type_}}}'))
+    parts.append(_JsonLiteral("}"))
+    return parts
+
+
+def _get_json_parts(data) -> list:
+    if isinstance(data, str):
+        # The alias of an aggregate, a missing value being a JSON null
+        return [f"COALESCE(CAST(\"{data}\" AS VARCHAR(64)), 'null')"]
+    parts = [_JsonLiteral("[")]
+    for i, value in enumerate(data):
+        if i:
+            parts.append(_JsonLiteral(", "))
+        parts.extend(_get_json_parts(value))
+    parts.append(_JsonLiteral("]"))
+    return parts
+
+
+def _flatten(data) -> list:
+    if isinstance(data, (list, tuple)):
+        return [leaf for item in data for leaf in _flatten(item)]
+    return [data]
+
+
+def _map_nested(data, func):
+    if isinstance(data, (list, tuple)):
+        return [_map_nested(item, func) for item in data]
+    return func(data)
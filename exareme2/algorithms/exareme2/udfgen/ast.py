@@ -1,9 +1,12 @@
 import ast
+import functools
+import re
 from abc import ABC
 from abc import abstractmethod
 from numbers import Number
 from textwrap import indent
 from typing import Dict
+from typing import FrozenSet
 from typing import List
 from typing import NamedTuple
 from typing import Optional
@@ -17,7 +20,6 @@ from exareme2.algorithms.exareme2.udfgen.helpers import get_func_body_from_ast
 from exareme2.algorithms.exareme2.udfgen.helpers import get_items_of_type
 from exareme2.algorithms.exareme2.udfgen.helpers import get_return_names_from_body
 from exareme2.algorithms.exareme2.udfgen.helpers import iotype_to_sql_schema
-from exareme2.algorithms.exareme2.udfgen.helpers import is_any_element_of_type
 from exareme2.algorithms.exareme2.udfgen.helpers import make_unique_func_name
 from exareme2.algorithms.exareme2.udfgen.helpers import parse_func
 from exareme2.algorithms.exareme2.udfgen.helpers import recursive_repr
@@ -29,10 +31,8 @@ from exareme2.algorithms.exareme2.udfgen.iotypes import LoopbackOutputType
 from exareme2.algorithms.exareme2.udfgen.iotypes import OutputType
 from exareme2.algorithms.exareme2.udfgen.iotypes import ParametrizedType
 from exareme2.algorithms.exareme2.udfgen.iotypes import PlaceholderArg
-from exareme2.algorithms.exareme2.udfgen.iotypes import StateType
 from exareme2.algorithms.exareme2.udfgen.iotypes import TableArg
 from exareme2.algorithms.exareme2.udfgen.iotypes import TableType
-from exareme2.algorithms.exareme2.udfgen.iotypes import TransferTypeBase
 from exareme2.algorithms.exareme2.udfgen.iotypes import UDFLoggerArg
 from exareme2.algorithms.exareme2.udfgen.iotypes import UDFLoggerType
 
@@ -179,20 +179,39 @@ class UDFHeader(ASTNode):
 
 
 class Imports(ASTNode):
-    # TODO imports should be dynamic
-    def __init__(self, import_pickle, import_json):
-        self._import_lines = ["import pandas as pd", "import udfio"]
-        if import_pickle:
-            pickle_import = "import pickle"
-            self._import_lines.append(pickle_import)
-        if import_json:
-            json_import = "import json"
-            self._import_lines.append(json_import)
+    """Imports the modules referred to in the UDF's code. MonetDB runs the
+    imports on every invocation of the UDF, so the unused modules are left out."""
+
+    # The imports of the modules available to the UDFs, by the name the code
+    # refers to them with
+    MODULE_IMPORTS = {
+        "pd": "import pandas as pd",
+        "udfio": "import udfio",
+        "pickle": "import pickle",
+        "json": "import json",
+    }
+
+    def __init__(self, *code_parts: str):
+        # The names are found per part, so that the ones of the body, which is
+        # the largest part and the same on every generation, are found once
+        referred_names = frozenset().union(
+            *(get_referred_names(code) for code in code_parts)
+        )
+        self._import_lines = [
+            import_line
+            for name, import_line in self.MODULE_IMPORTS.items()
+            if name in referred_names
+        ]
 
     def compile(self) -> str:
         return LN.join(self._import_lines)
 
 
+@functools.lru_cache(maxsize=1024)
+def get_referred_names(code: str) -> FrozenSet[str]:
+    return frozenset(re.findall(r"[A-Za-z_]\w*", code))
+
+
 class TableBuild(ASTNode):
     def __init__(self, arg_name, arg, template):
         self.arg_name = arg_name
@@ -296,14 +315,23 @@ class PlaceholderAssignments(ASTNode):
 
 class UDFBodyStatements(ASTNode):
     def __init__(self, statements):
-        self.returnless_stmts = [
-            astor.to_source(stmt)
-            for stmt in statements
-            if not isinstance(stmt, ast.Return)
-        ]
+        self.statements = tuple(statements)
 
     def compile(self) -> str:
-        return LN.join(remove_empty_lines(self.returnless_stmts))
+        return compile_statements(self.statements)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_statements(statements: Tuple[ast.stmt, ...]) -> str:
+    """Generates the source of the statements, without the return statement.
+
+    AST nodes are hashed by identity and the body statements of a UDF are
+    parsed once, when it is registered, so the source of each UDF's body is
+    generated once per process."""
+    returnless_stmts = [
+        astor.to_source(stmt) for stmt in statements if not isinstance(stmt, ast.Return)
+    ]
+    return LN.join(remove_empty_lines(returnless_stmts))
 
 
 class UDFBody(ASTNode):
@@ -320,25 +348,8 @@ class UDFBody(ASTNode):
         sec_return_types: List[OutputType],
         sec_output_table_names: List[str],
     ):
-        all_types = (
-            [arg.type for arg in table_args.values()]
-            + [main_return_type]
-            + sec_return_types
-        )
-
-        import_pickle = is_any_element_of_type(StateType, all_types)
-        import_json = is_any_element_of_type(TransferTypeBase, all_types)
-
         self.statements = []
 
-        # imports
-        self.statements.append(
-            Imports(
-                import_pickle=import_pickle,
-                import_json=import_json,
-            )
-        )
-
         # initial assignments
         self.statements.append(TableBuilds(table_args))
         self.statements.append(LiteralAssignments(literal_args))
@@ -348,7 +359,8 @@ class UDFBody(ASTNode):
         # main body
         self.statements.append(UDFBodyStatements(statements))
 
-        # return statements
+        # return statements, formatted with the output table names, which change
+        # on every run, so unlike the main body they are not cached
         self.statements.append(
             UDFLoopbackReturnStatements(
                 sec_return_names=sec_return_names,
@@ -359,7 +371,10 @@ class UDFBody(ASTNode):
         self.statements.append(UDFReturnStatement(main_return_name, main_return_type))
 
     def compile(self) -> str:
-        return LN.join(remove_empty_lines([stmt.compile() for stmt in self.statements]))
+        code_parts = [stmt.compile() for stmt in self.statements]
+        code = LN.join(remove_empty_lines(code_parts))
+        imports = Imports(*code_parts)
+        return LN.join(remove_empty_lines([imports.compile(), code]))
 
 
 class UDFDefinition(ASTNode):
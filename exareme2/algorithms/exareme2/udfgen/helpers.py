@@ -1,5 +1,6 @@
 import ast
 import base64
+import functools
 import hashlib
 import inspect
 import re
@@ -12,7 +13,13 @@ SEP = ","
 
 def iotype_to_sql_schema(iotype, name_prefix=""):
     column_names = iotype.column_names(name_prefix)
-    types = [dtype.to_sql() for _, dtype in iotype.schema]
+    dtypes = [dtype for _, dtype in iotype.schema]
+    return _columns_to_sql_schema(tuple(column_names), tuple(dtypes))
+
+
+@functools.lru_cache(maxsize=1024)
+def _columns_to_sql_schema(column_names, dtypes):
+    types = [dtype.to_sql() for dtype in dtypes]
     sql_params = [f'"{name}" {dtype}' for name, dtype in zip(column_names, types)]
     return SEP.join(sql_params)
 
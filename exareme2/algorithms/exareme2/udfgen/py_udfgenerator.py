@@ -400,8 +400,6 @@ class PyUdfGenerator(UdfGenerator):
             - The output type is known statically
         """
 
-        input_types = copy_types_from_udfargs(self.udf_args)
-
         # case: output type has DEFERRED schema
         if self.output_schema:
             main_output_type = relation(schema=self.output_schema)
@@ -413,6 +411,7 @@ class PyUdfGenerator(UdfGenerator):
             isinstance(main_output_type, ParametrizedType)
             and main_output_type.is_generic
         ):
+            input_types = copy_types_from_udfargs(self.udf_args)
             param_table_types = get_items_of_type(TableType, mapping=input_types)
             main_output_type = infer_output_type(
                 passed_input_types=param_table_types,
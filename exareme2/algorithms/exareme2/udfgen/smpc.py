@@ -5,7 +5,6 @@ from typing import Tuple
 
 from exareme2 import DType as dt
 from exareme2.algorithms.exareme2.udfgen.ast import ASTNode
-from exareme2.algorithms.exareme2.udfgen.ast import Imports
 from exareme2.algorithms.exareme2.udfgen.ast import LiteralAssignments
 from exareme2.algorithms.exareme2.udfgen.ast import LoggerAssignment
 from exareme2.algorithms.exareme2.udfgen.ast import PlaceholderAssignments
@@ -14,18 +13,14 @@ from exareme2.algorithms.exareme2.udfgen.ast import UDFBody
 from exareme2.algorithms.exareme2.udfgen.ast import UDFBodyStatements
 from exareme2.algorithms.exareme2.udfgen.ast import UDFLoopbackReturnStatements
 from exareme2.algorithms.exareme2.udfgen.ast import UDFReturnStatement
-from exareme2.algorithms.exareme2.udfgen.helpers import is_any_element_of_type
 from exareme2.algorithms.exareme2.udfgen.iotypes import DictArg
 from exareme2.algorithms.exareme2.udfgen.iotypes import DictType
 from exareme2.algorithms.exareme2.udfgen.iotypes import InputType
 from exareme2.algorithms.exareme2.udfgen.iotypes import LiteralArg
 from exareme2.algorithms.exareme2.udfgen.iotypes import LoopbackOutputType
-from exareme2.algorithms.exareme2.udfgen.iotypes import MergeTransferType
 from exareme2.algorithms.exareme2.udfgen.iotypes import OutputType
 from exareme2.algorithms.exareme2.udfgen.iotypes import PlaceholderArg
-from exareme2.algorithms.exareme2.udfgen.iotypes import StateType
 from exareme2.algorithms.exareme2.udfgen.iotypes import TableArg
-from exareme2.algorithms.exareme2.udfgen.iotypes import TransferType
 from exareme2.algorithms.exareme2.udfgen.iotypes import TransferTypeBase
 from exareme2.algorithms.exareme2.udfgen.iotypes import UDFArgument
 from exareme2.algorithms.exareme2.udfgen.iotypes import UDFLoggerArg
@@ -277,27 +272,8 @@ class UDFBodySMPC(UDFBody):
         sec_return_types: List[OutputType],
         sec_output_table_names: List[str],
     ):
-        all_types = (
-            [arg.type for arg in table_args.values()]
-            + [main_return_type]
-            + sec_return_types
-        )
-
-        import_pickle = is_any_element_of_type(StateType, all_types)
-        import_json = is_any_element_of_type(
-            (TransferType, SecureTransferType, MergeTransferType), all_types
-        )
-
         self.statements = []
 
-        # imports
-        self.statements.append(
-            Imports(
-                import_pickle=import_pickle,
-                import_json=import_json,
-            )
-        )
-
         # initial assignments
         self.statements.append(TableBuilds(table_args))
         self.statements.append(SMPCBuilds(smpc_args))
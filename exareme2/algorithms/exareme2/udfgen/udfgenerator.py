@@ -6,6 +6,10 @@ from exareme2.algorithms.exareme2.udfgen.udfgen_DTOs import UDFGenTableResult
 
 
 class UdfGenerator(ABC):
+    # Generators creating their outputs as views over their inputs, with no
+    # execution statement, set it to True
+    creates_views = False
+
     @abstractmethod
     def get_definition(self, udf_name: str, output_table_names: List[str]) -> str:
         pass
@@ -14,6 +18,14 @@ class UdfGenerator(ABC):
     def get_exec_stmt(self, udf_name: str, output_table_names: List[str]) -> str:
         pass
 
+    def get_exec_stmts(self, udf_name: str, output_table_names: List[str]) -> List[str]:
+        """
+        Returns the execution statements, each one filling a single output table.
+        Generators filling several output tables with separate statements should
+        override it.
+        """
+        return [self.get_exec_stmt(udf_name, output_table_names)]
+
     @abstractmethod
     def get_results(self, output_table_names: List[str]) -> List[UDFGenTableResult]:
         pass
@@ -4,7 +4,9 @@ import re
 from functools import partial
 from functools import reduce
 from typing import Any
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Set
 from typing import Tuple
 from typing import Type
@@ -15,6 +17,9 @@ import pandas as pd
 LOG_LEVEL_ENV_VARIABLE = "LOG_LEVEL"
 LOG_LEVEL_DEFAULT_VALUE = "INFO"
 
+# Number of rows processed at once by the local steps that stream their input
+CHUNK_SIZE = 10_000
+
 
 def get_logger(udf_name: str, request_id: str):
     logger = logging.getLogger("monetdb_udf")
@@ -67,6 +72,18 @@ def as_relational_table(result, row_id):
     return result
 
 
+def iter_chunks(n_rows: int, chunk_size: Optional[int] = None) -> Iterator[slice]:
+    """
+    Yields the slices splitting 'n_rows' rows in chunks of 'chunk_size' rows,
+    CHUNK_SIZE by default, so that a UDF can accumulate its results chunk by
+    chunk, keeping the memory of its intermediate arrays bounded whatever the
+    size of its input.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    for start in range(0, n_rows, chunk_size):
+        yield slice(start, min(start + chunk_size, n_rows))
+
+
 def reduce_tensor_pair(op, a: pd.DataFrame, b: pd.DataFrame):
     ndims = len(a.columns) - 1
     dimensions = [f"dim{_}" for _ in range(ndims)]
@@ -215,12 +232,51 @@ def _operation_on_secure_transfer_key_data(key, transfers: List[dict], operation
     """
     Given a list of secure_transfer dicts, it makes the appropriate operation on the data of the key provided.
     """
-    result = transfers[0][key][smpc_transfer_data_key]
-    for transfer in transfers[1:]:
-        result = _calc_values(result, transfer[key][smpc_transfer_data_key], operation)
+    values = [transfer[key][smpc_transfer_data_key] for transfer in transfers]
+
+    arrays = [_as_numeric_array(value) for value in values]
+    if all(array is not None for array in arrays) and (
+        len({array.shape for array in arrays}) == 1
+    ):
+        return _calc_array_values(np.stack(arrays), operation).tolist()
+
+    result = values[0]
+    for value in values[1:]:
+        result = _calc_values(result, value, operation)
     return result
 
 
+def _as_numeric_array(data: Any) -> Optional[np.ndarray]:
+    """
+    Returns the data as a numeric array, when they are nested lists of numbers
+    with a regular shape, e.g. a matrix converted with 'tolist()'. Otherwise,
+    None is returned and the data are handled element by element.
+    """
+    if not isinstance(data, list):
+        return None
+    try:
+        array = np.array(data)
+    except (ValueError, OverflowError):
+        return None
+    if array.dtype.kind not in "iuf":
+        return None
+    return array
+
+
+def _calc_array_values(arrays: np.ndarray, operation: str) -> np.ndarray:
+    """
+    Reduces the arrays stacked along the first axis.
+    """
+    if operation == smpc_sum_op:
+        return arrays.sum(axis=0)
+    elif operation == smpc_min_op:
+        return arrays.min(axis=0)
+    elif operation == smpc_max_op:
+        return arrays.max(axis=0)
+    else:
+        raise NotImplementedError
+
+
 def _calc_values(value1: Any, value2: Any, operation: str):
     """
     The values could be either integers/floats or lists that contain other lists or integers/floats.
@@ -273,20 +329,31 @@ def split_secure_transfer_dict(secure_transfer: dict) -> Tuple[dict, list, list,
     for key, data_transfer in secure_transfer.items():
         _validate_secure_transfer_item(key, data_transfer)
         cur_op = data_transfer[smpc_transfer_op_key]
-        try:
-            (
-                data_transfer_tmpl,
-                cur_flat_data,
-                op_indexes[cur_op],
-            ) = _flatten_data_and_keep_relative_positions(
-                op_indexes[cur_op],
-                data_transfer[smpc_transfer_data_key],
-                [list, int, float],
-            )
-        except TypeError as e:
-            raise TypeError(
-                f"Secure Transfer key: '{key}', operation: '{cur_op}'. Error: {str(e)}"
+        data_array = _as_numeric_array(data_transfer[smpc_transfer_data_key])
+        if data_array is not None:
+            # The relative positions have the shape of the data
+            data_transfer_tmpl = (
+                np.arange(op_indexes[cur_op], op_indexes[cur_op] + data_array.size)
+                .reshape(data_array.shape)
+                .tolist()
             )
+            cur_flat_data = data_array.ravel().tolist()
+            op_indexes[cur_op] += data_array.size
+        else:
+            try:
+                (
+                    data_transfer_tmpl,
+                    cur_flat_data,
+                    op_indexes[cur_op],
+                ) = _flatten_data_and_keep_relative_positions(
+                    op_indexes[cur_op],
+                    data_transfer[smpc_transfer_data_key],
+                    [list, int, float],
+                )
+            except TypeError as e:
+                raise TypeError(
+                    f"Secure Transfer key: '{key}', operation: '{cur_op}'. Error: {str(e)}"
+                )
         op_flat_data[cur_op].extend(cur_flat_data)
 
         secure_transfer_key_template = {
@@ -338,33 +405,34 @@ def construct_secure_transfer_dict(
     When SMPC is used, a secure_transfer dict is broken into template and values.
     In order to be used from a udf it needs to take it's final key - value form.
     """
+    op_values = {
+        smpc_sum_op: sum_op_values,
+        smpc_min_op: min_op_values,
+        smpc_max_op: max_op_values,
+    }
+    op_values_arrays = {}
+
     final_dict = {}
     for key, data_transfer_tmpl in template.items():
-        if data_transfer_tmpl[smpc_transfer_op_key] == smpc_sum_op:
-            structured_data = _structure_data_using_relative_positions(
-                data_transfer_tmpl[smpc_transfer_data_key],
-                data_transfer_tmpl[smpc_transfer_val_type_key],
-                sum_op_values,
-                [int, float],
-            )
-        elif data_transfer_tmpl[smpc_transfer_op_key] == smpc_min_op:
-            structured_data = _structure_data_using_relative_positions(
-                data_transfer_tmpl[smpc_transfer_data_key],
-                data_transfer_tmpl[smpc_transfer_val_type_key],
-                min_op_values,
-                [int, float],
-            )
-        elif data_transfer_tmpl[smpc_transfer_op_key] == smpc_max_op:
+        operation = data_transfer_tmpl[smpc_transfer_op_key]
+        if operation not in op_values:
+            raise ValueError(f"Operation not supported: {operation}")
+
+        positions = _as_numeric_array(data_transfer_tmpl[smpc_transfer_data_key])
+        if positions is not None and positions.dtype.kind == "i":
+            if operation not in op_values_arrays:
+                op_values_arrays[operation] = np.asarray(op_values[operation])
+            structured_data = op_values_arrays[operation][positions]
+            if data_transfer_tmpl[smpc_transfer_val_type_key] == smpc_int_type:
+                structured_data = structured_data.astype(int)
+            structured_data = structured_data.tolist()
+        else:
             structured_data = _structure_data_using_relative_positions(
                 data_transfer_tmpl[smpc_transfer_data_key],
                 data_transfer_tmpl[smpc_transfer_val_type_key],
-                max_op_values,
+                op_values[operation],
                 [int, float],
             )
-        else:
-            raise ValueError(
-                f"Operation not supported: {data_transfer_tmpl[smpc_transfer_op_key]}"
-            )
 
         final_dict[key] = structured_data
     return final_dict
@@ -0,0 +1,79 @@
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import flwr as fl
+from flwr.common import Parameters
+from flwr.common import Scalar
+from flwr.common import parameters_to_ndarrays
+from flwr.common.logger import FLOWER_LOGGER
+
+from exareme2.algorithms.flower.inputdata_preprocessing import post_model_parameters
+from exareme2.algorithms.flower.inputdata_preprocessing import post_result
+
+NUM_OF_ROUNDS = 5
+TOL = 1e-4
+
+
+def get_stopping_params(parameters: Optional[dict]) -> Tuple[int, float]:
+    """Reads the 'num_of_rounds' and 'tol' algorithm parameters or their defaults."""
+    parameters = parameters or {}
+    num_of_rounds = parameters.get("num_of_rounds")
+    tol = parameters.get("tol")
+    return (
+        int(num_of_rounds) if num_of_rounds is not None else NUM_OF_ROUNDS,
+        float(tol) if tol is not None else TOL,
+    )
+
+
+class EarlyStoppingFedAvg(fl.server.strategy.FedAvg):
+    """
+    FedAvg that stops the training as soon as the centralized loss converges,
+    i.e. it changes less than 'tol' between two rounds, or after 'num_of_rounds'
+    rounds. The final model parameters and the metrics of the last evaluation are
+    then posted, the latter as the result, and the remaining rounds do not send
+    any instructions to the clients.
+    """
+
+    def __init__(self, num_of_rounds: int, tol: float, **kwargs):
+        super().__init__(**kwargs)
+        self.num_of_rounds = num_of_rounds
+        self.tol = tol
+        self.finished = False
+        self._previous_loss = None
+
+    def configure_fit(self, server_round, parameters, client_manager):
+        if self.finished:
+            return []
+        return super().configure_fit(server_round, parameters, client_manager)
+
+    def configure_evaluate(self, server_round, parameters, client_manager):
+        if self.finished:
+            return []
+        return super().configure_evaluate(server_round, parameters, client_manager)
+
+    def evaluate(
+        self, server_round: int, parameters: Parameters
+    ) -> Optional[Tuple[float, Dict[str, Scalar]]]:
+        if self.finished:
+            return None
+        res = super().evaluate(server_round, parameters)
+        if res is None:
+            return None
+
+        loss, metrics = res
+        converged = server_round > 0 and self._has_converged(loss)
+        if converged or server_round >= self.num_of_rounds:
+            if converged:
+                FLOWER_LOGGER.info(f"Loss converged at round {server_round}.")
+            self.finished = True
+            post_model_parameters(parameters_to_ndarrays(parameters))
+            post_result(metrics)
+        self._previous_loss = loss
+        return res
+
+    def _has_converged(self, loss: float) -> bool:
+        return (
+            self._previous_loss is not None
+            and abs(self._previous_loss - loss) <= self.tol
+        )
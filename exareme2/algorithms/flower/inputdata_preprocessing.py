@@ -4,8 +4,12 @@ from pathlib import Path
 from typing import List
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import requests
+from flwr.common import NDArrays
+from flwr.common import Parameters
+from flwr.common import ndarrays_to_parameters
 from flwr.common.logger import FLOWER_LOGGER
 from pydantic import BaseModel
 from sklearn import preprocessing
@@ -15,8 +19,12 @@ from exareme2.algorithms.flower.df_filter import apply_filter
 # Constants for project directories and environment configurations
 CONTROLLER_IP = os.getenv("CONTROLLER_IP", "127.0.0.1")
 CONTROLLER_PORT = os.getenv("CONTROLLER_PORT", 5000)
-RESULT_URL = f"http://{CONTROLLER_IP}:{CONTROLLER_PORT}/flower/result"
-INPUT_URL = f"http://{CONTROLLER_IP}:{CONTROLLER_PORT}/flower/input"
+REQUEST_ID = os.getenv("REQUEST_ID")
+FLOWER_URL = f"http://{CONTROLLER_IP}:{CONTROLLER_PORT}/flower/{REQUEST_ID}"
+RESULT_URL = f"{FLOWER_URL}/result"
+INPUT_URL = f"{FLOWER_URL}/input"
+PARAMETERS_URL = f"{FLOWER_URL}/parameters"
+MODEL_PARAMETERS_URL = f"{FLOWER_URL}/model_parameters"
 CDES_URL = f"http://{CONTROLLER_IP}:{CONTROLLER_PORT}/cdes_metadata"
 HEADERS = {"Content-type": "application/json", "Accept": "text/plain"}
 
@@ -90,6 +98,46 @@ def get_input() -> Inputdata:
     return input_data
 
 
+def get_parameters() -> dict:
+    FLOWER_LOGGER.debug(f"Getting parameters from: {PARAMETERS_URL} ...")
+    response = requests.get(PARAMETERS_URL)
+    if response.status_code != 200:
+        error_handling(response.text)
+    return response.json()
+
+
+def get_initial_parameters(default: NDArrays) -> Parameters:
+    """
+    Returns the model parameters to start the training from, which are those of a
+    previous training on the same variables, when the request is warm started,
+    or else the 'default' ones.
+    """
+    FLOWER_LOGGER.debug(f"Getting model parameters from: {MODEL_PARAMETERS_URL} ...")
+    response = requests.get(MODEL_PARAMETERS_URL)
+    if response.status_code != 200:
+        error_handling(response.text)
+        return ndarrays_to_parameters(default)
+
+    model_parameters = response.json()["model_parameters"]
+    if model_parameters is None:
+        return ndarrays_to_parameters(default)
+    arrays = [np.array(array) for array in model_parameters]
+    if [array.shape for array in arrays] != [array.shape for array in default]:
+        FLOWER_LOGGER.warning("The warm start model parameters have other shapes.")
+        return ndarrays_to_parameters(default)
+    return ndarrays_to_parameters(arrays)
+
+
+def post_model_parameters(model_parameters: NDArrays) -> None:
+    FLOWER_LOGGER.debug(f"Posting model parameters at: {MODEL_PARAMETERS_URL} ...")
+    data = {"model_parameters": [array.tolist() for array in model_parameters]}
+    response = requests.post(
+        MODEL_PARAMETERS_URL, data=json.dumps(data), headers=HEADERS
+    )
+    if response.status_code != 200:
+        error_handling(response.text)
+
+
 def get_enumerations(data_model: str, variable_name: str) -> list:
     try:
         FLOWER_LOGGER.debug(f"Getting enumerations from: {CDES_URL} ...")
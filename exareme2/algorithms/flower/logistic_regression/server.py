@@ -3,17 +3,18 @@ import os
 import flwr as fl
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import log_loss
+from utils import get_model_parameters
 from utils import set_initial_params
 from utils import set_model_params
 
+from exareme2.algorithms.flower.early_stopping import EarlyStoppingFedAvg
+from exareme2.algorithms.flower.early_stopping import get_stopping_params
 from exareme2.algorithms.flower.inputdata_preprocessing import fetch_data
+from exareme2.algorithms.flower.inputdata_preprocessing import get_initial_parameters
 from exareme2.algorithms.flower.inputdata_preprocessing import get_input
-from exareme2.algorithms.flower.inputdata_preprocessing import post_result
+from exareme2.algorithms.flower.inputdata_preprocessing import get_parameters
 from exareme2.algorithms.flower.inputdata_preprocessing import preprocess_data
 
-# TODO: NUM_OF_ROUNDS should become a parameter of the algorithm and be set on the AlgorithmRequestDTO
-NUM_OF_ROUNDS = 5
-
 
 def fit_round(server_round: int):
     """Configures the next round of training."""
@@ -25,8 +26,6 @@ def get_evaluate_fn(model, X_test, y_test):
         set_model_params(model, parameters)
         loss = log_loss(y_test, model.predict_proba(X_test))
         accuracy = model.score(X_test, y_test)
-        if server_round == NUM_OF_ROUNDS:
-            post_result({"accuracy": accuracy})
         return loss, {"accuracy": accuracy}
 
     return evaluate
@@ -38,7 +37,11 @@ if __name__ == "__main__":
     full_data = fetch_data(inputdata)
     X_train, y_train = preprocess_data(inputdata, full_data)
     set_initial_params(model, X_train, full_data, inputdata)
-    strategy = fl.server.strategy.FedAvg(
+    num_of_rounds, tol = get_stopping_params(get_parameters())
+    strategy = EarlyStoppingFedAvg(
+        num_of_rounds=num_of_rounds,
+        tol=tol,
+        initial_parameters=get_initial_parameters(get_model_parameters(model)),
         min_available_clients=int(os.environ["NUMBER_OF_CLIENTS"]),
         evaluate_fn=get_evaluate_fn(model, X_train, y_train),
         on_fit_config_fn=fit_round,
@@ -46,5 +49,5 @@ if __name__ == "__main__":
     fl.server.start_server(
         server_address=os.environ["SERVER_ADDRESS"],
         strategy=strategy,
-        config=fl.server.ServerConfig(num_rounds=NUM_OF_ROUNDS),
+        config=fl.server.ServerConfig(num_rounds=num_of_rounds),
     )
@@ -5,11 +5,12 @@ import flwr as fl
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import log_loss
 
-from exareme2.algorithms.flower.inputdata_preprocessing import post_result
+from exareme2.algorithms.flower.early_stopping import EarlyStoppingFedAvg
+from exareme2.algorithms.flower.early_stopping import get_stopping_params
+from exareme2.algorithms.flower.inputdata_preprocessing import get_initial_parameters
+from exareme2.algorithms.flower.inputdata_preprocessing import get_parameters
 from exareme2.algorithms.flower.mnist_logistic_regression import utils
 
-NUM_OF_ROUNDS = 5
-
 
 def fit_round(server_round: int) -> Dict:
     """Send round number to client."""
@@ -27,18 +28,22 @@ def get_evaluate_fn(model: LogisticRegression):
         utils.set_model_params(model, parameters)
         loss = log_loss(y_test, model.predict_proba(X_test))
         accuracy = model.score(X_test, y_test)
-        if server_round == NUM_OF_ROUNDS:
-            post_result({"accuracy": accuracy})
         return loss, {"accuracy": accuracy}
 
     return evaluate
 
 
-# Start Flower server for five rounds of federated learning
+# Start Flower server until the loss converges or the rounds are done
 if __name__ == "__main__":
     model = LogisticRegression()
     utils.set_initial_params(model)
-    strategy = fl.server.strategy.FedAvg(
+    num_of_rounds, tol = get_stopping_params(get_parameters())
+    strategy = EarlyStoppingFedAvg(
+        num_of_rounds=num_of_rounds,
+        tol=tol,
+        initial_parameters=get_initial_parameters(
+            list(utils.get_model_parameters(model))
+        ),
         min_available_clients=int(os.environ["NUMBER_OF_CLIENTS"]),
         min_evaluate_clients=int(os.environ["NUMBER_OF_CLIENTS"]),
         min_fit_clients=int(os.environ["NUMBER_OF_CLIENTS"]),
@@ -48,5 +53,5 @@ if __name__ == "__main__":
     fl.server.start_server(
         server_address=os.environ["SERVER_ADDRESS"],
         strategy=strategy,
-        config=fl.server.ServerConfig(num_rounds=NUM_OF_ROUNDS),
+        config=fl.server.ServerConfig(num_rounds=num_of_rounds),
     )
@@ -1,3 +1,4 @@
+import time
 from logging import Logger
 from typing import Final
 from typing import List
@@ -7,7 +8,9 @@ from celery.result import AsyncResult
 
 from exareme2.celery_app_conf import CELERY_APP_QUEUE_MAX_PRIORITY
 from exareme2.controller.celery.app import CeleryAppFactory
+from exareme2.controller.celery.app import CeleryTaskTimeoutException
 from exareme2.controller.celery.app import CeleryWrapper
+from exareme2.controller.metrics import celery_task_duration
 from exareme2.worker_communication import TableInfo
 from exareme2.worker_communication import TableSchema
 from exareme2.worker_communication import WorkerUDFKeyArguments
@@ -24,6 +27,7 @@ TASK_SIGNATURES: Final = {
     "create_merge_table": "exareme2.worker.exareme2.tables.tables_api.create_merge_table",
     "get_views": "exareme2.worker.exareme2.views.views_api.get_views",
     "create_data_model_views": "exareme2.worker.exareme2.views.views_api.create_data_model_views",
+    "get_dataset_statistics": "exareme2.worker.exareme2.dataset_statistics.dataset_statistics_api.get_dataset_statistics",
     "run_udf": "exareme2.worker.exareme2.udfs.udfs_api.run_udf",
     "cleanup": "exareme2.worker.exareme2.cleanup.cleanup_api.cleanup",
     "validate_smpc_templates_match": "exareme2.worker.exareme2.smpc.smpc_api.validate_smpc_templates_match",
@@ -40,20 +44,43 @@ TASK_SIGNATURES: Final = {
     "stop_flower_client": "exareme2.worker.flower.cleanup.cleanup_api.stop_flower_client",
     "garbage_collect": "exareme2.worker.flower.cleanup.cleanup_api.garbage_collect",
 }
+TASK_NAMES: Final = {signature: name for name, signature in TASK_SIGNATURES.items()}
 
 
 class WorkerTaskResult:
     def __init__(
-        self, celery_app: CeleryWrapper, async_result: AsyncResult, logger: Logger
+        self,
+        celery_app: CeleryWrapper,
+        async_result: AsyncResult,
+        logger: Logger,
+        task_name: Optional[str] = None,
     ):
         self._celery_app = celery_app
         self._async_result = async_result
         self._logger = logger
+        self._task_name = task_name
+        self._queued_at = time.perf_counter()
 
     def get(self, timeout: int):
-        return self._celery_app.get_result(
-            async_result=self._async_result, timeout=timeout, logger=self._logger
-        )
+        # The failed and timed out tasks are observed too, since they are the
+        # slowest ones, labelled with their outcome
+        outcome = "error"
+        try:
+            result = self._celery_app.get_result(
+                async_result=self._async_result, timeout=timeout, logger=self._logger
+            )
+            outcome = "success"
+            return result
+        except CeleryTaskTimeoutException:
+            outcome = "timeout"
+            raise
+        finally:
+            if self._task_name:
+                celery_task_duration.observe(
+                    time.perf_counter() - self._queued_at,
+                    task=self._task_name,
+                    outcome=outcome,
+                )
 
 
 class WorkerTasksHandler:
@@ -77,7 +104,12 @@ class WorkerTasksHandler:
             logger=self._logger,
             **task_params,
         )
-        return WorkerTaskResult(self._get_celery_app(), async_result, self._logger)
+        return WorkerTaskResult(
+            self._get_celery_app(),
+            async_result,
+            self._logger,
+            task_name=TASK_NAMES.get(task_signature),
+        )
 
     def get_tables(self, request_id: str, context_id: str) -> WorkerTaskResult:
         return self._queue_task(
@@ -86,11 +118,19 @@ class WorkerTasksHandler:
             context_id=context_id,
         )
 
-    def get_table_data(self, request_id: str, table_name: str) -> WorkerTaskResult:
+    def get_table_data(
+        self,
+        request_id: str,
+        table_name: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> WorkerTaskResult:
         return self._queue_task(
             task_signature=TASK_SIGNATURES["get_table_data"],
             request_id=request_id,
             table_name=table_name,
+            offset=offset,
+            limit=limit,
         )
 
     def create_table(
@@ -122,6 +162,7 @@ class WorkerTasksHandler:
         filters: dict,
         dropna: bool = True,
         check_min_rows: bool = True,
+        shared_views_id: Optional[str] = None,
     ) -> WorkerTaskResult:
         return self._queue_task(
             task_signature=TASK_SIGNATURES["create_data_model_views"],
@@ -134,6 +175,17 @@ class WorkerTasksHandler:
             filters=filters,
             dropna=dropna,
             check_min_rows=check_min_rows,
+            shared_views_id=shared_views_id,
+        )
+
+    def get_dataset_statistics(
+        self, request_id: str, data_model: str, datasets: List[str]
+    ) -> WorkerTaskResult:
+        return self._queue_task(
+            task_signature=TASK_SIGNATURES["get_dataset_statistics"],
+            request_id=request_id,
+            data_model=data_model,
+            datasets=datasets,
         )
 
     def get_merge_tables(self, request_id: str, context_id: str) -> WorkerTaskResult:
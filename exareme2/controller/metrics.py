@@ -0,0 +1,29 @@
+from exareme2.metrics import MetricsRegistry
+
+# Exposed through the '/metrics' endpoint of the controller.
+metrics = MetricsRegistry()
+
+algorithm_request_duration = metrics.histogram(
+    "exareme2_controller_algorithm_request_duration_seconds",
+    "Duration of the algorithm execution requests.",
+    ["algorithm", "type"],
+)
+algorithm_request_failures = metrics.counter(
+    "exareme2_controller_algorithm_request_failures_total",
+    "Algorithm execution requests that failed.",
+    ["algorithm", "type"],
+)
+celery_task_duration = metrics.histogram(
+    "exareme2_controller_celery_task_duration_seconds",
+    "Time from queuing a worker task until its result, or its failure, is received.",
+    ["task", "outcome"],
+)
+smpc_wait_duration = metrics.histogram(
+    "exareme2_controller_smpc_wait_duration_seconds",
+    "Time spent waiting for the SMPC cluster to compute a result.",
+    ["operation"],
+)
+worker_landscape_aggregator_refresh_duration = metrics.histogram(
+    "exareme2_controller_worker_landscape_aggregator_refresh_duration_seconds",
+    "Duration of the worker landscape aggregator refreshes.",
+)
@@ -5,9 +5,14 @@ from celery.utils.serialization import jsonify
 from quart import Blueprint
 from quart import request
 
+from exareme2.controller.metrics import metrics
 from exareme2.controller.quart.loggers import loggers
 from exareme2.controller.services import get_worker_landscape_aggregator
 from exareme2.controller.services.algorithm_execution import execute_algorithm
+from exareme2.controller.services.algorithm_execution import execute_algorithm_batch
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    AlgorithmBatchRequestDTO,
+)
 from exareme2.controller.services.api.algorithm_request_dtos import AlgorithmRequestDTO
 from exareme2.controller.services.api.algorithm_request_validator import BadRequest
 from exareme2.controller.services.api.algorithm_spec_dtos import (
@@ -15,6 +20,8 @@ from exareme2.controller.services.api.algorithm_spec_dtos import (
 )
 from exareme2.controller.services.flower import get_flower_execution_info
 from exareme2.controller.services.startup import start_background_services
+from exareme2.controller.tracer import tracer
+from exareme2.metrics import PROMETHEUS_CONTENT_TYPE
 
 algorithms = Blueprint("algorithms_endpoint", __name__)
 
@@ -80,6 +87,11 @@ async def healthcheck() -> str:
     return ""
 
 
+@algorithms.route("/metrics", methods=["GET"])
+async def get_metrics():
+    return metrics.render(), 200, {"Content-Type": PROMETHEUS_CONTENT_TYPE}
+
+
 @algorithms.route("/algorithms/<algorithm_name>", methods=["POST"])
 async def run_algorithm(algorithm_name: str) -> str:
     request_body = await request.json
@@ -98,19 +110,72 @@ async def run_algorithm(algorithm_name: str) -> str:
     return result
 
 
-@algorithms.route("/flower/input", methods=["GET"])
-async def get_flower_input() -> dict:
-    return get_flower_execution_info().get_inputdata().dict()
+@algorithms.route("/algorithms/batch", methods=["POST"])
+async def run_algorithm_batch() -> str:
+    """
+    Executes several algorithms over the same data model views. The results are
+    returned in the order of the algorithm requests.
+    """
+    request_body = await request.json
+    try:
+        algorithm_batch_request_dto = AlgorithmBatchRequestDTO.parse_obj(request_body)
+    except pydantic.error_wrappers.ValidationError as pydantic_error:
+        error_msg = (
+            f"Algorithm batch execution request malformed:"
+            f"\nrequest received:{request_body}"
+            f"\nerror:{pydantic_error}"
+        )
+        raise BadRequest(error_msg)
+
+    results = await execute_algorithm_batch(algorithm_batch_request_dto)
+
+    return "[" + ",".join(results) + "]"
 
 
-@algorithms.route("/flower/result", methods=["POST"])
-async def set_flower_result():
+@algorithms.route("/requests/<request_id>/trace", methods=["GET"])
+async def get_request_trace(request_id: str) -> dict:
+    return tracer.get_trace(request_id)
+
+
+@algorithms.route("/flower/<request_id>/input", methods=["GET"])
+async def get_flower_input(request_id: str) -> dict:
+    return get_flower_execution_info().get_inputdata(request_id).dict()
+
+
+@algorithms.route("/flower/<request_id>/parameters", methods=["GET"])
+async def get_flower_parameters(request_id: str) -> dict:
+    return get_flower_execution_info().get_parameters(request_id)
+
+
+@algorithms.route("/flower/<request_id>/model_parameters", methods=["GET"])
+async def get_flower_model_parameters(request_id: str) -> dict:
+    model_parameters = get_flower_execution_info().get_model_parameters(request_id)
+    return {"model_parameters": model_parameters}
+
+
+@algorithms.route("/flower/<request_id>/model_parameters", methods=["POST"])
+async def set_flower_model_parameters(request_id: str):
     request_body = await request.json
-    await get_flower_execution_info().set_result(result=request_body)
+    get_flower_execution_info().set_model_parameters(
+        request_id, request_body["model_parameters"]
+    )
+
+    return jsonify({"message": "Model parameters set successfully"}), 200
+
+
+@algorithms.route("/flower/<request_id>/result", methods=["POST"])
+async def set_flower_result(request_id: str):
+    request_body = await request.json
+    await get_flower_execution_info().set_result(request_id, result=request_body)
 
     return jsonify({"message": "Result set successfully"}), 200
 
 
+@algorithms.route("/flower/<request_id>/status", methods=["GET"])
+async def get_flower_status(request_id: str) -> dict:
+    return {"status": get_flower_execution_info().get_status(request_id).value}
+
+
 def configure_loggers():
     """
     The loggers should be initialized at app startup, otherwise the configs are overwritten.
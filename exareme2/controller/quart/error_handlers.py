@@ -6,6 +6,10 @@ from exareme2.controller.logger import get_background_service_logger
 from exareme2.controller.services.api.algorithm_request_validator import BadRequest
 from exareme2.controller.services.exareme2.controller import WorkerTaskTimeoutException
 from exareme2.controller.services.exareme2.controller import WorkerUnresponsiveException
+from exareme2.controller.services.exareme2.request_scheduler import (
+    ControllerOverloadedException,
+)
+from exareme2.controller.services.flower.flower_io_registry import UnknownFlowerJobError
 from exareme2.data_filters import FilterError
 from exareme2.smpc_cluster_communication import SMPCUsageError
 from exareme2.worker_communication import BadUserInput
@@ -24,9 +28,11 @@ INSUFFICIENT_DATA_ERROR_MESSAGE = (
 class HTTPStatusCode(enum.IntEnum):
     OK = 200
     BAD_REQUEST = 400
+    NOT_FOUND = 404
     BAD_USER_INPUT = 460
     INSUFFICIENT_DATA_ERROR = 461
     SMPC_USAGE_ERROR = 462
+    CONTROLLER_OVERLOADED_ERROR = 503
     WORKER_UNRESPONSIVE_ALGORITHM_EXECUTION_ERROR = 512
     WORKER_TASK_TIMEOUT_ALGORITHM_EXECUTION_ERROR = 513
     UNEXPECTED_ERROR = 500
@@ -48,6 +54,14 @@ def handle_bad_request(error: FilterError):
     return error.message, HTTPStatusCode.BAD_REQUEST
 
 
+@error_handlers.app_errorhandler(UnknownFlowerJobError)
+def handle_unknown_flower_job(error: UnknownFlowerJobError):
+    get_background_service_logger().info(
+        f"Request Error. Type: '{type(error).__name__}' Message: '{error}'"
+    )
+    return error.message, HTTPStatusCode.NOT_FOUND
+
+
 @error_handlers.app_errorhandler(BadUserInput)
 def handle_bad_user_input(error: BadUserInput):
     get_background_service_logger().info(
@@ -114,6 +128,18 @@ def handle_worker_task_timeout_algorithm_execution_exception(
     )
 
 
+@error_handlers.app_errorhandler(ControllerOverloadedException)
+def handle_controller_overloaded_exception(error: ControllerOverloadedException):
+    get_background_service_logger().info(
+        f"Request Error. Type: '{type(error).__name__}' Message: '{error}'"
+    )
+    return (
+        error.message,
+        HTTPStatusCode.CONTROLLER_OVERLOADED_ERROR,
+        {"Retry-After": str(error.retry_after)},
+    )
+
+
 #
 # @error_handlers.app_errorhandler(Exception)
 # def handle_unexpected_exception(error: Exception):
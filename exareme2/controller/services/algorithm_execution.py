@@ -1,7 +1,15 @@
 from exareme2.algorithms.specifications import AlgorithmType
 from exareme2.controller import config as ctrl_config
+from exareme2.controller.metrics import algorithm_request_duration
+from exareme2.controller.metrics import algorithm_request_failures
 from exareme2.controller.services import get_worker_landscape_aggregator
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    AlgorithmBatchRequestDTO,
+)
 from exareme2.controller.services.api.algorithm_request_dtos import AlgorithmRequestDTO
+from exareme2.controller.services.api.algorithm_request_validator import (
+    validate_algorithm_batch_request,
+)
 from exareme2.controller.services.api.algorithm_request_validator import (
     validate_algorithm_request,
 )
@@ -31,9 +39,43 @@ async def execute_algorithm(algo_name: str, request_dto: AlgorithmRequestDTO):
         if request_dto.type == AlgorithmType.FLOWER
         else get_exareme2_controller()
     )
-    algorithm_result = await controller.exec_algorithm(
-        algorithm_name=algo_name,
-        algorithm_request_dto=request_dto,
-    )
+    metric_labels = {"algorithm": algo_name, "type": request_dto.type.value}
+    try:
+        with algorithm_request_duration.time(**metric_labels):
+            algorithm_result = await controller.exec_algorithm(
+                algorithm_name=algo_name,
+                algorithm_request_dto=request_dto,
+            )
+    except Exception:
+        algorithm_request_failures.inc(**metric_labels)
+        raise
 
     return algorithm_result
+
+
+async def execute_algorithm_batch(batch_request_dto: AlgorithmBatchRequestDTO):
+    if not batch_request_dto.request_id:
+        batch_request_dto.request_id = UIDGenerator().get_a_uid()
+    for algorithm_request_dto in batch_request_dto.algorithms:
+        algorithm_request_dto.request_id = batch_request_dto.request_id
+
+    validate_algorithm_batch_request(
+        algorithm_batch_request_dto=batch_request_dto,
+        algorithms_specs=specifications.enabled_algorithms,
+        transformers_specs=specifications.enabled_transformers,
+        worker_landscape_aggregator=get_worker_landscape_aggregator(),
+        smpc_enabled=ctrl_config.smpc.enabled,
+        smpc_optional=ctrl_config.smpc.optional,
+    )
+    metric_labels = {"algorithm": "batch", "type": AlgorithmType.EXAREME2.value}
+    try:
+        with algorithm_request_duration.time(**metric_labels):
+            algorithm_results = await get_exareme2_controller().exec_algorithm_batch(
+                request_id=batch_request_dto.request_id,
+                algorithm_request_dtos=batch_request_dto.algorithms,
+            )
+    except Exception:
+        algorithm_request_failures.inc(**metric_labels)
+        raise
+
+    return algorithm_results
@@ -14,6 +14,8 @@ from exareme2.algorithms.specifications import AlgorithmType
 @unique
 class AlgorithmRequestSystemFlags(str, Enum):
     SMPC = "smpc"
+    WARM_START = "warm_start"
+    PRIORITY = "priority"
 
 
 class ImmutableBaseModel(BaseModel, ABC):
@@ -40,3 +42,12 @@ class AlgorithmRequestDTO(BaseModel):
     flags: Optional[Dict[str, Any]]
     preprocessing: Optional[Dict[str, PARAMETERS_TYPE]]
     type: AlgorithmType
+
+
+class BatchedAlgorithmRequestDTO(AlgorithmRequestDTO):
+    algorithm_name: str
+
+
+class AlgorithmBatchRequestDTO(BaseModel):
+    request_id: Optional[str]
+    algorithms: List[BatchedAlgorithmRequestDTO]
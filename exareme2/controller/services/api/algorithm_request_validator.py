@@ -14,6 +14,9 @@ from exareme2.algorithms.specifications import InputDataType
 from exareme2.algorithms.specifications import ParameterEnumSpecification
 from exareme2.algorithms.specifications import ParameterSpecification
 from exareme2.algorithms.specifications import TransformerSpecification
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    AlgorithmBatchRequestDTO,
+)
 from exareme2.controller.services.api.algorithm_request_dtos import (
     AlgorithmInputDataDTO,
 )
@@ -26,7 +29,7 @@ from exareme2.controller.services.api.algorithm_spec_dtos import ParameterType
 from exareme2.controller.services.worker_landscape_aggregator.worker_landscape_aggregator import (
     WorkerLandscapeAggregator,
 )
-from exareme2.data_filters import validate_filter
+from exareme2.data_filters import filter_cache
 from exareme2.smpc_cluster_communication import validate_smpc_usage
 from exareme2.worker_communication import BadUserInput
 from exareme2.worker_communication import CommonDataElement
@@ -72,6 +75,66 @@ def validate_algorithm_request(
     )
 
 
+def validate_algorithm_batch_request(
+    algorithm_batch_request_dto: AlgorithmBatchRequestDTO,
+    algorithms_specs: Dict[Tuple[str, AlgorithmType], AlgorithmSpecification],
+    transformers_specs: Dict[str, TransformerSpecification],
+    worker_landscape_aggregator: WorkerLandscapeAggregator,
+    smpc_enabled: bool,
+    smpc_optional: bool,
+):
+    """
+    Validates each algorithm request of the batch and that all of them select the
+    same data, so that they can be executed over the same data model views.
+    """
+    algorithm_requests = algorithm_batch_request_dto.algorithms
+    if not algorithm_requests:
+        raise BadRequest("The batch request does not contain any algorithm requests.")
+
+    for algorithm_request_dto in algorithm_requests:
+        validate_algorithm_request(
+            algorithm_name=algorithm_request_dto.algorithm_name,
+            algorithm_request_dto=algorithm_request_dto,
+            algorithms_specs=algorithms_specs,
+            transformers_specs=transformers_specs,
+            worker_landscape_aggregator=worker_landscape_aggregator,
+            smpc_enabled=smpc_enabled,
+            smpc_optional=smpc_optional,
+        )
+        if algorithm_request_dto.type != AlgorithmType.EXAREME2:
+            raise BadRequest(
+                f"Only {AlgorithmType.EXAREME2.value} algorithms can be batched, "
+                f"'{algorithm_request_dto.algorithm_name}' is of type "
+                f"{algorithm_request_dto.type.value}."
+            )
+        if algorithm_request_dto.preprocessing:
+            raise BadRequest(
+                "Algorithms with preprocessing steps cannot be batched, "
+                f"'{algorithm_request_dto.algorithm_name}' has preprocessing "
+                f"{list(algorithm_request_dto.preprocessing)}."
+            )
+
+    reference_request = algorithm_requests[0]
+    reference_data_selection = _get_data_selection(reference_request.inputdata)
+    for algorithm_request_dto in algorithm_requests[1:]:
+        if (
+            _get_data_selection(algorithm_request_dto.inputdata)
+            != reference_data_selection
+        ):
+            raise BadRequest(
+                "All the algorithm requests of a batch should have the same data "
+                "model, datasets and filters."
+            )
+        if algorithm_request_dto.flags != reference_request.flags:
+            raise BadRequest(
+                "All the algorithm requests of a batch should have the same flags."
+            )
+
+
+def _get_data_selection(inputdata: AlgorithmInputDataDTO) -> dict:
+    return inputdata.dict(exclude={"x", "y"})
+
+
 def _get_algorithm_specs(
     algorithm_name: str,
     algorithm_type: AlgorithmType,
@@ -201,7 +264,7 @@ def _validate_inputdata_filter(data_model, filter, data_model_cdes):
     Validates that the filter provided have the correct format
     following: https://querybuilder.js.org/
     """
-    validate_filter(data_model, filter, data_model_cdes)
+    filter_cache.validate_filter(data_model, filter, data_model_cdes)
 
 
 def _validate_algorithm_inputdatas(
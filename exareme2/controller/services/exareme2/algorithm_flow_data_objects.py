@@ -193,10 +193,12 @@ class GlobalWorkerTable(GlobalWorkerData):
         return self._table_info
 
     def get_table_data(self) -> List[List[Any]]:
-        table_data = [
-            column.data
-            for column in self.worker.get_table_data(self.table_info.name).columns
-        ]
+        # The table is fetched in pages, each one decoded and released before the
+        # next, keeping only the data of its columns
+        table_data = [[] for _ in self._schema.columns]
+        for page in self.worker.iter_table_data(self.table_info.name):
+            for data, column in zip(table_data, page.columns):
+                data.extend(column.data)
         return table_data
 
     def __repr__(self):
@@ -1,10 +1,14 @@
 import asyncio
 import concurrent
+import hashlib
+import json
 import traceback
 from abc import ABC
 from abc import abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from logging import Logger
+from typing import Any
 from typing import Dict
 from typing import Iterable
 from typing import List
@@ -32,6 +36,12 @@ from exareme2.controller.celery.app import CeleryConnectionError
 from exareme2.controller.celery.app import CeleryTaskTimeoutException
 from exareme2.controller.federation_info_logs import log_experiment_execution
 from exareme2.controller.services.api.algorithm_request_dtos import AlgorithmRequestDTO
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    AlgorithmRequestSystemFlags,
+)
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    BatchedAlgorithmRequestDTO,
+)
 from exareme2.controller.services.exareme2.algorithm_flow_data_objects import (
     LocalWorkersTable,
 )
@@ -48,15 +58,20 @@ from exareme2.controller.services.exareme2.execution_engine import (
 )
 from exareme2.controller.services.exareme2.execution_engine import SMPCParams
 from exareme2.controller.services.exareme2.execution_engine import Workers
+from exareme2.controller.services.exareme2.request_scheduler import DEFAULT_PRIORITY
+from exareme2.controller.services.exareme2.request_scheduler import HIGH_PRIORITY
+from exareme2.controller.services.exareme2.request_scheduler import RequestScheduler
 from exareme2.controller.services.exareme2.tasks_handler import Exareme2TasksHandler
 from exareme2.controller.services.exareme2.workers import GlobalWorker
 from exareme2.controller.services.exareme2.workers import LocalWorker
+from exareme2.controller.services.warm_start_cache import WarmStartCache
 from exareme2.controller.services.worker_landscape_aggregator.worker_landscape_aggregator import (
     DatasetsLocations,
 )
 from exareme2.controller.services.worker_landscape_aggregator.worker_landscape_aggregator import (
     WorkerLandscapeAggregator,
 )
+from exareme2.controller.tracer import tracer
 from exareme2.controller.uid_generator import UIDGenerator
 from exareme2.worker_communication import InsufficientDataError
 from exareme2.worker_communication import TableInfo
@@ -157,6 +172,34 @@ class DataModelViews:
         return number_of_tables[0]
 
 
+def get_shared_views_id(
+    local_workers: List[LocalWorker],
+    variable_groups: List[List[str]],
+    var_filters: Optional[dict],
+    dropna: bool,
+    check_min_rows: bool,
+) -> str:
+    """
+    Returns an id addressing the content of the "data model views" of a request, so
+    that requests selecting the same data share the views created on the workers.
+    The id is the same on all the workers, as required for the names of the tables
+    of a LocalWorkersTable, and it changes whenever the datasets of any worker change.
+    """
+    data_selection = {
+        "datasets_per_worker": sorted(
+            (worker.worker_id, worker.data_model, sorted(worker.datasets))
+            for worker in local_workers
+        ),
+        "variable_groups": variable_groups,
+        "filters": var_filters,
+        "dropna": dropna,
+        "check_min_rows": check_min_rows,
+    }
+    data_selection_json = json.dumps(data_selection, sort_keys=True)
+    # Table names are limited in length, so a shortened digest is used
+    return hashlib.sha256(data_selection_json.encode()).hexdigest()[:32]
+
+
 class DataModelViewsCreator:
     """
     Choosing which subset of the connected to the system workers will participate in an
@@ -179,6 +222,7 @@ class DataModelViewsCreator:
         dropna: bool,
         check_min_rows: bool,
         command_id: int,
+        shared_views_id: Optional[str] = None,
     ):
         """
         Parameters
@@ -198,6 +242,9 @@ class DataModelViewsCreator:
             or not
         command_id: int
             A unique id
+        shared_views_id: Optional[str]
+            When provided, the workers reuse the views already created, by any
+            context, with the same id (see get_shared_views_id)
         """
         self._local_workers = local_workers
         self._variable_groups = variable_groups
@@ -205,6 +252,7 @@ class DataModelViewsCreator:
         self._dropna = dropna
         self._check_min_rows = check_min_rows
         self._command_id = command_id
+        self._shared_views_id = shared_views_id
 
         self._data_model_views = None
 
@@ -237,6 +285,7 @@ class DataModelViewsCreator:
                     filters=self._var_filters,
                     dropna=self._dropna,
                     check_min_rows=self._check_min_rows,
+                    shared_views_id=self._shared_views_id,
                 )
             except InsufficientDataError:
                 continue
@@ -409,6 +458,13 @@ class WorkersFederation:
             dropna=dropna,
             check_min_rows=check_min_rows,
             command_id=self._command_id_generator.get_next_command_id(),
+            shared_views_id=get_shared_views_id(
+                local_workers=self._workers.local_workers,
+                variable_groups=variable_groups,
+                var_filters=self._var_filters,
+                dropna=dropna,
+                check_min_rows=check_min_rows,
+            ),
         )
         data_model_views_creator.create_data_model_views()
 
@@ -739,6 +795,8 @@ class Controller:
         tasks_timeout: int,
         run_udf_task_timeout: int,
         smpc_params: SMPCParams,
+        request_scheduler: Optional[RequestScheduler] = None,
+        warm_start_cache: Optional[WarmStartCache] = None,
     ):
         self._controller_logger = logger
         self._worker_landscape_aggregator = worker_landscape_aggregator
@@ -747,6 +805,8 @@ class Controller:
         self._celery_tasks_timeout = tasks_timeout
         self._celery_run_udf_task_timeout = run_udf_task_timeout
         self._smpc_params = smpc_params
+        self._request_scheduler = request_scheduler
+        self._warm_start_cache = warm_start_cache
 
     def start_cleanup_loop(self):
         self._controller_logger.info("(Controller) Cleaner starting ...")
@@ -785,84 +845,283 @@ class Controller:
             logger=logger,
         )
 
-        # add the identifier of the execution(context_id), along with the relevant local
-        # worker ids, to the cleaner so that whatever database artifacts are created during
-        # the execution get dropped at the end of the execution, when not needed anymore
-        self._cleaner.add_contextid_for_cleanup(
-            context_id, workers_federation.worker_ids
-        )
+        # Wait until the workers participating in the execution have available
+        # execution slots. If too many requests are already waiting, the request
+        # is rejected before any work is done on the workers.
+        async with self._schedule_execution(
+            request_id=request_id,
+            algorithm_name=algorithm_name,
+            worker_ids=workers_federation.worker_ids,
+            priority=_get_priority([algorithm_request_dto.flags]),
+        ):
+            # add the identifier of the execution(context_id), along with the relevant local
+            # worker ids, to the cleaner so that whatever database artifacts are created during
+            # the execution get dropped at the end of the execution, when not needed anymore
+            self._cleaner.add_contextid_for_cleanup(
+                context_id, workers_federation.worker_ids
+            )
 
-        # get metadata
-        variable_names = (algorithm_request_dto.inputdata.x or []) + (
-            algorithm_request_dto.inputdata.y or []
-        )
-        metadata = self._worker_landscape_aggregator.get_metadata(
-            data_model=data_model, variable_names=variable_names
-        )
+            # get metadata
+            variable_names = (algorithm_request_dto.inputdata.x or []) + (
+                algorithm_request_dto.inputdata.y or []
+            )
+            metadata = self._worker_landscape_aggregator.get_metadata(
+                data_model=data_model, variable_names=variable_names
+            )
 
-        # instantiate an algorithm execution engine, the engine is passed to the
-        # "Algorithm" implementation and serves as an API for the "Algorithm" code to
-        # execute celery on workers
-        engine_init_params = EngineInitParams(
-            smpc_params=self._smpc_params,
-            request_id=algorithm_request_dto.request_id,
-            algo_flags=algorithm_request_dto.flags,
-        )
-        engine = _create_algorithm_execution_engine(
-            engine_init_params=engine_init_params,
+            # instantiate an algorithm execution engine, the engine is passed to the
+            # "Algorithm" implementation and serves as an API for the "Algorithm" code to
+            # execute celery on workers
+            engine_init_params = EngineInitParams(
+                smpc_params=self._smpc_params,
+                request_id=algorithm_request_dto.request_id,
+                algo_flags=algorithm_request_dto.flags,
+                data_model=data_model,
+                warm_start_cache=self._warm_start_cache,
+                dataset_statistics_available=not (
+                    var_filters or algorithm_request_dto.preprocessing
+                ),
+            )
+            engine = _create_algorithm_execution_engine(
+                engine_init_params=engine_init_params,
+                command_id_generator=command_id_generator,
+                workers=workers_federation.workers,
+            )
+            variables = Variables(
+                x=sanitize_request_variable(algorithm_request_dto.inputdata.x),
+                y=sanitize_request_variable(algorithm_request_dto.inputdata.y),
+            )
+
+            # Choose ExecutionStrategy
+            if (
+                algorithm_request_dto.preprocessing
+                and algorithm_request_dto.preprocessing.get(
+                    TransformerName.LONGITUDINAL_TRANSFORMER
+                )
+            ):
+                execution_strategy = LongitudinalStrategy(
+                    algorithm_name=algorithm_name,
+                    variables=variables,
+                    algorithm_request_dto=algorithm_request_dto,
+                    engine=engine,
+                    logger=logger,
+                )
+            else:
+                execution_strategy = SingleAlgorithmStrategy(
+                    algorithm_name=algorithm_name,
+                    variables=variables,
+                    algorithm_request_dto=algorithm_request_dto,
+                    engine=engine,
+                    logger=logger,
+                )
+
+            # Create the "data model views"
+            with tracer.span("create_data_model_views", request_id, context_id):
+                data_model_views = workers_federation.create_data_model_views(
+                    variable_groups=execution_strategy.algorithm_data_loader.get_variable_groups(),
+                    dropna=execution_strategy.algorithm_data_loader.get_dropna(),
+                    check_min_rows=execution_strategy.algorithm_data_loader.get_check_min_rows(),
+                )
+
+            # Execute the strategy
+            with tracer.span(
+                "run_algorithm", request_id, context_id, algorithm_name=algorithm_name
+            ):
+                algorithm_result = await execution_strategy.run(
+                    data=data_model_views, metadata=metadata
+                )
+
+            logger.info(f"Finished execution->  {algorithm_name=} with {request_id=}")
+            logger.debug(f"Algorithm {request_id=} result-> {algorithm_result=}")
+
+            # Cleanup artifacts created in the workers' databases during the execution
+            with tracer.span("cleanup", request_id, context_id):
+                if not self._cleaner.cleanup_context_id(context_id=context_id):
+                    # if the cleanup did not succeed, set the current "context_id" as
+                    # released so that the Cleaner retries later
+                    self._cleaner.release_context_id(context_id=context_id)
+
+            return algorithm_result
+
+    async def exec_algorithm_batch(
+        self,
+        request_id: str,
+        algorithm_request_dtos: List[BatchedAlgorithmRequestDTO],
+    ) -> List[str]:
+        """
+        Executes several algorithms, selecting the same data, inside one context.
+        The data model views are created once for all the algorithms that share the
+        same 'dropna' and 'check_min_rows' settings, every distinct variable group
+        getting a single view, and the algorithm flows then run concurrently over
+        the shared views.
+        """
+        command_id_generator = CommandIdGenerator()
+
+        logger = ctrl_logger.get_request_logger(request_id=request_id)
+        context_id = UIDGenerator().get_a_uid()
+        inputdata = algorithm_request_dtos[0].inputdata
+        algorithm_names = [dto.algorithm_name for dto in algorithm_request_dtos]
+
+        workers_federation = WorkersFederation(
+            request_id=request_id,
+            context_id=context_id,
+            data_model=inputdata.data_model,
+            datasets=inputdata.datasets,
+            var_filters=inputdata.filters,
+            worker_landscape_aggregator=self._worker_landscape_aggregator,
+            celery_tasks_timeout=self._celery_tasks_timeout,
+            celery_run_udf_task_timeout=self._celery_run_udf_task_timeout,
             command_id_generator=command_id_generator,
-            workers=workers_federation.workers,
-        )
-        variables = Variables(
-            x=sanitize_request_variable(algorithm_request_dto.inputdata.x),
-            y=sanitize_request_variable(algorithm_request_dto.inputdata.y),
+            logger=logger,
         )
 
-        # Choose ExecutionStrategy
-        if (
-            algorithm_request_dto.preprocessing
-            and algorithm_request_dto.preprocessing.get(
-                TransformerName.LONGITUDINAL_TRANSFORMER
-            )
+        async with self._schedule_execution(
+            request_id=request_id,
+            algorithm_name=",".join(algorithm_names),
+            worker_ids=workers_federation.worker_ids,
+            priority=_get_priority([dto.flags for dto in algorithm_request_dtos]),
         ):
-            execution_strategy = LongitudinalStrategy(
-                algorithm_name=algorithm_name,
-                variables=variables,
-                algorithm_request_dto=algorithm_request_dto,
-                engine=engine,
-                logger=logger,
-            )
-        else:
-            execution_strategy = SingleAlgorithmStrategy(
-                algorithm_name=algorithm_name,
-                variables=variables,
-                algorithm_request_dto=algorithm_request_dto,
-                engine=engine,
-                logger=logger,
+            self._cleaner.add_contextid_for_cleanup(
+                context_id, workers_federation.worker_ids
             )
 
-        # Create the "data model views"
-        data_model_views = workers_federation.create_data_model_views(
-            variable_groups=execution_strategy.algorithm_data_loader.get_variable_groups(),
-            dropna=execution_strategy.algorithm_data_loader.get_dropna(),
-            check_min_rows=execution_strategy.algorithm_data_loader.get_check_min_rows(),
-        )
+            engine_init_params = EngineInitParams(
+                smpc_params=self._smpc_params,
+                request_id=request_id,
+                algo_flags=algorithm_request_dtos[0].flags,
+                data_model=inputdata.data_model,
+                warm_start_cache=self._warm_start_cache,
+                dataset_statistics_available=not (
+                    inputdata.filters
+                    or any(dto.preprocessing for dto in algorithm_request_dtos)
+                ),
+            )
+            variables_per_algorithm = [
+                Variables(
+                    x=sanitize_request_variable(dto.inputdata.x),
+                    y=sanitize_request_variable(dto.inputdata.y),
+                )
+                for dto in algorithm_request_dtos
+            ]
+            data_loaders = [
+                algorithm_data_loaders[dto.algorithm_name](variables=variables)
+                for dto, variables in zip(
+                    algorithm_request_dtos, variables_per_algorithm
+                )
+            ]
+
+            # Algorithms with the same view settings share their views and their
+            # execution engine, so that memoized local computations are also shared.
+            algorithm_indices_per_view_settings = {}
+            for index, data_loader in enumerate(data_loaders):
+                view_settings = (
+                    data_loader.get_dropna(),
+                    data_loader.get_check_min_rows(),
+                )
+                algorithm_indices_per_view_settings.setdefault(
+                    view_settings, []
+                ).append(index)
+
+            local_workers = workers_federation.workers.local_workers
+            strategies = [None] * len(algorithm_request_dtos)
+            with tracer.span("create_data_model_views", request_id, context_id):
+                for (
+                    dropna,
+                    check_min_rows,
+                ), algorithm_indices in algorithm_indices_per_view_settings.items():
+                    variable_groups = []
+                    for index in algorithm_indices:
+                        for variable_group in data_loaders[index].get_variable_groups():
+                            if variable_group not in variable_groups:
+                                variable_groups.append(variable_group)
+
+                    data_model_views_creator = DataModelViewsCreator(
+                        local_workers=local_workers,
+                        variable_groups=variable_groups,
+                        var_filters=inputdata.filters,
+                        dropna=dropna,
+                        check_min_rows=check_min_rows,
+                        command_id=command_id_generator.get_next_command_id(),
+                        shared_views_id=get_shared_views_id(
+                            local_workers=local_workers,
+                            variable_groups=variable_groups,
+                            var_filters=inputdata.filters,
+                            dropna=dropna,
+                            check_min_rows=check_min_rows,
+                        ),
+                    )
+                    data_model_views_creator.create_data_model_views()
+                    shared_views = data_model_views_creator.data_model_views
+
+                    engine = _create_algorithm_execution_engine(
+                        engine_init_params=engine_init_params,
+                        command_id_generator=command_id_generator,
+                        workers=Workers(
+                            local_workers=shared_views.get_list_of_workers(),
+                            global_worker=workers_federation.workers.global_worker,
+                        ),
+                    )
+                    for index in algorithm_indices:
+                        algorithm_views = _select_data_model_views(
+                            data_model_views=shared_views,
+                            variable_groups=variable_groups,
+                            selected_variable_groups=data_loaders[
+                                index
+                            ].get_variable_groups(),
+                        )
+                        strategy = SingleAlgorithmStrategy(
+                            algorithm_name=algorithm_names[index],
+                            variables=variables_per_algorithm[index],
+                            algorithm_request_dto=algorithm_request_dtos[index],
+                            engine=engine,
+                            logger=logger,
+                        )
+                        metadata = self._worker_landscape_aggregator.get_metadata(
+                            data_model=inputdata.data_model,
+                            variable_names=variables_per_algorithm[index].x
+                            + variables_per_algorithm[index].y,
+                        )
+                        strategies[index] = (strategy, algorithm_views, metadata)
+
+            with tracer.span(
+                "run_algorithm_batch",
+                request_id,
+                context_id,
+                algorithm_names=algorithm_names,
+            ):
+                algorithm_results = await asyncio.gather(
+                    *(
+                        strategy.run(data=data, metadata=metadata)
+                        for strategy, data, metadata in strategies
+                    )
+                )
 
-        # Execute the strategy
-        algorithm_result = await execution_strategy.run(
-            data=data_model_views, metadata=metadata
-        )
+            logger.info(f"Finished execution->  {algorithm_names=} with {request_id=}")
 
-        logger.info(f"Finished execution->  {algorithm_name=} with {request_id=}")
-        logger.debug(f"Algorithm {request_id=} result-> {algorithm_result=}")
+            with tracer.span("cleanup", request_id, context_id):
+                if not self._cleaner.cleanup_context_id(context_id=context_id):
+                    self._cleaner.release_context_id(context_id=context_id)
 
-        # Cleanup artifacts created in the workers' databases during the execution
-        if not self._cleaner.cleanup_context_id(context_id=context_id):
-            # if the cleanup did not succeed, set the current "context_id" as released
-            # so that the Cleaner retries later
-            self._cleaner.release_context_id(context_id=context_id)
+            return algorithm_results
 
-        return algorithm_result
+    @asynccontextmanager
+    async def _schedule_execution(
+        self,
+        request_id: str,
+        algorithm_name: str,
+        worker_ids: List[str],
+        priority: float,
+    ):
+        if not self._request_scheduler:
+            yield
+            return
+        async with self._request_scheduler.schedule(
+            request_id=request_id,
+            algorithm_name=algorithm_name,
+            worker_ids=worker_ids,
+            priority=priority,
+        ):
+            yield
 
     def _get_subset_of_workers_containing_datasets(self, workers, data_model, datasets):
         datasets_per_local_worker = {
@@ -903,6 +1162,19 @@ class Controller:
         )
 
 
+def _get_priority(flags_per_algorithm: List[Optional[Dict[str, Any]]]) -> float:
+    """
+    Requests with the 'priority' flag, on any of their algorithms, are scheduled
+    with a high priority.
+    """
+    if any(
+        flags and flags.get(AlgorithmRequestSystemFlags.PRIORITY)
+        for flags in flags_per_algorithm
+    ):
+        return HIGH_PRIORITY
+    return DEFAULT_PRIORITY
+
+
 def _create_tasks_handler(
     request_id: str,
     workerinfo: WorkerInfo,
@@ -969,6 +1241,24 @@ def _create_algorithm_execution_engine(
         )
 
 
+def _select_data_model_views(
+    data_model_views: DataModelViews,
+    variable_groups: List[List[str]],
+    selected_variable_groups: List[List[str]],
+) -> DataModelViews:
+    """
+    Returns the views, out of the ones created for 'variable_groups', that
+    correspond to the 'selected_variable_groups'.
+    """
+    views = data_model_views.to_list()
+    return DataModelViews(
+        [
+            views[variable_groups.index(variable_group)]
+            for variable_group in selected_variable_groups
+        ]
+    )
+
+
 def sanitize_request_variable(variable: list):
     if variable:
         return variable
@@ -1,7 +1,10 @@
+import json
+import threading
 from dataclasses import dataclass
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -56,7 +59,10 @@ from exareme2.controller.services.exareme2.smpc_cluster_comm_helpers import (
 )
 from exareme2.controller.services.exareme2.workers import GlobalWorker
 from exareme2.controller.services.exareme2.workers import LocalWorker
+from exareme2.controller.services.warm_start_cache import WarmStartCache
+from exareme2.controller.tracer import tracer
 from exareme2.smpc_cluster_communication import DifferentialPrivacyParams
+from exareme2.worker_communication import DatasetStatistics
 from exareme2.worker_communication import SMPCTablesInfo
 from exareme2.worker_communication import TableData
 from exareme2.worker_communication import TableInfo
@@ -89,10 +95,13 @@ class Workers:
 class CommandIdGenerator:
     def __init__(self):
         self._index = 0
+        # Algorithms of the same context can run concurrently in different threads
+        self._lock = threading.Lock()
 
     def get_next_command_id(self) -> str:
-        current = self._index
-        self._index += 1
+        with self._lock:
+            current = self._index
+            self._index += 1
         return str(current)
 
 
@@ -128,6 +137,11 @@ class InitializationParams:
 
     request_id: str
     algo_flags: Optional[Dict[str, Any]] = None
+    data_model: Optional[str] = None
+    warm_start_cache: Optional[WarmStartCache] = None
+    # The statistics stored by the workers describe the whole datasets, so they
+    # can only be used by the requests without filters or preprocessing
+    dataset_statistics_available: bool = False
 
 
 class AlgorithmExecutionEngine:
@@ -146,16 +160,82 @@ class AlgorithmExecutionEngine:
         self._logger = ctrl_logger.get_request_logger(
             request_id=initialization_params.request_id
         )
+        self._request_id = initialization_params.request_id
         self._algorithm_execution_flags = initialization_params.algo_flags
         self._smpc_params = initialization_params.smpc_params
+        self._data_model = initialization_params.data_model
+        self._warm_start_cache = initialization_params.warm_start_cache
+        self._dataset_statistics_available = (
+            initialization_params.dataset_statistics_available
+        )
 
         self._command_id_generator = command_id_generator
         self._workers = workers
 
+        # Results of the memoized local UDF runs of the current context. The
+        # algorithms sharing the engine run in different threads, so each run is
+        # guarded by a lock per memoization key.
+        self._memoized_local_results: Dict[Hashable, Any] = {}
+        self._memoization_locks: Dict[Hashable, threading.Lock] = {}
+        self._memoization_locks_lock = threading.Lock()
+
     @property
     def use_smpc(self):
         return self._get_use_smpc_flag()
 
+    @property
+    def use_warm_start(self) -> bool:
+        flags = self._algorithm_execution_flags
+        return bool(
+            self._warm_start_cache is not None
+            and flags
+            and flags.get(AlgorithmRequestSystemFlags.WARM_START)
+        )
+
+    def get_warm_start_params(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the final model parameters stored, under the same key and data
+        model, by a previous execution, so that an iterative algorithm can start
+        its training from them. Only requests with the 'warm_start' flag get them.
+        """
+        if not self.use_warm_start:
+            return None
+        return self._warm_start_cache.get((self._data_model, key))
+
+    def set_warm_start_params(self, key: Hashable, params: Any):
+        """
+        Stores the final model parameters of the execution, for the later
+        requests with the 'warm_start' flag.
+        """
+        if self._warm_start_cache is None:
+            return
+        self._warm_start_cache.set((self._data_model, key), params)
+
+    def get_dataset_statistics(self) -> Optional[Dict[str, DatasetStatistics]]:
+        """
+        Returns, per dataset, the statistics of the columns stored by the local
+        workers, so that an algorithm can skip an aggregation over the data. They
+        describe the whole datasets, so only the requests without filters or
+        preprocessing get them, and only without SMPC, which would otherwise be
+        bypassed. None is returned when any of the datasets has no statistics.
+        """
+        if not self._dataset_statistics_available or self.use_smpc:
+            return None
+        with self._span("get_dataset_statistics"):
+            statistics = {
+                dataset_statistics.dataset: dataset_statistics
+                for worker in self._workers.local_workers
+                for dataset_statistics in worker.get_dataset_statistics()
+            }
+        datasets = {
+            dataset
+            for worker in self._workers.local_workers
+            for dataset in worker.datasets
+        }
+        if not datasets.issubset(statistics):
+            return None
+        return statistics
+
     @property
     def num_local_workers(self):
         # used by fed_average strategy
@@ -169,7 +249,14 @@ class AlgorithmExecutionEngine:
         keyword_args: Optional[Dict[str, Any]] = None,
         share_to_global: Union[bool, Sequence[bool]] = False,
         output_schema: Optional[List[Tuple[str, DType]]] = None,
+        memoize: bool = False,
     ) -> Union[AlgoFlowData, List[AlgoFlowData]]:
+        """
+        When 'memoize' is True, the results of a previous run of the same UDF, with
+        the same arguments, in the current context are returned instead of running
+        the UDF again. It should only be used for UDFs whose results depend solely on
+        their arguments.
+        """
         # 1. check positional_args and keyword_args tables do not contain _GlobalWorkerTable(s)
         # 2. queues run_udf task on all local workers
         # 3. waits for all workers to complete the celery execution
@@ -178,8 +265,88 @@ class AlgorithmExecutionEngine:
         # 6. create merge table on global worker to merge the remote tables
 
         func_name = make_unique_func_name(func)
-        command_id = self._command_id_generator.get_next_command_id()
 
+        def run():
+            command_id = self._command_id_generator.get_next_command_id()
+            with self._span(
+                "run_udf_on_local_workers", func_name=func_name, command_id=command_id
+            ):
+                return self._run_udf_on_local_workers(
+                    func_name=func_name,
+                    command_id=command_id,
+                    positional_args=positional_args,
+                    keyword_args=keyword_args,
+                    share_to_global=share_to_global,
+                    output_schema=output_schema,
+                )
+
+        memoization_key = None
+        if memoize:
+            memoization_key = self._get_memoization_key(
+                func_name, positional_args, keyword_args, share_to_global, output_schema
+            )
+        if memoization_key is None:
+            return run()
+
+        # A concurrent run of the same UDF, with the same arguments, is waited for
+        # instead of being run again
+        with self._memoization_locks_lock:
+            lock = self._memoization_locks.setdefault(memoization_key, threading.Lock())
+        with lock:
+            if memoization_key in self._memoized_local_results:
+                self._logger.debug(f"Reusing the memoized results of {func_name=}.")
+                return self._memoized_local_results[memoization_key]
+            results = run()
+            self._memoized_local_results[memoization_key] = results
+        return results
+
+    @staticmethod
+    def _get_memoization_key(
+        func_name: str,
+        positional_args: Optional[List[Any]],
+        keyword_args: Optional[Dict[str, Any]],
+        share_to_global: Union[bool, Sequence[bool]],
+        output_schema: Optional[List[Tuple[str, DType]]],
+    ) -> Optional[Hashable]:
+        """
+        Tables are identified by the names of their underlying worker tables and all
+        other arguments by their json representation. Returns None when an argument
+        cannot be identified, in which case the UDF run is not memoized.
+        """
+
+        def arg_key(arg):
+            if isinstance(arg, LocalWorkersTable):
+                return tuple(
+                    sorted(
+                        table_info.name
+                        for table_info in arg.workers_tables_info.values()
+                    )
+                )
+            return json.dumps(arg, sort_keys=True)
+
+        try:
+            return (
+                func_name,
+                tuple(arg_key(arg) for arg in positional_args or []),
+                tuple(
+                    (name, arg_key(arg))
+                    for name, arg in sorted((keyword_args or {}).items())
+                ),
+                json.dumps(share_to_global),
+                json.dumps(output_schema, default=str),
+            )
+        except TypeError:
+            return None
+
+    def _run_udf_on_local_workers(
+        self,
+        func_name: str,
+        command_id: str,
+        positional_args: Optional[List[Any]],
+        keyword_args: Optional[Dict[str, Any]],
+        share_to_global: Union[bool, Sequence[bool]],
+        output_schema: Optional[List[Tuple[str, DType]]],
+    ) -> Union[AlgoFlowData, List[AlgoFlowData]]:
         self._validate_local_run_udf_args(
             positional_args=positional_args,
             keyword_args=keyword_args,
@@ -262,6 +429,27 @@ class AlgorithmExecutionEngine:
         func_name = make_unique_func_name(func)
         command_id = self._command_id_generator.get_next_command_id()
 
+        with self._span(
+            "run_udf_on_global_worker", func_name=func_name, command_id=command_id
+        ):
+            return self._run_udf_on_global_worker(
+                func_name=func_name,
+                command_id=command_id,
+                positional_args=positional_args,
+                keyword_args=keyword_args,
+                share_to_locals=share_to_locals,
+                output_schema=output_schema,
+            )
+
+    def _run_udf_on_global_worker(
+        self,
+        func_name: str,
+        command_id: str,
+        positional_args: Optional[List[Any]],
+        keyword_args: Optional[Dict[str, Any]],
+        share_to_locals: Union[bool, Sequence[bool]],
+        output_schema: Optional[List[Tuple[str, DType]]],
+    ) -> Union[AlgoFlowData, List[AlgoFlowData]]:
         self._validate_global_run_udf_args(
             positional_args=positional_args,
             keyword_args=keyword_args,
@@ -311,6 +499,16 @@ class AlgorithmExecutionEngine:
 
         return results_after_sharing_step
 
+    def _span(self, name: str, **attributes):
+        # All the workers participating in the execution share the same context_id
+        worker = self._workers.global_worker or self._workers.local_workers[0]
+        return tracer.span(
+            name=name,
+            request_id=self._request_id,
+            context_id=worker.context_id,
+            **attributes,
+        )
+
     def _get_use_smpc_flag(self) -> bool:
         """
         SMPC usage is initially defined from the config file.
@@ -346,19 +544,21 @@ class AlgorithmExecutionEngine:
     def _share_global_table_to_locals(
         self, global_table: GlobalWorkerTable
     ) -> LocalWorkersTable:
-        local_tables = {
-            worker: worker.create_remote_table(
-                table_name=global_table.table_info.name,
-                table_schema=global_table.table_info.schema_,
-                native_worker=self._workers.global_worker,
-            )
-            for worker in self._workers.local_workers
-        }
+        with self._span("share_global_table_to_locals"):
+            local_tables = {
+                worker: worker.create_remote_table(
+                    table_name=global_table.table_info.name,
+                    table_schema=global_table.table_info.schema_,
+                    native_worker=self._workers.global_worker,
+                )
+                for worker in self._workers.local_workers
+            }
         return LocalWorkersTable(workers_tables_info=local_tables)
 
     # TABLES functionality
     def get_table_data(self, worker_table) -> TableData:
-        return worker_table.get_table_data()
+        with self._span("get_table_data"):
+            return worker_table.get_table_data()
 
     def get_table_schema(self, worker_table) -> TableSchema:
         return worker_table.get_table_schema()
@@ -420,20 +620,21 @@ class AlgorithmExecutionEngine:
         # check the tables have the same schema
         common_schema = self._validate_same_schema_tables(workers_tables)
 
-        # create remote tables on global worker
-        table_infos = [
-            self._workers.global_worker.create_remote_table(
-                table_name=worker_table.name,
-                table_schema=common_schema,
-                native_worker=worker,
-            )
-            for worker, worker_table in workers_tables.items()
-        ]
+        with self._span("share_local_table_to_global", command_id=command_id):
+            # create remote tables on global worker
+            table_infos = [
+                self._workers.global_worker.create_remote_table(
+                    table_name=worker_table.name,
+                    table_schema=common_schema,
+                    native_worker=worker,
+                )
+                for worker, worker_table in workers_tables.items()
+            ]
 
-        # merge remote tables into one merge table on global worker
-        merge_table = self._workers.global_worker.create_merge_table(
-            str(command_id), table_infos
-        )
+            # merge remote tables into one merge table on global worker
+            merge_table = self._workers.global_worker.create_merge_table(
+                str(command_id), table_infos
+            )
 
         return GlobalWorkerTable(
             worker=self._workers.global_worker, table_info=merge_table
@@ -452,39 +653,43 @@ class AlgorithmExecutionEngine:
             global_template_table.table_info.name
         )
 
-        smpc_clients_per_op = load_data_to_smpc_clients(
-            command_id, local_workers_smpc_tables
-        )
+        with self._span("load_data_to_smpc_clients", command_id=command_id):
+            smpc_clients_per_op = load_data_to_smpc_clients(
+                command_id, local_workers_smpc_tables
+            )
 
-        (sum_op, min_op, max_op) = trigger_smpc_operations(
-            logger=self._logger,
-            context_id=self._workers.global_worker.context_id,
-            command_id=command_id,
-            smpc_clients_per_op=smpc_clients_per_op,
-            dp_params=self._smpc_params.dp_params,
-        )
+        with self._span("trigger_smpc_operations", command_id=command_id):
+            (sum_op, min_op, max_op) = trigger_smpc_operations(
+                logger=self._logger,
+                context_id=self._workers.global_worker.context_id,
+                command_id=command_id,
+                smpc_clients_per_op=smpc_clients_per_op,
+                dp_params=self._smpc_params.dp_params,
+            )
 
-        wait_for_smpc_results_to_be_ready(
-            logger=self._logger,
-            context_id=self._workers.global_worker.context_id,
-            command_id=command_id,
-            sum_op=sum_op,
-            min_op=min_op,
-            max_op=max_op,
-        )
+        with self._span("wait_for_smpc_results", command_id=command_id):
+            wait_for_smpc_results_to_be_ready(
+                logger=self._logger,
+                context_id=self._workers.global_worker.context_id,
+                command_id=command_id,
+                sum_op=sum_op,
+                min_op=min_op,
+                max_op=max_op,
+            )
 
-        (
-            sum_op_result_table,
-            min_op_result_table,
-            max_op_result_table,
-        ) = get_smpc_results(
-            worker=self._workers.global_worker,
-            context_id=self._workers.global_worker.context_id,
-            command_id=command_id,
-            sum_op=sum_op,
-            min_op=min_op,
-            max_op=max_op,
-        )
+        with self._span("get_smpc_results", command_id=command_id):
+            (
+                sum_op_result_table,
+                min_op_result_table,
+                max_op_result_table,
+            ) = get_smpc_results(
+                worker=self._workers.global_worker,
+                context_id=self._workers.global_worker.context_id,
+                command_id=command_id,
+                sum_op=sum_op,
+                min_op=min_op,
+                max_op=max_op,
+            )
 
         return GlobalWorkerSMPCTables(
             worker=self._workers.global_worker,
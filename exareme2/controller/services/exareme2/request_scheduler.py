@@ -0,0 +1,243 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from logging import Logger
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from exareme2.controller.tracer import tracer
+
+# Used as the cost of an algorithm that has never been executed
+DEFAULT_ALGORITHM_COST = 1.0
+# Weight of the latest observation in the moving average of an algorithm's cost
+COST_SMOOTHING_FACTOR = 0.3
+# Priority of the requests, dividing their estimated cost in the virtual finish time
+DEFAULT_PRIORITY = 1.0
+# Priority of the requests with the 'priority' flag
+HIGH_PRIORITY = 4.0
+
+
+class ControllerOverloadedException(Exception):
+    def __init__(self, retry_after: int):
+        message = (
+            "The controller is currently processing the maximum number of requests it "
+            f"can handle. Please try again in {retry_after} seconds."
+        )
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+
+class AlgorithmCostEstimator:
+    """
+    Keeps an estimate, in seconds, of the execution time of each algorithm. The
+    estimate is an exponential moving average of the observed execution times, so
+    it follows changes in the load of the federation without being dominated by a
+    single outlier.
+    """
+
+    def __init__(
+        self,
+        default_cost: float = DEFAULT_ALGORITHM_COST,
+        smoothing_factor: float = COST_SMOOTHING_FACTOR,
+    ):
+        self._default_cost = default_cost
+        self._smoothing_factor = smoothing_factor
+        self._costs: Dict[str, float] = {}
+
+    def estimate(self, algorithm_name: str) -> float:
+        return self._costs.get(algorithm_name, self._default_cost)
+
+    def update(self, algorithm_name: str, duration: float):
+        if algorithm_name not in self._costs:
+            self._costs[algorithm_name] = duration
+            return
+        self._costs[algorithm_name] = (
+            self._smoothing_factor * duration
+            + (1 - self._smoothing_factor) * self._costs[algorithm_name]
+        )
+
+
+@dataclass
+class _SchedulingEntry:
+    request_id: str
+    algorithm_name: str
+    worker_ids: List[str]
+    estimated_cost: float
+    enqueued_at: float
+    future: asyncio.Future
+    priority: float = DEFAULT_PRIORITY
+    started_at: Optional[float] = field(default=None)
+
+    @property
+    def virtual_finish_time(self) -> float:
+        # Cheap requests overtake expensive ones that arrived at about the same
+        # time, but an expensive request is never starved since every request
+        # arriving later than its virtual finish time is placed after it. The
+        # cost is weighted by the priority, so a request with a higher priority
+        # overtakes the requests of equal cost, still without starving them.
+        return self.enqueued_at + self.estimated_cost / self.priority
+
+
+class RequestScheduler:
+    """
+    Admission control for the algorithm execution requests.
+
+    Each worker can participate in at most 'max_concurrent_executions_per_worker'
+    executions at the same time. Requests that cannot be admitted wait in a queue
+    ordered by their virtual finish time (arrival time plus estimated cost divided
+    by the request's priority), which gives precedence to the cheap and to the
+    high priority requests while keeping the queue fair. When a
+    request at the head of the queue cannot be admitted, its workers are reserved,
+    so requests further back in the queue can only overtake it using other workers.
+    When the queue already holds 'max_queued_requests' requests, new requests are
+    rejected immediately with an estimate of when to retry.
+
+    The scheduler is meant to be used from a single event loop, so it does not
+    need any locking.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_executions_per_worker: int,
+        max_queued_requests: int,
+        logger: Logger,
+        cost_estimator: Optional[AlgorithmCostEstimator] = None,
+    ):
+        self._max_concurrent_executions_per_worker = (
+            max_concurrent_executions_per_worker
+        )
+        self._max_queued_requests = max_queued_requests
+        self._logger = logger
+        self._cost_estimator = cost_estimator or AlgorithmCostEstimator()
+
+        self._waiting: List[_SchedulingEntry] = []
+        self._running: List[_SchedulingEntry] = []
+        self._executions_per_worker: Dict[str, int] = {}
+
+    @property
+    def queued_requests(self) -> int:
+        return len(self._waiting)
+
+    @property
+    def running_requests(self) -> int:
+        return len(self._running)
+
+    @asynccontextmanager
+    async def schedule(
+        self,
+        request_id: str,
+        algorithm_name: str,
+        worker_ids: List[str],
+        priority: float = DEFAULT_PRIORITY,
+    ):
+        """
+        Waits until the request can be executed on the given workers and holds
+        the workers' execution slots until the context exits.
+
+        Raises
+        ------
+        ValueError
+            When the priority is not positive.
+        ControllerOverloadedException
+            When the queue is full.
+        """
+        if priority <= 0:
+            raise ValueError(f"The priority should be positive, got {priority=}.")
+
+        if len(self._waiting) >= self._max_queued_requests:
+            retry_after = self._estimate_retry_after()
+            self._logger.info(
+                f"Rejecting request {request_id=} of {algorithm_name=}, "
+                f"{len(self._waiting)} requests already queued. {retry_after=}"
+            )
+            raise ControllerOverloadedException(retry_after=retry_after)
+
+        entry = _SchedulingEntry(
+            request_id=request_id,
+            algorithm_name=algorithm_name,
+            worker_ids=list(set(worker_ids)),
+            estimated_cost=self._cost_estimator.estimate(algorithm_name),
+            enqueued_at=time.monotonic(),
+            future=asyncio.get_event_loop().create_future(),
+            priority=priority,
+        )
+        self._waiting.append(entry)
+        self._dispatch()
+
+        try:
+            with tracer.span(
+                "wait_for_execution_slot",
+                request_id,
+                queued_requests=len(self._waiting),
+            ):
+                await entry.future
+        except asyncio.CancelledError:
+            if entry in self._waiting:
+                self._waiting.remove(entry)
+            else:
+                self._release(entry)
+            self._dispatch()
+            raise
+
+        self._logger.debug(
+            f"Admitted request {request_id=} of {algorithm_name=} after waiting "
+            f"{entry.started_at - entry.enqueued_at:.3f} seconds."
+        )
+        try:
+            yield
+        finally:
+            self._cost_estimator.update(
+                algorithm_name, time.monotonic() - entry.started_at
+            )
+            self._release(entry)
+            self._dispatch()
+
+    def _dispatch(self):
+        reserved_workers = set()
+        for entry in sorted(self._waiting, key=lambda e: e.virtual_finish_time):
+            if any(
+                worker_id in reserved_workers
+                or self._executions_per_worker.get(worker_id, 0)
+                >= self._max_concurrent_executions_per_worker
+                for worker_id in entry.worker_ids
+            ):
+                reserved_workers.update(entry.worker_ids)
+                continue
+            self._admit(entry)
+
+    def _admit(self, entry: _SchedulingEntry):
+        self._waiting.remove(entry)
+        self._running.append(entry)
+        for worker_id in entry.worker_ids:
+            self._executions_per_worker[worker_id] = (
+                self._executions_per_worker.get(worker_id, 0) + 1
+            )
+        entry.started_at = time.monotonic()
+        entry.future.set_result(None)
+
+    def _release(self, entry: _SchedulingEntry):
+        self._running.remove(entry)
+        for worker_id in entry.worker_ids:
+            self._executions_per_worker[worker_id] -= 1
+            if not self._executions_per_worker[worker_id]:
+                del self._executions_per_worker[worker_id]
+
+    def _estimate_retry_after(self) -> int:
+        """
+        Estimates the time, in seconds, needed for the requests currently in the
+        system to finish, assuming that they compete for the slots of a single
+        worker, e.g. the global worker.
+        """
+        now = time.monotonic()
+        pending_cost = sum(entry.estimated_cost for entry in self._waiting) + sum(
+            max(entry.estimated_cost - (now - entry.started_at), 0)
+            for entry in self._running
+        )
+        return max(
+            math.ceil(pending_cost / self._max_concurrent_executions_per_worker), 1
+        )
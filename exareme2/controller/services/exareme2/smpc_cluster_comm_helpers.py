@@ -6,6 +6,7 @@ from typing import Tuple
 
 from exareme2 import smpc_cluster_communication as smpc_cluster
 from exareme2.controller import config as ctrl_config
+from exareme2.controller.metrics import smpc_wait_duration
 from exareme2.controller.services.exareme2.algorithm_flow_data_objects import (
     LocalWorkersSMPCTables,
 )
@@ -144,6 +145,12 @@ def wait_for_smpc_result_to_be_ready(
 
     logger.info(f"Waiting for SMPC, with jobid: '{jobid}', to finish.")
 
+    with smpc_wait_duration.time(operation=operation.value):
+        _poll_smpc_result(jobid)
+    logger.info(f"SMPC, with jobid: '{jobid}', finished.")
+
+
+def _poll_smpc_result(jobid: str):
     attempts = 0
     while True:
         sleep(ctrl_config.smpc.get_result_interval)
@@ -171,7 +178,6 @@ def wait_for_smpc_result_to_be_ready(
                 f"Max retries for the SMPC exceeded the limit: {ctrl_config.smpc.get_result_max_retries}"
             )
         attempts += 1
-    logger.info(f"SMPC, with jobid: '{jobid}', finished.")
 
 
 def wait_for_smpc_results_to_be_ready(
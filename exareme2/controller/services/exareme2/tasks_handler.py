@@ -1,9 +1,13 @@
+from functools import wraps
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 from exareme2.controller import logger as ctrl_logger
 from exareme2.controller.celery.tasks_handler import WorkerTaskResult
 from exareme2.controller.celery.tasks_handler import WorkerTasksHandler
+from exareme2.controller.tracer import tracer
+from exareme2.worker_communication import DatasetStatistics
 from exareme2.worker_communication import TableData
 from exareme2.worker_communication import TableInfo
 from exareme2.worker_communication import TableSchema
@@ -13,6 +17,31 @@ from exareme2.worker_communication import WorkerUDFKeyArguments
 from exareme2.worker_communication import WorkerUDFPosArguments
 from exareme2.worker_communication import WorkerUDFResults
 
+# The maximum number of rows fetched by a single get_table_data task, bounding the
+# size of the result messages of large tables. Every page is sorted and skips the
+# previous rows with an OFFSET, so the total cost grows quadratically with the
+# number of pages and the page size is kept large.
+TABLE_DATA_PAGE_SIZE = 500_000
+
+
+def _traced(method):
+    """
+    Records a span, covering the queuing, the broker round trip and the execution
+    of the task on the worker, for each call of an Exareme2TasksHandler method.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with tracer.span(
+            name=method.__name__,
+            request_id=self._request_id,
+            context_id=kwargs.get("context_id"),
+            worker_id=self._worker_id,
+        ):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class Exareme2TasksHandler:
     def __init__(
@@ -23,6 +52,7 @@ class Exareme2TasksHandler:
         worker_db_addr: str,
         tasks_timeout: int,
         run_udf_task_timeout: int,
+        table_data_page_size: int = TABLE_DATA_PAGE_SIZE,
     ):
         self._request_id = request_id
         self._worker_id = worker_id
@@ -30,6 +60,7 @@ class Exareme2TasksHandler:
         self._db_address = worker_db_addr
         self._tasks_timeout = tasks_timeout
         self._run_udf_task_timeout = run_udf_task_timeout
+        self._table_data_page_size = table_data_page_size
         self._logger = ctrl_logger.get_request_logger(request_id=request_id)
         self._worker_tasks_handler = WorkerTasksHandler(
             self._worker_queue_addr, self._logger
@@ -47,18 +78,47 @@ class Exareme2TasksHandler:
     def tasks_timeout(self) -> int:
         return self._tasks_timeout
 
+    @_traced
     def get_tables(self, context_id: str) -> List[str]:
         result = self._worker_tasks_handler.get_tables(
             self._request_id, context_id
         ).get(self._tasks_timeout)
         return list(result)
 
+    @_traced
     def get_table_data(self, table_name: str) -> TableData:
-        result = self._worker_tasks_handler.get_table_data(
-            request_id=self._request_id, table_name=table_name
-        ).get(self._tasks_timeout)
-        return TableData.parse_raw(result)
+        pages = self.iter_table_data(table_name)
+        table_data = next(pages)
+        # The columns of the first page are extended in place, so that only the
+        # data of the current page are kept along with the table's
+        for page in pages:
+            for column, page_column in zip(table_data.columns, page.columns):
+                column.data.extend(page_column.data)
+        return table_data
 
+    def iter_table_data(self, table_name: str) -> Iterator[TableData]:
+        """
+        Yields the data of a table in pages of consecutive rows, each one fetched
+        by its own task, so that a large table is never transferred nor decoded
+        as a single message. A table fitting in one page takes a single task.
+        """
+        offset = 0
+        while True:
+            result = self._worker_tasks_handler.get_table_data(
+                request_id=self._request_id,
+                table_name=table_name,
+                offset=offset,
+                limit=self._table_data_page_size,
+            ).get(self._tasks_timeout)
+            page = TableData.parse_raw(result)
+            yield page
+
+            num_rows = len(page.columns[0].data) if page.columns else 0
+            if num_rows < self._table_data_page_size:
+                return
+            offset += num_rows
+
+    @_traced
     def create_table(
         self, context_id: str, command_id: str, schema: TableSchema
     ) -> TableInfo:
@@ -71,11 +131,13 @@ class Exareme2TasksHandler:
         return TableInfo.parse_raw(result)
 
     # VIEWS functionality
+    @_traced
     def get_views(self, context_id: str) -> List[str]:
         return self._worker_tasks_handler.get_views(
             request_id=self._request_id, context_id=context_id
         ).get(self._tasks_timeout)
 
+    @_traced
     def create_data_model_views(
         self,
         context_id: str,
@@ -86,6 +148,7 @@ class Exareme2TasksHandler:
         filters: dict,
         dropna: bool = True,
         check_min_rows: bool = True,
+        shared_views_id: Optional[str] = None,
     ) -> List[TableInfo]:
         result_str = self._worker_tasks_handler.create_data_model_views(
             request_id=self._request_id,
@@ -97,17 +160,31 @@ class Exareme2TasksHandler:
             filters=filters,
             dropna=dropna,
             check_min_rows=check_min_rows,
+            shared_views_id=shared_views_id,
         ).get(self._tasks_timeout)
         result = [TableInfo.parse_raw(res) for res in result_str]
         return result
 
+    @_traced
+    def get_dataset_statistics(
+        self, data_model: str, datasets: List[str]
+    ) -> List[DatasetStatistics]:
+        result = self._worker_tasks_handler.get_dataset_statistics(
+            request_id=self._request_id,
+            data_model=data_model,
+            datasets=datasets,
+        ).get(self._tasks_timeout)
+        return [DatasetStatistics.parse_raw(res) for res in result]
+
     # MERGE TABLES functionality
+    @_traced
     def get_merge_tables(self, context_id: str) -> List[str]:
         return self._worker_tasks_handler.get_merge_tables(
             request_id=self._request_id,
             context_id=context_id,
         ).get(self._tasks_timeout)
 
+    @_traced
     def create_merge_table(
         self,
         context_id: str,
@@ -124,6 +201,7 @@ class Exareme2TasksHandler:
         return TableInfo.parse_raw(result)
 
     # REMOTE TABLES functionality
+    @_traced
     def get_remote_tables(self, context_id: str) -> List[str]:
         result = self._worker_tasks_handler.get_remote_tables(
             request_id=self._request_id,
@@ -131,6 +209,7 @@ class Exareme2TasksHandler:
         ).get(self._tasks_timeout)
         return result
 
+    @_traced
     def create_remote_table(
         self,
         table_name: str,
@@ -171,6 +250,7 @@ class Exareme2TasksHandler:
             output_schema=output_schema,
         )
 
+    @_traced
     def get_udf_result(
         self, worker_task_result: WorkerTaskResult
     ) -> List[WorkerUDFDTO]:
@@ -178,6 +258,7 @@ class Exareme2TasksHandler:
         return (WorkerUDFResults.parse_raw(result)).results
 
     # ------------- SMPC functionality ---------------
+    @_traced
     def validate_smpc_templates_match(
         self,
         table_name: str,
@@ -187,6 +268,7 @@ class Exareme2TasksHandler:
             table_name=table_name,
         ).get(self._tasks_timeout)
 
+    @_traced
     def load_data_to_smpc_client(self, table_name: str, jobid: str) -> str:
         result = self._worker_tasks_handler.load_data_to_smpc_client(
             request_id=self._request_id,
@@ -195,6 +277,7 @@ class Exareme2TasksHandler:
         ).get(self._tasks_timeout)
         return result
 
+    @_traced
     def get_smpc_result(
         self,
         jobid: str,
@@ -217,5 +300,6 @@ class Exareme2TasksHandler:
             context_id=context_id,
         )
 
+    @_traced
     def wait_queued_cleanup_complete(self, worker_task_result: WorkerTaskResult):
         worker_task_result.get(self._tasks_timeout)
@@ -1,11 +1,13 @@
 from abc import ABC
 from abc import abstractmethod
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 
 from exareme2.controller.celery.tasks_handler import WorkerTaskResult
 from exareme2.controller.services.exareme2.tasks_handler import Exareme2TasksHandler
+from exareme2.worker_communication import DatasetStatistics
 from exareme2.worker_communication import TableData
 from exareme2.worker_communication import TableInfo
 from exareme2.worker_communication import TableSchema
@@ -29,6 +31,10 @@ class _IWorker(ABC):
     def get_table_data(self, table_name: str) -> TableData:
         pass
 
+    @abstractmethod
+    def iter_table_data(self, table_name: str) -> Iterator[TableData]:
+        pass
+
     @abstractmethod
     def create_table(self, command_id: str, schema: TableSchema) -> TableInfo:
         pass
@@ -106,6 +112,11 @@ class _Worker(_IWorker, ABC):
             table_name=table_name,
         )
 
+    def iter_table_data(self, table_name: str) -> Iterator[TableData]:
+        return self._tasks_handler.iter_table_data(
+            table_name=table_name,
+        )
+
     def create_table(self, command_id: str, schema: TableSchema) -> TableInfo:
         return self._tasks_handler.create_table(
             context_id=self.context_id,
@@ -209,6 +220,7 @@ class LocalWorker(_Worker):
         filters: dict = None,
         dropna: bool = True,
         check_min_rows: bool = True,
+        shared_views_id: Optional[str] = None,
     ) -> List[TableInfo]:
         """
         Creates views on a specific data model.
@@ -225,6 +237,9 @@ class LocalWorker(_Worker):
             Remove NAs from the view.
         check_min_rows : bool
             Raise an exception if there are not enough rows in the view.
+        shared_views_id : Optional[str]
+            When provided, the views are shared with the other contexts requesting
+            views with the same id.
 
         Returns
         ------
@@ -240,6 +255,16 @@ class LocalWorker(_Worker):
             filters=filters,
             dropna=dropna,
             check_min_rows=check_min_rows,
+            shared_views_id=shared_views_id,
+        )
+
+    def get_dataset_statistics(self) -> List[DatasetStatistics]:
+        """
+        Returns the statistics, stored by the worker, of the columns of its
+        datasets, without any filter.
+        """
+        return self._tasks_handler.get_dataset_statistics(
+            data_model=self._data_model, datasets=self._datasets
         )
 
     def get_udf_result(
@@ -1,11 +1,17 @@
 import asyncio
 from typing import Dict
 from typing import List
+from typing import Optional
 
 from exareme2.controller import config as ctrl_config
 from exareme2.controller import logger as ctrl_logger
 from exareme2.controller.federation_info_logs import log_experiment_execution
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    AlgorithmRequestSystemFlags,
+)
+from exareme2.controller.services.flower.flower_io_registry import Status
 from exareme2.controller.services.flower.tasks_handler import FlowerTasksHandler
+from exareme2.controller.services.warm_start_cache import WarmStartCache
 from exareme2.controller.uid_generator import UIDGenerator
 from exareme2.worker_communication import WorkerInfo
 
@@ -31,11 +37,16 @@ class WorkerTaskTimeoutException(WorkerException):
 # Controller class
 class Controller:
     def __init__(
-        self, worker_landscape_aggregator, flower_execution_info, task_timeout
+        self,
+        worker_landscape_aggregator,
+        flower_execution_info,
+        task_timeout,
+        warm_start_cache: Optional[WarmStartCache] = None,
     ):
         self.worker_landscape_aggregator = worker_landscape_aggregator
         self.flower_execution_info = flower_execution_info
         self.task_timeout = task_timeout
+        self.warm_start_cache = warm_start_cache
         self.lock = asyncio.Lock()
 
     def _create_worker_tasks_handler(self, request_id, worker_info: WorkerInfo):
@@ -85,8 +96,13 @@ class Controller:
             for handler in task_handlers:
                 handler.garbage_collect()
 
-            self.flower_execution_info.set_inputdata(
-                inputdata=algorithm_request_dto.inputdata
+            self.flower_execution_info.register(
+                request_id,
+                inputdata=algorithm_request_dto.inputdata,
+                parameters=algorithm_request_dto.parameters,
+                model_parameters=self._get_warm_start_params(
+                    algorithm_name, algorithm_request_dto
+                ),
             )
             server_pid = None
             clients_pids = {}
@@ -120,7 +136,13 @@ class Controller:
                     algorithm_request_dto.parameters,
                     [info.id for info in workers_info],
                 )
-                result = await self.flower_execution_info.get_result_with_timeout()
+                result = await self.flower_execution_info.get_result_with_timeout(
+                    request_id
+                )
+
+                self._store_warm_start_params(
+                    algorithm_name, algorithm_request_dto, request_id
+                )
 
                 logger.info(f"Finished execution -> {algorithm_name} with {request_id}")
                 return result
@@ -129,9 +151,41 @@ class Controller:
                 raise WorkerTaskTimeoutException(self.task_timeout)
             finally:
                 await self._cleanup(
-                    algorithm_name, server_task_handler, server_pid, clients_pids
+                    request_id,
+                    algorithm_name,
+                    server_task_handler,
+                    server_pid,
+                    clients_pids,
                 )
 
+    def _get_warm_start_params(self, algorithm_name, algorithm_request_dto):
+        """
+        Returns the final model parameters of a previous execution on the same
+        variables, when the request has the 'warm_start' flag.
+        """
+        flags = algorithm_request_dto.flags or {}
+        if self.warm_start_cache is None or not flags.get(
+            AlgorithmRequestSystemFlags.WARM_START
+        ):
+            return None
+        return self.warm_start_cache.get(
+            _get_warm_start_key(algorithm_name, algorithm_request_dto)
+        )
+
+    def _store_warm_start_params(
+        self, algorithm_name, algorithm_request_dto, request_id
+    ):
+        if self.warm_start_cache is None:
+            return
+        if self.flower_execution_info.get_status(request_id) != Status.SUCCESS:
+            return
+        model_parameters = self.flower_execution_info.get_model_parameters(request_id)
+        if model_parameters is not None:
+            self.warm_start_cache.set(
+                _get_warm_start_key(algorithm_name, algorithm_request_dto),
+                model_parameters,
+            )
+
     def _create_global_handler(self, request_id):
         global_worker = self.worker_landscape_aggregator.get_global_worker()
         return (
@@ -140,9 +194,19 @@ class Controller:
         )
 
     async def _cleanup(
-        self, algorithm_name, server_task_handler, server_pid, clients_pids
+        self, request_id, algorithm_name, server_task_handler, server_pid, clients_pids
     ):
-        await self.flower_execution_info.reset()
+        self.flower_execution_info.release(request_id)
         server_task_handler.stop_flower_server(server_pid, algorithm_name)
         for pid, handler in clients_pids.items():
             handler.stop_flower_client(pid, algorithm_name)
+
+
+def _get_warm_start_key(algorithm_name, algorithm_request_dto):
+    inputdata = algorithm_request_dto.inputdata
+    return (
+        inputdata.data_model,
+        algorithm_name,
+        tuple(inputdata.x or []),
+        tuple(inputdata.y or []),
+    )
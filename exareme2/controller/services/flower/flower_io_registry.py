@@ -1,14 +1,19 @@
 import asyncio
+from collections import OrderedDict
 from enum import Enum
 from enum import unique
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
 
 from exareme2.controller.services.api.algorithm_request_dtos import (
     AlgorithmInputDataDTO,
 )
 
+# Number of finished jobs whose results are kept, after the job is released
+MAX_FINISHED_JOBS = 100
+
 
 @unique
 class Status(str, Enum):
@@ -26,64 +31,134 @@ class Result:
         return f"Result(status={self.status}, content={self.content})"
 
 
-class FlowerIORegistry:
-    def __init__(self, timeout, logger):
-        self._inputdata: Optional[AlgorithmInputDataDTO] = None
-        self._result: Optional[Result] = None
-        self.result_ready: Optional[asyncio.Event] = None
-        self._logger = logger
-        self._reset_sync()
-        self._timeout = timeout
-
-    def _reset_sync(self):
-        """Synchronously resets the algorithm execution info to initial state."""
-        self._inputdata = AlgorithmInputDataDTO(data_model="", datasets=[])
-        self._result = Result(content={}, status=Status.RUNNING)
+class UnknownFlowerJobError(Exception):
+    def __init__(self, request_id: str):
+        message = f"There is no flower job with request id: '{request_id}'."
+        super().__init__(message)
+        self.message = message
+
+
+class _FlowerJob:
+    def __init__(
+        self,
+        inputdata: AlgorithmInputDataDTO,
+        parameters: Dict[str, Any],
+        model_parameters: Optional[List[Any]],
+        timeout: float,
+    ):
+        self.inputdata = inputdata
+        self.parameters = parameters
+        self.model_parameters = model_parameters
+        self.timeout = timeout
+        self.result = Result(content={}, status=Status.RUNNING)
         self.result_ready = asyncio.Event()
-        self._logger.debug("Algorithm reset: input data cleared, status set to RUNNING")
 
-    async def reset(self):
-        """Asynchronously resets the algorithm execution info to initial state."""
-        self._reset_sync()
-        self._logger.debug("Asynchronous reset complete")
 
-    async def set_result(self, result: Dict[str, Any]):
-        """Sets the execution result and updates the status based on the presence of an error."""
-        status = Status.FAILURE if "error" in result else Status.SUCCESS
-        self._result = Result(content=result, status=status)
-        self._logger.debug(f"Result set with status: {status}, content: {result}")
-        self.result_ready.set()
+class FlowerIORegistry:
+    """
+    Holds the input data, the result and the status of the flower jobs, keyed by
+    their request id, so that many jobs can exchange data with the controller at
+    the same time.
 
-    async def get_result(self) -> Dict[str, Any]:
-        await self.result_ready.wait()
-        self._logger.debug(f"Result retrieved: {self._result}")
-        return self._result.content
+    The jobs are registered when they start and released when they end. The
+    results of the released jobs are kept, up to 'max_finished_jobs' of them, so
+    that they can still be retrieved for a while.
+    """
 
-    async def get_result_with_timeout(self) -> Dict[str, Any]:
+    def __init__(self, timeout, logger, max_finished_jobs: int = MAX_FINISHED_JOBS):
+        self._timeout = timeout
+        self._logger = logger
+        self._max_finished_jobs = max_finished_jobs
+        self._jobs: Dict[str, _FlowerJob] = {}
+        self._finished_jobs: "OrderedDict[str, _FlowerJob]" = OrderedDict()
+
+    def register(
+        self,
+        request_id: str,
+        inputdata: AlgorithmInputDataDTO,
+        parameters: Optional[Dict[str, Any]] = None,
+        model_parameters: Optional[List[Any]] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Registers a new job, with its input data, its parameters, the initial
+        parameters of its model, if it is warm started, and its result timeout.
+        """
+        self._finished_jobs.pop(request_id, None)
+        self._jobs[request_id] = _FlowerJob(
+            inputdata=inputdata,
+            parameters=parameters or {},
+            model_parameters=model_parameters,
+            timeout=timeout if timeout is not None else self._timeout,
+        )
+        self._logger.debug(f"Job {request_id} registered with input data: {inputdata}")
+
+    def release(self, request_id: str):
+        """Moves the job to the finished jobs, dropping the oldest ones if needed."""
+        job = self._jobs.pop(request_id, None)
+        if job is None:
+            return
+        self._finished_jobs[request_id] = job
+        while len(self._finished_jobs) > self._max_finished_jobs:
+            self._finished_jobs.popitem(last=False)
+        self._logger.debug(f"Job {request_id} released")
+
+    async def set_result(self, request_id: str, result: Dict[str, Any]):
+        """Sets the execution result and updates the status based on the presence of an error."""
+        job = self._get_job(request_id)
+        status = Status.FAILURE if "error" in result else Status.SUCCESS
+        job.result = Result(content=result, status=status)
+        self._logger.debug(
+            f"Job {request_id} result set with status: {status}, content: {result}"
+        )
+        job.result_ready.set()
+
+    async def get_result(self, request_id: str) -> Dict[str, Any]:
+        job = self._get_job(request_id)
+        await job.result_ready.wait()
+        self._logger.debug(f"Job {request_id} result retrieved: {job.result}")
+        return job.result.content
+
+    async def get_result_with_timeout(self, request_id: str) -> Dict[str, Any]:
+        job = self._get_job(request_id)
         try:
-            await asyncio.wait_for(self.get_result(), self._timeout)
-            self._logger.debug(f"Result with timeout: {self._result}")
-            return self._result.content
+            return await asyncio.wait_for(self.get_result(request_id), job.timeout)
         except asyncio.TimeoutError:
-            error = f"Failed to get result: operation timed out after {self._timeout} seconds"
+            error = (
+                f"Failed to get result: operation timed out after {job.timeout} seconds"
+            )
             self._logger.error(error)
-            self._result = Result(content={"error": error}, status=Status.FAILURE)
+            job.result = Result(content={"error": error}, status=Status.FAILURE)
             raise TimeoutError(error)
 
-    def get_status(self) -> Status:
-        """Returns the current status of the execution."""
-        status = self._result.status if self._result else Status.RUNNING
-        self._logger.debug(f"Status retrieved: {status}")
+    def get_status(self, request_id: str) -> Status:
+        """Returns the current status of the job's execution."""
+        status = self._get_job(request_id).result.status
+        self._logger.debug(f"Job {request_id} status retrieved: {status}")
         return status
 
-    def set_inputdata(self, inputdata: AlgorithmInputDataDTO):
-        """Sets new input data for the algorithm and resets status and result."""
-        self._inputdata = inputdata
-        self._result = Result(content={}, status=Status.RUNNING)
-        self.result_ready.clear()
-        self._logger.debug(f"Input data updated: {inputdata}, status reset to RUNNING")
-
-    def get_inputdata(self) -> AlgorithmInputDataDTO:
-        """Returns the current input data."""
-        self._logger.debug(f"Input data retrieved: {self._inputdata}")
-        return self._inputdata
+    def get_inputdata(self, request_id: str) -> AlgorithmInputDataDTO:
+        """Returns the input data of the job."""
+        inputdata = self._get_job(request_id).inputdata
+        self._logger.debug(f"Job {request_id} input data retrieved: {inputdata}")
+        return inputdata
+
+    def get_parameters(self, request_id: str) -> Dict[str, Any]:
+        """Returns the algorithm parameters of the job."""
+        parameters = self._get_job(request_id).parameters
+        self._logger.debug(f"Job {request_id} parameters retrieved: {parameters}")
+        return parameters
+
+    def get_model_parameters(self, request_id: str) -> Optional[List[Any]]:
+        """Returns the initial, or after the training the final, model parameters."""
+        return self._get_job(request_id).model_parameters
+
+    def set_model_parameters(self, request_id: str, model_parameters: List[Any]):
+        self._get_job(request_id).model_parameters = model_parameters
+        self._logger.debug(f"Job {request_id} model parameters set")
+
+    def _get_job(self, request_id: str) -> _FlowerJob:
+        job = self._jobs.get(request_id) or self._finished_jobs.get(request_id)
+        if job is None:
+            raise UnknownFlowerJobError(request_id)
+        return job
@@ -10,12 +10,14 @@ from exareme2.controller.services.exareme2.controller import (
     Controller as Exareme2Controller,
 )
 from exareme2.controller.services.exareme2.execution_engine import SMPCParams
+from exareme2.controller.services.exareme2.request_scheduler import RequestScheduler
 from exareme2.controller.services.flower import set_controller as set_flower_controller
 from exareme2.controller.services.flower import set_flower_execution_info
 from exareme2.controller.services.flower.controller import (
     Controller as FlowerController,
 )
 from exareme2.controller.services.flower.flower_io_registry import FlowerIORegistry
+from exareme2.controller.services.warm_start_cache import WarmStartCache
 from exareme2.controller.services.worker_landscape_aggregator.worker_landscape_aggregator import (
     WorkerLandscapeAggregator,
 )
@@ -45,6 +47,8 @@ def start_background_services():
     )
     set_cleaner(cleaner)
 
+    warm_start_cache = WarmStartCache()
+
     controller = Exareme2Controller(
         worker_landscape_aggregator=worker_landscape_aggregator,
         cleaner=cleaner,
@@ -61,6 +65,12 @@ def start_background_services():
             if ctrl_config.smpc.dp.enabled
             else None,
         ),
+        request_scheduler=RequestScheduler(
+            max_concurrent_executions_per_worker=ctrl_config.scheduler.max_concurrent_executions_per_worker,
+            max_queued_requests=ctrl_config.scheduler.max_queued_requests,
+            logger=ctrl_logger.get_background_service_logger(),
+        ),
+        warm_start_cache=warm_start_cache,
     )
     controller.start_cleanup_loop()
     set_exareme2_controller(controller)
@@ -75,5 +85,6 @@ def start_background_services():
         flower_execution_info=flower_execution_info,
         worker_landscape_aggregator=worker_landscape_aggregator,
         task_timeout=ctrl_config.rabbitmq.celery_tasks_timeout,
+        warm_start_cache=warm_start_cache,
     )
     set_flower_controller(controller)
@@ -0,0 +1,37 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+from typing import Hashable
+from typing import Optional
+
+MAX_ENTRIES = 256
+
+
+class WarmStartCache:
+    """
+    Keeps the final parameters of the models trained by the iterative algorithms,
+    keyed by the algorithm, the data model (with its version) and the variables,
+    so that a later request on the same variables can start its training from
+    them instead of from zero. Only requests with the 'warm_start' flag use it.
+
+    The least recently used entries are dropped after 'max_entries'.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: Hashable, params: Any):
+        with self._lock:
+            self._entries[key] = params
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
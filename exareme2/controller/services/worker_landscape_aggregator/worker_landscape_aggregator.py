@@ -21,6 +21,7 @@ from exareme2.controller.federation_info_logs import log_dataset_added
 from exareme2.controller.federation_info_logs import log_dataset_removed
 from exareme2.controller.federation_info_logs import log_worker_joined_federation
 from exareme2.controller.federation_info_logs import log_worker_left_federation
+from exareme2.controller.metrics import worker_landscape_aggregator_refresh_duration
 from exareme2.controller.services.worker_landscape_aggregator.worker_info_tasks_handler import (
     WorkerInfoTasksHandler,
 )
@@ -315,16 +316,17 @@ class WorkerLandscapeAggregator:
         For each data model the 'enumerations' field in the cde with code 'dataset' is updated with all datasets across workers.
         Once all the information is aggregated and validated the wla will provide the information to the Worker Registry and to the Data Model Registry.
         """
-        (
-            workers_info,
-            data_models_metadata_per_worker,
-        ) = self._fetch_workers_metadata()
-        worker_registry = WorkerRegistry(workers_info=workers_info)
-        dmr = _crunch_data_model_registry_data(
-            data_models_metadata_per_worker, self._logger
-        )
+        with worker_landscape_aggregator_refresh_duration.time():
+            (
+                workers_info,
+                data_models_metadata_per_worker,
+            ) = self._fetch_workers_metadata()
+            worker_registry = WorkerRegistry(workers_info=workers_info)
+            dmr = _crunch_data_model_registry_data(
+                data_models_metadata_per_worker, self._logger
+            )
 
-        self._set_new_registries(worker_registry, dmr)
+            self._set_new_registries(worker_registry, dmr)
 
         self._logger.debug(
             f"Workers:{[worker_info.id for worker_info in self.get_workers()]}"
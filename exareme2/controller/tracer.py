@@ -0,0 +1,5 @@
+from exareme2.tracing import Tracer
+
+# Keeps the spans of the requests executed by the controller, so that they can be
+# retrieved through the '/requests/<request_id>/trace' endpoint.
+tracer = Tracer(service="CONTROLLER")
@@ -1,3 +1,6 @@
+import json
+import threading
+from collections import OrderedDict
 from typing import Dict
 
 import pymonetdb.sql.monetize as monetize
@@ -20,7 +23,16 @@ FILTER_OPERATORS = {
     "not_in": lambda column, values: f"{column} NOT IN ({','.join(str(value) for value in values)})",
 }
 
-__all__ = ["build_filter_clause", "validate_filter", "FilterError"]
+# Maximum number of distinct filters kept by a FilterCache
+FILTER_CACHE_MAX_SIZE = 1024
+
+__all__ = [
+    "build_filter_clause",
+    "validate_filter",
+    "FilterError",
+    "FilterCache",
+    "filter_cache",
+]
 
 
 class FilterError(Exception):
@@ -141,3 +153,64 @@ def _check_value_column_same_type(column, value, cdes):
         raise FilterError(
             f"{column}'s type: {column_sql_type} was different from the type of the given value:{type(value)}"
         )
+
+
+class FilterCache:
+    """
+    Caches the validated filters, so that the same filters, e.g. applied by a
+    dashboard on many requests, are only validated once.
+
+    The filters are keyed by their canonical json. A validation also depends on
+    the CDEs of the data model, so the validated filters of a data model are
+    discarded when it is validated against different CDEs. Failed validations
+    are not cached. When more than 'max_size' filters are cached, the least
+    recently used ones are dropped.
+    """
+
+    def __init__(self, max_size: int = FILTER_CACHE_MAX_SIZE):
+        self._max_size = max_size
+        self._validated_filters: "OrderedDict[tuple, bool]" = OrderedDict()
+        self._cdes_per_data_model: Dict[str, Dict[str, CommonDataElement]] = {}
+        self._lock = threading.Lock()
+
+    def validate_filter(
+        self, data_model: str, rules: dict, cdes: Dict[str, CommonDataElement]
+    ):
+        if rules is None:
+            return
+
+        key = (data_model, _get_canonical_filter(rules))
+        with self._lock:
+            self._invalidate_if_cdes_changed(data_model, cdes)
+            if key in self._validated_filters:
+                self._validated_filters.move_to_end(key)
+                return
+
+        validate_filter(data_model, rules, cdes)
+        with self._lock:
+            self._validated_filters[key] = True
+            while len(self._validated_filters) > self._max_size:
+                self._validated_filters.popitem(last=False)
+
+    def _invalidate_if_cdes_changed(
+        self, data_model: str, cdes: Dict[str, CommonDataElement]
+    ):
+        cached_cdes = self._cdes_per_data_model.get(data_model)
+        # The CDEs are refreshed periodically, usually without any change, so
+        # they are compared by value only when a new object is given.
+        if cached_cdes is cdes:
+            return
+        if cached_cdes != cdes:
+            for key in [key for key in self._validated_filters if key[0] == data_model]:
+                del self._validated_filters[key]
+        self._cdes_per_data_model[data_model] = cdes
+
+
+def _get_canonical_filter(rules) -> str:
+    try:
+        return json.dumps(rules, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        raise FilterError(f"Filters could not be serialized to json: {rules}")
+
+
+filter_cache = FilterCache()
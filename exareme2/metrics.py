@@ -0,0 +1,226 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds, in seconds, of the histogram buckets. They cover everything from
+# a single MonetDB query to a full algorithm execution.
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    math.inf,
+)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    formatted_labels = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()
+    )
+    return "{" + formatted_labels + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    type_ = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _get_label_values(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects the labels {self.labelnames}, "
+                f"{tuple(labels)} were given."
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels_dict(self, label_values: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, label_values))
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_}",
+            *self._samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    type_ = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._get_label_values(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        return [
+            f"{self.name}{_format_labels(self._labels_dict(label_values))} "
+            f"{_format_value(value)}"
+            for label_values, value in values.items()
+        ]
+
+
+class _HistogramValue:
+    def __init__(self, num_buckets: int):
+        self.bucket_counts = [0] * num_buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    type_ = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        if self._buckets[-1] != math.inf:
+            self._buckets += (math.inf,)
+        self._values: Dict[Tuple[str, ...], _HistogramValue] = {}
+
+    def observe(self, value: float, **labels):
+        label_values = self._get_label_values(labels)
+        bucket_index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            histogram_value = self._values.get(label_values)
+            if histogram_value is None:
+                histogram_value = self._values[label_values] = _HistogramValue(
+                    len(self._buckets)
+                )
+            histogram_value.bucket_counts[bucket_index] += 1
+            histogram_value.sum += value
+            histogram_value.count += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Observes the duration, in seconds, of the enclosed block.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels) -> int:
+        with self._lock:
+            histogram_value = self._values.get(self._get_label_values(labels))
+            return histogram_value.count if histogram_value else 0
+
+    def get_sum(self, **labels) -> float:
+        with self._lock:
+            histogram_value = self._values.get(self._get_label_values(labels))
+            return histogram_value.sum if histogram_value else 0.0
+
+    def _samples(self) -> List[str]:
+        samples = []
+        with self._lock:
+            for label_values, histogram_value in self._values.items():
+                labels = self._labels_dict(label_values)
+                cumulative_count = 0
+                for bucket, bucket_count in zip(
+                    self._buckets, histogram_value.bucket_counts
+                ):
+                    cumulative_count += bucket_count
+                    bucket_labels = _format_labels(
+                        {**labels, "le": _format_value(bucket)}
+                    )
+                    samples.append(
+                        f"{self.name}_bucket{bucket_labels} {cumulative_count}"
+                    )
+                samples.append(
+                    f"{self.name}_sum{_format_labels(labels)} "
+                    f"{_format_value(histogram_value.sum)}"
+                )
+                samples.append(
+                    f"{self.name}_count{_format_labels(labels)} {histogram_value.count}"
+                )
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics of a service and renders them in the Prometheus text
+    exposition format, so that they can be scraped from a '/metrics' endpoint.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered.")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
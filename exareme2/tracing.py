@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from pydantic import BaseModel
+
+MAX_TRACED_REQUESTS = 100
+
+
+class Span(BaseModel):
+    """
+    A timed operation executed on behalf of an algorithm request.
+
+    'start' is a unix timestamp and 'duration' is in seconds.
+    """
+
+    name: str
+    service: str
+    request_id: str
+    context_id: Optional[str]
+    start: float
+    duration: float
+    thread_id: int
+    attributes: Dict[str, Any] = {}
+
+    def to_trace_event(self) -> dict:
+        """
+        Converts the span to a complete event of the Trace Event Format, so that
+        the exported traces can be opened with chrome://tracing or Perfetto.
+        """
+        return {
+            "name": self.name,
+            "cat": self.service,
+            "ph": "X",
+            "ts": int(self.start * 1_000_000),
+            "dur": int(self.duration * 1_000_000),
+            "pid": self.service,
+            "tid": self.thread_id,
+            "args": {
+                "request_id": self.request_id,
+                "context_id": self.context_id,
+                **self.attributes,
+            },
+        }
+
+
+class Tracer:
+    """
+    Records the spans of the most recent requests in memory.
+
+    Spans are grouped by 'request_id'. When more than 'max_traced_requests' requests
+    have been traced, the spans of the oldest request are dropped. An 'exporter' can
+    be provided to also emit each span as soon as it finishes.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        max_traced_requests: int = MAX_TRACED_REQUESTS,
+        exporter: Optional[Callable[[Span], None]] = None,
+    ):
+        self._service = service
+        self._max_traced_requests = max_traced_requests
+        self._exporter = exporter
+        self._spans_per_request: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        request_id: str,
+        context_id: Optional[str] = None,
+        **attributes,
+    ):
+        """
+        Times the enclosed block. The yielded dict can be used to add attributes
+        that are only known inside the block.
+        """
+        span_attributes = dict(attributes)
+        start = time.time()
+        start_counter = time.perf_counter()
+        try:
+            yield span_attributes
+        except Exception as exc:
+            span_attributes["error"] = type(exc).__name__
+            raise
+        finally:
+            self.record(
+                Span(
+                    name=name,
+                    service=self._service,
+                    request_id=request_id,
+                    context_id=context_id,
+                    start=start,
+                    duration=time.perf_counter() - start_counter,
+                    thread_id=threading.get_ident(),
+                    attributes=span_attributes,
+                )
+            )
+
+    def record(self, span: Span):
+        with self._lock:
+            spans = self._spans_per_request.get(span.request_id)
+            if spans is None:
+                spans = self._spans_per_request[span.request_id] = []
+                while len(self._spans_per_request) > self._max_traced_requests:
+                    self._spans_per_request.popitem(last=False)
+            spans.append(span)
+        if self._exporter:
+            self._exporter(span)
+
+    def get_spans(self, request_id: str) -> List[Span]:
+        with self._lock:
+            return list(self._spans_per_request.get(request_id, []))
+
+    def get_trace(self, request_id: str) -> dict:
+        """
+        Returns the spans of a request in the Trace Event Format.
+        """
+        spans = sorted(self.get_spans(request_id), key=lambda span: span.start)
+        return {"traceEvents": [span.to_trace_event() for span in spans]}
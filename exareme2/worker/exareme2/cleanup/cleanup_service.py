@@ -1,4 +1,5 @@
 from exareme2.worker.exareme2.cleanup.cleanup_db import drop_db_artifacts_by_context_id
+from exareme2.worker.exareme2.views.views_service import release_shared_views
 from exareme2.worker.utils.logger import initialise_logger
 
 
@@ -13,3 +14,4 @@ def cleanup(request_id: str, context_id: str):
         The id of the experiment
     """
     drop_db_artifacts_by_context_id(context_id)
+    release_shared_views(context_id)
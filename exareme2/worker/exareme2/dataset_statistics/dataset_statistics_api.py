@@ -0,0 +1,17 @@
+from typing import List
+
+from celery import shared_task
+
+from exareme2.worker.exareme2.dataset_statistics import dataset_statistics_service
+
+
+@shared_task
+def get_dataset_statistics(
+    request_id: str, data_model: str, datasets: List[str]
+) -> List[str]:
+    return [
+        statistics.json()
+        for statistics in dataset_statistics_service.get_dataset_statistics(
+            request_id, data_model, datasets
+        )
+    ]
@@ -0,0 +1,95 @@
+from typing import Dict
+from typing import List
+
+from exareme2 import DType
+from exareme2.worker.exareme2.monetdb import monetdb_facade
+from exareme2.worker.exareme2.monetdb.guard import is_datamodel
+from exareme2.worker.exareme2.monetdb.guard import is_list_of_identifiers
+from exareme2.worker.exareme2.monetdb.guard import sql_injection_guard
+from exareme2.worker_communication import ColumnStatistics
+from exareme2.worker_communication import DatasetStatistics
+
+DATASET_COLUMN = "dataset"
+
+
+@sql_injection_guard(
+    data_model=is_datamodel,
+    numerical_columns=is_list_of_identifiers,
+    nominal_columns=is_list_of_identifiers,
+)
+def compute_dataset_statistics(
+    data_model: str,
+    numerical_columns: List[str],
+    nominal_columns: List[str],
+) -> Dict[str, DatasetStatistics]:
+    """
+    Computes the statistics of the columns of every dataset of the data model,
+    with one GROUP BY on the datasets for the counts, sums, sums of squares, mins
+    and maxs and one for the counts per category.
+    """
+    table_name = f'"{data_model}"."primary_data"'
+
+    aggregates = ["COUNT(*)"]
+    for column in numerical_columns:
+        value = f'CAST("{column}" AS DOUBLE)'
+        aggregates += [
+            f'COUNT("{column}")',
+            f"SUM({value})",
+            f"SUM({value} * {value})",
+            f"MIN({value})",
+            f"MAX({value})",
+        ]
+    aggregates += [f'COUNT("{column}")' for column in nominal_columns]
+    statistics_rows = monetdb_facade.execute_and_fetchall(
+        f"""
+        SELECT "{DATASET_COLUMN}", {", ".join(aggregates)}
+        FROM {table_name}
+        GROUP BY "{DATASET_COLUMN}"
+        """
+    )
+
+    category_counts = _get_category_counts(table_name, nominal_columns)
+
+    statistics = {}
+    for dataset, row_count, *values in statistics_rows:
+        columns = {}
+        for column in numerical_columns:
+            count, sum_, sum_sq, min_, max_, *values = values
+            columns[column] = ColumnStatistics(
+                count=count,
+                null_count=row_count - count,
+                sum=sum_ or 0.0,
+                sum_sq=sum_sq or 0.0,
+                min=min_,
+                max=max_,
+            )
+        for column, count in zip(nominal_columns, values):
+            columns[column] = ColumnStatistics(
+                count=count,
+                null_count=row_count - count,
+                category_counts=category_counts.get((dataset, column), {}),
+            )
+        statistics[dataset] = DatasetStatistics(
+            dataset=dataset, row_count=row_count, columns=columns
+        )
+    return statistics
+
+
+def _get_category_counts(
+    table_name: str, nominal_columns: List[str]
+) -> Dict[tuple, Dict[str, int]]:
+    if not nominal_columns:
+        return {}
+    query = "\nUNION ALL\n".join(
+        f"""
+        SELECT "{DATASET_COLUMN}", '{column}', CAST("{column}" AS {DType.STR.to_sql()}), COUNT(*)
+        FROM {table_name}
+        WHERE "{column}" IS NOT NULL
+        GROUP BY "{DATASET_COLUMN}", "{column}"
+        """
+        for column in nominal_columns
+    )
+    category_counts = {}
+    for dataset, column, category, count in monetdb_facade.execute_and_fetchall(query):
+        category_counts.setdefault((dataset, column), {})[category] = count
+    return category_counts
@@ -0,0 +1,82 @@
+from typing import Dict
+from typing import List
+
+from exareme2.worker import config as worker_config
+from exareme2.worker.exareme2.dataset_statistics import dataset_statistics_db
+from exareme2.worker.exareme2.dataset_statistics.dataset_statistics_db import (
+    DATASET_COLUMN,
+)
+from exareme2.worker.utils.logger import initialise_logger
+from exareme2.worker.worker_info import sqlite
+from exareme2.worker.worker_info.worker_info_db import get_data_model_cdes
+from exareme2.worker.worker_info.worker_info_db import get_data_models
+from exareme2.worker_communication import DataModelUnavailable
+from exareme2.worker_communication import DatasetStatistics
+
+MINIMUM_ROW_COUNT = worker_config.privacy.minimum_row_count
+
+
+@initialise_logger
+def get_dataset_statistics(
+    request_id: str, data_model: str, datasets: List[str]
+) -> List[DatasetStatistics]:
+    """
+    Returns the statistics of the columns of the requested datasets, as stored in
+    the database, without any filter. The datasets having less rows than the
+    minimum row count are left out, as are the categories counted in less rows.
+
+    Parameters
+    ----------
+    request_id : str
+        The identifier for the logging
+    data_model : str
+        The data model of the datasets
+    datasets : List[str]
+        The requested datasets
+
+    Returns
+    ------
+    List[DatasetStatistics]
+        The statistics of the requested datasets held by the worker
+    """
+    if data_model not in get_data_models():
+        raise DataModelUnavailable(worker_config.identifier, data_model)
+
+    statistics = _get_data_model_statistics(data_model)
+    return [
+        _without_small_categories(statistics[dataset])
+        for dataset in datasets
+        if dataset in statistics and statistics[dataset].row_count >= MINIMUM_ROW_COUNT
+    ]
+
+
+def _without_small_categories(statistics: DatasetStatistics) -> DatasetStatistics:
+    columns = {
+        name: column.copy(
+            update={
+                "category_counts": {
+                    category: count
+                    for category, count in column.category_counts.items()
+                    if count >= MINIMUM_ROW_COUNT
+                }
+            }
+        )
+        if column.category_counts is not None
+        else column
+        for name, column in statistics.columns.items()
+    }
+    return statistics.copy(update={"columns": columns})
+
+
+@sqlite.cached
+def _get_data_model_statistics(data_model: str) -> Dict[str, DatasetStatistics]:
+    # The statistics of all the datasets of the data model are computed at once,
+    # on the first request after the data of the worker are loaded or updated,
+    # since mipdb then modifies the metadata database, which clears the cache.
+    cdes = get_data_model_cdes(data_model).values
+    columns = [code for code in cdes if code != DATASET_COLUMN]
+    return dataset_statistics_db.compute_dataset_statistics(
+        data_model=data_model,
+        numerical_columns=[code for code in columns if not cdes[code].is_categorical],
+        nominal_columns=[code for code in columns if cdes[code].is_categorical],
+    )
@@ -140,6 +140,10 @@ def is_list_of_identifiers(lst):
     return all(s.isidentifier() for s in lst)
 
 
+def is_list_of_identifier_lists(lst):
+    return all(is_list_of_identifiers(sublist) for sublist in lst)
+
+
 def is_valid_filter(filter):
     if filter is None:
         return True
@@ -218,5 +222,9 @@ def output_schema_validator(schema):
     return schema is None or all(name.isidentifier() for name, _ in schema)
 
 
+def is_row_count(value):
+    return value is None or (isinstance(value, int) and value >= 0)
+
+
 def is_valid_request_id(string):
     return string.isalnum() or bool(uuid_ptrn.fullmatch(string))
@@ -1,8 +1,11 @@
 import re
+import time
 from contextlib import contextmanager
 from functools import wraps
 from math import log2
 from typing import Any
+from typing import Callable
+from typing import Iterable
 from typing import List
 from typing import Optional
 
@@ -12,9 +15,13 @@ from eventlet.lock import Semaphore
 from pydantic import BaseModel
 from pymonetdb import DatabaseError
 from pymonetdb import ProgrammingError
+from pymonetdb.filetransfer import Upload
+from pymonetdb.filetransfer import Uploader
 
 from exareme2.worker import config as worker_config
 from exareme2.worker.utils import logger as logging
+from exareme2.worker.utils import metrics
+from exareme2.worker.utils import tracer
 
 query_execution_lock = Semaphore()
 udf_execution_lock = Semaphore()
@@ -25,6 +32,7 @@ class _DBExecutionDTO(BaseModel):
     parameters: Optional[List[Any]]
     use_public_user: bool = False
     timeout: Optional[int]
+    upload_lines: Optional[Callable[[], Iterable[str]]] = None
 
     class Config:
         allow_mutation = False
@@ -43,7 +51,17 @@ def execute_and_fetchall(
     return _execute_and_fetchall(db_execution_dto=db_execution_dto)
 
 
-def execute_query(query: str, parameters=None, use_public_user: bool = False):
+def execute_query(
+    query: str,
+    parameters=None,
+    use_public_user: bool = False,
+    upload_lines: Optional[Callable[[], Iterable[str]]] = None,
+):
+    """
+    'upload_lines' provides the lines of the file requested by a
+    'COPY INTO ... ON CLIENT' query. It is called once per execution attempt, so
+    that the lines can be generated lazily while they are sent to the database.
+    """
     query_execution_timeout = worker_config.celery.tasks_timeout
     query = convert_to_idempotent(query)
     db_execution_dto = _DBExecutionDTO(
@@ -51,6 +69,7 @@ def execute_query(query: str, parameters=None, use_public_user: bool = False):
         parameters=parameters,
         use_public_user=use_public_user,
         timeout=query_execution_timeout,
+        upload_lines=upload_lines,
     )
     _execute(db_execution_dto=db_execution_dto, lock=query_execution_lock)
 
@@ -69,9 +88,22 @@ def execute_udf(query: str, parameters=None):
     _execute(db_execution_dto=db_execution_dto, lock=udf_execution_lock)
 
 
+class _LinesUploader(Uploader):
+    def __init__(self, upload_lines: Callable[[], Iterable[str]]):
+        self._upload_lines = upload_lines
+
+    def handle_upload(
+        self, upload: Upload, filename: str, text_mode: bool, skip_amount: int
+    ):
+        writer = upload.text_writer()
+        for count, line in enumerate(self._upload_lines()):
+            if count >= skip_amount:
+                writer.write(line)
+
+
 # Connection Pool disabled due to bugs in maintaining connections
 @contextmanager
-def _connection(use_public_user: bool):
+def _connection(use_public_user: bool, uploader: Optional[Uploader] = None):
     if use_public_user:
         username = worker_config.monetdb.public_username
         password = worker_config.monetdb.public_password
@@ -86,13 +118,17 @@ def _connection(use_public_user: bool):
         password=password,
         database=worker_config.monetdb.database,
     )
+    if uploader:
+        conn.set_uploader(uploader)
     yield conn
     conn.close()
 
 
 @contextmanager
-def _cursor(use_public_user: bool, commit: bool = False):
-    with _connection(use_public_user) as conn:
+def _cursor(
+    use_public_user: bool, commit: bool = False, uploader: Optional[Uploader] = None
+):
+    with _connection(use_public_user, uploader) as conn:
         cur = conn.cursor()
         yield cur
         cur.close()
@@ -102,11 +138,15 @@ def _cursor(use_public_user: bool, commit: bool = False):
 
 @contextmanager
 def _lock(query_lock, timeout):
+    """
+    Yields the time, in seconds, spent waiting for the lock.
+    """
+    start = time.perf_counter()
     acquired = query_lock.acquire(timeout=timeout)
     if not acquired:
         raise TimeoutError("Could not acquire the lock in the designed timeout.")
     try:
-        yield
+        yield time.perf_counter() - start
     finally:
         query_lock.release()
 
@@ -179,12 +219,19 @@ def _execute_and_fetchall(db_execution_dto) -> List:
     Used to execute only select queries that return a result.
     'parameters' option to provide the functionality of bind-parameters.
     """
-    with _cursor(use_public_user=db_execution_dto.use_public_user) as cur:
-        cur.execute(db_execution_dto.query, db_execution_dto.parameters)
-        result = cur.fetchall()
+    with tracer.span(
+        "execute_and_fetchall", query=_get_query_summary(db_execution_dto)
+    ), metrics.monetdb_query_duration.time(type="select"):
+        with _cursor(use_public_user=db_execution_dto.use_public_user) as cur:
+            cur.execute(db_execution_dto.query, db_execution_dto.parameters)
+            result = cur.fetchall()
     return result
 
 
+def _get_query_summary(db_execution_dto: _DBExecutionDTO) -> str:
+    return db_execution_dto.query.strip()[:100]
+
+
 def convert_udf_execution_query_to_idempotent(query: str) -> str:
     def extract_table_name(query: str) -> str:
         """
@@ -263,11 +310,23 @@ def _execute(db_execution_dto: _DBExecutionDTO, lock):
     'parameters' option to provide the functionality of bind-parameters.
     """
 
+    lock_name = "udf" if lock is udf_execution_lock else "query"
+    query_duration = metrics.monetdb_query_duration.time(type=lock_name)
     try:
-        with _lock(lock, db_execution_dto.timeout):
+        with tracer.span(
+            "execute", query=_get_query_summary(db_execution_dto)
+        ) as span_attributes, query_duration, _lock(
+            lock, db_execution_dto.timeout
+        ) as lock_wait:
+            span_attributes["lock_wait"] = lock_wait
+            metrics.monetdb_lock_wait_duration.observe(lock_wait, lock=lock_name)
+            uploader = None
+            if db_execution_dto.upload_lines:
+                uploader = _LinesUploader(db_execution_dto.upload_lines)
             with _cursor(
                 use_public_user=db_execution_dto.use_public_user,
                 commit=True,
+                uploader=uploader,
             ) as cur:
                 cur.execute(db_execution_dto.query, db_execution_dto.parameters)
     except TimeoutError:
@@ -1,4 +1,5 @@
 from typing import List
+from typing import Optional
 
 from celery import shared_task
 
@@ -58,5 +59,10 @@ def create_merge_table(
 
 
 @shared_task
-def get_table_data(request_id: str, table_name: str) -> str:
-    return tables_service.get_table_data(request_id, table_name).json()
+def get_table_data(
+    request_id: str,
+    table_name: str,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> str:
+    return tables_service.get_table_data(request_id, table_name, offset, limit).json()
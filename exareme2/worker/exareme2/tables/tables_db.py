@@ -1,14 +1,19 @@
+import math
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Union
 
 import pymonetdb
 
+from exareme2 import DATA_TABLE_PRIMARY_KEY
 from exareme2 import DType
 from exareme2.worker import config as worker_config
 from exareme2.worker.exareme2.monetdb import monetdb_facade
 from exareme2.worker.exareme2.monetdb.guard import is_list_of_identifiers
+from exareme2.worker.exareme2.monetdb.guard import is_row_count
 from exareme2.worker.exareme2.monetdb.guard import is_socket_address
 from exareme2.worker.exareme2.monetdb.guard import is_valid_table_schema
 from exareme2.worker.exareme2.monetdb.guard import sql_injection_guard
@@ -24,6 +29,12 @@ from exareme2.worker_communication import TableSchema
 from exareme2.worker_communication import TablesNotFound
 from exareme2.worker_communication import TableType
 
+# Tables whose values are smaller than this approximate size, in characters, are
+# inserted with a single INSERT statement, larger ones are bulk loaded.
+BULK_LOAD_MIN_SIZE = 100_000
+# Written in place of the NULL values when bulk loading
+BULK_LOAD_NULL = "NULL"
+
 
 def create_table_name(
     table_type: TableType,
@@ -231,8 +242,15 @@ def create_remote_table(
 @sql_injection_guard(
     table_name=str.isidentifier,
     use_public_user=None,
+    offset=is_row_count,
+    limit=is_row_count,
 )
-def get_table_data(table_name: str, use_public_user: bool = True) -> List[ColumnData]:
+def get_table_data(
+    table_name: str,
+    use_public_user: bool = True,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[ColumnData]:
     """
     Returns a list of columns data which will contain name, type and the data of the specific column.
 
@@ -242,6 +260,14 @@ def get_table_data(table_name: str, use_public_user: bool = True) -> List[Column
         The name of the table
     use_public_user : bool
         Will the public or local user be used to access the data?
+    offset : Optional[int]
+        The number of rows skipped, for reading the table in pages
+    limit : Optional[int]
+        The maximum number of rows returned, all of them when None
+
+    The pages are sorted by the row_id, when the table has one, and by all the
+    columns, so that consecutive pages neither repeat nor skip rows. Identical
+    rows are interchangeable, so their order does not matter.
 
     Returns
     ------
@@ -255,8 +281,21 @@ def get_table_data(table_name: str, use_public_user: bool = True) -> List[Column
         worker_config.monetdb.local_username
     )  # The db local user, on whose namespace the tables are on.
 
+    query = f"SELECT * FROM {db_local_username}.{table_name}"
+    if limit is not None:
+        # The row_id, when present, comes first. It is not unique in merge tables,
+        # so the rest of the columns break the ties
+        column_names = schema.column_names
+        order_by = [name for name in column_names if name == DATA_TABLE_PRIMARY_KEY] + [
+            name for name in column_names if name != DATA_TABLE_PRIMARY_KEY
+        ]
+        query += f""" ORDER BY {", ".join(f'"{name}"' for name in order_by)}"""
+        query += f" LIMIT {limit}"
+        if offset:
+            query += f" OFFSET {offset}"
+
     row_stored_data = monetdb_facade.execute_and_fetchall(
-        f"SELECT * FROM {db_local_username}.{table_name}",
+        query,
         use_public_user=use_public_user,
     )
 
@@ -277,10 +316,22 @@ def insert_data_to_table(
 ) -> None:
     # Ensure all rows have the same length
     row_length = len(table_values[0])
-    column_length = len(table_values)
     if not all(len(row) == row_length for row in table_values):
         raise ValueError("All rows must have the same length")
 
+    is_large = _get_approximate_size(table_values) >= BULK_LOAD_MIN_SIZE
+    if is_large and _can_be_bulk_loaded(table_values):
+        _bulk_load_values(table_name, table_values)
+    else:
+        _insert_values(table_name, table_values)
+
+
+def _insert_values(
+    table_name: str, table_values: List[List[Union[str, int, float]]]
+) -> None:
+    row_length = len(table_values[0])
+    column_length = len(table_values)
+
     # Create the query parameters by flattening the list of rows
     parameters = [value for row in table_values for value in row]
 
@@ -294,6 +345,61 @@ def insert_data_to_table(
     monetdb_facade.execute_query(query, parameters)
 
 
+def _bulk_load_values(
+    table_name: str, table_values: List[List[Union[str, int, float]]]
+) -> None:
+    """
+    Streams the values to the database as CSV lines, which the database parses
+    much faster than the literals of an INSERT statement.
+    """
+    query = f"""
+        COPY {len(table_values)} RECORDS INTO {table_name}
+        FROM '{table_name}' ON CLIENT
+        USING DELIMITERS ',', E'\\n', '"'
+        NULL AS '{BULK_LOAD_NULL}'
+        NO ESCAPE
+        """
+    monetdb_facade.execute_query(
+        query, upload_lines=lambda: _convert_values_to_csv_lines(table_values)
+    )
+
+
+def _convert_values_to_csv_lines(
+    table_values: List[List[Union[str, int, float]]]
+) -> Iterable[str]:
+    for row in table_values:
+        yield ",".join(_convert_value_to_csv_field(value) for value in row) + "\n"
+
+
+def _convert_value_to_csv_field(value: Union[str, int, float, None]) -> str:
+    if value is None:
+        return BULK_LOAD_NULL
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+
+def _can_be_bulk_loaded(table_values: List[List[Union[str, int, float]]]) -> bool:
+    """
+    The CSV lines cannot tell a string equal to the NULL marker from a NULL
+    value, nor carry the non finite floats, so the tables having such values
+    are inserted with an INSERT statement instead.
+    """
+    return not any(
+        value == BULK_LOAD_NULL
+        if isinstance(value, str)
+        else isinstance(value, float) and not math.isfinite(value)
+        for row in table_values
+        for value in row
+    )
+
+
+def _get_approximate_size(table_values: List[List[Union[str, int, float]]]) -> int:
+    return sum(len(str(value)) for row in table_values for value in row)
+
+
 def _convert_column_stored_data_to_column_data_objects(
     column_stored_data: List[List[Any]], schema: TableSchema
 ):
@@ -392,11 +498,14 @@ def get_tables_by_type(context_id: str) -> Dict[TableType, List[str]]:
     context_id : str
         The id of the experiment
     """
+    # The latest tables come first, since they may depend on the earlier ones,
+    # like the views created over other views
     table_names_and_types = monetdb_facade.execute_and_fetchall(
         f"""
         SELECT name, type FROM tables
         WHERE name LIKE '%{context_id.lower()}%'
         AND system = false
+        ORDER BY id DESC
         """
     )
     table_names_by_type = {}
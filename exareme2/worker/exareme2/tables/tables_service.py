@@ -1,4 +1,5 @@
 from typing import List
+from typing import Optional
 
 from exareme2.worker import config as worker_config
 from exareme2.worker.exareme2.tables import tables_db
@@ -164,7 +165,12 @@ def create_merge_table(
 
 
 @initialise_logger
-def get_table_data(request_id: str, table_name: str) -> TableData:
+def get_table_data(
+    request_id: str,
+    table_name: str,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> TableData:
     """
     Parameters
     ----------
@@ -172,12 +178,16 @@ def get_table_data(request_id: str, table_name: str) -> TableData:
         The identifier for the logging
     table_name : str
         The name of the table
+    offset : Optional[int]
+        The number of rows skipped, for reading the table in pages
+    limit : Optional[int]
+        The maximum number of rows returned, all of them when None
     """
     # If the public user is used, its ensured that the table won't hold private data.
     # Tables are published to the public DB user when they are meant for sending to other workers.
     # The "protect_local_data" config allows for turning this logic off in testing scenarios.
     use_public_user = True if worker_config.privacy.protect_local_data else False
 
-    columns = tables_db.get_table_data(table_name, use_public_user)
+    columns = tables_db.get_table_data(table_name, use_public_user, offset, limit)
 
     return TableData(name=table_name, columns=columns)
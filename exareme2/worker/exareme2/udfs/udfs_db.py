@@ -3,6 +3,8 @@ from typing import List
 from exareme2.worker.exareme2.monetdb import monetdb_facade
 
 
-def run_udf(udf_defenitions: List[str], udf_exec_stmt):
+def run_udf(udf_defenitions: List[str], udf_exec_stmts: List[str]):
     monetdb_facade.execute_query(";\n".join(udf_defenitions))
-    monetdb_facade.execute_udf(udf_exec_stmt)
+    # Each statement is made idempotent on its own output table
+    for udf_exec_stmt in udf_exec_stmts:
+        monetdb_facade.execute_udf(udf_exec_stmt)
@@ -21,6 +21,7 @@ from exareme2.worker.exareme2.tables.tables_db import create_table_name
 from exareme2.worker.exareme2.tables.tables_db import get_table_type
 from exareme2.worker.exareme2.udfs import udfs_db
 from exareme2.worker.utils.logger import initialise_logger
+from exareme2.worker.utils.metrics import udf_generation_duration
 from exareme2.worker_communication import SMPCTablesInfo
 from exareme2.worker_communication import TableInfo
 from exareme2.worker_communication import TableSchema
@@ -79,7 +80,7 @@ def run_udf(
     if output_schema is not None:
         output_schema = _convert_output_schema(output_schema)
 
-    udf_definitions, udf_exec_stmt, udf_results = _generate_udf_statements(
+    udf_definitions, udf_exec_stmts, udf_results = _generate_udf_statements(
         request_id=request_id,
         command_id=command_id,
         context_id=context_id,
@@ -90,7 +91,7 @@ def run_udf(
         output_schema=output_schema,
     )
 
-    udfs_db.run_udf(udf_definitions, udf_exec_stmt)
+    udfs_db.run_udf(udf_definitions, udf_exec_stmts)
 
     return udf_results
 
@@ -192,7 +193,7 @@ def _generate_udf_statements(
     keyword_args: WorkerUDFKeyArguments,
     use_smpc: bool,
     output_schema,
-) -> Tuple[List[str], str, WorkerUDFResults]:
+) -> Tuple[List[str], List[str], WorkerUDFResults]:
     # Data needed for UDF generation
     # ------------------------------
     flowargs, flowkwargs = _convert_workerudf_to_flow_args(
@@ -206,50 +207,59 @@ def _generate_udf_statements(
     # min_row_count is necessary when an algorithm needs it in the UDF
     min_row_count = worker_config.privacy.minimum_row_count
 
-    udfgen = get_udfgenerator(
-        udfregistry=udf.registry,
-        func_name=func_name,
-        flowargs=flowargs,
-        flowkwargs=flowkwargs,
-        smpc_used=use_smpc,
-        request_id=request_id,
-        output_schema=output_schema,
-        min_row_count=min_row_count,
-    )
-    # outputnum is the number of UDF outputs, we need it to create an
-    # equal number of output names before calling the UDF generator
-    outputnum = udfgen.num_outputs
-
-    # A UDF may produce more than one table results, so we create a
-    # list of one or more output table names
-    output_names = _make_output_table_names(
-        outputnum, worker_id, context_id, command_id
-    )
+    with udf_generation_duration.time(udf=func_name):
+        udfgen = get_udfgenerator(
+            udfregistry=udf.registry,
+            func_name=func_name,
+            flowargs=flowargs,
+            flowkwargs=flowkwargs,
+            smpc_used=use_smpc,
+            request_id=request_id,
+            output_schema=output_schema,
+            min_row_count=min_row_count,
+        )
+        # outputnum is the number of UDF outputs, we need it to create an
+        # equal number of output names before calling the UDF generator
+        outputnum = udfgen.num_outputs
+        output_type = TableType.VIEW if udfgen.creates_views else TableType.NORMAL
+
+        # A UDF may produce more than one table results, so we create a
+        # list of one or more output table names
+        output_names = _make_output_table_names(
+            outputnum, output_type, worker_id, context_id, command_id
+        )
 
-    # UDF generation
-    udf_definition = udfgen.get_definition(udf_name, output_names)
-    udf_exec_stmt = udfgen.get_exec_stmt(udf_name, output_names)
-    udf_results = udfgen.get_results(output_names)
+        # UDF generation
+        udf_definition = udfgen.get_definition(udf_name, output_names)
+        udf_exec_stmts = udfgen.get_exec_stmts(udf_name, output_names)
+        udf_results = udfgen.get_results(output_names)
 
     # Create list of udf definitions
     table_creation_queries = _get_udf_table_creation_queries(udf_results)
     public_username = worker_config.monetdb.public_username
     table_sharing_queries = _get_udf_table_sharing_queries(udf_results, public_username)
-    udf_definitions = [*table_creation_queries, *table_sharing_queries, udf_definition]
+    udf_definitions = [*table_creation_queries, *table_sharing_queries]
+    # The pure SQL UDFs, like the aggregate ones, don't have a definition
+    if udf_definition:
+        udf_definitions.append(udf_definition)
 
     # Convert results
-    results = [_convert_result(res) for res in udf_results]
+    results = [_convert_result(res, output_type) for res in udf_results]
     results_dto = WorkerUDFResults(results=results)
 
-    return udf_definitions, udf_exec_stmt, results_dto
+    return udf_definitions, udf_exec_stmts, results_dto
 
 
 def _make_output_table_names(
-    outputlen: int, worker_id: str, context_id: str, command_id: str
+    outputlen: int,
+    table_type: TableType,
+    worker_id: str,
+    context_id: str,
+    command_id: str,
 ) -> List[str]:
     return [
         create_table_name(
-            table_type=TableType.NORMAL,
+            table_type=table_type,
             worker_id=worker_id,
             context_id=context_id,
             command_id=command_id,
@@ -311,19 +321,21 @@ def _get_udf_table_sharing_queries(
     return queries
 
 
-def _convert_result(result: UDFGenResult) -> WorkerUDFDTO:
+def _convert_result(result: UDFGenResult, table_type: TableType) -> WorkerUDFDTO:
     if isinstance(result, UDFGenTableResult):
-        return _convert_table_result(result)
+        return _convert_table_result(result, table_type)
     elif isinstance(result, UDFGenSMPCResult):
         return _convert_smpc_result(result)
     raise TypeError(f"Unknown result type {result.__class__}")
 
 
-def _convert_table_result(result: UDFGenTableResult) -> WorkerTableDTO:
+def _convert_table_result(
+    result: UDFGenTableResult, table_type: TableType
+) -> WorkerTableDTO:
     table_info = TableInfo(
         name=result.table_name,
         schema_=TableSchema.from_list(result.table_schema),
-        type_=TableType.NORMAL,
+        type_=table_type,
     )
     return WorkerTableDTO(value=table_info)
 
@@ -0,0 +1,127 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+from eventlet.lock import Semaphore
+
+from exareme2.worker_communication import TableInfo
+
+
+@dataclass
+class _SharedViews:
+    views: List[TableInfo]
+    context_ids: Set[str] = field(default_factory=set)
+    released_at: Optional[float] = None
+
+
+class SharedViewsRegistry:
+    """
+    Keeps track of the data model views that are shared between contexts.
+
+    The views are identified by a 'views_id' that addresses their content, i.e. the
+    data model, datasets, filters and columns they select. Each context acquiring the
+    views holds a reference to them, which is released when the context is cleaned
+    up. Views without references are kept for 'idle_timeout' seconds, so that
+    repeated requests can reuse them, and are then dropped by 'drop_expired'.
+
+    The registry's lock only guards its entries. The views of an id are created
+    and dropped under a lock of that id, so the views of different ids are
+    created concurrently and the views of an id are never dropped while they
+    are being created again. The lock of an id is removed with its views.
+    """
+
+    def __init__(self, idle_timeout: float):
+        self._idle_timeout = idle_timeout
+        self._shared_views: Dict[str, _SharedViews] = {}
+        self._lock = Semaphore()
+        self._views_id_locks: Dict[str, Semaphore] = {}
+
+    def acquire(
+        self,
+        views_id: str,
+        context_id: str,
+        create_views: Callable[[], List[TableInfo]],
+    ) -> List[TableInfo]:
+        """
+        Returns the views with the given 'views_id', calling 'create_views' only
+        if they do not exist yet, and adds a reference to them for the context.
+        """
+        with self._views_id_lock(views_id):
+            with self._lock:
+                shared_views = self._shared_views.get(views_id)
+            if shared_views is None:
+                try:
+                    shared_views = _SharedViews(views=create_views())
+                except Exception:
+                    # No views are registered, so neither is their lock
+                    with self._lock:
+                        del self._views_id_locks[views_id]
+                    raise
+            with self._lock:
+                self._shared_views[views_id] = shared_views
+                shared_views.context_ids.add(context_id)
+                shared_views.released_at = None
+            return shared_views.views
+
+    def release(self, context_id: str):
+        with self._lock:
+            for shared_views in self._shared_views.values():
+                if context_id not in shared_views.context_ids:
+                    continue
+                shared_views.context_ids.remove(context_id)
+                if not shared_views.context_ids:
+                    shared_views.released_at = time.monotonic()
+
+    def drop_expired(self, drop_views: Callable[[List[TableInfo]], None]):
+        """
+        Removes the views that have not been referenced for more than
+        'idle_timeout' seconds from the registry and drops them with 'drop_views'.
+        """
+        with self._lock:
+            expired_views_ids = [
+                views_id
+                for views_id, shared_views in self._shared_views.items()
+                if self._is_expired(shared_views)
+            ]
+        for views_id in expired_views_ids:
+            with self._views_id_lock(views_id):
+                with self._lock:
+                    # The views may have been acquired again in the meantime
+                    shared_views = self._shared_views.get(views_id)
+                    if shared_views is None or not self._is_expired(shared_views):
+                        continue
+                try:
+                    drop_views(shared_views.views)
+                finally:
+                    with self._lock:
+                        del self._shared_views[views_id]
+                        del self._views_id_locks[views_id]
+
+    def _is_expired(self, shared_views: _SharedViews) -> bool:
+        return (
+            shared_views.released_at is not None
+            and time.monotonic() - shared_views.released_at >= self._idle_timeout
+        )
+
+    @contextmanager
+    def _views_id_lock(self, views_id: str):
+        # The lock of an id may be removed while waiting for it, in which case
+        # the lock that replaced it is acquired instead
+        while True:
+            with self._lock:
+                lock = self._views_id_locks.setdefault(views_id, Semaphore())
+            lock.acquire()
+            with self._lock:
+                if self._views_id_locks.get(views_id) is lock:
+                    break
+            lock.release()
+        try:
+            yield
+        finally:
+            lock.release()
@@ -1,4 +1,5 @@
 from typing import List
+from typing import Optional
 
 from celery import shared_task
 
@@ -21,6 +22,7 @@ def create_data_model_views(
     filters: dict = None,
     dropna: bool = True,
     check_min_rows: bool = True,
+    shared_views_id: Optional[str] = None,
 ) -> List[str]:
     return [
         view.json()
@@ -34,6 +36,7 @@ def create_data_model_views(
             filters,
             dropna,
             check_min_rows,
+            shared_views_id,
         )
     ]
 
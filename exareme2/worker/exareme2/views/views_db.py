@@ -1,8 +1,11 @@
+from typing import Dict
 from typing import List
 from typing import Optional
 
+from exareme2 import DType
 from exareme2.data_filters import build_filter_clause
 from exareme2.worker.exareme2.monetdb import monetdb_facade
+from exareme2.worker.exareme2.monetdb.guard import is_list_of_identifier_lists
 from exareme2.worker.exareme2.monetdb.guard import is_list_of_identifiers
 from exareme2.worker.exareme2.monetdb.guard import is_primary_data_table
 from exareme2.worker.exareme2.monetdb.guard import is_valid_filter
@@ -76,6 +79,100 @@ def create_view(
     )
 
 
+@sql_injection_guard(
+    view_names=is_list_of_identifiers,
+    table_name=is_primary_data_table,
+    columns_per_view=is_list_of_identifier_lists,
+    filters=is_valid_filter,
+    column_types=None,
+    minimum_row_count=None,
+    check_min_rows=None,
+)
+def create_views(
+    view_names: List[str],
+    table_name: str,
+    columns_per_view: List[List[str]],
+    filters: Optional[dict],
+    column_types: Dict[str, DType],
+    minimum_row_count: int,
+    check_min_rows=False,
+) -> List[TableInfo]:
+    """
+    Creates views, with the same filters, on the same table in a single
+    transaction.
+
+    The views have the same filters, so they also have the same number of rows,
+    which is counted once for all of them. The schemas of the views are built
+    from the given 'column_types', the catalog is only queried for views having
+    columns without a known type.
+    """
+    if not view_names:
+        return []
+
+    filter_clause = ""
+    if filters:
+        filter_clause = f"WHERE {build_filter_clause(filters)}"
+
+    views_creation_query = "".join(
+        f"""
+        CREATE VIEW {view_name}
+        AS SELECT {", ".join([f'"{column}"' for column in columns])}
+        FROM {table_name}
+        {filter_clause};
+        """
+        for view_name, columns in zip(view_names, columns_per_view)
+    )
+
+    monetdb_facade.execute_query(views_creation_query)
+
+    view_rows_query_result = monetdb_facade.execute_and_fetchall(
+        f"""
+        SELECT COUNT(*)
+        FROM {view_names[0]}
+        """
+    )
+    view_rows_count = view_rows_query_result[0][0]
+
+    if view_rows_count < 1 or (check_min_rows and view_rows_count < minimum_row_count):
+        drop_views_if_exist(view_names)
+        raise InsufficientDataError(
+            f"Query: {views_creation_query} creates insufficient data views. "
+            f"({view_names=} have been dropped)"
+        )
+
+    return [
+        TableInfo(
+            name=view_name,
+            schema_=_get_view_schema(view_name, columns, column_types),
+            type_=TableType.VIEW,
+        )
+        for view_name, columns in zip(view_names, columns_per_view)
+    ]
+
+
+def _get_view_schema(
+    view_name: str, columns: List[str], column_types: Dict[str, DType]
+) -> TableSchema:
+    if all(column in column_types for column in columns):
+        return TableSchema(
+            columns=[
+                ColumnInfo(name=column, dtype=column_types[column])
+                for column in columns
+            ]
+        )
+    return _get_ordered_table_schema(get_table_schema(view_name), columns)
+
+
+@sql_injection_guard(view_names=is_list_of_identifiers)
+def drop_views_if_exist(view_names: List[str]):
+    if not view_names:
+        return
+    # The facade makes the DROP VIEW statements idempotent, adding IF EXISTS
+    monetdb_facade.execute_query(
+        "".join(f"DROP VIEW {view_name};" for view_name in view_names)
+    )
+
+
 def _get_ordered_table_schema(
     table_schema: TableSchema, ordered_columns: List[str]
 ) -> TableSchema:
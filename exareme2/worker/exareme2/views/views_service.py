@@ -1,18 +1,37 @@
+from typing import Dict
 from typing import List
+from typing import Optional
+
+from eventlet.lock import Semaphore
 
 from exareme2 import DATA_TABLE_PRIMARY_KEY
+from exareme2 import DType
 from exareme2.worker import config as worker_config
 from exareme2.worker.exareme2.tables.tables_db import create_table_name
 from exareme2.worker.exareme2.views import views_db
+from exareme2.worker.exareme2.views.shared_views import SharedViewsRegistry
 from exareme2.worker.utils.logger import initialise_logger
+from exareme2.worker.worker_info.sqlite import get_db_version_id
+from exareme2.worker.worker_info.worker_info_db import get_data_model_cdes
 from exareme2.worker.worker_info.worker_info_db import get_data_models
 from exareme2.worker.worker_info.worker_info_db import get_dataset_infos
 from exareme2.worker_communication import DataModelUnavailable
 from exareme2.worker_communication import DatasetUnavailable
+from exareme2.worker_communication import InsufficientDataError
 from exareme2.worker_communication import TableInfo
 from exareme2.worker_communication import TableType
 
 MINIMUM_ROW_COUNT = worker_config.privacy.minimum_row_count
+# Prefixes the command id of the shared views, since they outlive the command
+# that created them
+SHARED_VIEWS_COMMAND_ID = "shared"
+
+shared_views = SharedViewsRegistry(
+    idle_timeout=worker_config.views.shared_views_idle_timeout
+)
+# Guards the drop of the shared views left over by a previous run of the worker
+_leftover_shared_views_lock = Semaphore()
+_leftover_shared_views_dropped = False
 
 
 @initialise_logger
@@ -44,10 +63,17 @@ def create_data_model_views(
     filters: dict = None,
     dropna: bool = True,
     check_min_rows: bool = True,
+    shared_views_id: Optional[str] = None,
 ) -> List[TableInfo]:
     """
     Create a view on a provided data model with specific columns, filters and datasets to the DB.
 
+    When a 'shared_views_id' is provided, the views are shared with the other contexts
+    requesting the same 'shared_views_id' while the same data are loaded. They are
+    named after the 'shared_views_id' and the version of the data, instead of the
+    context, and are only created, and their row count checked, by the first of
+    these contexts. They are dropped after the cleanup of the last one.
+
     Parameters
     ----------
     request_id : str
@@ -68,7 +94,128 @@ def create_data_model_views(
         A flag that determines if the not null constraints about the columns should be included in the filters
     check_min_rows : bool
         A flag that determines if the min_rows_threshold should be checked.
+    shared_views_id : Optional[str]
+        An alphanumeric id addressing the content of the views, identical for all
+        the requests creating the same views.
+    """
+    if shared_views_id:
+        # Loading or deleting data changes the version, so views created on
+        # previous data, whose checks may no longer hold, are not reused
+        shared_views_command_id = SHARED_VIEWS_COMMAND_ID + get_db_version_id()
+        _drop_leftover_shared_views()
+        return shared_views.acquire(
+            views_id=shared_views_id + shared_views_command_id,
+            context_id=context_id,
+            create_views=lambda: _create_shared_data_model_views(
+                shared_views_id=shared_views_id,
+                shared_views_command_id=shared_views_command_id,
+                data_model=data_model,
+                datasets=datasets,
+                columns_per_view=columns_per_view,
+                filters=filters,
+                dropna=dropna,
+                check_min_rows=check_min_rows,
+            ),
+        )
+    return _create_data_model_views(
+        context_id=context_id,
+        command_id=command_id,
+        data_model=data_model,
+        datasets=datasets,
+        columns_per_view=columns_per_view,
+        filters=filters,
+        dropna=dropna,
+        check_min_rows=check_min_rows,
+    )
+
+
+def _create_shared_data_model_views(
+    shared_views_id: str,
+    shared_views_command_id: str,
+    data_model: str,
+    datasets: List[str],
+    columns_per_view: List[List[str]],
+    filters: Optional[dict],
+    dropna: bool,
+    check_min_rows: bool,
+) -> List[TableInfo]:
+    shared_view_names = _get_shared_view_names(
+        shared_views_id, shared_views_command_id, len(columns_per_view)
+    )
+    try:
+        return _create_data_model_views(
+            context_id=shared_views_id,
+            command_id=shared_views_command_id,
+            data_model=data_model,
+            datasets=datasets,
+            columns_per_view=columns_per_view,
+            filters=filters,
+            dropna=dropna,
+            check_min_rows=check_min_rows,
+        )
+    except InsufficientDataError:
+        # The views are not registered, so the ones already created are dropped
+        # here instead of during the cleanup of the context.
+        views_db.drop_views_if_exist(shared_view_names)
+        raise
+
+
+def _drop_leftover_shared_views():
+    """
+    Drops the shared views left over by a previous run of the worker, which are
+    not in the registry, before the first shared views are created. It is done
+    by the first task creating shared views, instead of when the worker starts,
+    since the database queries need the logger of a task.
     """
+    global _leftover_shared_views_dropped
+    with _leftover_shared_views_lock:
+        if _leftover_shared_views_dropped:
+            return
+        view_names = [
+            view_name
+            for view_name in views_db.get_view_names(SHARED_VIEWS_COMMAND_ID)
+            if _is_shared_view_name(view_name)
+        ]
+        if view_names:
+            views_db.drop_views_if_exist(view_names)
+        _leftover_shared_views_dropped = True
+
+
+def _is_shared_view_name(view_name: str) -> bool:
+    # The table names have the format <type>_<workerId>_<contextId>_<commandId>_<id>
+    parts = view_name.split("_")
+    return (
+        len(parts) == 5
+        and parts[1] == worker_config.identifier.lower()
+        and parts[3].startswith(SHARED_VIEWS_COMMAND_ID)
+    )
+
+
+def _get_shared_view_names(
+    shared_views_id: str, shared_views_command_id: str, number_of_views: int
+) -> List[str]:
+    return [
+        create_table_name(
+            table_type=TableType.VIEW,
+            worker_id=worker_config.identifier,
+            context_id=shared_views_id,
+            command_id=shared_views_command_id,
+            result_id=str(count),
+        )
+        for count in range(number_of_views)
+    ]
+
+
+def _create_data_model_views(
+    context_id: str,
+    command_id: str,
+    data_model: str,
+    datasets: List[str],
+    columns_per_view: List[List[str]],
+    filters: Optional[dict],
+    dropna: bool,
+    check_min_rows: bool,
+) -> List[TableInfo]:
     _validate_data_model_and_datasets_exist(data_model, datasets)
     if datasets:
         filters = _get_filters_with_datasets_constraints(
@@ -82,48 +229,49 @@ def create_data_model_views(
             filters=filters, columns=all_columns
         )
 
-    return [
-        create_data_model_view(
+    view_names = [
+        create_table_name(
+            table_type=TableType.VIEW,
+            worker_id=worker_config.identifier,
             context_id=context_id,
             command_id=command_id,
             result_id=str(count),
-            data_model=data_model,
-            columns=view_columns,
-            filters=filters,
-            check_min_rows=check_min_rows,
         )
-        for count, view_columns in enumerate(columns_per_view)
+        for count in range(len(columns_per_view))
     ]
-
-
-def create_data_model_view(
-    context_id: str,
-    command_id: str,
-    result_id: str,
-    data_model: str,
-    columns: List[str],
-    filters: dict = None,
-    check_min_rows: bool = True,
-) -> TableInfo:
-    view_name = create_table_name(
-        table_type=TableType.VIEW,
-        worker_id=worker_config.identifier,
-        context_id=context_id,
-        command_id=command_id,
-        result_id=result_id,
-    )
-    columns.insert(0, DATA_TABLE_PRIMARY_KEY)
-
-    return views_db.create_view(
-        view_name=view_name,
+    return views_db.create_views(
+        view_names=view_names,
         table_name=f'"{data_model}"."primary_data"',
-        columns=columns,
+        columns_per_view=[
+            [DATA_TABLE_PRIMARY_KEY] + view_columns for view_columns in columns_per_view
+        ],
         filters=filters,
+        column_types=_get_data_model_column_types(data_model),
         minimum_row_count=MINIMUM_ROW_COUNT,
         check_min_rows=check_min_rows,
     )
 
 
+def _get_data_model_column_types(data_model: str) -> Dict[str, DType]:
+    column_types = {
+        code: DType.from_cde(cde.sql_type)
+        for code, cde in get_data_model_cdes(data_model).values.items()
+    }
+    column_types[DATA_TABLE_PRIMARY_KEY] = DType.INT
+    return column_types
+
+
+def release_shared_views(context_id: str):
+    """
+    Releases the references of the context to the shared views and drops the
+    shared views that have not been referenced for longer than the idle timeout.
+    """
+    shared_views.release(context_id)
+    shared_views.drop_expired(
+        lambda views: views_db.drop_views_if_exist([view.name for view in views])
+    )
+
+
 def _get_filters_with_datasets_constraints(filters, datasets):
     """
     This function will return the given filters which will also include the dataset's constraints.
@@ -6,6 +6,7 @@ from celery import signals
 from exareme2.celery_app_conf import configure_celery_app_to_use_priority_queue
 from exareme2.worker import config as worker_config
 from exareme2.worker.utils.logger import init_logger
+from exareme2.worker.utils.metrics import start_metrics_exporter
 
 rabbitmq_credentials = (
     worker_config.rabbitmq.user + ":" + worker_config.rabbitmq.password
@@ -25,6 +26,7 @@ app = Celery(
     include=[
         "exareme2.worker.worker_info.worker_info_api",
         "exareme2.worker.exareme2.views.views_api",
+        "exareme2.worker.exareme2.dataset_statistics.dataset_statistics_api",
         "exareme2.worker.exareme2.tables.tables_api",
         "exareme2.worker.exareme2.udfs.udfs_api",
         "exareme2.worker.exareme2.smpc.smpc_api",
@@ -51,6 +53,15 @@ def setup_celery_logging(*args, **kwargs):
     logger.setLevel(worker_config.framework_log_level)
 
 
+@signals.worker_init.connect
+def start_worker_metrics_exporter(*args, **kwargs):
+    if worker_config.metrics.enabled:
+        start_metrics_exporter(worker_config.metrics.port)
+        worker_logger.info(
+            f"Metrics exporter started on port {worker_config.metrics.port}."
+        )
+
+
 app.conf.worker_concurrency = worker_config.celery.worker_concurrency
 
 configure_celery_app_to_use_priority_queue(app)
@@ -6,9 +6,12 @@ from functools import wraps
 from celery import current_task
 
 from exareme2.worker import config as worker_config
+from exareme2.worker.utils.metrics import task_duration
+from exareme2.worker.utils.tracer import task_span
 from exareme2.worker_communication import RequestIDNotFound
 
 LOGGING_ID_TASK_PARAM = "request_id"
+TRACING_ID_TASK_PARAM = "context_id"
 
 task_loggers = {}
 
@@ -36,22 +39,33 @@ def get_logger():
     return task_loggers[current_task.request.id]
 
 
+def _get_task_param(func, param_name, args, kwargs):
+    if kwargs.get(param_name):
+        return kwargs.get(param_name)
+
+    arglist = inspect.getfullargspec(func)
+    if param_name in arglist.args:
+        # finds the index of the param in list of args from inspect
+        # and finds values in args list
+        param_index = arglist.args.index(param_name)
+        if param_index < len(args):
+            return args[param_index]
+    return None
+
+
 def initialise_logger(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        arglist = inspect.getfullargspec(func)
-        if kwargs.get(LOGGING_ID_TASK_PARAM):
-            request_id = kwargs.get(LOGGING_ID_TASK_PARAM)
-        elif LOGGING_ID_TASK_PARAM in arglist.args:
-            # finds the index of request_id arg in list of args from inspect
-            # and finds values in args list
-            request_id_index = arglist.args.index(LOGGING_ID_TASK_PARAM)
-            request_id = args[request_id_index]
-        else:
+        request_id = _get_task_param(func, LOGGING_ID_TASK_PARAM, args, kwargs)
+        if not request_id:
             raise RequestIDNotFound()
+        context_id = _get_task_param(func, TRACING_ID_TASK_PARAM, args, kwargs)
 
         task_loggers[current_task.request.id] = init_logger(request_id)
-        function = func(*args, **kwargs)
+        with task_span(func.__name__, request_id, context_id), task_duration.time(
+            task=func.__name__
+        ):
+            function = func(*args, **kwargs)
         del task_loggers[current_task.request.id]
         return function
 
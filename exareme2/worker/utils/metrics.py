@@ -0,0 +1,58 @@
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from exareme2.metrics import PROMETHEUS_CONTENT_TYPE
+from exareme2.metrics import MetricsRegistry
+
+METRICS_PATH = "/metrics"
+
+metrics = MetricsRegistry()
+
+task_duration = metrics.histogram(
+    "exareme2_worker_task_duration_seconds",
+    "Duration of the celery tasks executed by the worker.",
+    ["task"],
+)
+monetdb_query_duration = metrics.histogram(
+    "exareme2_worker_monetdb_query_duration_seconds",
+    "Duration of the MonetDB queries, including the time waiting for a lock.",
+    ["type"],
+)
+monetdb_lock_wait_duration = metrics.histogram(
+    "exareme2_worker_monetdb_lock_wait_duration_seconds",
+    "Time spent waiting for a MonetDB execution lock.",
+    ["lock"],
+)
+udf_generation_duration = metrics.histogram(
+    "exareme2_worker_udf_generation_duration_seconds",
+    "Duration of the UDF definition and execution statements generation.",
+    ["udf"],
+)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != METRICS_PATH:
+            self.send_error(404)
+            return
+        body = metrics.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # The scraping requests would flood the worker's logs
+        pass
+
+
+def start_metrics_exporter(port: int) -> ThreadingHTTPServer:
+    """
+    Serves the worker's metrics on 'http://<worker>:<port>/metrics', in a
+    background thread, so that they can be scraped by Prometheus.
+    """
+    server = ThreadingHTTPServer(("", port), _MetricsRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
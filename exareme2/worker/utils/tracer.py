@@ -0,0 +1,61 @@
+import logging
+from contextlib import contextmanager
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from celery import current_task
+
+from exareme2.tracing import Span
+from exareme2.tracing import Tracer
+from exareme2.worker import config as worker_config
+
+
+def _export_span(span: Span):
+    # The request loggers are named after the request_id, see logger.init_logger
+    logging.getLogger(span.request_id).debug(f"Span: {span.json()}")
+
+
+tracer = Tracer(
+    service=f"{worker_config.role} {worker_config.identifier}",
+    exporter=_export_span,
+)
+
+# The request_id and context_id of the task being executed, per celery task id
+_task_trace_contexts: Dict[Optional[str], Tuple[str, Optional[str]]] = {}
+
+
+def _get_current_task_id() -> Optional[str]:
+    return current_task.request.id if current_task else None
+
+
+@contextmanager
+def task_span(name: str, request_id: str, context_id: Optional[str] = None):
+    """
+    Records a span covering the whole execution of a task and keeps the task's
+    request_id and context_id, so that the spans recorded during the task's
+    execution can be correlated with the controller's spans.
+    """
+    task_id = _get_current_task_id()
+    _task_trace_contexts[task_id] = (request_id, context_id)
+    try:
+        with tracer.span(name, request_id, context_id):
+            yield
+    finally:
+        _task_trace_contexts.pop(task_id, None)
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Records a span as part of the task currently executed. Outside a task
+    nothing is recorded.
+    """
+    trace_context = _task_trace_contexts.get(_get_current_task_id())
+    if not trace_context:
+        yield attributes
+        return
+
+    request_id, context_id = trace_context
+    with tracer.span(name, request_id, context_id, **attributes) as span_attributes:
+        yield span_attributes
@@ -1,16 +1,157 @@
+import hashlib
+import os
 import sqlite3
+from functools import wraps
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
+
+from eventlet.lock import Semaphore
 
 from exareme2.worker import config as worker_config
 
-CONN = sqlite3.connect(
-    f"{str(worker_config.data_path)}/{worker_config.sqlite.db_name}.db"
-)
+DB_PATH = f"{str(worker_config.data_path)}/{worker_config.sqlite.db_name}.db"
+# In WAL mode the changes are written in this file until they are checkpointed
+WAL_PATH = f"{DB_PATH}-wal"
+
+
+class _SharedConnection:
+    """
+    Holds the read only connection of the worker, shared by all the tasks. The
+    worker runs its tasks in greenlets, where a thread local connection would be
+    opened, and never closed, for every task. The queries are serialized by a
+    lock, they block the worker thread anyway. The connection is opened again
+    when the database file is replaced.
+    """
+
+    def __init__(self):
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_file_id = None
+        self._lock = Semaphore()
+
+    def execute_and_fetchall(self, query) -> List:
+        with self._lock:
+            cur = self._get_connection().cursor()
+            try:
+                cur.execute(query)
+                return cur.fetchall()
+            finally:
+                cur.close()
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        db_file_id = _get_file_id(DB_PATH)
+        if self._conn is None or self._db_file_id != db_file_id:
+            self._close()
+            self._conn = sqlite3.connect(
+                f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False
+            )
+            self._db_file_id = db_file_id
+        return self._conn
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._db_file_id = None
+
+
+_connection = _SharedConnection()
 
 
 def execute_and_fetchall(query) -> List:
-    cur = CONN.cursor()
-    cur.execute(query)
-    result = cur.fetchall()
-    cur.close()
-    return result
+    return _connection.execute_and_fetchall(query)
+
+
+def _get_file_id(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat_result.st_dev, stat_result.st_ino
+
+
+def _get_db_version() -> Tuple:
+    """
+    Changes every time the database is modified, since the database or, in WAL
+    mode, the WAL file are written.
+    """
+    version = []
+    for path in (DB_PATH, WAL_PATH):
+        try:
+            stat_result = os.stat(path)
+        except FileNotFoundError:
+            version.append(None)
+            continue
+        version.append(
+            (
+                stat_result.st_ino,
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+            )
+        )
+    return tuple(version)
+
+
+def get_db_version_id() -> str:
+    """
+    Returns an alphanumeric id of the current version of the database, which
+    changes every time data are loaded, updated or deleted.
+    """
+    return hashlib.sha1(repr(_get_db_version()).encode()).hexdigest()[:16]
+
+
+class _MetadataCache:
+    """
+    Holds the results of the metadata queries for the current version of the
+    database. When the database changes, all the results are discarded.
+    """
+
+    def __init__(self):
+        self._db_version = None
+        self._results: Dict[Tuple, object] = {}
+        self._lock = Semaphore()
+
+    def get(self, key: Tuple, db_version: Tuple):
+        with self._lock:
+            if db_version != self._db_version:
+                return None
+            return self._results.get(key)
+
+    def set(self, key: Tuple, db_version: Tuple, result):
+        with self._lock:
+            if db_version != self._db_version:
+                self._db_version = db_version
+                self._results = {}
+            self._results[key] = result
+
+    def clear(self):
+        with self._lock:
+            self._db_version = None
+            self._results = {}
+
+
+metadata_cache = _MetadataCache()
+
+
+def cached(func):
+    """
+    Caches the results of a function reading the metadata, until the database
+    changes. The cached results are shared, so they should not be modified.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func, args, tuple(sorted(kwargs.items())))
+        db_version = _get_db_version()
+        result = metadata_cache.get(key, db_version)
+        if result is None:
+            result = func(*args, **kwargs)
+            metadata_cache.set(key, db_version, result)
+        return result
+
+    return wrapper
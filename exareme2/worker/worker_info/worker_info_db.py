@@ -14,6 +14,7 @@ from exareme2.worker_communication import DatasetInfo
 HEALTHCHECK_VALIDATION_STRING = "HEALTHCHECK"
 
 
+@sqlite.cached
 def get_data_models() -> List[str]:
     """
     Retrieves the enabled data_models from the database.
@@ -40,6 +41,7 @@ def convert_absolute_dataset_path_to_relative(dataset_path: str) -> str:
     return dataset_path.split(str(worker_config.data_path))[-1]
 
 
+@sqlite.cached
 @sql_injection_guard(data_model=is_datamodel)
 def get_dataset_infos(data_model: str) -> List[DatasetInfo]:
     """
@@ -78,6 +80,7 @@ def get_dataset_infos(data_model: str) -> List[DatasetInfo]:
     ]
 
 
+@sqlite.cached
 @sql_injection_guard(data_model=is_datamodel)
 def get_data_model_cdes(data_model: str) -> CommonDataElements:
     """
@@ -105,6 +108,7 @@ def get_data_model_cdes(data_model: str) -> CommonDataElements:
     return cdes
 
 
+@sqlite.cached
 @sql_injection_guard(data_model=is_datamodel)
 def get_data_model_attributes(data_model: str) -> DataModelAttributes:
     """
@@ -275,6 +275,29 @@ class DatasetsInfoPerDataModel(ImmutableBaseModel):
     datasets_info_per_data_model: Dict[str, List[DatasetInfo]]
 
 
+class ColumnStatistics(ImmutableBaseModel):
+    """
+    Summary of the values of a column in a dataset. The sums, the min and the max
+    are only given for the numerical columns and the counts per category only for
+    the nominal ones. The categories counted in less rows than the minimum row
+    count are left out of the counts per category.
+    """
+
+    count: int
+    null_count: int
+    sum: Optional[float] = None
+    sum_sq: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    category_counts: Optional[Dict[str, int]] = None
+
+
+class DatasetStatistics(ImmutableBaseModel):
+    dataset: str
+    row_count: int
+    columns: Dict[str, ColumnStatistics]
+
+
 class CommonDataElement(ImmutableBaseModel):
     code: str
     label: str
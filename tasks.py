@@ -172,6 +172,13 @@ def create_configs(c):
                 "privacy"
             ]["protect_local_data"]
 
+        if metrics_port := worker.get("metrics_port"):
+            worker_config["metrics"]["enabled"] = True
+            worker_config["metrics"]["port"] = metrics_port
+        else:
+            worker_config["metrics"]["enabled"] = False
+            worker_config["metrics"]["port"] = 0
+
         worker_config["smpc"]["enabled"] = deployment_config["smpc"]["enabled"]
         if worker_config["smpc"]["enabled"]:
             worker_config["smpc"]["optional"] = deployment_config["smpc"]["optional"]
@@ -224,6 +231,13 @@ def create_configs(c):
     ]
     controller_config["deployment_type"] = "LOCAL"
 
+    controller_config["scheduler"][
+        "max_concurrent_executions_per_worker"
+    ] = deployment_config["scheduler"]["max_concurrent_executions_per_worker"]
+    controller_config["scheduler"]["max_queued_requests"] = deployment_config[
+        "scheduler"
+    ]["max_queued_requests"]
+
     controller_config["localworkers"]["config_file"] = str(
         CONTROLLER_LOCALWORKERS_CONFIG_FILE
     )
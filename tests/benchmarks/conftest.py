@@ -0,0 +1,140 @@
+"""
+Benchmarks of the engine's hot paths.
+
+Each benchmark times a callable over a number of rounds and the results are
+appended, one json object per line, to the file defined by the
+EXAREME2_BENCHMARK_RESULTS_FILE env variable (default '.benchmarks/results.jsonl'),
+so that they can be compared over time. If the EXAREME2_BENCHMARK_MAX_REGRESSION
+env variable is set (e.g. 0.2), a benchmark whose median is slower than the median
+of its previous recorded run by more than that fraction fails.
+
+The end-to-end benchmarks of the algorithm flows reuse the dockerized services of
+the standalone tests, so they need docker available and are marked as 'slow'.
+There is no in-process stand-in for them: the workers run the UDFs inside MonetDB
+and each worker process reads its own configuration, so a fake Celery layer would
+still need a database per worker. The 'Benchmarks' CI job runs the regression
+gate on the other benchmarks, with '-m "benchmark and not slow"'.
+"""
+import json
+import os
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+BENCHMARK_RESULTS_FILE_ENV_VARIABLE = "EXAREME2_BENCHMARK_RESULTS_FILE"
+BENCHMARK_RESULTS_FILE = PROJECT_ROOT / ".benchmarks" / "results.jsonl"
+BENCHMARK_MAX_REGRESSION_ENV_VARIABLE = "EXAREME2_BENCHMARK_MAX_REGRESSION"
+DEFAULT_ROUNDS = 20
+
+
+def _get_results_file() -> Path:
+    return Path(
+        os.getenv(BENCHMARK_RESULTS_FILE_ENV_VARIABLE, str(BENCHMARK_RESULTS_FILE))
+    )
+
+
+def _get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _load_previous_medians(results_file: Path) -> Dict[str, float]:
+    """
+    Returns the median of the latest recorded run of each benchmark.
+    """
+    if not results_file.is_file():
+        return {}
+    medians = {}
+    with open(results_file) as fp:
+        for line in fp:
+            result = json.loads(line)
+            medians[result["name"]] = result["median"]
+    return medians
+
+
+class Benchmark:
+    def __init__(self, name: str, rounds: int = DEFAULT_ROUNDS):
+        self.name = name
+        self.rounds = rounds
+        self.timings: List[float] = []
+
+    def __call__(self, func: Callable, *args, **kwargs):
+        """
+        Calls 'func' once to warm up and then 'rounds' times, timing each call.
+        Returns the result of the last call.
+        """
+        result = func(*args, **kwargs)
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.timings.append(time.perf_counter() - start)
+        return result
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "rounds": len(self.timings),
+            "min": min(self.timings),
+            "max": max(self.timings),
+            "mean": statistics.mean(self.timings),
+            "median": statistics.median(self.timings),
+        }
+
+
+@pytest.fixture(scope="session")
+def benchmark_session():
+    results_file = _get_results_file()
+    session = {
+        "previous_medians": _load_previous_medians(results_file),
+        "results": [],
+    }
+    yield session
+
+    if not session["results"]:
+        return
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    commit = _get_git_commit()
+    with open(results_file, "a") as fp:
+        for result in session["results"]:
+            fp.write(json.dumps({"timestamp": timestamp, "commit": commit, **result}))
+            fp.write("\n")
+
+
+@pytest.fixture
+def benchmark(request, benchmark_session):
+    bench = Benchmark(name=request.node.nodeid)
+    yield bench
+
+    if not bench.timings:
+        return
+    stats = bench.stats
+    benchmark_session["results"].append(stats)
+
+    max_regression = os.getenv(BENCHMARK_MAX_REGRESSION_ENV_VARIABLE)
+    previous_median = benchmark_session["previous_medians"].get(bench.name)
+    if max_regression and previous_median:
+        allowed_median = previous_median * (1 + float(max_regression))
+        if stats["median"] > allowed_median:
+            pytest.fail(
+                f"Benchmark {bench.name} regressed: median {stats['median']:.6f}s, "
+                f"previous median {previous_median:.6f}s."
+            )
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+import requests
+
+from tests.standalone_tests.conftest import ALGORITHMS_URL
+from tests.standalone_tests.conftest import controller_service_with_localworker1
+from tests.standalone_tests.conftest import globalworker_worker_service
+from tests.standalone_tests.conftest import load_data_localworker1
+from tests.standalone_tests.conftest import localworker1_worker_service
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+# The algorithm flows are executed end to end, on a global and a local worker
+# backed by the dockerized MonetDB instances of the standalone tests, so that
+# the benchmarks include the task, UDF generation and database costs.
+ALGORITHM_ROUNDS = 3
+
+
+def get_algorithm_requests():
+    inputdata = {
+        "data_model": "dementia:0.1",
+        "datasets": ["edsd0", "edsd1", "edsd2", "edsd3"],
+    }
+    return [
+        (
+            "pca",
+            {
+                "inputdata": {
+                    **inputdata,
+                    "y": ["leftamygdala", "lefthippocampus", "rightamygdala"],
+                },
+                "type": "exareme2",
+            },
+        ),
+        (
+            "linear_regression",
+            {
+                "inputdata": {
+                    **inputdata,
+                    "y": ["lefthippocampus"],
+                    "x": ["leftamygdala", "rightamygdala", "agegroup"],
+                },
+                "type": "exareme2",
+            },
+        ),
+        (
+            "descriptive_stats",
+            {
+                "inputdata": {
+                    **inputdata,
+                    "y": ["lefthippocampus", "leftamygdala", "agegroup"],
+                },
+                "type": "exareme2",
+            },
+        ),
+    ]
+
+
+@pytest.mark.parametrize("algorithm_name, request_dict", get_algorithm_requests())
+def test_algorithm_flow(
+    benchmark,
+    algorithm_name,
+    request_dict,
+    localworker1_worker_service,
+    load_data_localworker1,
+    globalworker_worker_service,
+    controller_service_with_localworker1,
+):
+    benchmark.rounds = ALGORITHM_ROUNDS
+    algorithm_url = ALGORITHMS_URL + "/" + algorithm_name
+    headers = {"Content-type": "application/json", "Accept": "text/plain"}
+
+    response = benchmark(
+        requests.post,
+        algorithm_url,
+        data=json.dumps(request_dict),
+        headers=headers,
+    )
+    assert response.status_code == 200
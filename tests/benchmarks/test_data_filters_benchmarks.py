@@ -0,0 +1,89 @@
+import pytest
+
+from exareme2.data_filters import FilterCache
+from exareme2.data_filters import build_filter_clause
+from exareme2.data_filters import validate_filter
+from exareme2.worker_communication import CommonDataElement
+
+pytestmark = pytest.mark.benchmark
+
+DATA_MODEL = "dementia:0.1"
+NUM_NUMERICAL_CDES = 50
+
+
+@pytest.fixture
+def cdes():
+    cdes = {
+        f"numerical{i}": CommonDataElement(
+            code=f"numerical{i}",
+            label=f"numerical{i}",
+            sql_type="real",
+            is_categorical=False,
+            min=0,
+            max=100,
+        )
+        for i in range(NUM_NUMERICAL_CDES)
+    }
+    cdes["dataset"] = CommonDataElement(
+        code="dataset",
+        label="dataset",
+        sql_type="text",
+        is_categorical=True,
+        enumerations={f"dataset{i}": f"dataset{i}" for i in range(10)},
+    )
+    return cdes
+
+
+@pytest.fixture
+def nested_filter():
+    return {
+        "condition": "AND",
+        "rules": [
+            {
+                "condition": "OR",
+                "rules": [
+                    {
+                        "id": f"numerical{i}",
+                        "field": f"numerical{i}",
+                        "type": "double",
+                        "input": "number",
+                        "operator": "between",
+                        "value": [10, 90],
+                    },
+                    {
+                        "id": f"numerical{i}",
+                        "field": f"numerical{i}",
+                        "type": "double",
+                        "input": "number",
+                        "operator": "is_null",
+                        "value": None,
+                    },
+                ],
+            }
+            for i in range(NUM_NUMERICAL_CDES)
+        ]
+        + [
+            {
+                "id": "dataset",
+                "field": "dataset",
+                "type": "string",
+                "input": "text",
+                "operator": "in",
+                "value": [f"dataset{i}" for i in range(10)],
+            }
+        ],
+    }
+
+
+def test_build_filter_clause(benchmark, nested_filter):
+    clause = benchmark(build_filter_clause, nested_filter)
+    assert clause.startswith("(")
+
+
+def test_validate_filter(benchmark, cdes, nested_filter):
+    benchmark(validate_filter, DATA_MODEL, nested_filter, cdes)
+
+
+def test_cached_validate_filter(benchmark, cdes, nested_filter):
+    cache = FilterCache()
+    benchmark(cache.validate_filter, DATA_MODEL, nested_filter, cdes)
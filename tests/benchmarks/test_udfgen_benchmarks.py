@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from exareme2.algorithms.exareme2 import pca
+from exareme2.algorithms.exareme2 import sufficient_statistics
+from exareme2.algorithms.exareme2.udfgen import udfio
+from exareme2.algorithms.exareme2.udfgen.decorator import udf
+from exareme2.algorithms.exareme2.udfgen.helpers import make_unique_func_name
+from exareme2.algorithms.exareme2.udfgen.py_udfgenerator import PyUdfGenerator
+from exareme2.datatypes import DType
+from exareme2.worker_communication import ColumnInfo
+from exareme2.worker_communication import TableInfo
+from exareme2.worker_communication import TableSchema
+from exareme2.worker_communication import TableType
+
+pytestmark = pytest.mark.benchmark
+
+NUM_COLUMNS = 20
+NUM_WORKERS = 10
+
+
+def _generate_udf(func_name, flowkwargs):
+    udfgen = PyUdfGenerator(
+        udfregistry=udf.registry,
+        func_name=func_name,
+        flowargs=[],
+        flowkwargs=flowkwargs,
+        request_id="benchmark",
+    )
+    output_names = [f"output_table_{i}" for i in range(udfgen.num_outputs)]
+    return (
+        udfgen.get_definition("benchmark_udf", output_names),
+        udfgen.get_exec_stmt("benchmark_udf", output_names),
+        udfgen.get_results(output_names),
+    )
+
+
+@pytest.fixture
+def data_view():
+    return TableInfo(
+        name="data_view",
+        schema_=TableSchema(
+            columns=[ColumnInfo(name="row_id", dtype=DType.INT)]
+            + [
+                ColumnInfo(name=f"column{i}", dtype=DType.FLOAT)
+                for i in range(NUM_COLUMNS)
+            ]
+        ),
+        type_=TableType.VIEW,
+    )
+
+
+@pytest.fixture
+def local_transfers():
+    return TableInfo(
+        name="local_transfers",
+        schema_=TableSchema(
+            columns=[ColumnInfo(name="secure_transfer", dtype=DType.JSON)]
+        ),
+        type_=TableType.MERGE,
+    )
+
+
+def test_local_udf_generation(benchmark, data_view):
+    definition, _, _ = benchmark(
+        _generate_udf,
+        make_unique_func_name(sufficient_statistics.local_moments),
+        {"x": data_view},
+    )
+    assert "CREATE OR REPLACE FUNCTION" in definition
+
+
+def test_global_udf_generation(benchmark, local_transfers):
+    definition, _, _ = benchmark(
+        _generate_udf,
+        make_unique_func_name(pca.global1),
+        {"local_transfers": local_transfers},
+    )
+    assert "CREATE OR REPLACE FUNCTION" in definition
+
+
+@pytest.fixture
+def secure_transfers():
+    rng = np.random.default_rng(0)
+    return [
+        {
+            "n_obs": {"data": 100, "operation": "sum", "type": "int"},
+            "sx": {
+                "data": rng.random(NUM_COLUMNS).tolist(),
+                "operation": "sum",
+                "type": "float",
+            },
+            "sxx": {
+                "data": rng.random((NUM_COLUMNS, NUM_COLUMNS)).tolist(),
+                "operation": "sum",
+                "type": "float",
+            },
+            "max_x": {
+                "data": rng.random(NUM_COLUMNS).tolist(),
+                "operation": "max",
+                "type": "float",
+            },
+        }
+        for _ in range(NUM_WORKERS)
+    ]
+
+
+def test_secure_transfers_merging(benchmark, secure_transfers):
+    result = benchmark(udfio.secure_transfers_to_merged_dict, secure_transfers)
+    assert result["n_obs"] == 100 * NUM_WORKERS
+
+
+def test_secure_transfer_split_and_construct(benchmark, secure_transfers):
+    def split_and_construct(secure_transfer):
+        template, sum_op, min_op, max_op = udfio.split_secure_transfer_dict(
+            secure_transfer
+        )
+        return udfio.construct_secure_transfer_dict(template, sum_op, min_op, max_op)
+
+    result = benchmark(split_and_construct, secure_transfers[0])
+    assert result["n_obs"] == 100
+
+
+def test_tensor_table_roundtrip(benchmark):
+    array = np.random.default_rng(0).random((1000, NUM_COLUMNS))
+
+    result = benchmark(lambda: udfio.from_tensor_table(udfio.as_tensor_table(array)))
+    assert result.shape == array.shape
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from exareme2.worker_communication import ColumnDataFloat
+from exareme2.worker_communication import ColumnDataInt
+from exareme2.worker_communication import ColumnDataStr
+from exareme2.worker_communication import TableData
+
+pytestmark = pytest.mark.benchmark
+
+NUM_ROWS = 10_000
+NUM_FLOAT_COLUMNS = 10
+
+
+@pytest.fixture
+def table_data():
+    rng = np.random.default_rng(0)
+    return TableData(
+        name="table",
+        columns=[
+            ColumnDataInt(name="row_id", data=list(range(NUM_ROWS))),
+            ColumnDataStr(name="dataset", data=["dataset0"] * NUM_ROWS),
+        ]
+        + [
+            ColumnDataFloat(name=f"column{i}", data=rng.random(NUM_ROWS).tolist())
+            for i in range(NUM_FLOAT_COLUMNS)
+        ],
+    )
+
+
+def test_table_data_serialization(benchmark, table_data):
+    serialized = benchmark(table_data.json)
+    assert serialized
+
+
+def test_table_data_deserialization(benchmark, table_data):
+    serialized = table_data.json()
+    result = benchmark(TableData.parse_raw, serialized)
+    assert result == table_data
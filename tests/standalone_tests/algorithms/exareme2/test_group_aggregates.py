@@ -0,0 +1,347 @@
+import sqlite3
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from exareme2 import DType
+from exareme2.algorithms.exareme2.anova_oneway import local1
+from exareme2.algorithms.exareme2.group_aggregates import BinCountsUdf
+from exareme2.algorithms.exareme2.group_aggregates import CategoryCountsUdf
+from exareme2.algorithms.exareme2.group_aggregates import GroupStatisticsUdf
+from exareme2.algorithms.exareme2.group_aggregates import get_group_statistics_columns
+from exareme2.algorithms.exareme2.naive_bayes_categorical_cv import CategoricalNB
+from exareme2.algorithms.exareme2.naive_bayes_gaussian_cv import GaussianNB
+from exareme2.worker_communication import TableInfo
+from exareme2.worker_communication import TableSchema
+from exareme2.worker_communication import TableType
+
+
+def make_table_info(name, schema):
+    return TableInfo(
+        name=name,
+        schema_=TableSchema.from_list([("row_id", DType.INT)] + schema),
+        type_=TableType.NORMAL,
+    )
+
+
+@pytest.fixture
+def flowkwargs():
+    return {
+        "groups": make_table_info("groups_table", [("g", DType.STR)]),
+        "values": make_table_info(
+            "values_table", [("a", DType.FLOAT), ("b", DType.INT)]
+        ),
+    }
+
+
+def test_group_statistics_output_schema(flowkwargs):
+    udf = GroupStatisticsUdf(flowkwargs=flowkwargs)
+    assert udf.output_schema == [
+        ("group_value", DType.STR),
+        ("count__a", DType.INT),
+        ("sum__a", DType.FLOAT),
+        ("sum_sq__a", DType.FLOAT),
+        ("min__a", DType.FLOAT),
+        ("max__a", DType.FLOAT),
+        ("count__b", DType.INT),
+        ("sum__b", DType.FLOAT),
+        ("sum_sq__b", DType.FLOAT),
+        ("min__b", DType.FLOAT),
+        ("max__b", DType.FLOAT),
+    ]
+
+
+def test_group_statistics_exec_stmt(flowkwargs):
+    expected = """\
+INSERT INTO __main
+SELECT
+    *
+FROM
+    (
+    SELECT
+        groups_table."g" AS "group_value",
+        COUNT(values_table."a") AS "count__a",
+        SUM(CAST(values_table."a" AS DOUBLE)) AS "sum__a",
+        SUM(CAST(values_table."a" AS DOUBLE) * CAST(values_table."a" AS DOUBLE)) AS "sum_sq__a",
+        MIN(CAST(values_table."a" AS DOUBLE)) AS "min__a",
+        MAX(CAST(values_table."a" AS DOUBLE)) AS "max__a",
+        COUNT(values_table."b") AS "count__b",
+        SUM(CAST(values_table."b" AS DOUBLE)) AS "sum__b",
+        SUM(CAST(values_table."b" AS DOUBLE) * CAST(values_table."b" AS DOUBLE)) AS "sum_sq__b",
+        MIN(CAST(values_table."b" AS DOUBLE)) AS "min__b",
+        MAX(CAST(values_table."b" AS DOUBLE)) AS "max__b"
+    FROM
+        groups_table,
+        values_table
+    WHERE
+        groups_table."row_id"=values_table."row_id"
+    GROUP BY
+        groups_table."g"
+    ) AS aggregates;"""
+
+    udf = GroupStatisticsUdf(flowkwargs=flowkwargs)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert result == expected
+
+
+def test_category_counts_exec_stmt(flowkwargs):
+    expected = """\
+INSERT INTO __main
+SELECT
+    *
+FROM
+    (
+    SELECT
+        'a' AS "variable",
+        groups_table."g" AS "group_value",
+        CAST(values_table."a" AS VARCHAR(500)) AS "value",
+        COUNT(*) AS "count"
+    FROM
+        groups_table,
+        values_table
+    WHERE
+        groups_table."row_id"=values_table."row_id"
+    GROUP BY
+        groups_table."g",
+        values_table."a"
+    UNION ALL
+    SELECT
+        'b' AS "variable",
+        groups_table."g" AS "group_value",
+        CAST(values_table."b" AS VARCHAR(500)) AS "value",
+        COUNT(*) AS "count"
+    FROM
+        groups_table,
+        values_table
+    WHERE
+        groups_table."row_id"=values_table."row_id"
+    GROUP BY
+        groups_table."g",
+        values_table."b"
+    ) AS aggregates;"""
+
+    udf = CategoryCountsUdf(flowkwargs=flowkwargs)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert result == expected
+
+
+@pytest.fixture
+def bin_counts_flowkwargs():
+    return {
+        "data": make_table_info("data_table", [("y", DType.FLOAT), ("g", DType.STR)]),
+        "variable": "y",
+        "groupings": ["g"],
+        "bins": 4,
+        "bin_range": [0.0, 2.0],
+    }
+
+
+def test_bin_counts_exec_stmt(bin_counts_flowkwargs):
+    expected = """\
+INSERT INTO __main
+SELECT
+    *
+FROM
+    (
+    SELECT
+        CASE WHEN GROUPING(binned."g") = 0 THEN 'g' ELSE '' END AS "variable",
+        CASE WHEN GROUPING(binned."g") = 0 THEN CAST(binned."g" AS VARCHAR(500)) END AS "group_value",
+        binned."bin",
+        COUNT(*) AS "count"
+    FROM
+        (
+        SELECT
+            indexed."g",
+            CASE
+                WHEN indexed."bin_index" >= 3 AND indexed."value" < 1.5 THEN 2
+                WHEN indexed."bin_index" >= 3 THEN 3
+                WHEN indexed."value" < indexed."bin_index" * 0.5 + 0.0 THEN indexed."bin_index" - 1
+                WHEN indexed."value" >= (indexed."bin_index" + 1) * 0.5 + 0.0 THEN indexed."bin_index" + 1
+                ELSE indexed."bin_index"
+            END AS "bin"
+        FROM
+            (
+            SELECT
+                data_table."g",
+                CAST(data_table."y" AS DOUBLE) AS "value",
+                CASE WHEN data_table."y" >= 0.0 AND data_table."y" <= 2.0 THEN CAST(FLOOR((CAST(data_table."y" AS DOUBLE) - 0.0) * 2.0) AS INT) END AS "bin_index"
+            FROM
+                data_table
+            ) AS indexed
+        ) AS binned
+    GROUP BY
+        GROUPING SETS (
+            (binned."bin"),
+            (binned."g", binned."bin")
+        )
+    ) AS aggregates;"""
+
+    udf = BinCountsUdf(flowkwargs=bin_counts_flowkwargs)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert result == expected
+
+
+def test_bin_counts_of_nominal_variable(bin_counts_flowkwargs):
+    flowkwargs = {
+        **bin_counts_flowkwargs,
+        "variable": "g",
+        "groupings": [],
+        "bins": None,
+        "bin_range": None,
+    }
+
+    udf = BinCountsUdf(flowkwargs=flowkwargs)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+
+    assert 'CAST(data_table."g" AS VARCHAR(500)) AS "bin"' in result
+    assert "'' AS \"variable\"" in result
+    assert dict(udf.output_schema)["bin"] == DType.STR
+
+
+@pytest.mark.parametrize("bins", [1, 3, 7, 20, 100])
+def test_bin_counts_bins_same_as_numpy(bin_counts_flowkwargs, bins):
+    # The values on the edges of the bins are the ones numpy corrects, and the
+    # ones out of the range have no bin
+    values = np.concatenate([np.linspace(-1.5, 4.0, 111), [0.1, 0.7, 3.3, 5.0]])
+    bin_range = [-1.5, 4.0]
+    con = sqlite3.connect(":memory:")
+    try:
+        con.execute("SELECT FLOOR(1.5)")
+    except sqlite3.OperationalError:
+        pytest.skip("SQLite is compiled without the math functions")
+    con.execute('CREATE TABLE data_table ("y" DOUBLE, "g" TEXT)')
+    con.executemany("INSERT INTO data_table VALUES (?, 'a')", [(v,) for v in values])
+    flowkwargs = {**bin_counts_flowkwargs, "bins": bins, "bin_range": bin_range}
+
+    udf = BinCountsUdf(flowkwargs=flowkwargs)
+    query = udf._get_binned_query().compile()
+    indices = [index for _, index in con.execute(query) if index is not None]
+
+    expected, _ = np.histogram(values, bins=bins, range=bin_range)
+    assert np.bincount(indices, minlength=bins).tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("udf_class", [GroupStatisticsUdf, CategoryCountsUdf])
+def test_exec_stmt_ends_outside_the_aggregate_query(flowkwargs, udf_class):
+    # The worker appends a WHERE clause to the statement to make it idempotent
+    udf = udf_class(flowkwargs=flowkwargs)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert result.endswith(") AS aggregates;")
+
+
+def test_category_counts_get_results(flowkwargs):
+    udf = CategoryCountsUdf(flowkwargs=flowkwargs)
+    [result] = udf.get_results(output_table_names=["__main"])
+    assert result.table_name == "__main"
+    assert result.create_query.startswith("CREATE TABLE __main")
+
+
+def group_statistics(groups, values):
+    """Computes in pandas the table computed by GroupStatisticsUdf."""
+    data = values.join(groups)
+    stats = pd.DataFrame({"group_value": data.groupby("g").size().index})
+    for column in values.columns:
+        grouped = data.groupby("g")[column]
+        names = get_group_statistics_columns(column)
+        stats[names["count"]] = grouped.count().values
+        stats[names["sum"]] = grouped.sum().values
+        stats[names["sum_sq"]] = grouped.apply(lambda x: (x**2).sum()).values
+        stats[names["min"]] = grouped.min().values
+        stats[names["max"]] = grouped.max().values
+    return stats
+
+
+def category_counts(groups, values):
+    """Computes in pandas the table computed by CategoryCountsUdf."""
+    data = values.join(groups)
+    counts = [
+        data.groupby(["g", column])
+        .size()
+        .rename("count")
+        .reset_index()
+        .rename(columns={"g": "group_value", column: "value"})
+        .assign(variable=column)
+        for column in values.columns
+    ]
+    return pd.concat(counts, ignore_index=True)
+
+
+@pytest.fixture
+def data():
+    groups = pd.DataFrame({"g": ["A", "B", "A", "A", "B", "A"]})
+    values = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "b": ["x", "y", "x", "z", "y", "y"],
+        }
+    )
+    return groups, values
+
+
+def test_gaussian_nb_fit_local(data):
+    groups, values = data
+    values = values[["a"]]
+    stats = group_statistics(groups, values)
+
+    values_, names = GaussianNB._fit_local(
+        stats=stats, xvars=["a"], categories=["A", "B", "C"]
+    )
+
+    assert names == {"index": ["A", "B", "C"], "columns": ["a"]}
+    assert values_["counts"]["data"] == [[4], [2], [0]]
+    assert values_["sums"]["data"] == [[14.0], [7.0], [0.0]]
+    assert values_["sums_sq"]["data"] == [[62.0], [29.0], [0.0]]
+
+
+def test_categorical_nb_fit_local(data):
+    groups, values = data
+    values = values[["b"]]
+    counts = category_counts(groups, values)
+    categories = {"g": ["A", "B", "C"], "b": ["x", "y", "z"]}
+
+    stransf, transf = CategoricalNB._fit_local(
+        counts=counts, xvars=["b"], yvar="g", categories=categories
+    )
+
+    # Same as the counts of pandas categoricals grouped by class and category
+    df = pd.DataFrame(
+        {
+            "g": pd.Categorical(groups["g"], categories=categories["g"]),
+            "b": pd.Categorical(values["b"], categories=categories["b"]),
+        }
+    )
+    expected = df.groupby(["g", "b"], observed=False).size()
+    assert stransf["counts"]["data"] == [expected.values.tolist()]
+    assert transf["indices"] == {"b": expected.index.tolist()}
+    assert stransf["class_count"]["data"] == [[4], [2], [0]]
+    assert transf["class_index"] == ["A", "B", "C"]
+
+
+def test_anova_local1(data):
+    groups, values = data
+    values = values[["a"]]
+    stats = group_statistics(groups, values)
+
+    sec_transfer, transfer = local1(
+        group_stats=stats,
+        covar_enums=["B", "A", "C"],
+        var_label="a",
+        covar_label="g",
+    )
+
+    assert sec_transfer["n_obs"]["data"] == 6
+    assert sec_transfer["overall_stats_count"]["data"] == 6
+    assert sec_transfer["overall_stats_sum"]["data"] == 21.0
+    assert sec_transfer["overall_ssq"]["data"] == 91.0
+    assert sec_transfer["group_stats_count"]["data"] == [2, 4, 0]
+    assert sec_transfer["group_stats_sum"]["data"] == [7.0, 14.0, 0.0]
+    assert sec_transfer["group_stats_ssq"]["data"] == [29.0, 62.0, 0.0]
+    assert sec_transfer["min_per_group"]["data"] == [2.0, 1.0, sys.float_info.max]
+    assert sec_transfer["max_per_group"]["data"] == [5.0, 6.0, sys.float_info.min]
+    assert transfer["group_stats_df_index"] == ["B", "A", "C"]
+    assert np.isclose(
+        sum(sec_transfer["group_stats_sum"]["data"]),
+        sec_transfer["overall_stats_sum"]["data"],
+    )
@@ -0,0 +1,24 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from exareme2.algorithms.exareme2.kmeans import compute_metrics2
+from exareme2.algorithms.exareme2.udfgen import udfio
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_compute_metrics2_in_chunks(chunk_size):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(50, 2))
+    centers = [[-1.0, -1.0], [1.0, 1.0], [100.0, 100.0]]
+
+    with patch.object(udfio, "CHUNK_SIZE", chunk_size):
+        metrics = compute_metrics2(X, {"centers": centers}, n_clusters=3)
+
+    distances = np.linalg.norm(X[:, None, :] - np.array(centers), axis=2)
+    labels = np.argmin(distances, axis=1)
+    expected_sums = [X[labels == i].sum(axis=0) for i in range(3)]
+    expected_counts = [int((labels == i).sum()) for i in range(3)]
+    np.testing.assert_allclose(metrics["sum_list"]["data"], expected_sums)
+    assert metrics["count_list"]["data"] == expected_counts
@@ -1,22 +1,26 @@
+from unittest.mock import Mock
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
 from sklearn.linear_model import LogisticRegression as LogisticRegressionSKL
 
+from exareme2.algorithms.exareme2.logistic_regression import ALGORITHM_NAME
 from exareme2.algorithms.exareme2.logistic_regression import LogisticRegression
+from exareme2.algorithms.exareme2.udfgen import udfio
 from tests.standalone_tests.algorithms.exareme2.test_linear_regression import (
     InMemoryExecutionEngine,
 )
 
-np.random.seed(1)
-
 
 class TestLogisticRegression:
     @pytest.mark.parametrize("nrows", range(10, 100, 10))
     @pytest.mark.parametrize("ncols", range(1, 20))
     def test_predict(self, nrows, ncols):
-        X = pd.DataFrame(np.random.randn(nrows, ncols))
-        y = np.random.random_integers(0, 1, size=nrows)
+        rng = np.random.default_rng(nrows * ncols)
+        X = pd.DataFrame(rng.standard_normal((nrows, ncols)))
+        y = rng.integers(0, 2, size=nrows)
         coef, expected_pred = self._get_sklearn_coef_and_pred(X, y)
         lr = LogisticRegression(engine=InMemoryExecutionEngine())
         lr.coeff = coef
@@ -32,3 +36,55 @@ class TestLogisticRegression:
         coef = lr.coef_
         expected_pred = lr.predict_proba(X)
         return coef.reshape(-1), expected_pred[:, 1]
+
+
+class TestLogisticRegressionWarmStart:
+    def test_initial_coeff_without_warm_start_key(self):
+        engine = Mock()
+        lr = LogisticRegression(engine=engine)
+        lr.p = 2
+
+        assert lr._get_initial_coeff(["a", "b"]) == [0, 0]
+        engine.get_warm_start_params.assert_not_called()
+
+    def test_initial_coeff_from_warm_start(self):
+        engine = Mock()
+        engine.get_warm_start_params.return_value = [0.5, 1.5]
+        lr = LogisticRegression(engine=engine, warm_start_key=("y", "1"))
+        lr.p = 2
+
+        assert lr._get_initial_coeff(["a", "b"]) == [0.5, 1.5]
+        engine.get_warm_start_params.assert_called_once_with(
+            (ALGORITHM_NAME, ("y", "1"), ("a", "b"))
+        )
+
+    def test_initial_coeff_with_other_number_of_covariates(self):
+        engine = Mock()
+        engine.get_warm_start_params.return_value = [0.5]
+        lr = LogisticRegression(engine=engine, warm_start_key=("y", "1"))
+        lr.p = 2
+
+        assert lr._get_initial_coeff(["a", "b"]) == [0, 0]
+
+
+class TestLogisticRegressionLocalStep:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_fit_local_step_in_chunks(self, chunk_size):
+        from scipy import special
+
+        rng = np.random.default_rng(1)
+        X = pd.DataFrame(rng.standard_normal((50, 3)))
+        y = pd.DataFrame(rng.integers(0, 2, size=(50, 1)))
+        coeff = [0.1, -0.2, 0.3]
+
+        with patch.object(udfio, "CHUNK_SIZE", chunk_size):
+            stransfer = LogisticRegression._fit_local_step(X, y, coeff)
+
+        mu = special.expit(X.to_numpy() @ coeff)
+        y_ = y.to_numpy().ravel()
+        expected_H = X.to_numpy().T @ np.diag(mu * (1 - mu)) @ X.to_numpy()
+        expected_grad = X.to_numpy().T @ (y_ - mu)
+        expected_ll = np.sum(special.xlogy(y_, mu) + special.xlogy(1 - y_, 1 - mu))
+        np.testing.assert_allclose(stransfer["H"]["data"], expected_H)
+        np.testing.assert_allclose(stransfer["grad"]["data"], expected_grad)
+        np.testing.assert_allclose(stransfer["ll"]["data"], expected_ll)
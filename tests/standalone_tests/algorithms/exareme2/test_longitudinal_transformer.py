@@ -1,5 +1,4 @@
 from inspect import cleandoc
-from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -12,17 +11,39 @@ from exareme2.algorithms.exareme2.longitudinal_transformer import (
     LongitudinalTransformerUdf,
 )
 from exareme2.worker_communication import BadUserInput
+from exareme2.worker_communication import ColumnInfo
+from exareme2.worker_communication import TableInfo
+from exareme2.worker_communication import TableSchema
+from exareme2.worker_communication import TableType
+
+
+def make_table_info(name, columns):
+    columns = {
+        "row_id": DType.INT,
+        "subjectid": DType.STR,
+        "visitid": DType.STR,
+        **columns,
+    }
+    return TableInfo(
+        name=name,
+        schema_=TableSchema(
+            columns=[
+                ColumnInfo(name=col, dtype=dtype) for col, dtype in columns.items()
+            ]
+        ),
+        type_=TableType.VIEW,
+    )
 
 
 class TestLongitudinalTransformerUdf:
-    def test_get_exec_stmt__first(self):
+    def test_create_view__first(self):
         kwargs = self._make_kwargs({"var": "first"})
         transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        result = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
+        _, result = transf.get_results(output_table_names=["x_result", "result"])
 
         expected = """
-        INSERT INTO result
+        CREATE VIEW result("row_id","var") AS
         SELECT
             t1."row_id",
             t1."var"
@@ -41,16 +62,16 @@ class TestLongitudinalTransformerUdf:
             WHERE
                 "visitid"='FL1') AS t2
             ON t1.subjectid=t2.subjectid;"""
-        assert result == cleandoc(expected)
+        assert result.create_query == cleandoc(expected)
 
-    def test_get_exec_stmt__second(self):
+    def test_create_view__second(self):
         kwargs = self._make_kwargs({"var": "second"})
         transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        result = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
+        _, result = transf.get_results(output_table_names=["x_result", "result"])
 
         expected = """
-        INSERT INTO result
+        CREATE VIEW result("row_id","var") AS
         SELECT
             t1."row_id",
             t2."var"
@@ -69,16 +90,16 @@ class TestLongitudinalTransformerUdf:
             WHERE
                 "visitid"='FL1') AS t2
             ON t1.subjectid=t2.subjectid;"""
-        assert result == cleandoc(expected)
+        assert result.create_query == cleandoc(expected)
 
-    def test_get_exec_stmt__diff(self):
+    def test_create_view__diff(self):
         kwargs = self._make_kwargs({"var": "diff"})
         transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        result = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
+        _, result = transf.get_results(output_table_names=["x_result", "result"])
 
         expected = """
-        INSERT INTO result
+        CREATE VIEW result("row_id","var_diff") AS
         SELECT
             t1."row_id",
             t2."var" - t1."var"
@@ -97,16 +118,16 @@ class TestLongitudinalTransformerUdf:
             WHERE
                 "visitid"='FL1') AS t2
             ON t1.subjectid=t2.subjectid;"""
-        assert result == cleandoc(expected)
+        assert result.create_query == cleandoc(expected)
 
-    def test_get_exec_stmt__multiple_vars(self):
+    def test_create_view__multiple_vars(self):
         kwargs = self._make_kwargs({"var1": "first", "var2": "second", "var3": "diff"})
         transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        result = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
+        _, result = transf.get_results(output_table_names=["x_result", "result"])
 
         expected = """
-        INSERT INTO result
+        CREATE VIEW result("row_id","var1","var2","var3_diff") AS
         SELECT
             t1."row_id",
             t1."var1",
@@ -127,16 +148,16 @@ class TestLongitudinalTransformerUdf:
             WHERE
                 "visitid"='FL1') AS t2
             ON t1.subjectid=t2.subjectid;"""
-        assert result == cleandoc(expected)
+        assert result.create_query == cleandoc(expected)
 
-    def test_get_exec_stmt__other_visits(self):
+    def test_create_view__other_visits(self):
         kwargs = self._make_kwargs({"var": "first"}, visit1="FL1", visit2="FL2")
         transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        result = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
+        _, result = transf.get_results(output_table_names=["x_result", "result"])
 
         expected = """
-        INSERT INTO result
+        CREATE VIEW result("row_id","var") AS
         SELECT
             t1."row_id",
             t1."var"
@@ -155,39 +176,69 @@ class TestLongitudinalTransformerUdf:
             WHERE
                 "visitid"='FL2') AS t2
             ON t1.subjectid=t2.subjectid;"""
-        assert result == cleandoc(expected)
+        assert result.create_query == cleandoc(expected)
 
-    def test_output_schema(self):
-        kwargs = self._make_kwargs(strategies={})
-        schema = [("var1", DType.INT), ("var2", DType.FLOAT), ("var3", DType.STR)]
-        transf = LongitudinalTransformerUdf(flowkwargs=kwargs, output_schema=schema)
+    def test_get_exec_stmts__views_need_none(self):
+        kwargs = self._make_kwargs({"var": "second"})
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        result = transf.output_schema
+        x_result, _ = transf.get_results(output_table_names=["x_result", "result"])
 
-        assert result == schema
+        assert transf.creates_views
+        assert transf.get_definition(None, ["x_result", "result"]) == ""
+        assert transf.get_exec_stmts(None, ["x_result", "result"]) == []
+
+        expected = """
+        CREATE VIEW x_result("row_id","xvar") AS
+        SELECT
+            t1."row_id",
+            t1."xvar"
+        FROM
+            (SELECT
+                *
+            FROM
+                test_x_table
+            WHERE
+                "visitid"='BL') AS t1
+            INNER JOIN
+            (SELECT
+                *
+            FROM
+                test_x_table
+            WHERE
+                "visitid"='FL1') AS t2
+            ON t1.subjectid=t2.subjectid;"""
+        assert x_result.create_query == cleandoc(expected)
 
     def test_get_results(self):
-        kwargs = self._make_kwargs(strategies={})
-        schema = [("var1", DType.INT), ("var2", DType.FLOAT), ("var3", DType.STR)]
-        transf = LongitudinalTransformerUdf(flowkwargs=kwargs, output_schema=schema)
+        kwargs = self._make_kwargs({"var1": "diff", "var2": "first", "var3": "second"})
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        results = transf.get_results(["result"])
+        x_result, y_result = transf.get_results(["x_result", "result"])
 
-        assert len(results) == 1
-        [result] = results
-        assert result.table_name == "result"
-        assert result.table_schema == schema
-        exp_query = 'CREATE TABLE result("var1" INT,"var2" DOUBLE,"var3" VARCHAR(500));'
-        assert result.create_query == exp_query
+        assert x_result.table_name == "x_result"
+        assert x_result.table_schema == [("row_id", DType.INT), ("xvar", DType.FLOAT)]
+        assert y_result.table_name == "result"
+        assert y_result.table_schema == [
+            ("row_id", DType.INT),
+            ("var1_diff", DType.INT),
+            ("var2", DType.FLOAT),
+            ("var3", DType.STR),
+        ]
+        assert y_result.create_query.startswith(
+            'CREATE VIEW result("row_id","var1_diff","var2","var3") AS\nSELECT'
+        )
 
     @staticmethod
     def _make_kwargs(strategies, visit1="BL", visit2="FL1"):
-        dataframe = SimpleNamespace(name="test_table")
+        dtypes = {"var1": DType.INT, "var2": DType.FLOAT, "var3": DType.STR}
+        y_columns = {name: dtypes.get(name, DType.FLOAT) for name in strategies}
         return {
-            "dataframe": dataframe,
+            "x": make_table_info("test_x_table", {"xvar": DType.FLOAT}),
+            "y": make_table_info("test_table", y_columns),
             "visit1": visit1,
             "visit2": visit2,
-            "strategies": strategies,
+            "strategies": {"xvar": "first", **strategies},
         }
 
 
@@ -202,82 +253,99 @@ def db(globalworker_db_cursor):
 class TestLongitudinalTransformerUdf_WithDb:
     test_table = "test_longitudinal_table"
 
-    @pytest.mark.usefixtures("delete_result_table")
-    def test_create_result_table(self, db):
-        output_schema = [("a", DType.INT)]
-        transf = LongitudinalTransformerUdf(flowkwargs={}, output_schema=output_schema)
+    @pytest.mark.usefixtures("longitudinal_dataframe", "delete_result_table")
+    def test_create_result_view(self, db):
+        kwargs = self._make_kwargs(strategies={}, visit1="BL", visit2="FL1")
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        udf_result, *_ = transf.get_results(output_table_names=["result"])
+        _, udf_result = transf.get_results(output_table_names=["x_result", "result"])
         create_query = udf_result.create_query
         db.execute(create_query)
 
         result = self._get_result(db)
         assert result == []
 
-    @pytest.mark.usefixtures("longitudinal_dataframe", "result_table")
+    @pytest.mark.usefixtures("longitudinal_dataframe", "delete_result_table")
     def test_longitudinal_transform__no_rows(self, db):
         kwargs = self._make_kwargs(
             strategies={"numvar": "diff", "nomvar": "first"},
             visit1="BL",
             visit2="FL3",
         )
-        schema = [("row_id", DType.INT), ("numvar", DType.INT), ("nomvar", DType.STR)]
-        transf = LongitudinalTransformerUdf(flowkwargs=kwargs, output_schema=schema)
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        exec_stmt = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
-        db.execute(exec_stmt)
+        _, udf_result = transf.get_results(output_table_names=["x_result", "result"])
+        db.execute(udf_result.create_query)
 
         result = self._get_result(db)
         assert result == []
 
-    @pytest.mark.usefixtures("longitudinal_dataframe", "result_table")
+    @pytest.mark.usefixtures("longitudinal_dataframe", "delete_result_table")
     def test_longitudinal_transform__one_row(self, db):
         kwargs = self._make_kwargs(
             strategies={"numvar": "diff", "nomvar": "first"},
             visit1="BL",
             visit2="FL2",
         )
-        schema = [("row_id", DType.INT), ("numvar", DType.INT), ("nomvar", DType.STR)]
-        transf = LongitudinalTransformerUdf(flowkwargs=kwargs, output_schema=schema)
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        exec_stmt = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
-        db.execute(exec_stmt)
+        _, udf_result = transf.get_results(output_table_names=["x_result", "result"])
+        db.execute(udf_result.create_query)
 
         result = self._get_result(db)
         assert result == [(0, 2, "a")]
 
-    @pytest.mark.usefixtures("longitudinal_dataframe", "result_table")
+    @pytest.mark.usefixtures("longitudinal_dataframe", "delete_result_table")
     def test_longitudinal_transform__multiple_rows(self, db):
         kwargs = self._make_kwargs(
             strategies={"numvar": "diff", "nomvar": "first"},
             visit1="BL",
             visit2="FL1",
         )
-        schema = [("row_id", DType.INT), ("numvar", DType.INT), ("nomvar", DType.STR)]
-        transf = LongitudinalTransformerUdf(flowkwargs=kwargs, output_schema=schema)
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        exec_stmt = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
-        db.execute(exec_stmt)
+        _, udf_result = transf.get_results(output_table_names=["x_result", "result"])
+        db.execute(udf_result.create_query)
 
         result = self._get_result(db)
         assert result == [(0, 1, "a"), (3, 2, "a")]
 
-    @pytest.mark.usefixtures("longitudinal_dataframe", "result_table")
+    @pytest.mark.usefixtures("longitudinal_dataframe", "delete_result_table")
     def test_longitudinal_transform__second_strategy(self, db):
         kwargs = self._make_kwargs(
             strategies={"numvar": "diff", "nomvar": "second"},
             visit1="BL",
             visit2="FL2",
         )
-        schema = [("row_id", DType.INT), ("numvar", DType.INT), ("nomvar", DType.STR)]
-        transf = LongitudinalTransformerUdf(flowkwargs=kwargs, output_schema=schema)
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
 
-        exec_stmt = transf.get_exec_stmt(udf_name=None, output_table_names=["result"])
-        db.execute(exec_stmt)
+        _, udf_result = transf.get_results(output_table_names=["x_result", "result"])
+        db.execute(udf_result.create_query)
 
         result = self._get_result(db)
         assert result == [(0, 2, "b")]
 
+    @pytest.mark.usefixtures("longitudinal_dataframe", "delete_result_table")
+    def test_longitudinal_transform__both_outputs(self, db):
+        kwargs = {
+            "x": make_table_info(self.test_table, {"numvar": DType.INT}),
+            "y": make_table_info(self.test_table, {"nomvar": DType.STR}),
+            "visit1": "BL",
+            "visit2": "FL1",
+            "strategies": {"numvar": "diff", "nomvar": "second"},
+        }
+        transf = LongitudinalTransformerUdf(flowkwargs=kwargs)
+        output_table_names = ["x_result", "result"]
+
+        # The views are created as the worker does, with no execution statement
+        for udf_result in transf.get_results(output_table_names):
+            db.execute(udf_result.create_query)
+        assert transf.get_exec_stmts(None, output_table_names) == []
+
+        x_result = db.execute("SELECT * FROM x_result").fetchall()
+        assert sorted(x_result) == [(0, 1), (3, 2)]
+        assert sorted(self._get_result(db)) == [(0, "b"), (3, "b")]
+
     @pytest.fixture(scope="class")
     def longitudinal_dataframe(self, db):
         self._create_longitudinal_table(db)
@@ -287,17 +355,13 @@ class TestLongitudinalTransformerUdf_WithDb:
         finally:
             self._delete_longitudinal_table(db)
 
-    @pytest.fixture(scope="function")
-    def result_table(self, db, delete_result_table):
-        db.execute("CREATE TABLE result(row_id INT, numvar INT, nomvar TEXT)")
-        yield
-
     @pytest.fixture(scope="function")
     def delete_result_table(self, db):
         try:
             yield
         finally:
-            db.execute("DROP TABLE IF EXISTS result")
+            db.execute("DROP VIEW IF EXISTS result")
+            db.execute("DROP VIEW IF EXISTS x_result")
 
     def _create_longitudinal_table(self, db):
         sql = f"""
@@ -328,9 +392,11 @@ class TestLongitudinalTransformerUdf_WithDb:
         return db.execute("SELECT * FROM result").fetchall()
 
     def _make_kwargs(self, strategies, visit1, visit2):
-        dataframe = SimpleNamespace(name=self.test_table)
+        columns = {"numvar": DType.INT, "nomvar": DType.STR}
+        table = make_table_info(self.test_table, columns)
         return {
-            "dataframe": dataframe,
+            "x": table,
+            "y": table,
             "visit1": visit1,
             "visit2": visit2,
             "strategies": strategies,
@@ -338,26 +404,48 @@ class TestLongitudinalTransformerUdf_WithDb:
 
 
 class TestLongitudinalTransformer:
-    def test_transform_schema__valid(self):
+    def test_transform__single_local_run(self):
         metadata = {
             "numvar": {"sql_type": "int", "is_categorical": False},
             "nomvar": {"sql_type": "text", "is_categorical": True},
         }
         engine = Mock()
+        engine.run_udf_on_local_workers.return_value = ["X", "y"]
         strategies = {"numvar": "diff", "nomvar": "first"}
         transf = LongitudinalTransformer(
             engine, metadata, strategies, visit1="BL", visit2="FL1"
         )
 
-        transf.transform(X=None)
+        result = transf.transform(X="x_view", y="y_view")
 
-        expected_schema = [
-            ("row_id", DType.INT),
-            ("numvar_diff", DType.INT),
-            ("nomvar", DType.STR),
-        ]
+        assert result == ["X", "y"]
+        engine.run_udf_on_local_workers.assert_called_once()
         call_kwargs = engine.run_udf_on_local_workers.call_args.kwargs
-        assert call_kwargs["output_schema"] == expected_schema
+        assert call_kwargs["keyword_args"] == {
+            "x": "x_view",
+            "y": "y_view",
+            "visit1": "BL",
+            "visit2": "FL1",
+            "strategies": strategies,
+        }
+        assert call_kwargs["share_to_global"] == [False, False]
+
+    def test_transform_metadata(self):
+        metadata = {
+            "numvar": {"sql_type": "int", "is_categorical": False},
+            "nomvar": {"sql_type": "text", "is_categorical": True},
+        }
+        strategies = {"numvar": "diff", "nomvar": "first"}
+        transf = LongitudinalTransformer(
+            Mock(), metadata, strategies, visit1="BL", visit2="FL1"
+        )
+
+        result = transf.transform_metadata(metadata)
+
+        assert result == {
+            "numvar_diff": metadata["numvar"],
+            "nomvar": metadata["nomvar"],
+        }
 
     def test_transform_schema__invalid_diff(self):
         metadata = {"nomvar": {"sql_type": "text", "is_categorical": True}}
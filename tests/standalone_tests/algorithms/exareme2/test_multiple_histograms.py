@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+from exareme2.algorithms.exareme2.multiple_histograms import compute_local_histograms
+from exareme2.algorithms.exareme2.multiple_histograms import get_min_max_from_statistics
+from exareme2.algorithms.exareme2.multiple_histograms import merge_histograms
+from exareme2.algorithms.exareme2.udfgen.udfio import secure_transfers_to_merged_dict
+from exareme2.worker_communication import ColumnStatistics
+from exareme2.worker_communication import DatasetStatistics
+
+
+def bin_counts(data, variable, groupings, bins, bin_range):
+    """Computes in pandas the table computed by BinCountsUdf."""
+    indices = np.digitize(data[variable], np.linspace(*bin_range, bins + 1)) - 1
+    data = data.assign(bin=np.minimum(indices, bins - 1))
+    counts = [data.groupby("bin").size().rename("count").reset_index()]
+    counts[0] = counts[0].assign(variable="", group_value=None)
+    for grouping in groupings:
+        counts.append(
+            data.groupby([grouping, "bin"])
+            .size()
+            .rename("count")
+            .reset_index()
+            .rename(columns={grouping: "group_value"})
+            .assign(variable=grouping)
+        )
+    return pd.concat(counts, ignore_index=True)
+
+
+def test_compute_local_histograms():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "y": rng.normal(size=100),
+            "g": rng.choice(["a", "c"], 100),
+        }
+    )
+    bins, bin_range = 5, (data.y.min(), data.y.max())
+    metadata = {"g": {"a": "A", "b": "B", "c": "C"}}
+
+    result = compute_local_histograms(
+        bin_counts(data, "y", ["g"], bins, bin_range),
+        bin_labels=list(range(bins)),
+        metadata=metadata,
+        xvars=["g"],
+    )
+
+    expected, _ = np.histogram(data.y, bins=bins, range=bin_range)
+    assert result["histogram"]["data"] == expected.tolist()
+    [grouped] = result["grouped_histogram"]["data"]
+    for group, counts in zip(metadata["g"], grouped):
+        expected, _ = np.histogram(data.y[data.g == group], bins=bins, range=bin_range)
+        assert counts == expected.tolist()
+
+
+def test_compute_local_histograms_of_nominal_variable():
+    bin_counts = pd.DataFrame(
+        {
+            "variable": ["", "", "x", "x"],
+            "group_value": [None, None, "1", "2"],
+            "bin": ["b", "a", "a", "b"],
+            "count": [3, 2, 2, 3],
+        }
+    )
+
+    result = compute_local_histograms(
+        bin_counts,
+        bin_labels=["a", "b", "c"],
+        metadata={"x": {"1": "one", "2": "two"}},
+        xvars=["x"],
+    )
+
+    assert result["histogram"]["data"] == [2, 3, 0]
+    assert result["grouped_histogram"]["data"] == [[[2, 0, 0], [0, 3, 0]]]
+
+
+def test_merge_histograms_hides_small_counts():
+    local_histograms = [
+        {"histogram": {"data": [1, 5], "operation": "sum", "type": "int"}},
+        {"histogram": {"data": [1, 0], "operation": "sum", "type": "int"}},
+    ]
+    locals_result = secure_transfers_to_merged_dict(local_histograms)
+
+    result = merge_histograms(locals_result, xvars=[], min_row_count=3)
+
+    assert result == {"histogram": [None, 5]}
+
+
+def dataset_statistics(dataset, y_min, y_max, g_null_count=0):
+    return DatasetStatistics(
+        dataset=dataset,
+        row_count=10,
+        columns={
+            "y": ColumnStatistics(count=10, null_count=0, min=y_min, max=y_max),
+            "g": ColumnStatistics(count=10 - g_null_count, null_count=g_null_count),
+        },
+    )
+
+
+def test_get_min_max_from_statistics():
+    statistics = {
+        "ds1": dataset_statistics("ds1", y_min=1.0, y_max=5.0),
+        "ds2": dataset_statistics("ds2", y_min=-2.0, y_max=3.0),
+    }
+    assert get_min_max_from_statistics(statistics, "y", ["g"]) == (-2.0, 5.0)
+
+
+def test_get_min_max_from_statistics_with_missing_values():
+    statistics = {
+        "ds1": dataset_statistics("ds1", y_min=1.0, y_max=5.0, g_null_count=1),
+    }
+    assert get_min_max_from_statistics(statistics, "y", ["g"]) is None
+    assert get_min_max_from_statistics(None, "y", ["g"]) is None
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from exareme2.algorithms.exareme2.pca import global1
+from exareme2.algorithms.exareme2.sufficient_statistics import local_moments
+from exareme2.algorithms.exareme2.udfgen.udfio import secure_transfers_to_merged_dict
+
+
+def test_single_pass_pca_matches_correlation_matrix_eigendecomposition():
+    rng = np.random.default_rng(0)
+    mixing = rng.random((4, 4))
+    local_data = [
+        pd.DataFrame(rng.normal(1000, 100, (n_obs, 4)) @ mixing)
+        for n_obs in (30, 50, 70)
+    ]
+
+    local_transfers = [local_moments(x) for x in local_data]
+    result = global1(secure_transfers_to_merged_dict(local_transfers))
+
+    all_data = pd.concat(local_data)
+    expected_eigenvalues, expected_eigenvectors = np.linalg.eigh(
+        np.corrcoef(all_data.values, rowvar=False)
+    )
+    expected_eigenvalues = expected_eigenvalues[::-1]
+    expected_eigenvectors = expected_eigenvectors[:, ::-1].T
+    assert result["n_obs"] == len(all_data)
+    np.testing.assert_allclose(result["eigenvalues"], expected_eigenvalues)
+    np.testing.assert_allclose(
+        np.abs(result["eigenvectors"]), np.abs(expected_eigenvectors), atol=1e-8
+    )
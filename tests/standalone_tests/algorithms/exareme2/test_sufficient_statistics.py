@@ -0,0 +1,160 @@
+import json
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from exareme2 import DType
+from exareme2.algorithms.exareme2.pearson_correlation import global1 as pearson_global
+from exareme2.algorithms.exareme2.sufficient_statistics import ColumnMomentsUdf
+from exareme2.algorithms.exareme2.sufficient_statistics import local_cross_moments
+from exareme2.algorithms.exareme2.sufficient_statistics import local_moments
+from exareme2.algorithms.exareme2.ttest_independent import GroupMomentsUdf
+from exareme2.algorithms.exareme2.ttest_independent import global_independent
+from exareme2.algorithms.exareme2.ttest_onesample import global_one_sample
+from exareme2.algorithms.exareme2.ttest_paired import global_paired
+from exareme2.algorithms.exareme2.udfgen.udfio import secure_transfers_to_merged_dict
+from exareme2.worker_communication import TableInfo
+from exareme2.worker_communication import TableSchema
+from exareme2.worker_communication import TableType
+
+
+@pytest.fixture
+def local_data():
+    rng = np.random.default_rng(0)
+    return [
+        (
+            pd.DataFrame(rng.normal(10, 2, (n_obs, 3))),
+            pd.DataFrame(rng.normal(5, 1, (n_obs, 2))),
+        )
+        for n_obs in (20, 30, 40)
+    ]
+
+
+def test_local_moments(local_data):
+    x = pd.concat([x for x, _ in local_data]).values
+
+    moments = secure_transfers_to_merged_dict([local_moments(x) for x, _ in local_data])
+
+    assert moments["n_obs"] == len(x)
+    np.testing.assert_allclose(moments["sx"], x.sum(axis=0))
+    np.testing.assert_allclose(moments["sxx"], (x**2).sum(axis=0))
+    np.testing.assert_allclose(moments["cross_products"], x.T @ x)
+
+
+def test_local_cross_moments(local_data):
+    x = pd.concat([x for x, _ in local_data]).values
+    y = pd.concat([y for _, y in local_data]).values
+
+    moments = secure_transfers_to_merged_dict(
+        [local_cross_moments(x, y) for x, y in local_data]
+    )
+
+    assert moments["n_obs"] == len(x)
+    np.testing.assert_allclose(moments["sx"], x.sum(axis=0))
+    np.testing.assert_allclose(moments["sxx"], (x**2).sum(axis=0))
+    np.testing.assert_allclose(moments["sy"], y.sum(axis=0))
+    np.testing.assert_allclose(moments["syy"], (y**2).sum(axis=0))
+    np.testing.assert_allclose(moments["sxy"], y.T @ x)
+
+
+def test_pearson_from_cross_moments(local_data):
+    x = pd.concat([x for x, _ in local_data]).values
+    y = pd.concat([y for _, y in local_data]).values
+    moments = secure_transfers_to_merged_dict(
+        [local_cross_moments(x, y) for x, y in local_data]
+    )
+
+    result = pearson_global(moments, alpha=0.95)
+
+    expected = np.corrcoef(y, x, rowvar=False)[: y.shape[1], y.shape[1] :]
+    np.testing.assert_allclose(result["correlations"], expected)
+
+
+def test_ttest_onesample_from_moments(local_data):
+    from scipy.stats import ttest_1samp
+
+    x = [x[[0]] for x, _ in local_data]
+    moments = secure_transfers_to_merged_dict([local_moments(x_) for x_ in x])
+
+    result = global_one_sample(moments, alpha=0.05, alternative="two-sided", mu=9)
+
+    expected = ttest_1samp(pd.concat(x)[0], 9)
+    assert result["t_stat"] == pytest.approx(expected.statistic)
+    assert result["p_value"] == pytest.approx(expected.pvalue)
+
+
+def test_ttest_paired_from_cross_moments(local_data):
+    from scipy.stats import ttest_rel
+
+    pairs = [(x[[0]], y[[0]]) for x, y in local_data]
+    moments = secure_transfers_to_merged_dict(
+        [local_cross_moments(x, y) for x, y in pairs]
+    )
+
+    result = global_paired(moments, alpha=0.05, alternative="two-sided")
+
+    expected = ttest_rel(
+        pd.concat([x for x, _ in pairs])[0], pd.concat([y for _, y in pairs])[0]
+    )
+    assert result["t_stat"] == pytest.approx(expected.statistic)
+    assert result["p"] == pytest.approx(expected.pvalue)
+
+
+def execute_aggregate_udf(udf_class, tables, **literals):
+    """Executes an aggregate UDF on the dataframes, loaded in an in-memory
+    SQLite database, and returns its secure transfer."""
+    con = sqlite3.connect(":memory:")
+    flowkwargs = dict(literals)
+    for name, df in tables.items():
+        df = df.rename(columns=str).rename_axis("row_id").reset_index()
+        df.to_sql(name, con, index=False)
+        dtypes = {"int64": DType.INT, "float64": DType.FLOAT, "object": DType.STR}
+        flowkwargs[name] = TableInfo(
+            name=name,
+            schema_=TableSchema.from_list(
+                [(column, dtypes[str(df[column].dtype)]) for column in df.columns]
+            ),
+            type_=TableType.NORMAL,
+        )
+    con.execute('CREATE TABLE main ("secure_transfer" TEXT)')
+    udf = udf_class(flowkwargs=flowkwargs)
+    con.execute(udf.get_exec_stmt(udf_name=None, output_table_names=["main"]))
+    [(secure_transfer,)] = con.execute("SELECT * FROM main").fetchall()
+    return json.loads(secure_transfer)
+
+
+def test_column_moments_udf_same_as_local_cross_moments(local_data):
+    x, y = local_data[0]
+
+    result = execute_aggregate_udf(ColumnMomentsUdf, {"x": x, "y": y})
+
+    expected = local_cross_moments(x, y)
+    assert result.keys() == expected.keys()
+    for key, item in expected.items():
+        assert result[key]["type"] == item["type"]
+        np.testing.assert_allclose(result[key]["data"], item["data"])
+
+
+def test_ttest_independent_from_group_moments():
+    from scipy.stats import ttest_ind
+
+    rng = np.random.default_rng(0)
+    x = pd.DataFrame({"group": rng.choice(["A", "B", "C"], 50)})
+    y = pd.DataFrame({"value": rng.normal(10, 2, 50)})
+
+    moments = execute_aggregate_udf(
+        GroupMomentsUdf, {"x": x, "y": y}, groupA="A", groupB="B"
+    )
+    result = global_independent(
+        secure_transfers_to_merged_dict([moments]),
+        alpha=0.05,
+        alternative="two-sided",
+    )
+
+    group_a, group_b = y.value[x.group == "A"], y.value[x.group == "B"]
+    expected = ttest_ind(group_a, group_b, equal_var=False)
+    assert result["t_stat"] == pytest.approx(expected.statistic)
+    assert result["mean_diff"] == pytest.approx(group_a.mean() - group_b.mean())
+    assert result["df"] == len(group_a) + len(group_b) - 2
@@ -2,11 +2,25 @@ import numpy as np
 import pytest
 
 from exareme2.algorithms.exareme2.udfgen.udfio import construct_secure_transfer_dict
+from exareme2.algorithms.exareme2.udfgen.udfio import iter_chunks
 from exareme2.algorithms.exareme2.udfgen.udfio import merge_tensor_to_list
 from exareme2.algorithms.exareme2.udfgen.udfio import secure_transfers_to_merged_dict
 from exareme2.algorithms.exareme2.udfgen.udfio import split_secure_transfer_dict
 
 
+@pytest.mark.parametrize(
+    "n_rows, chunk_size, expected_slices",
+    [
+        (0, 2, []),
+        (4, 2, [slice(0, 2), slice(2, 4)]),
+        (5, 2, [slice(0, 2), slice(2, 4), slice(4, 5)]),
+        (3, 10, [slice(0, 3)]),
+    ],
+)
+def test_iter_chunks(n_rows, chunk_size, expected_slices):
+    assert list(iter_chunks(n_rows, chunk_size)) == expected_slices
+
+
 def test_merge_tensor_to_list_2tables_0D():
     columns = dict(
         worker_id=np.array(["a", "b"]),
@@ -721,3 +735,39 @@ def test_proper_int_casting_in_construct_secure_transfer_dict():
         "min": [100, 200, 300],
         "max": 1,
     }
+
+
+def test_secure_transfers_to_merged_dict_with_matrices():
+    matrices = [np.arange(6).reshape(2, 3) * i for i in range(1, 4)]
+    transfers = [
+        {
+            "sum": {"data": matrix.tolist(), "operation": "sum", "type": "int"},
+            "min": {"data": matrix.tolist(), "operation": "min", "type": "int"},
+            "max": {"data": matrix.tolist(), "operation": "max", "type": "int"},
+        }
+        for matrix in matrices
+    ]
+
+    result = secure_transfers_to_merged_dict(transfers)
+
+    assert result["sum"] == sum(matrices).tolist()
+    assert result["min"] == np.min(matrices, axis=0).tolist()
+    assert result["max"] == np.max(matrices, axis=0).tolist()
+    assert all(isinstance(value, int) for row in result["sum"] for value in row)
+
+
+def test_split_and_construct_secure_transfer_dict_with_matrix():
+    matrix = [[0.5, 1.5], [2.5, 3.5]]
+    secure_transfer = {
+        "a": {"data": 1, "operation": "sum", "type": "int"},
+        "b": {"data": matrix, "operation": "sum", "type": "float"},
+    }
+
+    template, sum_op, min_op, max_op = split_secure_transfer_dict(secure_transfer)
+
+    assert template["b"]["data"] == [[1, 2], [3, 4]]
+    assert sum_op == [1, 0.5, 1.5, 2.5, 3.5]
+    assert construct_secure_transfer_dict(template, sum_op, min_op, max_op) == {
+        "a": 1,
+        "b": matrix,
+    }
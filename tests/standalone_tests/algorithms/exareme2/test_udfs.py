@@ -235,13 +235,25 @@ def test_convert_table_result():
             type_=TableType.NORMAL,
         )
     )
-    result = _convert_result(udfgen_result)
+    result = _convert_result(udfgen_result, TableType.NORMAL)
     assert result == expected
 
 
+def test_convert_view_result():
+    udfgen_result = UDFGenTableResult(
+        table_schema=[("a", DType.INT)], create_query="", table_name="view_name"
+    )
+    result = _convert_result(udfgen_result, TableType.VIEW)
+    assert result.value.type_ == TableType.VIEW
+
+
 def test_create_output_table_names():
     names = _make_output_table_names(
-        outputlen=2, worker_id="worker1", context_id="context2", command_id="command3"
+        outputlen=2,
+        table_type=TableType.NORMAL,
+        worker_id="worker1",
+        context_id="context2",
+        command_id="command3",
     )
     assert names == [
         "normal_worker1_context2_command3_0",
@@ -249,6 +261,20 @@ def test_create_output_table_names():
     ]
 
 
+def test_create_output_view_names():
+    names = _make_output_table_names(
+        outputlen=2,
+        table_type=TableType.VIEW,
+        worker_id="worker1",
+        context_id="context2",
+        command_id="command3",
+    )
+    assert names == [
+        "view_worker1_context2_command3_0",
+        "view_worker1_context2_command3_1",
+    ]
+
+
 def get_udf_table_sharing_queries_params():
     return [
         pytest.param(
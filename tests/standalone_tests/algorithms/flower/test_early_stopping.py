@@ -0,0 +1,75 @@
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from exareme2.algorithms.flower import early_stopping
+from exareme2.algorithms.flower.early_stopping import EarlyStoppingFedAvg
+from exareme2.algorithms.flower.early_stopping import get_stopping_params
+
+
+@pytest.fixture
+def post_result():
+    with patch.object(early_stopping, "post_result") as post_result:
+        with patch.object(early_stopping, "post_model_parameters"):
+            yield post_result
+
+
+def create_strategy(losses, num_of_rounds=10, tol=0.01):
+    evaluate_fn = Mock(
+        side_effect=[(loss, {"accuracy": i}) for i, loss in enumerate(losses)]
+    )
+    return EarlyStoppingFedAvg(
+        num_of_rounds=num_of_rounds, tol=tol, evaluate_fn=evaluate_fn
+    )
+
+
+def run_rounds(strategy, num_of_rounds):
+    for server_round in range(num_of_rounds + 1):
+        strategy.evaluate(server_round, parameters=Mock(tensors=[]))
+
+
+def test_get_stopping_params_defaults():
+    assert get_stopping_params(None) == (
+        early_stopping.NUM_OF_ROUNDS,
+        early_stopping.TOL,
+    )
+
+
+def test_get_stopping_params():
+    assert get_stopping_params({"num_of_rounds": 3, "tol": 0.1}) == (3, 0.1)
+
+
+def test_stops_when_the_loss_converges(post_result):
+    strategy = create_strategy([1.0, 0.5, 0.3, 0.295, 0.29])
+    run_rounds(strategy, 3)
+
+    assert strategy.finished
+    post_result.assert_called_once_with({"accuracy": 3})
+    assert strategy.configure_fit(4, Mock(), Mock()) == []
+    assert strategy.configure_evaluate(4, Mock(), Mock()) == []
+    assert strategy.evaluate(4, Mock(tensors=[])) is None
+
+
+def test_posts_the_final_model_parameters(post_result):
+    strategy = create_strategy([1.0, 0.5], num_of_rounds=1)
+    with patch.object(early_stopping, "post_model_parameters") as post_params:
+        run_rounds(strategy, 1)
+
+    post_params.assert_called_once_with([])
+
+
+def test_stops_after_the_last_round(post_result):
+    strategy = create_strategy([1.0, 0.5, 0.3, 0.1], num_of_rounds=3)
+    run_rounds(strategy, 3)
+
+    assert strategy.finished
+    post_result.assert_called_once_with({"accuracy": 3})
+
+
+def test_keeps_training_while_the_loss_changes(post_result):
+    strategy = create_strategy([1.0, 0.5, 0.3, 0.1])
+    run_rounds(strategy, 3)
+
+    assert not strategy.finished
+    post_result.assert_not_called()
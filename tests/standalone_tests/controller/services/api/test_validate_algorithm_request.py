@@ -15,11 +15,20 @@ from exareme2.algorithms.specifications import ParameterType
 from exareme2.algorithms.specifications import TransformerSpecification
 from exareme2.algorithms.specifications import TransformerType
 from exareme2.controller import logger as ctrl_logger
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    AlgorithmBatchRequestDTO,
+)
 from exareme2.controller.services.api.algorithm_request_dtos import (
     AlgorithmInputDataDTO,
 )
 from exareme2.controller.services.api.algorithm_request_dtos import AlgorithmRequestDTO
+from exareme2.controller.services.api.algorithm_request_dtos import (
+    BatchedAlgorithmRequestDTO,
+)
 from exareme2.controller.services.api.algorithm_request_validator import BadRequest
+from exareme2.controller.services.api.algorithm_request_validator import (
+    validate_algorithm_batch_request,
+)
 from exareme2.controller.services.api.algorithm_request_validator import (
     validate_algorithm_request,
 )
@@ -1463,3 +1472,105 @@ def test_validate_algorithm_exceptions(
                 smpc_enabled=False,
                 smpc_optional=False,
             )
+
+
+def create_batched_request_dto(algorithm_name, datasets, y, flags=None):
+    return BatchedAlgorithmRequestDTO(
+        algorithm_name=algorithm_name,
+        type=AlgorithmType.EXAREME2,
+        inputdata=AlgorithmInputDataDTO(
+            data_model="data_model_with_all_cde_types:0.1",
+            datasets=datasets,
+            y=y,
+        ),
+        flags=flags,
+    )
+
+
+def test_validate_algorithm_batch_success(
+    algorithms_specs,
+    transformers_specs,
+    worker_landscape_aggregator,
+):
+    batch_request_dto = AlgorithmBatchRequestDTO(
+        algorithms=[
+            create_batched_request_dto(
+                "algorithm_with_y_int", ["sample_dataset1"], ["int_cde"]
+            ),
+            create_batched_request_dto(
+                "algorithm_with_y_text_multiple_true",
+                ["sample_dataset1"],
+                ["text_cde_categ", "text_cde_categ"],
+            ),
+        ]
+    )
+    with patch.object(
+        worker_landscape_aggregator,
+        "get_global_worker",
+        return_value=mocked_worker_info,
+    ):
+        validate_algorithm_batch_request(
+            algorithm_batch_request_dto=batch_request_dto,
+            algorithms_specs=algorithms_specs,
+            transformers_specs=transformers_specs,
+            worker_landscape_aggregator=worker_landscape_aggregator,
+            smpc_enabled=False,
+            smpc_optional=False,
+        )
+
+
+@pytest.mark.parametrize(
+    "algorithm_request_dtos, exception_message",
+    [
+        pytest.param([], "does not contain any algorithm requests", id="empty batch"),
+        pytest.param(
+            [
+                create_batched_request_dto(
+                    "algorithm_with_y_int", ["sample_dataset1"], ["int_cde"]
+                ),
+                create_batched_request_dto(
+                    "algorithm_with_y_int", ["sample_dataset2"], ["int_cde"]
+                ),
+            ],
+            "same data model, datasets and filters",
+            id="different datasets",
+        ),
+        pytest.param(
+            [
+                create_batched_request_dto(
+                    "algorithm_with_y_int", ["sample_dataset1"], ["int_cde"]
+                ),
+                create_batched_request_dto(
+                    "algorithm_with_y_int",
+                    ["sample_dataset1"],
+                    ["int_cde"],
+                    flags={"smpc": False},
+                ),
+            ],
+            "same flags",
+            id="different flags",
+        ),
+    ],
+)
+def test_validate_algorithm_batch_exceptions(
+    algorithm_request_dtos,
+    exception_message,
+    algorithms_specs,
+    transformers_specs,
+    worker_landscape_aggregator,
+):
+    batch_request_dto = AlgorithmBatchRequestDTO(algorithms=algorithm_request_dtos)
+    with pytest.raises(BadRequest, match=exception_message):
+        with patch.object(
+            worker_landscape_aggregator,
+            "get_global_worker",
+            return_value=mocked_worker_info,
+        ):
+            validate_algorithm_batch_request(
+                algorithm_batch_request_dto=batch_request_dto,
+                algorithms_specs=algorithms_specs,
+                transformers_specs=transformers_specs,
+                worker_landscape_aggregator=worker_landscape_aggregator,
+                smpc_enabled=False,
+                smpc_optional=False,
+            )
@@ -1,14 +1,23 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 
 from exareme2.controller import logger as ctrl_logger
+from exareme2.controller.services.exareme2.algorithm_flow_data_objects import (
+    LocalWorkersTable,
+)
 from exareme2.controller.services.exareme2.execution_engine import (
     AlgorithmExecutionEngine,
 )
 from exareme2.controller.services.exareme2.execution_engine import InitializationParams
 from exareme2.controller.services.exareme2.execution_engine import SMPCParams
+from exareme2.controller.services.warm_start_cache import WarmStartCache
 from exareme2.smpc_cluster_communication import DifferentialPrivacyParams
+from exareme2.worker_communication import DatasetStatistics
 
 
 class TestAlgorithmExecutionEngine:
@@ -59,6 +68,167 @@ class TestAlgorithmExecutionEngine:
         )
         assert algorithm_execution_engine._workers == dummy_workers
 
+    @staticmethod
+    def _local_workers_table(table_name):
+        table = Mock(spec=LocalWorkersTable)
+        table_info = Mock()
+        table_info.name = table_name
+        table.workers_tables_info = {"worker1": table_info}
+        return table
+
+    def test_memoized_local_udf_runs_once_per_arguments(
+        self, algorithm_execution_engine_init_params
+    ):
+        def func(x):
+            pass
+
+        algorithm_execution_engine = AlgorithmExecutionEngine(
+            initialization_params=algorithm_execution_engine_init_params,
+            command_id_generator=MagicMock(),
+            workers=MagicMock(),
+        )
+        algorithm_execution_engine._workers.global_worker.context_id = "ctx"
+        view1 = self._local_workers_table("normal_worker1_ctx_1_0")
+        view2 = self._local_workers_table("normal_worker1_ctx_2_0")
+
+        with patch.object(
+            algorithm_execution_engine,
+            "_run_udf_on_local_workers",
+            side_effect=lambda **kwargs: object(),
+        ) as mock_run_udf:
+            result = algorithm_execution_engine.run_udf_on_local_workers(
+                func, keyword_args={"x": view1}, memoize=True
+            )
+            memoized_result = algorithm_execution_engine.run_udf_on_local_workers(
+                func, keyword_args={"x": view1}, memoize=True
+            )
+            other_view_result = algorithm_execution_engine.run_udf_on_local_workers(
+                func, keyword_args={"x": view2}, memoize=True
+            )
+            not_memoized_result = algorithm_execution_engine.run_udf_on_local_workers(
+                func, keyword_args={"x": view1}
+            )
+
+        assert memoized_result is result
+        assert other_view_result is not result
+        assert not_memoized_result is not result
+        assert mock_run_udf.call_count == 3
+
+    def test_concurrent_memoized_local_udf_runs_once(
+        self, algorithm_execution_engine_init_params
+    ):
+        def func(x):
+            pass
+
+        def run_udf(**kwargs):
+            time.sleep(0.05)
+            return object()
+
+        algorithm_execution_engine = AlgorithmExecutionEngine(
+            initialization_params=algorithm_execution_engine_init_params,
+            command_id_generator=MagicMock(),
+            workers=MagicMock(),
+        )
+        algorithm_execution_engine._workers.global_worker.context_id = "ctx"
+        view = self._local_workers_table("normal_worker1_ctx_1_0")
+
+        with patch.object(
+            algorithm_execution_engine,
+            "_run_udf_on_local_workers",
+            side_effect=run_udf,
+        ) as mock_run_udf, ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(
+                    algorithm_execution_engine.run_udf_on_local_workers,
+                    func,
+                    keyword_args={"x": view},
+                    memoize=True,
+                )
+                for _ in range(4)
+            ]
+            results = [future.result() for future in futures]
+
+        assert all(result is results[0] for result in results)
+        assert mock_run_udf.call_count == 1
+
+    @pytest.mark.parametrize(
+        "algo_flags, expected_params",
+        [({"warm_start": True}, [1, 2]), ({"warm_start": False}, None), (None, None)],
+    )
+    def test_warm_start_params_need_the_warm_start_flag(
+        self, algo_flags, expected_params
+    ):
+        warm_start_cache = WarmStartCache()
+
+        def create_engine(data_model, algo_flags):
+            return AlgorithmExecutionEngine(
+                initialization_params=InitializationParams(
+                    smpc_params=SMPCParams(smpc_enabled=False, smpc_optional=False),
+                    request_id="dummyrequestid",
+                    algo_flags=algo_flags,
+                    data_model=data_model,
+                    warm_start_cache=warm_start_cache,
+                ),
+                command_id_generator=MagicMock(),
+                workers=MagicMock(),
+            )
+
+        create_engine("dementia:0.1", None).set_warm_start_params("key", [1, 2])
+
+        engine = create_engine("dementia:0.1", algo_flags)
+        assert engine.get_warm_start_params("key") == expected_params
+        other_data_model_engine = create_engine("tbi:0.1", algo_flags)
+        assert other_data_model_engine.get_warm_start_params("key") is None
+
+    @staticmethod
+    def create_engine_with_dataset_statistics(available, worker_statistics):
+        local_workers = []
+        for datasets, statistics in worker_statistics:
+            worker = MagicMock(datasets=datasets, context_id="context")
+            worker.get_dataset_statistics.return_value = statistics
+            local_workers.append(worker)
+        return AlgorithmExecutionEngine(
+            initialization_params=InitializationParams(
+                smpc_params=SMPCParams(smpc_enabled=False, smpc_optional=False),
+                request_id="dummyrequestid",
+                dataset_statistics_available=available,
+            ),
+            command_id_generator=MagicMock(),
+            workers=MagicMock(local_workers=local_workers, global_worker=None),
+        )
+
+    @staticmethod
+    def dataset_statistics(dataset):
+        return DatasetStatistics(dataset=dataset, row_count=10, columns={})
+
+    def test_dataset_statistics_are_merged_per_dataset(self):
+        statistics1 = self.dataset_statistics("dataset1")
+        statistics2 = self.dataset_statistics("dataset2")
+        engine = self.create_engine_with_dataset_statistics(
+            True, [(["dataset1"], [statistics1]), (["dataset2"], [statistics2])]
+        )
+
+        assert engine.get_dataset_statistics() == {
+            "dataset1": statistics1,
+            "dataset2": statistics2,
+        }
+
+    def test_dataset_statistics_need_all_the_datasets(self):
+        engine = self.create_engine_with_dataset_statistics(
+            True,
+            [(["dataset1", "dataset2"], [self.dataset_statistics("dataset1")])],
+        )
+
+        assert engine.get_dataset_statistics() is None
+
+    def test_dataset_statistics_unavailable(self):
+        engine = self.create_engine_with_dataset_statistics(
+            False, [(["dataset1"], [self.dataset_statistics("dataset1")])]
+        )
+
+        assert engine.get_dataset_statistics() is None
+        engine._workers.local_workers[0].get_dataset_statistics.assert_not_called()
+
     # NOTE: This unittest was written during the 'differential privacy' feature implementation. The
     # only thing it actually tests is that the _share_local_smpc_tables_to_global method passes the
     # correct/expected arguments to the function related to the 'differential privacy' mechanism it
@@ -12,7 +12,12 @@ from exareme2.controller.services.exareme2.algorithm_flow_data_objects import (
 from exareme2.controller.services.exareme2.controller import DataModelViews
 from exareme2.controller.services.exareme2.controller import DataModelViewsCreator
 from exareme2.controller.services.exareme2.controller import WorkersFederation
+from exareme2.controller.services.exareme2.controller import _get_priority
+from exareme2.controller.services.exareme2.controller import _select_data_model_views
+from exareme2.controller.services.exareme2.controller import get_shared_views_id
 from exareme2.controller.services.exareme2.execution_engine import Workers
+from exareme2.controller.services.exareme2.request_scheduler import DEFAULT_PRIORITY
+from exareme2.controller.services.exareme2.request_scheduler import HIGH_PRIORITY
 from exareme2.controller.services.exareme2.tasks_handler import Exareme2TasksHandler
 from exareme2.controller.services.exareme2.workers import LocalWorker
 from exareme2.worker_communication import InsufficientDataError
@@ -339,6 +344,7 @@ class TestDataModelViewsCreator:
                 dropna=data_model_views_creator_init_params.dropna,
                 check_min_rows=data_model_views_creator_init_params.check_min_rows,
                 command_id=data_model_views_creator_init_params.command_id,
+                shared_views_id=None,
             )
 
         assert isinstance(data_model_views_creator.data_model_views, DataModelViews)
@@ -407,3 +413,66 @@ class TestDataModelViewsCreator:
 
 class AsyncResult:
     pass
+
+
+def test_select_data_model_views():
+    data_model_views = DataModelViews(["view_x", "view_y", "view_xy"])
+
+    selected_views = _select_data_model_views(
+        data_model_views=data_model_views,
+        variable_groups=[["x"], ["y"], ["x", "y"]],
+        selected_variable_groups=[["y"], ["x"], ["y"]],
+    )
+
+    assert selected_views.to_list() == ["view_y", "view_x", "view_y"]
+
+
+def test_shared_views_id_does_not_depend_on_worker_order():
+    worker1 = MagicMock(worker_id="worker1", data_model="dm:0.1", datasets=["d1"])
+    worker2 = MagicMock(worker_id="worker2", data_model="dm:0.1", datasets=["d2"])
+    view_args = dict(
+        variable_groups=[["x"], ["y"]],
+        var_filters=None,
+        dropna=True,
+        check_min_rows=True,
+    )
+
+    views_id = get_shared_views_id(local_workers=[worker1, worker2], **view_args)
+
+    assert views_id.isalnum()
+    assert views_id == get_shared_views_id(
+        local_workers=[worker2, worker1], **view_args
+    )
+
+
+def test_shared_views_id_depends_on_the_data_selection():
+    worker1 = MagicMock(worker_id="worker1", data_model="dm:0.1", datasets=["d1"])
+    worker1_more_datasets = MagicMock(
+        worker_id="worker1", data_model="dm:0.1", datasets=["d1", "d2"]
+    )
+    view_args = dict(
+        variable_groups=[["x"], ["y"]], var_filters=None, check_min_rows=True
+    )
+
+    views_id = get_shared_views_id(local_workers=[worker1], dropna=True, **view_args)
+
+    assert views_id != get_shared_views_id(
+        local_workers=[worker1_more_datasets], dropna=True, **view_args
+    )
+    assert views_id != get_shared_views_id(
+        local_workers=[worker1], dropna=False, **view_args
+    )
+
+
+@pytest.mark.parametrize(
+    "flags_per_algorithm, expected_priority",
+    [
+        ([None], DEFAULT_PRIORITY),
+        ([{"smpc": True}], DEFAULT_PRIORITY),
+        ([{"priority": False}], DEFAULT_PRIORITY),
+        ([{"priority": True}], HIGH_PRIORITY),
+        ([None, {"priority": True}], HIGH_PRIORITY),
+    ],
+)
+def test_get_priority(flags_per_algorithm, expected_priority):
+    assert _get_priority(flags_per_algorithm) == expected_priority
@@ -0,0 +1,159 @@
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from exareme2.controller.services.exareme2.request_scheduler import HIGH_PRIORITY
+from exareme2.controller.services.exareme2.request_scheduler import (
+    AlgorithmCostEstimator,
+)
+from exareme2.controller.services.exareme2.request_scheduler import (
+    ControllerOverloadedException,
+)
+from exareme2.controller.services.exareme2.request_scheduler import RequestScheduler
+
+
+class TestAlgorithmCostEstimator(unittest.TestCase):
+    def test_estimate_of_unknown_algorithm_is_the_default_cost(self):
+        estimator = AlgorithmCostEstimator(default_cost=2.0)
+        self.assertEqual(estimator.estimate("pca"), 2.0)
+
+    def test_first_observation_replaces_the_default_cost(self):
+        estimator = AlgorithmCostEstimator(default_cost=2.0)
+        estimator.update("pca", 10.0)
+        self.assertEqual(estimator.estimate("pca"), 10.0)
+
+    def test_observations_are_smoothed(self):
+        estimator = AlgorithmCostEstimator(smoothing_factor=0.5)
+        estimator.update("pca", 10.0)
+        estimator.update("pca", 20.0)
+        self.assertEqual(estimator.estimate("pca"), 15.0)
+
+
+class TestRequestScheduler(unittest.IsolatedAsyncioTestCase):
+    def _create_scheduler(self, max_concurrent_executions_per_worker=1, costs=None):
+        cost_estimator = AlgorithmCostEstimator()
+        for algorithm_name, cost in (costs or {}).items():
+            cost_estimator.update(algorithm_name, cost)
+        return RequestScheduler(
+            max_concurrent_executions_per_worker=max_concurrent_executions_per_worker,
+            max_queued_requests=2,
+            logger=Mock(),
+            cost_estimator=cost_estimator,
+        )
+
+    async def _execute(
+        self, scheduler, request_id, algorithm_name, worker_ids, log, **kwargs
+    ):
+        async with scheduler.schedule(request_id, algorithm_name, worker_ids, **kwargs):
+            log.append(request_id)
+            await asyncio.sleep(0.01)
+
+    async def test_requests_on_same_worker_are_limited(self):
+        scheduler = self._create_scheduler()
+        async with scheduler.schedule("req1", "pca", ["worker1"]):
+            task = asyncio.create_task(
+                self._execute(scheduler, "req2", "pca", ["worker1"], [])
+            )
+            await asyncio.sleep(0)
+            self.assertEqual(scheduler.running_requests, 1)
+            self.assertEqual(scheduler.queued_requests, 1)
+        await task
+        self.assertEqual(scheduler.running_requests, 0)
+        self.assertEqual(scheduler.queued_requests, 0)
+
+    async def test_requests_on_different_workers_run_concurrently(self):
+        scheduler = self._create_scheduler()
+        async with scheduler.schedule("req1", "pca", ["worker1"]):
+            async with scheduler.schedule("req2", "pca", ["worker2"]):
+                self.assertEqual(scheduler.running_requests, 2)
+
+    async def test_cheap_requests_are_admitted_first(self):
+        scheduler = self._create_scheduler(
+            costs={"heavy_algorithm": 100.0, "cheap_algorithm": 0.1}
+        )
+        log = []
+        async with scheduler.schedule("req0", "cheap_algorithm", ["worker1"]):
+            heavy = asyncio.create_task(
+                self._execute(scheduler, "heavy", "heavy_algorithm", ["worker1"], log)
+            )
+            await asyncio.sleep(0)
+            cheap = asyncio.create_task(
+                self._execute(scheduler, "cheap", "cheap_algorithm", ["worker1"], log)
+            )
+            await asyncio.sleep(0)
+        await asyncio.gather(heavy, cheap)
+        self.assertEqual(log, ["cheap", "heavy"])
+
+    async def test_high_priority_requests_are_admitted_first(self):
+        scheduler = self._create_scheduler(costs={"pca": 10.0})
+        log = []
+        async with scheduler.schedule("req0", "pca", ["worker1"]):
+            normal = asyncio.create_task(
+                self._execute(scheduler, "normal", "pca", ["worker1"], log)
+            )
+            await asyncio.sleep(0)
+            high = asyncio.create_task(
+                self._execute(
+                    scheduler,
+                    "high",
+                    "pca",
+                    ["worker1"],
+                    log,
+                    priority=HIGH_PRIORITY,
+                )
+            )
+            await asyncio.sleep(0)
+        await asyncio.gather(normal, high)
+        self.assertEqual(log, ["high", "normal"])
+
+    async def test_priority_should_be_positive(self):
+        scheduler = self._create_scheduler()
+        with self.assertRaises(ValueError):
+            async with scheduler.schedule("req1", "pca", ["worker1"], priority=0):
+                pass
+        self.assertEqual(scheduler.queued_requests, 0)
+
+    async def test_request_cannot_overtake_on_reserved_workers(self):
+        scheduler = self._create_scheduler()
+        log = []
+        async with scheduler.schedule("req0", "pca", ["worker1"]):
+            first = asyncio.create_task(
+                self._execute(scheduler, "first", "pca", ["worker1", "worker2"], log)
+            )
+            await asyncio.sleep(0)
+            second = asyncio.create_task(
+                self._execute(scheduler, "second", "pca", ["worker2"], log)
+            )
+            await asyncio.sleep(0)
+            self.assertEqual(scheduler.queued_requests, 2)
+        await asyncio.gather(first, second)
+        self.assertEqual(log, ["first", "second"])
+
+    async def test_request_is_rejected_when_queue_is_full(self):
+        scheduler = self._create_scheduler(costs={"pca": 10.0})
+        async with scheduler.schedule("req0", "pca", ["worker1"]):
+            tasks = [
+                asyncio.create_task(
+                    self._execute(scheduler, f"req{i}", "pca", ["worker1"], [])
+                )
+                for i in range(1, 3)
+            ]
+            await asyncio.sleep(0)
+            with self.assertRaises(ControllerOverloadedException) as exc:
+                async with scheduler.schedule("req3", "pca", ["worker1"]):
+                    pass
+            self.assertGreaterEqual(exc.exception.retry_after, 20)
+        await asyncio.gather(*tasks)
+
+    async def test_cancelled_request_is_removed_from_queue(self):
+        scheduler = self._create_scheduler()
+        async with scheduler.schedule("req0", "pca", ["worker1"]):
+            task = asyncio.create_task(
+                self._execute(scheduler, "req1", "pca", ["worker1"], [])
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(scheduler.queued_requests, 0)
+        self.assertEqual(scheduler.running_requests, 0)
@@ -7,6 +7,10 @@ from exareme2.controller.services.api.algorithm_request_dtos import (
 )
 from exareme2.controller.services.flower import FlowerIORegistry
 from exareme2.controller.services.flower.flower_io_registry import Status
+from exareme2.controller.services.flower.flower_io_registry import UnknownFlowerJobError
+
+REQUEST_ID = "request1"
+INPUTDATA = AlgorithmInputDataDTO(data_model="model", datasets=["dataset"])
 
 
 class TestFlowerExecutionInfo(unittest.TestCase):
@@ -18,67 +22,93 @@ class TestFlowerExecutionInfo(unittest.TestCase):
 
         self.logger = Mock()
         self.info = FlowerIORegistry(20, self.logger)
+        self.info.register(REQUEST_ID, INPUTDATA)
 
     def tearDown(self):
         self.loop.close()  # Close the loop at the end of the test
 
-    def test_reset_sync_initial_state(self):
-        self.info._reset_sync()
-        self.assertEqual(self.info.get_status(), Status.RUNNING)
-        self.assertFalse(self.info.result_ready.is_set())
+    def test_register_initial_state(self):
+        self.assertEqual(self.info.get_status(REQUEST_ID), Status.RUNNING)
+        self.assertEqual(self.info.get_inputdata(REQUEST_ID), INPUTDATA)
+
+    def test_register_parameters(self):
+        self.assertEqual(self.info.get_parameters(REQUEST_ID), {})
+        self.info.register("request2", INPUTDATA, parameters={"num_of_rounds": 3})
+        self.assertEqual(self.info.get_parameters("request2"), {"num_of_rounds": 3})
+
+    def test_model_parameters(self):
+        self.assertIsNone(self.info.get_model_parameters(REQUEST_ID))
+        self.info.register("request2", INPUTDATA, model_parameters=[[0.5]])
+        self.assertEqual(self.info.get_model_parameters("request2"), [[0.5]])
+        self.info.set_model_parameters("request2", [[1.5]])
+        self.assertEqual(self.info.get_model_parameters("request2"), [[1.5]])
 
     def test_set_result_success(self):
         result = {"data": "some value"}
-        asyncio.run(self.info.set_result(result))
-        self.assertEqual(self.info.get_status(), Status.SUCCESS)
-        self.assertTrue(self.info.result_ready.is_set())
+        asyncio.run(self.info.set_result(REQUEST_ID, result))
+        self.assertEqual(self.info.get_status(REQUEST_ID), Status.SUCCESS)
 
     def test_set_result_failure(self):
         result = {"error": "some error"}
-        asyncio.run(self.info.set_result(result))
-        self.assertEqual(self.info.get_status(), Status.FAILURE)
+        asyncio.run(self.info.set_result(REQUEST_ID, result))
+        self.assertEqual(self.info.get_status(REQUEST_ID), Status.FAILURE)
 
     def test_get_result(self):
         result = {"data": "expected result"}
-        asyncio.run(self.info.set_result(result))
-        retrieved_result = asyncio.run(self.info.get_result())
+        asyncio.run(self.info.set_result(REQUEST_ID, result))
+        retrieved_result = asyncio.run(self.info.get_result(REQUEST_ID))
         self.assertEqual(retrieved_result, result)
 
-    def test_set_inputdata(self):
-        new_data = AlgorithmInputDataDTO(
-            data_model="new model", datasets=["new dataset"]
+    def test_jobs_are_independent(self):
+        other_inputdata = AlgorithmInputDataDTO(
+            data_model="other model", datasets=["other dataset"]
         )
-        self.info.set_inputdata(new_data)
-        self.assertEqual(self.info.get_status(), Status.RUNNING)
-        self.assertEqual(self.info.get_inputdata(), new_data)
+        self.info.register("request2", other_inputdata)
+        asyncio.run(self.info.set_result("request2", {"data": "value"}))
+
+        self.assertEqual(self.info.get_status(REQUEST_ID), Status.RUNNING)
+        self.assertEqual(self.info.get_status("request2"), Status.SUCCESS)
+        self.assertEqual(self.info.get_inputdata("request2"), other_inputdata)
+
+    def test_unknown_job(self):
+        with self.assertRaises(UnknownFlowerJobError):
+            self.info.get_inputdata("unknown")
+
+    def test_released_job_result_is_retained(self):
+        asyncio.run(self.info.set_result(REQUEST_ID, {"data": "value"}))
+        self.info.release(REQUEST_ID)
+        self.assertEqual(self.info.get_status(REQUEST_ID), Status.SUCCESS)
+
+    def test_oldest_released_jobs_are_dropped(self):
+        info = FlowerIORegistry(20, self.logger, max_finished_jobs=1)
+        info.register("request1", INPUTDATA)
+        info.register("request2", INPUTDATA)
+        info.release("request1")
+        info.release("request2")
+
+        with self.assertRaises(UnknownFlowerJobError):
+            info.get_status("request1")
+        self.assertEqual(info.get_status("request2"), Status.RUNNING)
 
 
 class TestFlowerExecutionInfoAsync(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.logger = Mock()
         self.info = FlowerIORegistry(20, self.logger)
+        self.info.register(REQUEST_ID, INPUTDATA)
 
-    async def test_event_set_on_result(self):
-        """Test that the event is set when the result is set."""
-        result = {"data": "some value"}
-        await self.info.set_result(result)
-        self.assertTrue(
-            self.info.result_ready.is_set(), "Event should be set after result is set"
-        )
-
-    async def test_get_result_waits_for_event(self):
-        """Test that get_result waits for the event to be set."""
+    async def test_get_result_waits_for_result(self):
+        """Test that get_result waits for the result to be set."""
         result = {"data": "expected result"}
-        # Start setting the result in the background
-        await self.info.set_result(result)
-
-        # Now retrieve the result, should wait for the set_result to complete
-        retrieved_result = await self.info.get_result()
-        self.assertEqual(retrieved_result, result)
-
-    async def test_event_reset_on_reset(self):
-        """Test that the event is reset when the info is reset."""
-        await self.info.reset()
-        self.assertFalse(
-            self.info.result_ready.is_set(), "Event should be reset after calling reset"
-        )
+        get_result_task = asyncio.create_task(self.info.get_result(REQUEST_ID))
+        await asyncio.sleep(0)
+        self.assertFalse(get_result_task.done())
+
+        await self.info.set_result(REQUEST_ID, result)
+        self.assertEqual(await get_result_task, result)
+
+    async def test_get_result_with_job_timeout(self):
+        self.info.register("request2", INPUTDATA, timeout=0.01)
+        with self.assertRaises(TimeoutError):
+            await self.info.get_result_with_timeout("request2")
+        self.assertEqual(self.info.get_status("request2"), Status.FAILURE)
@@ -4,8 +4,14 @@ from unittest.mock import patch
 
 from exareme2.controller import logger as ctrl_logger
 from exareme2.controller.celery.app import CeleryAppFactory
+from exareme2.controller.celery.app import CeleryTaskTimeoutException
 from exareme2.controller.celery.tasks_handler import WorkerTaskResult
 from exareme2.controller.celery.tasks_handler import WorkerTasksHandler
+from exareme2.controller.metrics import celery_task_duration
+from exareme2.controller.services.exareme2.tasks_handler import Exareme2TasksHandler
+from exareme2.worker_communication import ColumnDataInt
+from exareme2.worker_communication import ColumnDataStr
+from exareme2.worker_communication import TableData
 
 
 class TestWorkerTasksHandlerRefactored(unittest.TestCase):
@@ -40,6 +46,24 @@ class TestWorkerTasksHandlerRefactored(unittest.TestCase):
             logger=self.mock_logger,
             request_id=self.request_id,
             table_name=table_name,
+            offset=None,
+            limit=None,
+        )
+
+    def test_get_table_data_page(self):
+        table_name = "test_table"
+        self.mock_celery_app.queue_task.return_value = self.mock_async_result
+        self.worker_tasks_handler.get_table_data(
+            self.request_id, table_name, offset=10, limit=5
+        )
+
+        self.mock_celery_app.queue_task.assert_called_with(
+            task_signature="exareme2.worker.exareme2.tables.tables_api.get_table_data",
+            logger=self.mock_logger,
+            request_id=self.request_id,
+            table_name=table_name,
+            offset=10,
+            limit=5,
         )
 
     def test_create_table(self):
@@ -105,6 +129,7 @@ class TestWorkerTasksHandlerRefactored(unittest.TestCase):
             filters=filters,
             dropna=dropna,
             check_min_rows=check_min_rows,
+            shared_views_id=None,
         )
 
     def test_get_merge_tables(self):
@@ -175,3 +200,99 @@ class TestWorkerTasksHandlerRefactored(unittest.TestCase):
             monetdb_socket_address=monetdb_socket_address,
             request_id=self.request_id,
         )
+
+
+class TestWorkerTaskResult(unittest.TestCase):
+    def setUp(self):
+        self.celery_app = MagicMock()
+        self.task_result = WorkerTaskResult(
+            self.celery_app, MagicMock(), MagicMock(), task_name="get_tables"
+        )
+
+    def _get_count(self, outcome):
+        return celery_task_duration.get_count(task="get_tables", outcome=outcome)
+
+    def test_get_observes_the_duration_of_a_successful_task(self):
+        count = self._get_count("success")
+        self.celery_app.get_result.return_value = ["table1"]
+
+        self.assertEqual(self.task_result.get(timeout=10), ["table1"])
+        self.assertEqual(self._get_count("success"), count + 1)
+
+    def test_get_observes_the_duration_of_a_timed_out_task(self):
+        count = self._get_count("timeout")
+        self.celery_app.get_result.side_effect = CeleryTaskTimeoutException(
+            timeout_type="TimeoutError",
+            connection_address="fake_addr",
+            async_result=MagicMock(),
+        )
+
+        with self.assertRaises(CeleryTaskTimeoutException):
+            self.task_result.get(timeout=10)
+        self.assertEqual(self._get_count("timeout"), count + 1)
+
+    def test_get_observes_the_duration_of_a_failed_task(self):
+        count = self._get_count("error")
+        self.celery_app.get_result.side_effect = ValueError()
+
+        with self.assertRaises(ValueError):
+            self.task_result.get(timeout=10)
+        self.assertEqual(self._get_count("error"), count + 1)
+
+
+class TestExareme2TasksHandlerTableData(unittest.TestCase):
+    def setUp(self):
+        self.tasks_handler = Exareme2TasksHandler(
+            request_id="test_request_id",
+            worker_id="test_worker_id",
+            worker_queue_addr="fake_addr",
+            worker_db_addr="fake_db_addr",
+            tasks_timeout=10,
+            run_udf_task_timeout=10,
+            table_data_page_size=2,
+        )
+        self.worker_tasks_handler = MagicMock()
+        self.tasks_handler._worker_tasks_handler = self.worker_tasks_handler
+
+    def set_table_rows(self, rows):
+        def get_table_data(request_id, table_name, offset, limit):
+            page = rows[offset : offset + limit]
+            result = MagicMock()
+            result.get.return_value = TableData(
+                name=table_name,
+                columns=[
+                    ColumnDataInt(name="a", data=[a for a, _ in page]),
+                    ColumnDataStr(name="b", data=[b for _, b in page]),
+                ],
+            ).json()
+            return result
+
+        self.worker_tasks_handler.get_table_data.side_effect = get_table_data
+
+    def test_iter_table_data_in_pages(self):
+        self.set_table_rows([(1, "x"), (2, "y"), (3, "z")])
+
+        pages = list(self.tasks_handler.iter_table_data("test_table"))
+
+        assert [page.columns[0].data for page in pages] == [[1, 2], [3]]
+        offsets = [
+            call.kwargs["offset"]
+            for call in self.worker_tasks_handler.get_table_data.call_args_list
+        ]
+        assert offsets == [0, 2]
+
+    def test_iter_table_data_ends_with_an_empty_page_after_a_full_one(self):
+        self.set_table_rows([(1, "x"), (2, "y")])
+
+        pages = list(self.tasks_handler.iter_table_data("test_table"))
+
+        assert [page.columns[0].data for page in pages] == [[1, 2], []]
+
+    def test_get_table_data_merges_the_pages(self):
+        self.set_table_rows([(1, "x"), (2, "y"), (3, "z"), (4, None), (5, "w")])
+
+        table_data = self.tasks_handler.get_table_data("test_table")
+
+        assert table_data.name == "test_table"
+        assert table_data.columns[0].data == [1, 2, 3, 4, 5]
+        assert table_data.columns[1].data == ["x", "y", "z", None, "w"]
@@ -0,0 +1,23 @@
+from exareme2.controller.services.warm_start_cache import WarmStartCache
+
+
+def test_get_missing_key():
+    assert WarmStartCache().get("key") is None
+
+
+def test_set_and_get():
+    cache = WarmStartCache()
+    cache.set("key", [1, 2])
+    assert cache.get("key") == [1, 2]
+
+
+def test_least_recently_used_entries_are_dropped():
+    cache = WarmStartCache(max_entries=2)
+    cache.set("key1", [1])
+    cache.set("key2", [2])
+    cache.get("key1")
+    cache.set("key3", [3])
+
+    assert cache.get("key1") == [1]
+    assert cache.get("key2") is None
+    assert cache.get("key3") == [3]
@@ -1,5 +1,7 @@
 import pytest
 
+import exareme2.data_filters
+from exareme2.data_filters import FilterCache
 from exareme2.data_filters import FilterError
 from exareme2.data_filters import build_filter_clause
 from exareme2.data_filters import validate_filter
@@ -476,3 +478,64 @@ all_validate_filter_fail_cases = [
 def test_validate_filter_fail_cases_bad_filter(test_input, data_models):
     with pytest.raises(FilterError):
         validate_filter(DATA_MODEL, test_input, data_models)
+
+
+@pytest.mark.parametrize("test_input", all_validate_filter_fail_cases)
+def test_filter_cache_validate_filter_fail_cases(test_input, data_models):
+    cache = FilterCache()
+    for _ in range(2):
+        with pytest.raises(FilterError):
+            cache.validate_filter(DATA_MODEL, test_input, data_models)
+
+
+def test_filter_cache_does_not_revalidate_cached_filter(data_models, mocker):
+    cache = FilterCache()
+    rules = all_success_cases[0][0]
+    validate_filter_spy = mocker.spy(exareme2.data_filters, "validate_filter")
+
+    cache.validate_filter(DATA_MODEL, rules, data_models[DATA_MODEL])
+    validation_calls = validate_filter_spy.call_count
+    cache.validate_filter(DATA_MODEL, rules, data_models[DATA_MODEL])
+
+    assert validation_calls > 0
+    assert validate_filter_spy.call_count == validation_calls
+
+
+def test_filter_cache_revalidates_filter_when_cdes_change(data_models):
+    cache = FilterCache()
+    rules = {
+        "condition": "AND",
+        "rules": [
+            {
+                "id": "test_age_value",
+                "field": "test_age_value",
+                "type": "int",
+                "input": "number",
+                "operator": "equal",
+                "value": 17,
+            }
+        ],
+    }
+    cdes = data_models[DATA_MODEL]
+    cache.validate_filter(DATA_MODEL, rules, cdes)
+
+    cdes_without_column = {
+        code: cde for code, cde in cdes.items() if code != "test_age_value"
+    }
+    with pytest.raises(FilterError):
+        cache.validate_filter(DATA_MODEL, rules, cdes_without_column)
+
+
+def test_filter_cache_drops_least_recently_used_filters(data_models, mocker):
+    cache = FilterCache(max_size=1)
+    cdes = data_models[DATA_MODEL]
+    first_rules = all_success_cases[0][0]
+    second_rules = all_success_cases[1][0]
+    cache.validate_filter(DATA_MODEL, first_rules, cdes)
+    cache.validate_filter(DATA_MODEL, second_rules, cdes)
+
+    validate_filter_spy = mocker.spy(exareme2.data_filters, "validate_filter")
+    cache.validate_filter(DATA_MODEL, second_rules, cdes)
+    assert validate_filter_spy.call_count == 0
+    cache.validate_filter(DATA_MODEL, first_rules, cdes)
+    assert validate_filter_spy.call_count > 0
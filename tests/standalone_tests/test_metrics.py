@@ -0,0 +1,82 @@
+import pytest
+
+from exareme2.metrics import MetricsRegistry
+
+
+def test_counter_is_incremented_per_label_values():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ["algorithm"])
+    counter.inc(algorithm="pca")
+    counter.inc(2, algorithm="pca")
+    counter.inc(algorithm="anova")
+
+    assert counter.get(algorithm="pca") == 3
+    assert counter.get(algorithm="anova") == 1
+    assert counter.get(algorithm="ttest") == 0
+
+
+def test_metric_labels_must_match_label_names():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ["algorithm"])
+    with pytest.raises(ValueError):
+        counter.inc(task="run_udf")
+
+
+def test_metric_cannot_be_registered_twice():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.")
+    with pytest.raises(ValueError):
+        registry.histogram("requests_total", "Requests.")
+
+
+def test_histogram_time_observes_duration():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("duration_seconds", "Duration.", ["task"])
+    with histogram.time(task="run_udf"):
+        pass
+
+    assert histogram.get_count(task="run_udf") == 1
+    assert histogram.get_sum(task="run_udf") >= 0
+
+
+def test_histogram_time_observes_duration_on_error():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("duration_seconds", "Duration.")
+    with pytest.raises(ValueError):
+        with histogram.time():
+            raise ValueError
+
+    assert histogram.get_count() == 1
+
+
+def test_render_in_prometheus_text_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ["algorithm"])
+    histogram = registry.histogram(
+        "duration_seconds", "Duration.", ["task"], buckets=[0.1, 1.0]
+    )
+    counter.inc(algorithm="pca")
+    histogram.observe(0.1, task="run_udf")
+    histogram.observe(0.5, task="run_udf")
+    histogram.observe(5, task="run_udf")
+
+    assert registry.render() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{algorithm="pca"} 1.0\n'
+        "# HELP duration_seconds Duration.\n"
+        "# TYPE duration_seconds histogram\n"
+        'duration_seconds_bucket{task="run_udf",le="0.1"} 1\n'
+        'duration_seconds_bucket{task="run_udf",le="1.0"} 2\n'
+        'duration_seconds_bucket{task="run_udf",le="+Inf"} 3\n'
+        'duration_seconds_sum{task="run_udf"} 5.6\n'
+        'duration_seconds_count{task="run_udf"} 3\n'
+    )
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ["algorithm"])
+    counter.inc(algorithm='a"b')
+
+    assert 'requests_total{algorithm="a\\"b"} 1.0' in registry.render()
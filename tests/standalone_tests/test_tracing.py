@@ -0,0 +1,68 @@
+from unittest.mock import Mock
+
+import pytest
+
+from exareme2.tracing import Tracer
+
+
+def test_span_is_recorded_per_request():
+    tracer = Tracer(service="test")
+    with tracer.span("step1", request_id="req1", context_id="ctx1", worker_id="w1"):
+        pass
+    with tracer.span("step2", request_id="req2"):
+        pass
+
+    spans = tracer.get_spans("req1")
+    assert len(spans) == 1
+    assert spans[0].name == "step1"
+    assert spans[0].context_id == "ctx1"
+    assert spans[0].attributes == {"worker_id": "w1"}
+    assert spans[0].duration >= 0
+
+
+def test_span_attributes_can_be_added_inside_the_span():
+    tracer = Tracer(service="test")
+    with tracer.span("step", request_id="req") as attributes:
+        attributes["rows"] = 10
+
+    assert tracer.get_spans("req")[0].attributes == {"rows": 10}
+
+
+def test_span_records_error():
+    tracer = Tracer(service="test")
+    with pytest.raises(ValueError):
+        with tracer.span("step", request_id="req"):
+            raise ValueError
+
+    assert tracer.get_spans("req")[0].attributes == {"error": "ValueError"}
+
+
+def test_oldest_requests_are_dropped():
+    tracer = Tracer(service="test", max_traced_requests=2)
+    for request_id in ["req1", "req2", "req3"]:
+        with tracer.span("step", request_id=request_id):
+            pass
+
+    assert tracer.get_spans("req1") == []
+    assert len(tracer.get_spans("req3")) == 1
+
+
+def test_exporter_is_called_for_each_span():
+    exporter = Mock()
+    tracer = Tracer(service="test", exporter=exporter)
+    with tracer.span("step", request_id="req"):
+        pass
+
+    exporter.assert_called_once_with(tracer.get_spans("req")[0])
+
+
+def test_get_trace_returns_trace_events_in_start_order():
+    tracer = Tracer(service="test")
+    with tracer.span("outer", request_id="req"):
+        with tracer.span("inner", request_id="req"):
+            pass
+
+    trace_events = tracer.get_trace("req")["traceEvents"]
+    assert [event["name"] for event in trace_events] == ["outer", "inner"]
+    assert trace_events[0]["ph"] == "X"
+    assert trace_events[0]["args"]["request_id"] == "req"
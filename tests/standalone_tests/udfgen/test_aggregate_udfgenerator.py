@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from exareme2 import DType
+from exareme2.algorithms.exareme2.udfgen import Aggregate
+from exareme2.algorithms.exareme2.udfgen import AggregateUdfGenerator
+from exareme2.algorithms.exareme2.udfgen import udfio
+from exareme2.algorithms.exareme2.udfgen.udfgen_DTOs import UDFGenSMPCResult
+from exareme2.algorithms.exareme2.udfgen.udfgen_DTOs import UDFGenTableResult
+from exareme2.worker_communication import TableInfo
+from exareme2.worker_communication import TableSchema
+from exareme2.worker_communication import TableType
+
+
+class MomentsUdf(AggregateUdfGenerator):
+    def get_aggregates(self):
+        columns = [self.column("x", c) for c in self.value_columns("x")]
+        return {
+            "n_obs": Aggregate(self.sql.count(), type="int"),
+            "sums": Aggregate([self.sql.sum(c) for c in columns]),
+            "mins": Aggregate([self.sql.min(c) for c in columns], operation="min"),
+        }
+
+
+def make_table_info(name, schema):
+    return TableInfo(
+        name=name,
+        schema_=TableSchema.from_list([("row_id", DType.INT)] + schema),
+        type_=TableType.NORMAL,
+    )
+
+
+@pytest.fixture
+def flowkwargs():
+    return {
+        "x": make_table_info("x_table", [("a", DType.FLOAT), ("b", DType.INT)]),
+        "y": make_table_info("y_table", [("c", DType.FLOAT)]),
+    }
+
+
+def test_sql_helpers():
+    sql = AggregateUdfGenerator.sql
+    assert sql.count() == "COUNT(*)"
+    assert sql.count("a = 1") == "COALESCE(SUM(CASE WHEN a = 1 THEN 1 ELSE 0 END), 0)"
+    assert sql.sum("a") == "COALESCE(SUM(CAST(a AS DOUBLE)), 0)"
+    assert (
+        sql.sum("a", "b = 1")
+        == "COALESCE(SUM(CAST(CASE WHEN b = 1 THEN a END AS DOUBLE)), 0)"
+    )
+    assert sql.literal("it's") == "'it''s'"
+    assert sql.literal(3) == "3"
+
+
+def test_exec_stmt(flowkwargs):
+    expected = """\
+INSERT INTO __main
+SELECT
+    '{"n_obs": {"data": ' || COALESCE(CAST("v0" AS VARCHAR(64)), 'null') || ', "operation": "sum", "type": "int"}, "sums": {"data": [' || COALESCE(CAST("v1" AS VARCHAR(64)), 'null') || ', ' || COALESCE(CAST("v2" AS VARCHAR(64)), 'null') || '], "operation": "sum", "type": "float"}, "mins": {"data": [' || COALESCE(CAST("v3" AS VARCHAR(64)), 'null') || ', ' || COALESCE(CAST("v4" AS VARCHAR(64)), 'null') || '], "operation": "min", "type": "float"}}' AS "secure_transfer"
+FROM
+    (
+    SELECT
+        COUNT(*) AS "v0",
+        COALESCE(SUM(CAST(x_table."a" AS DOUBLE)), 0) AS "v1",
+        COALESCE(SUM(CAST(x_table."b" AS DOUBLE)), 0) AS "v2",
+        MIN(CAST(x_table."a" AS DOUBLE)) AS "v3",
+        MIN(CAST(x_table."b" AS DOUBLE)) AS "v4"
+    FROM
+        x_table,
+        y_table
+    WHERE
+        x_table."row_id"=y_table."row_id"
+    ) AS aggregates;"""
+
+    udf = MomentsUdf(flowkwargs=flowkwargs)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert result == expected
+
+
+def test_exec_stmt_always_produces_a_secure_transfer(flowkwargs):
+    # Without a HAVING clause, an aggregate query always returns a single row
+    udf = MomentsUdf(flowkwargs=flowkwargs, min_row_count=10)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert "HAVING" not in result
+
+
+def test_exec_stmt_ends_outside_the_aggregate_query(flowkwargs):
+    # The worker appends a WHERE clause to the statement to make it idempotent
+    udf = MomentsUdf(flowkwargs=flowkwargs, min_row_count=10)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert result.endswith(") AS aggregates;")
+
+
+def test_definition_without_smpc(flowkwargs):
+    udf = MomentsUdf(flowkwargs=flowkwargs)
+    assert udf.get_definition(udf_name=None, output_table_names=["__main"]) == ""
+
+
+def test_get_results_without_smpc(flowkwargs):
+    udf = MomentsUdf(flowkwargs=flowkwargs)
+    [result] = udf.get_results(output_table_names=["__main"])
+    assert isinstance(result, UDFGenTableResult)
+    assert result.table_name == "__main"
+    assert result.table_schema == [("secure_transfer", DType.JSON)]
+    assert result.share
+
+
+def test_smpc_template_matches_split_secure_transfer(flowkwargs):
+    udf = MomentsUdf(flowkwargs=flowkwargs, smpc_used=True)
+    secure_transfer = {
+        "n_obs": {"data": 3, "operation": "sum", "type": "int"},
+        "sums": {"data": [1.0, 2.0], "operation": "sum", "type": "float"},
+        "mins": {"data": [0.5, 0.1], "operation": "min", "type": "float"},
+    }
+    template, sum_op, min_op, max_op = udfio.split_secure_transfer_dict(secure_transfer)
+
+    assert udf._get_smpc_template() == template
+    assert udf._get_values_per_operation() == {
+        "sum": ["v0", "v1", "v2"],
+        "min": ["v3", "v4"],
+        "max": [],
+    }
+    assert (len(sum_op), len(min_op), len(max_op)) == (3, 2, 0)
+
+
+def test_exec_stmt_with_smpc_inserts_the_template(flowkwargs):
+    udf = MomentsUdf(flowkwargs=flowkwargs, smpc_used=True)
+    result = udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    template = json.dumps(udf._get_smpc_template())
+    assert result.startswith(f"INSERT INTO __main\nSELECT\n    '{template}' AS")
+
+
+def test_exec_stmts_with_smpc_insert_the_operation_values(flowkwargs):
+    udf = MomentsUdf(flowkwargs=flowkwargs, smpc_used=True)
+    result = udf.get_exec_stmts(udf_name=None, output_table_names=["__main"])
+    assert len(result) == 3
+    assert result[0] == udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])
+    assert result[1].startswith("INSERT INTO __mainsum\n")
+    assert result[2].startswith("INSERT INTO __mainmin\n")
+    assert "WHERE NOT EXISTS" not in result[1]
+    assert udf.get_definition(udf_name=None, output_table_names=["__main"]) == ""
+
+
+def test_exec_stmts_without_smpc(flowkwargs):
+    udf = MomentsUdf(flowkwargs=flowkwargs)
+    result = udf.get_exec_stmts(udf_name=None, output_table_names=["__main"])
+    assert result == [udf.get_exec_stmt(udf_name=None, output_table_names=["__main"])]
+
+
+def test_get_results_with_smpc(flowkwargs):
+    udf = MomentsUdf(flowkwargs=flowkwargs, smpc_used=True)
+    [result] = udf.get_results(output_table_names=["__main"])
+    assert isinstance(result, UDFGenSMPCResult)
+    assert result.template.table_name == "__main"
+    assert result.template.share
+    assert result.sum_op_values.table_name == "__mainsum"
+    assert result.min_op_values.table_name == "__mainmin"
+    assert result.max_op_values is None
@@ -1,12 +1,17 @@
 # type: ignore
+import ast
 from inspect import cleandoc
+from unittest.mock import patch
 
 from exareme2.algorithms.exareme2.udfgen.ast import Column
+from exareme2.algorithms.exareme2.udfgen.ast import Imports
 from exareme2.algorithms.exareme2.udfgen.ast import Join
 from exareme2.algorithms.exareme2.udfgen.ast import ScalarFunction
 from exareme2.algorithms.exareme2.udfgen.ast import Select
 from exareme2.algorithms.exareme2.udfgen.ast import Table
 from exareme2.algorithms.exareme2.udfgen.ast import TableFunction
+from exareme2.algorithms.exareme2.udfgen.ast import UDFBodyStatements
+from exareme2.algorithms.exareme2.udfgen.ast import get_referred_names
 
 
 def test_column_alias():
@@ -361,3 +366,42 @@ def test_join__outer():
     (right) AS Right
     ON Left.some_column=Right.some_column"""
     assert result == cleandoc(expected)
+
+
+def test_udf_body_statements_source_is_generated_once():
+    statements = ast.parse("x = 1\ny = x + 1\nreturn y").body
+
+    with patch(
+        "exareme2.algorithms.exareme2.udfgen.ast.astor.to_source",
+        side_effect=lambda stmt: ast.unparse(stmt) + "\n",
+    ) as to_source:
+        result1 = UDFBodyStatements(statements).compile()
+        result2 = UDFBodyStatements(statements).compile()
+
+    assert result1 == result2 == "x = 1\ny = x + 1"
+    assert to_source.call_count == 2
+
+
+def test_imports_only_referred_modules():
+    code = "x = udfio.from_tensor_table(_columns)\nreturn json.dumps(x)"
+    assert Imports(code).compile() == "import udfio\nimport json"
+
+
+def test_imports_nothing_when_no_module_is_referred():
+    assert Imports("result = {'a': 1}").compile() == ""
+
+
+def test_imports_of_code_parts():
+    parts = ["x = udfio.from_tensor_table(_columns)", "", "return json.dumps(x)"]
+    assert Imports(*parts).compile() == "import udfio\nimport json"
+
+
+def test_imports_find_the_referred_names_of_a_body_once():
+    body = "x = pd.DataFrame()\nresult = json.dumps(x)"
+    get_referred_names.cache_clear()
+
+    Imports("_columns = udfio.from_tensor_table(_table1)", body)
+    Imports("_columns = udfio.from_tensor_table(_table2)", body)
+
+    cache_info = get_referred_names.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 3)
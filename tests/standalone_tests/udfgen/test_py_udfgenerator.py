@@ -677,7 +677,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'dim1', 'val'], ['x_dim0', 'x_dim1', 'x_val'])})
     result = x
@@ -772,7 +771,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     X = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'dim1', 'val'], ['X_dim0', 'X_dim1', 'X_val'])})
     result = X
@@ -887,7 +885,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     r = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'col0', 'col1', 'col2'], ['r_row_id', 'r_col0', 'r_col1', 'r_col2'])}, 'row_id')
     result = r
@@ -1000,7 +997,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     r1 = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'col0', 'col1', 'col2'], ['r1_row_id', 'r1_col0', 'r1_col1', 'r1_col2'])}, 'row_id')
     r2 = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'col4', 'col5', 'col6'], ['r2_row_id', 'r2_col4', 'r2_col5', 'r2_col6'])}, 'row_id')
@@ -1134,7 +1130,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     r1 = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'col0', 'col1', 'col2'], ['r1_row_id', 'r1_col0', 'r1_col1', 'r1_col2'])}, 'row_id')
     r2 = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'col4', 'col5', 'col6'], ['r2_row_id', 'r2_col4', 'r2_col5', 'r2_col6'])}, 'row_id')
@@ -1262,7 +1257,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     r1 = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'col0', 'col1', 'col2'], ['r1_row_id', 'r1_col0', 'r1_col1', 'r1_col2'])}, 'row_id')
     r2 = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'col0', 'col1', 'col2'], ['r2_row_id', 'r2_col0', 'r2_col1', 'r2_col2'])}, 'row_id')
@@ -1367,7 +1361,6 @@ RETURNS
 TABLE("ci" INT,"cf" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['x_dim0', 'x_val'])})
     return udfio.as_relational_table(x, 'row_id')
@@ -1461,7 +1454,6 @@ RETURNS
 TABLE("result" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['x_dim0', 'x_val'])})
     v = 42
@@ -1558,7 +1550,6 @@ RETURNS
 TABLE("result" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['x_dim0', 'x_val'])})
     v = 42
@@ -1639,7 +1630,6 @@ RETURNS
 TABLE("dim0" INT,"val" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = [1, 2, 3]
     return udfio.as_tensor_table(numpy.array(x))
@@ -1725,7 +1715,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     r = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'c0', 'c1', 'c2'], ['r_row_id', 'r_c0', 'r_c1', 'r_c2'])}, 'row_id')
     result = r
@@ -1821,7 +1810,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     r = udfio.from_relational_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['row_id', 'c0', 'c1', 'c2'], ['r_row_id', 'r_c0', 'r_c1', 'r_c2'])}, 'row_id')
     result = r
@@ -1918,7 +1906,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     t = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'dim1', 'val'], ['t_dim0', 't_dim1', 't_val'])})
     result = t
@@ -2025,7 +2012,6 @@ RETURNS
 TABLE("dim0" INT,"val" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['x_dim0', 'x_val'])})
     y = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['y_dim0', 'y_val'])})
@@ -2148,7 +2134,6 @@ RETURNS
 TABLE("dim0" INT,"val" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['x_dim0', 'x_val'])})
     y = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['y_dim0', 'y_val'])})
@@ -2279,7 +2264,6 @@ RETURNS
 TABLE("dim0" INT,"dim1" INT,"val" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     x = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'dim1', 'val'], ['x_dim0', 'x_dim1', 'x_val'])})
     y = udfio.from_tensor_table({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'dim1', 'val'], ['y_dim0', 'y_dim1', 'y_val'])})
@@ -2389,7 +2373,6 @@ RETURNS
 TABLE("dim0" INT,"val" INT)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     xs = udfio.merge_tensor_to_list({name: _columns[name_w_prefix] for name, name_w_prefix in zip(['dim0', 'val'], ['xs_dim0', 'xs_val'])})
     x = sum(xs)
@@ -2467,8 +2450,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     t = 5
     result = {'num': 5}
@@ -2569,8 +2550,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     __state_str = _conn.execute("SELECT state from test_state_table;")["state"][0]
     prev_state = pickle.loads(__state_str)
@@ -2658,8 +2637,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import json
     t = 5
     result = {'num': t, 'list_of_nums': [t, t, t]}
@@ -2761,8 +2738,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import json
     __transfer_str = _conn.execute("SELECT transfer from test_transfer_table;")["transfer"][0]
     transfer = json.loads(__transfer_str)
@@ -2866,8 +2841,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __transfer_str = _conn.execute("SELECT transfer from test_transfer_table;")["transfer"][0]
@@ -2982,8 +2955,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __transfer_str = _conn.execute("SELECT transfer from test_transfer_table;")["transfer"][0]
@@ -3106,8 +3077,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __transfer_strs = _conn.execute("SELECT transfer from test_merge_transfer_table;")["transfer"]
@@ -3230,8 +3199,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __state_str = _conn.execute("SELECT state from test_state_table;")["state"][0]
@@ -3369,8 +3336,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __transfer_str = _conn.execute("SELECT transfer from test_transfer_table;")["transfer"][0]
@@ -3517,8 +3482,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __state_str = _conn.execute("SELECT state from test_state_table;")["state"][0]
@@ -3652,8 +3615,6 @@ RETURNS
 TABLE("secure_transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __state_str = _conn.execute("SELECT state from test_state_table;")["state"][0]
@@ -3769,7 +3730,6 @@ RETURNS
 TABLE("secure_transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     import pickle
     import json
@@ -3921,8 +3881,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import pickle
     import json
     __state_str = _conn.execute("SELECT state from test_state_table;")["state"][0]
@@ -4055,7 +4013,6 @@ RETURNS
 TABLE("state" BLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     import pickle
     import json
@@ -4224,7 +4181,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     import json
     __transfer_strs = _conn.execute("SELECT secure_transfer from test_secure_transfer_table;")["secure_transfer"]
@@ -4348,7 +4304,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     import json
     __template_str = _conn.execute("SELECT secure_transfer from test_smpc_template_table;")["secure_transfer"][0]
@@ -4453,7 +4408,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     import json
     t = 5
@@ -4540,7 +4494,6 @@ RETURNS
 TABLE("a" INT,"b" DOUBLE)
 LANGUAGE PYTHON
 {
-    import pandas as pd
     import udfio
     result = {'a': [1, 2, 3], 'b': [4.0, 5.0, 6.0]}
     return udfio.as_relational_table(result, 'row_id')
@@ -4608,8 +4561,6 @@ RETURNS
 TABLE("transfer" CLOB)
 LANGUAGE PYTHON
 {
-    import pandas as pd
-    import udfio
     import json
     a = 10
     result = {'a': a}
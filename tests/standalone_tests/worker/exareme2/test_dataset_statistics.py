@@ -0,0 +1,143 @@
+from unittest.mock import patch
+
+import pytest
+
+from exareme2.worker.exareme2.dataset_statistics import dataset_statistics_db
+from exareme2.worker.exareme2.dataset_statistics import dataset_statistics_service
+from exareme2.worker.exareme2.monetdb.guard import InvalidSQLParameter
+from exareme2.worker_communication import ColumnStatistics
+from exareme2.worker_communication import DatasetStatistics
+
+
+@pytest.fixture
+def monetdb_facade():
+    with patch.object(dataset_statistics_db, "monetdb_facade") as monetdb_facade:
+        yield monetdb_facade
+
+
+def test_compute_dataset_statistics(monetdb_facade):
+    monetdb_facade.execute_and_fetchall.side_effect = [
+        [
+            ("dataset1", 4, 3, 6.0, 14.0, 1.0, 3.0, 4),
+            ("dataset2", 2, 0, None, None, None, None, 1),
+        ],
+        [
+            ("dataset1", "gender", "F", 3),
+            ("dataset1", "gender", "M", 1),
+            ("dataset2", "gender", "F", 1),
+        ],
+    ]
+
+    statistics = dataset_statistics_db.compute_dataset_statistics(
+        data_model="dementia:0.1",
+        numerical_columns=["age"],
+        nominal_columns=["gender"],
+    )
+
+    assert statistics == {
+        "dataset1": DatasetStatistics(
+            dataset="dataset1",
+            row_count=4,
+            columns={
+                "age": ColumnStatistics(
+                    count=3, null_count=1, sum=6.0, sum_sq=14.0, min=1.0, max=3.0
+                ),
+                "gender": ColumnStatistics(
+                    count=4, null_count=0, category_counts={"F": 3, "M": 1}
+                ),
+            },
+        ),
+        "dataset2": DatasetStatistics(
+            dataset="dataset2",
+            row_count=2,
+            columns={
+                "age": ColumnStatistics(count=0, null_count=2, sum=0.0, sum_sq=0.0),
+                "gender": ColumnStatistics(
+                    count=1, null_count=1, category_counts={"F": 1}
+                ),
+            },
+        ),
+    }
+    statistics_query = monetdb_facade.execute_and_fetchall.call_args_list[0].args[0]
+    assert 'FROM "dementia:0.1"."primary_data"' in statistics_query
+    assert 'GROUP BY "dataset"' in statistics_query
+
+
+def test_compute_dataset_statistics_without_nominal_columns(monetdb_facade):
+    monetdb_facade.execute_and_fetchall.return_value = [
+        ("dataset1", 1, 1, 2.0, 4.0, 2.0, 2.0)
+    ]
+
+    statistics = dataset_statistics_db.compute_dataset_statistics(
+        data_model="dementia:0.1", numerical_columns=["age"], nominal_columns=[]
+    )
+
+    monetdb_facade.execute_and_fetchall.assert_called_once()
+    assert statistics["dataset1"].columns["age"].sum == 2.0
+
+
+def test_compute_dataset_statistics_guards_the_columns(monetdb_facade):
+    with pytest.raises(InvalidSQLParameter):
+        dataset_statistics_db.compute_dataset_statistics(
+            data_model="dementia:0.1",
+            numerical_columns=['age"; DROP TABLE x; --'],
+            nominal_columns=[],
+        )
+
+
+def test_get_dataset_statistics_leaves_out_the_small_datasets():
+    statistics = {
+        dataset: DatasetStatistics(dataset=dataset, row_count=row_count, columns={})
+        for dataset, row_count in [("big", 100), ("small", 1), ("other", 100)]
+    }
+
+    with patch.object(
+        dataset_statistics_service, "get_data_models", return_value=["dementia:0.1"]
+    ), patch.object(
+        dataset_statistics_service,
+        "_get_data_model_statistics",
+        return_value=statistics,
+    ), patch.object(
+        dataset_statistics_service, "MINIMUM_ROW_COUNT", 10
+    ):
+        # Without the logging of the celery task
+        get_dataset_statistics = (
+            dataset_statistics_service.get_dataset_statistics.__wrapped__
+        )
+        result = get_dataset_statistics(
+            "request_id", "dementia:0.1", ["big", "small", "unknown"]
+        )
+
+    assert result == [statistics["big"]]
+
+
+def test_get_dataset_statistics_leaves_out_the_small_categories():
+    statistics = DatasetStatistics(
+        dataset="dataset1",
+        row_count=100,
+        columns={
+            "gender": ColumnStatistics(
+                count=100, null_count=0, category_counts={"F": 95, "M": 5}
+            ),
+            "age": ColumnStatistics(count=100, null_count=0, min=1.0, max=2.0),
+        },
+    )
+
+    with patch.object(
+        dataset_statistics_service, "get_data_models", return_value=["dementia:0.1"]
+    ), patch.object(
+        dataset_statistics_service,
+        "_get_data_model_statistics",
+        return_value={"dataset1": statistics},
+    ), patch.object(
+        dataset_statistics_service, "MINIMUM_ROW_COUNT", 10
+    ):
+        get_dataset_statistics = (
+            dataset_statistics_service.get_dataset_statistics.__wrapped__
+        )
+        [result] = get_dataset_statistics("request_id", "dementia:0.1", ["dataset1"])
+
+    assert result.columns["gender"].category_counts == {"F": 95}
+    assert result.columns["age"] == statistics.columns["age"]
+    # The cached statistics are left unchanged
+    assert statistics.columns["gender"].category_counts == {"F": 95, "M": 5}
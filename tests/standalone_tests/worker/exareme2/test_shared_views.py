@@ -0,0 +1,253 @@
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import eventlet
+import pytest
+
+from exareme2 import DType
+from exareme2.worker import config as worker_config
+from exareme2.worker.exareme2.monetdb.monetdb_facade import convert_to_idempotent
+from exareme2.worker.exareme2.views import views_db
+from exareme2.worker.exareme2.views import views_service
+from exareme2.worker.exareme2.views.shared_views import SharedViewsRegistry
+
+
+def drop_expired(registry):
+    dropped = []
+    registry.drop_expired(dropped.extend)
+    return dropped
+
+
+def test_views_are_created_once_per_views_id():
+    registry = SharedViewsRegistry(idle_timeout=60)
+    create_views = Mock(return_value=["view"])
+
+    views_ctx1 = registry.acquire("views1", "ctx1", create_views)
+    views_ctx2 = registry.acquire("views1", "ctx2", create_views)
+
+    assert views_ctx1 == views_ctx2 == ["view"]
+    create_views.assert_called_once()
+
+
+def test_failed_views_creation_is_not_registered():
+    registry = SharedViewsRegistry(idle_timeout=0)
+    create_views = Mock(side_effect=[ValueError, ["view"]])
+
+    try:
+        registry.acquire("views1", "ctx1", create_views)
+    except ValueError:
+        pass
+    views = registry.acquire("views1", "ctx1", create_views)
+
+    assert views == ["view"]
+    assert create_views.call_count == 2
+
+
+def test_views_id_locks_are_removed_with_the_views():
+    registry = SharedViewsRegistry(idle_timeout=0)
+    with pytest.raises(ValueError):
+        registry.acquire("views1", "ctx1", Mock(side_effect=ValueError))
+    registry.acquire("views2", "ctx1", lambda: ["view"])
+    registry.release("ctx1")
+
+    assert drop_expired(registry) == ["view"]
+    assert registry._views_id_locks == {}
+
+
+def test_views_expire_only_after_last_context_is_released():
+    registry = SharedViewsRegistry(idle_timeout=0)
+    registry.acquire("views1", "ctx1", lambda: ["view"])
+    registry.acquire("views1", "ctx2", lambda: ["view"])
+
+    registry.release("ctx1")
+    assert drop_expired(registry) == []
+
+    registry.release("ctx2")
+    assert drop_expired(registry) == ["view"]
+    assert drop_expired(registry) == []
+
+
+def test_released_views_are_kept_for_the_idle_timeout():
+    registry = SharedViewsRegistry(idle_timeout=60)
+    registry.acquire("views1", "ctx1", lambda: ["view"])
+    registry.release("ctx1")
+
+    assert drop_expired(registry) == []
+
+    # The views can be acquired again before they expire
+    create_views = Mock()
+    assert registry.acquire("views1", "ctx2", create_views) == ["view"]
+    create_views.assert_not_called()
+
+    registry.release("ctx2")
+    with patch(
+        "exareme2.worker.exareme2.views.shared_views.time.monotonic",
+        return_value=float("inf"),
+    ):
+        assert drop_expired(registry) == ["view"]
+
+
+def test_views_of_different_ids_are_created_concurrently():
+    registry = SharedViewsRegistry(idle_timeout=60)
+
+    # Creating the views of another id, while the first ones are being created,
+    # doesn't wait for them
+    def create_views1():
+        registry.acquire("views2", "ctx2", lambda: ["view2"])
+        return ["view1"]
+
+    assert registry.acquire("views1", "ctx1", create_views1) == ["view1"]
+    assert registry.acquire("views2", "ctx3", Mock()) == ["view2"]
+
+
+def test_views_are_not_dropped_while_created_again():
+    registry = SharedViewsRegistry(idle_timeout=0)
+    registry.acquire("views1", "ctx1", lambda: ["old view"])
+    registry.release("ctx1")
+    acquired = []
+
+    def drop_views(views):
+        # The views are acquired again while they are being dropped
+        acquiring = eventlet.spawn(
+            registry.acquire, "views1", "ctx2", lambda: ["new view"]
+        )
+        acquiring.link(lambda thread: acquired.append(thread.wait()))
+        eventlet.sleep(0)
+        assert acquired == []
+
+    registry.drop_expired(drop_views)
+    eventlet.sleep(0)
+
+    assert acquired == [["new view"]]
+    assert drop_expired(registry) == []
+
+
+def test_shared_views_are_not_reused_after_the_data_change():
+    create_views = Mock(side_effect=lambda **kwargs: [kwargs])
+    kwargs = dict(
+        request_id="request",
+        command_id="command",
+        data_model="dementia:0.1",
+        datasets=["edsd"],
+        columns_per_view=[["x"]],
+        shared_views_id="views1",
+    )
+
+    with patch.object(
+        views_service, "shared_views", SharedViewsRegistry(idle_timeout=60)
+    ), patch.object(
+        views_service, "_create_shared_data_model_views", create_views
+    ), patch.object(
+        views_service, "get_db_version_id", side_effect=["v1", "v1", "v2"]
+    ), patch.object(
+        views_service, "_drop_leftover_shared_views"
+    ):
+        create_data_model_views = views_service.create_data_model_views.__wrapped__
+        create_data_model_views(context_id="ctx1", **kwargs)
+        create_data_model_views(context_id="ctx2", **kwargs)
+        create_data_model_views(context_id="ctx3", **kwargs)
+
+    command_ids = [
+        call.kwargs["shared_views_command_id"] for call in create_views.call_args_list
+    ]
+    assert command_ids == ["sharedv1", "sharedv2"]
+
+
+def test_leftover_shared_views_are_dropped_once():
+    worker_id = worker_config.identifier.lower()
+    view_names = [
+        f"view_{worker_id}_views1_sharedv1_0",
+        f"view_{worker_id}_ctx1_sharedv1_0",
+        f"view_{worker_id}_ctx1_1_0",
+        "view_otherworker_views1_sharedv1_0",
+    ]
+    with patch.object(
+        views_service, "_leftover_shared_views_dropped", False
+    ), patch.object(
+        views_service.views_db, "get_view_names", return_value=view_names
+    ) as get_view_names, patch.object(
+        views_service.views_db, "drop_views_if_exist"
+    ) as drop_views_if_exist:
+        views_service._drop_leftover_shared_views()
+        views_service._drop_leftover_shared_views()
+
+    get_view_names.assert_called_once()
+    drop_views_if_exist.assert_called_once_with(view_names[:2])
+
+
+# Alias globalworker_db_cursor to db
+@pytest.fixture(scope="module")
+def db(globalworker_db_cursor):
+    return globalworker_db_cursor
+
+
+@pytest.mark.slow
+@pytest.mark.database
+class TestSharedViews_WithDb:
+    table_name = "test_shared_views_table"
+    view_names = ["view_testworker_sharedviews_shared_0"]
+
+    @pytest.fixture
+    def data_table(self, db):
+        db.execute(f"CREATE TABLE {self.table_name}(row_id INT, x DOUBLE)")
+        db.execute(f"INSERT INTO {self.table_name} VALUES (0, 0.5), (1, 1.5)")
+        try:
+            yield
+        finally:
+            db.execute(f"DROP VIEW IF EXISTS {self.view_names[0]}")
+            db.execute(f"DROP TABLE {self.table_name}")
+
+    @pytest.fixture
+    def monetdb_facade(self, db):
+        # Executes the queries as the facade does, with the same rewriting into
+        # idempotent queries
+        facade = Mock()
+        facade.execute_query.side_effect = lambda query: db.execute(
+            convert_to_idempotent(query)
+        )
+        facade.execute_and_fetchall.side_effect = lambda query: db.execute(
+            query
+        ).fetchall()
+        with patch.object(views_db, "monetdb_facade", facade):
+            yield facade
+
+    @pytest.mark.usefixtures("data_table", "monetdb_facade")
+    def test_create_reuse_and_drop_shared_views(self, db):
+        registry = SharedViewsRegistry(idle_timeout=0)
+        create_views = Mock(
+            side_effect=lambda: views_db.create_views(
+                view_names=self.view_names,
+                table_name=self.table_name,
+                columns_per_view=[["row_id", "x"]],
+                filters=None,
+                column_types={"row_id": DType.INT, "x": DType.FLOAT},
+                minimum_row_count=1,
+                check_min_rows=True,
+            )
+        )
+
+        # Views left over by a previous run are dropped before the creation
+        views_db.drop_views_if_exist(self.view_names)
+        views_ctx1 = registry.acquire("views1", "ctx1", create_views)
+        views_ctx2 = registry.acquire("views1", "ctx2", create_views)
+
+        assert views_ctx1 == views_ctx2
+        create_views.assert_called_once()
+        assert db.execute(f"SELECT * FROM {self.view_names[0]}").fetchall() == [
+            (0, 0.5),
+            (1, 1.5),
+        ]
+
+        registry.release("ctx1")
+        registry.release("ctx2")
+        registry.drop_expired(
+            lambda views: views_db.drop_views_if_exist([view.name for view in views])
+        )
+
+        assert self._view_exists(db) is False
+
+    def _view_exists(self, db):
+        [(count,)] = db.execute(
+            f"SELECT COUNT(*) FROM tables WHERE name = '{self.view_names[0]}'"
+        ).fetchall()
+        return count > 0
@@ -5,11 +5,13 @@ from pymonetdb import OperationalError
 
 from exareme2.datatypes import DType
 from exareme2.worker_communication import ColumnInfo
+from exareme2.worker_communication import TableData
 from exareme2.worker_communication import TableInfo
 from exareme2.worker_communication import TableSchema
 from tests.standalone_tests.conftest import TASKS_TIMEOUT
 from tests.standalone_tests.conftest import create_table_in_db
 from tests.standalone_tests.conftest import get_table_data_from_db
+from tests.standalone_tests.conftest import insert_data_to_db
 from tests.standalone_tests.controller.workers_communication_helper import (
     get_celery_task_signature,
 )
@@ -169,3 +171,50 @@ def test_get_table_data_works_on_published_table(
         pytest.fail(
             "The table data should be fetched without error since the table is published."
         )
+
+
+@pytest.mark.slow
+def test_get_table_data_in_pages(
+    request_id,
+    context_id,
+    localworker1_worker_service,
+    localworker1_celery_app,
+    localworker1_db_cursor,
+):
+    table_name = f"normal_testlocalworker1_{context_id}"
+    table_schema = TableSchema(
+        columns=[
+            ColumnInfo(name="row_id", dtype=DType.INT),
+            ColumnInfo(name="col1", dtype=DType.STR),
+        ]
+    )
+    create_table_in_db(
+        localworker1_db_cursor, table_name, table_schema, publish_table=True
+    )
+    # Inserted out of order, the pages being sorted by row_id
+    insert_data_to_db(
+        table_name,
+        [[row_id, str(row_id)] for row_id in (3, 0, 4, 1, 2)],
+        localworker1_db_cursor,
+    )
+
+    pages = []
+    for offset in (0, 2, 4):
+        async_result = localworker1_celery_app.queue_task(
+            task_signature=get_table_data_task_signature,
+            logger=StdOutputLogger(),
+            request_id=request_id,
+            table_name=table_name,
+            offset=offset,
+            limit=2,
+        )
+        table_data = TableData.parse_raw(
+            localworker1_celery_app.get_result(
+                async_result=async_result,
+                logger=StdOutputLogger(),
+                timeout=TASKS_TIMEOUT,
+            )
+        )
+        pages.append(table_data.columns[1].data)
+
+    assert pages == [["0", "1"], ["2", "3"], ["4"]]
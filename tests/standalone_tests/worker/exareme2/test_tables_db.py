@@ -0,0 +1,190 @@
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pymonetdb
+import pytest
+
+from exareme2 import DType
+from exareme2.worker.exareme2.monetdb.monetdb_facade import _LinesUploader
+from exareme2.worker.exareme2.tables import tables_db
+from exareme2.worker_communication import ColumnInfo
+from exareme2.worker_communication import TableSchema
+from tests.standalone_tests.conftest import COMMON_IP
+from tests.standalone_tests.conftest import COMMON_MONETDB_NAME
+from tests.standalone_tests.conftest import MONETDB_GLOBALWORKER_PORT
+
+
+@pytest.fixture
+def monetdb_facade():
+    with patch.object(tables_db, "monetdb_facade") as monetdb_facade:
+        yield monetdb_facade
+
+
+def test_insert_data_to_table_with_small_table_uses_insert(monetdb_facade):
+    tables_db.insert_data_to_table("table1", [[1, "a"], [2, "b"]])
+
+    monetdb_facade.execute_query.assert_called_once_with(
+        "INSERT INTO table1 VALUES (%s, %s), (%s, %s)", [1, "a", 2, "b"]
+    )
+
+
+def test_insert_data_to_table_with_large_table_uses_bulk_load(monetdb_facade):
+    large_value = "x" * tables_db.BULK_LOAD_MIN_SIZE
+    tables_db.insert_data_to_table("table1", [[1, large_value], [2, None]])
+
+    query = monetdb_facade.execute_query.call_args.args[0]
+    assert "COPY 2 RECORDS INTO table1" in query
+    assert "ON CLIENT" in query
+    upload_lines = monetdb_facade.execute_query.call_args.kwargs["upload_lines"]
+    assert list(upload_lines()) == [f'1,"{large_value}"\n', "2,NULL\n"]
+
+
+def test_insert_data_to_table_with_rows_of_different_length():
+    with pytest.raises(ValueError):
+        tables_db.insert_data_to_table("table1", [[1, 2], [3]])
+
+
+def test_convert_values_to_csv_lines_escapes_quotes():
+    lines = tables_db._convert_values_to_csv_lines([['{"a": 1}', 0.5]])
+
+    assert list(lines) == ['"{""a"": 1}",0.5\n']
+
+
+def test_convert_values_to_csv_lines_with_bools():
+    lines = tables_db._convert_values_to_csv_lines([[True, False]])
+
+    assert list(lines) == ["true,false\n"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [tables_db.BULK_LOAD_NULL, float("nan"), float("inf")],
+)
+def test_insert_data_to_table_with_values_not_fitting_csv_uses_insert(
+    monetdb_facade, value
+):
+    large_value = "x" * tables_db.BULK_LOAD_MIN_SIZE
+    tables_db.insert_data_to_table("table1", [[large_value, value]])
+
+    query = monetdb_facade.execute_query.call_args.args[0]
+    assert query == "INSERT INTO table1 VALUES (%s, %s)"
+
+
+def test_get_approximate_size_counts_the_characters_of_all_values():
+    assert tables_db._get_approximate_size([["abc", 12345, 0.5, None]]) == 15
+
+
+@pytest.fixture
+def table_schema():
+    schema = TableSchema(
+        columns=[
+            ColumnInfo(name="row_id", dtype=DType.INT),
+            ColumnInfo(name="x", dtype=DType.FLOAT),
+        ]
+    )
+    with patch.object(tables_db, "get_table_schema", return_value=schema):
+        yield schema
+
+
+@pytest.mark.usefixtures("table_schema")
+def test_get_table_data_page_is_sorted_by_row_id(monetdb_facade):
+    monetdb_facade.execute_and_fetchall.return_value = [(2, 0.5), (3, 1.5)]
+
+    columns = tables_db.get_table_data("table1", offset=2, limit=2)
+
+    query = monetdb_facade.execute_and_fetchall.call_args.args[0]
+    assert query.endswith('ORDER BY "row_id", "x" LIMIT 2 OFFSET 2')
+    assert [column.data for column in columns] == [[2, 3], [0.5, 1.5]]
+
+
+def test_get_table_data_without_row_id_is_paged_sorted_by_all_columns(
+    monetdb_facade, table_schema
+):
+    schema = TableSchema(
+        columns=[ColumnInfo(name="y", dtype=DType.STR), *table_schema.columns[1:]]
+    )
+    monetdb_facade.execute_and_fetchall.return_value = [("b", 1.5)]
+
+    with patch.object(tables_db, "get_table_schema", return_value=schema):
+        columns = tables_db.get_table_data("table1", offset=2, limit=2)
+
+    query = monetdb_facade.execute_and_fetchall.call_args.args[0]
+    assert query.endswith('ORDER BY "y", "x" LIMIT 2 OFFSET 2')
+    assert [column.data for column in columns] == [["b"], [1.5]]
+
+
+# Alias globalworker_db_cursor to db
+@pytest.fixture(scope="module")
+def db(globalworker_db_cursor):
+    return globalworker_db_cursor
+
+
+@pytest.mark.slow
+@pytest.mark.database
+class TestInsertDataToTable_WithDb:
+    table_name = "test_insert_data_table"
+    rows = [
+        [0, 'a "quoted" value', True, 0.5],
+        [1, "a value\nin two lines", False, -1.5],
+        [2, None, None, None],
+        [3, "", True, 1e300],
+        [4, 'ends with a quote"', False, 2.0],
+    ]
+
+    @pytest.fixture
+    def table(self, db):
+        db.execute(
+            f"CREATE TABLE {self.table_name}"
+            f"(row_id INT, s TEXT, b BOOLEAN, f DOUBLE)"
+        )
+        try:
+            yield
+        finally:
+            db.execute(f"DROP TABLE {self.table_name}")
+
+    @pytest.fixture
+    def monetdb_facade(self):
+        # Executes the queries with the uploader of the facade, which the
+        # 'COPY INTO ... ON CLIENT' queries need
+        def execute_query(query, parameters=None, upload_lines=None):
+            conn = pymonetdb.connect(
+                hostname=COMMON_IP,
+                port=MONETDB_GLOBALWORKER_PORT,
+                username="executor",
+                password="executor",
+                database=COMMON_MONETDB_NAME,
+            )
+            if upload_lines:
+                conn.set_uploader(_LinesUploader(upload_lines))
+            try:
+                conn.cursor().execute(query, parameters)
+                conn.commit()
+            finally:
+                conn.close()
+
+        facade = Mock()
+        facade.execute_query.side_effect = execute_query
+        with patch.object(tables_db, "monetdb_facade", facade):
+            yield facade
+
+    def _fetch_rows(self, db):
+        rows = db.execute(f"SELECT * FROM {self.table_name} ORDER BY row_id")
+        return [list(row) for row in rows.fetchall()]
+
+    @pytest.mark.parametrize("bulk_load_min_size", [0, tables_db.BULK_LOAD_MIN_SIZE])
+    @pytest.mark.usefixtures("table")
+    def test_values_round_trip(self, db, monetdb_facade, bulk_load_min_size):
+        with patch.object(tables_db, "BULK_LOAD_MIN_SIZE", bulk_load_min_size):
+            tables_db.insert_data_to_table(self.table_name, self.rows)
+
+        query = monetdb_facade.execute_query.call_args.args[0]
+        assert ("COPY" in query) == (bulk_load_min_size == 0)
+        assert self._fetch_rows(db) == self.rows
+
+    @pytest.mark.usefixtures("table")
+    def test_null_marker_string_is_not_read_as_null(self, db, monetdb_facade):
+        rows = [[0, tables_db.BULK_LOAD_NULL, True, 0.5], [1, None, False, 1.5]]
+        with patch.object(tables_db, "BULK_LOAD_MIN_SIZE", 0):
+            tables_db.insert_data_to_table(self.table_name, rows)
+
+        assert self._fetch_rows(db) == rows
@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from exareme2 import DType
+from exareme2.worker.exareme2.monetdb.monetdb_facade import convert_to_idempotent
+from exareme2.worker.exareme2.views import views_db
+from exareme2.worker_communication import ColumnInfo
+from exareme2.worker_communication import InsufficientDataError
+from exareme2.worker_communication import TableSchema
+
+
+@pytest.fixture
+def monetdb_facade():
+    with patch.object(views_db, "monetdb_facade") as monetdb_facade:
+        yield monetdb_facade
+
+
+def create_views(**kwargs):
+    return views_db.create_views(
+        view_names=["view1", "view2"],
+        table_name='"dementia:0.1"."primary_data"',
+        columns_per_view=[["row_id", "x"], ["row_id", "y"]],
+        filters=None,
+        column_types={"row_id": DType.INT, "x": DType.FLOAT, "y": DType.STR},
+        minimum_row_count=10,
+        **kwargs,
+    )
+
+
+def test_create_views_uses_one_ddl_and_one_count_query(monetdb_facade):
+    monetdb_facade.execute_and_fetchall.return_value = [(20,)]
+
+    views = create_views(check_min_rows=True)
+
+    monetdb_facade.execute_query.assert_called_once()
+    views_creation_query = monetdb_facade.execute_query.call_args.args[0]
+    assert views_creation_query.count("CREATE VIEW") == 2
+    monetdb_facade.execute_and_fetchall.assert_called_once()
+    assert [view.name for view in views] == ["view1", "view2"]
+    assert views[0].schema_ == TableSchema(
+        columns=[
+            ColumnInfo(name="row_id", dtype=DType.INT),
+            ColumnInfo(name="x", dtype=DType.FLOAT),
+        ]
+    )
+    assert views[1].schema_ == TableSchema(
+        columns=[
+            ColumnInfo(name="row_id", dtype=DType.INT),
+            ColumnInfo(name="y", dtype=DType.STR),
+        ]
+    )
+
+
+def test_create_views_with_insufficient_data_drops_all_views(monetdb_facade):
+    monetdb_facade.execute_and_fetchall.return_value = [(5,)]
+
+    with pytest.raises(InsufficientDataError):
+        create_views(check_min_rows=True)
+
+    # The facade adds the IF EXISTS to the DROP VIEW statements
+    drop_query = convert_to_idempotent(monetdb_facade.execute_query.call_args.args[0])
+    assert drop_query == "DROP VIEW IF EXISTS view1;DROP VIEW IF EXISTS view2;"
+
+
+def test_create_views_without_known_column_types_queries_the_catalog(monetdb_facade):
+    monetdb_facade.execute_and_fetchall.return_value = [(20,)]
+    view_schema = TableSchema(
+        columns=[
+            ColumnInfo(name="x", dtype=DType.FLOAT),
+            ColumnInfo(name="row_id", dtype=DType.INT),
+        ]
+    )
+
+    with patch.object(
+        views_db, "get_table_schema", return_value=view_schema
+    ) as get_table_schema:
+        views = views_db.create_views(
+            view_names=["view1"],
+            table_name='"dementia:0.1"."primary_data"',
+            columns_per_view=[["row_id", "x"]],
+            filters=None,
+            column_types={},
+            minimum_row_count=10,
+        )
+
+    get_table_schema.assert_called_once_with("view1")
+    assert [column.name for column in views[0].schema_.columns] == ["row_id", "x"]
@@ -0,0 +1,16 @@
+import requests
+
+from exareme2.worker.utils.metrics import metrics
+from exareme2.worker.utils.metrics import start_metrics_exporter
+
+
+def test_metrics_exporter_serves_the_worker_metrics():
+    server = start_metrics_exporter(port=0)
+    try:
+        port = server.server_address[1]
+        response = requests.get(f"http://localhost:{port}/metrics")
+        assert response.status_code == 200
+        assert response.text == metrics.render()
+        assert requests.get(f"http://localhost:{port}/other").status_code == 404
+    finally:
+        server.shutdown()
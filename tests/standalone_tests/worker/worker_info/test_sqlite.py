@@ -0,0 +1,81 @@
+import os
+import sqlite3
+from unittest.mock import Mock
+
+import eventlet
+import pytest
+
+from exareme2.worker.worker_info import sqlite
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "worker.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE data_models (code TEXT)")
+    conn.execute("INSERT INTO data_models VALUES ('dementia')")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(sqlite, "DB_PATH", db_path)
+    monkeypatch.setattr(sqlite, "WAL_PATH", f"{db_path}-wal")
+    connection = sqlite._SharedConnection()
+    monkeypatch.setattr(sqlite, "_connection", connection)
+    sqlite.metadata_cache.clear()
+    yield db_path
+    sqlite.metadata_cache.clear()
+    connection.close()
+
+
+def test_execute_and_fetchall(db_path):
+    assert sqlite.execute_and_fetchall("SELECT code FROM data_models") == [
+        ("dementia",)
+    ]
+
+
+def test_connection_is_read_only(db_path):
+    with pytest.raises(sqlite3.OperationalError):
+        sqlite.execute_and_fetchall("INSERT INTO data_models VALUES ('tbi')")
+
+
+def test_connection_is_shared_by_the_greenlets(db_path):
+    connection = sqlite._connection._get_connection()
+    greenlets = [eventlet.spawn(sqlite._connection._get_connection) for _ in range(3)]
+
+    assert all(greenlet.wait() is connection for greenlet in greenlets)
+
+
+def test_connection_is_opened_again_when_the_db_is_replaced(db_path):
+    connection = sqlite._connection._get_connection()
+
+    new_db_path = f"{db_path}.new"
+    conn = sqlite3.connect(new_db_path)
+    conn.execute("CREATE TABLE data_models (code TEXT)")
+    conn.execute("INSERT INTO data_models VALUES ('tbi')")
+    conn.commit()
+    conn.close()
+    os.replace(new_db_path, db_path)
+
+    assert sqlite.execute_and_fetchall("SELECT code FROM data_models") == [("tbi",)]
+    assert sqlite._connection._get_connection() is not connection
+
+
+def test_cached_results_are_reused_until_the_db_changes(db_path):
+    func = Mock(return_value=["dementia"])
+    cached_func = sqlite.cached(func)
+
+    assert cached_func("arg") == ["dementia"]
+    assert cached_func("arg") == ["dementia"]
+    assert func.call_count == 1
+
+    os.utime(db_path, ns=(0, 0))
+    assert cached_func("arg") == ["dementia"]
+    assert func.call_count == 2
+
+
+def test_cached_results_are_per_arguments(db_path):
+    func = Mock(side_effect=lambda arg: arg)
+    cached_func = sqlite.cached(func)
+
+    assert cached_func("arg1") == "arg1"
+    assert cached_func("arg2") == "arg2"